@@ -23,6 +23,9 @@ from app.domain.file.model import File
 from app.domain.extracted_data.model import ExtractedData
 from app.domain.file_change_pattern.model import FileChangePattern
 from app.domain.exclusion_pattern.model import ExclusionPattern
+from app.domain.directory.model import Directory, Root
+from app.domain.job.model import Job
+from app.domain.index_run.model import IndexRun, IndexRunDirectory
 from sqlmodel import SQLModel
 
 target_metadata = SQLModel.metadata
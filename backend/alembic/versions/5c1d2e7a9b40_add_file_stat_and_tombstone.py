@@ -0,0 +1,36 @@
+"""Add mtime, inode and tombstone columns to file
+
+Revision ID: 5c1d2e7a9b40
+Revises: 98d464063607
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1d2e7a9b40'
+down_revision: Union[str, None] = '98d464063607'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('mtime_ns', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('inode', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.create_index(batch_op.f('ix_file_is_deleted'), ['is_deleted'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_file_is_deleted'))
+        batch_op.drop_column('is_deleted')
+        batch_op.drop_column('inode')
+        batch_op.drop_column('mtime_ns')
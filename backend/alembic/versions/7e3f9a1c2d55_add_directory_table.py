@@ -0,0 +1,43 @@
+"""Add directory table for directory-level skip on re-scan
+
+Revision ID: 7e3f9a1c2d55
+Revises: 5c1d2e7a9b40
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e3f9a1c2d55'
+down_revision: Union[str, None] = '5c1d2e7a9b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('directory',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('path', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('parent_path', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('mtime_ns', sa.Integer(), nullable=False),
+    sa.Column('child_count', sa.Integer(), nullable=False),
+    sa.Column('last_scanned_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_directory_path'), 'directory', ['path'], unique=True)
+    op.create_index(op.f('ix_directory_parent_path'), 'directory', ['parent_path'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_directory_parent_path'), table_name='directory')
+    op.drop_index(op.f('ix_directory_path'), table_name='directory')
+    op.drop_table('directory')
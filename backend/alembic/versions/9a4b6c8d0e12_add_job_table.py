@@ -0,0 +1,49 @@
+"""Add job table for background jobs
+
+Revision ID: 9a4b6c8d0e12
+Revises: 7e3f9a1c2d55
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+import app.domain.custom_types
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4b6c8d0e12'
+down_revision: Union[str, None] = '7e3f9a1c2d55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_type', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('params', app.domain.custom_types.JsonEncodedDict(), nullable=True),
+    sa.Column('progress', app.domain.custom_types.JsonEncodedDict(), nullable=True),
+    sa.Column('checkpoint', app.domain.custom_types.JsonEncodedDict(), nullable=True),
+    sa.Column('result', app.domain.custom_types.JsonEncodedDict(), nullable=True),
+    sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_job_type'), 'job', ['job_type'], unique=False)
+    op.create_index(op.f('ix_job_status'), 'job', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_job_status'), table_name='job')
+    op.drop_index(op.f('ix_job_job_type'), table_name='job')
+    op.drop_table('job')
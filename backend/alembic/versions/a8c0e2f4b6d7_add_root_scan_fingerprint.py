@@ -0,0 +1,32 @@
+"""Add scan option fingerprint to root
+
+Revision ID: a8c0e2f4b6d7
+Revises: f7b9d1e3a5c6
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c0e2f4b6d7'
+down_revision: Union[str, None] = 'f7b9d1e3a5c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 지문이 없는 기존 시작 경로는 다음 인덱싱에서 한 번 모든 디렉토리를 다시 읽습니다.
+    with op.batch_alter_table('root', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('scan_fingerprint', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('root', schema=None) as batch_op:
+        batch_op.drop_column('scan_fingerprint')
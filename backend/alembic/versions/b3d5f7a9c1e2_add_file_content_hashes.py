@@ -0,0 +1,37 @@
+"""Add partial and content hash columns to file
+
+Revision ID: b3d5f7a9c1e2
+Revises: 9a4b6c8d0e12
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d5f7a9c1e2'
+down_revision: Union[str, None] = '9a4b6c8d0e12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('partial_hash', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+        batch_op.add_column(sa.Column('content_hash', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_file_content_hash'), ['content_hash'], unique=False)
+        batch_op.create_index(batch_op.f('ix_file_size'), ['size'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_file_size'))
+        batch_op.drop_index(batch_op.f('ix_file_content_hash'))
+        batch_op.drop_column('content_hash')
+        batch_op.drop_column('partial_hash')
@@ -0,0 +1,36 @@
+"""Add archive_id to directory for archive member directories
+
+Revision ID: b9d1f3a5c7e8
+Revises: a8c0e2f4b6d7
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d1f3a5c7e8'
+down_revision: Union[str, None] = 'a8c0e2f4b6d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('directory', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('archive_id', sa.Integer(), nullable=True))
+    # 이미 저장된 압축 파일 내부 항목의 디렉토리를 가상 디렉토리로 표시합니다.
+    op.execute(
+        "UPDATE directory SET archive_id = ("
+        "SELECT MIN(file.archive_id) FROM file "
+        "WHERE file.directory_id = directory.id AND file.archive_id IS NOT NULL)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('directory', schema=None) as batch_op:
+        batch_op.drop_column('archive_id')
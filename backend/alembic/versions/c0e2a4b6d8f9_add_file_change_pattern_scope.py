@@ -0,0 +1,35 @@
+"""Add scope columns to filechangepattern
+
+Revision ID: c0e2a4b6d8f9
+Revises: b9d1f3a5c7e8
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0e2a4b6d8f9'
+down_revision: Union[str, None] = 'b9d1f3a5c7e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('filechangepattern', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('scope_extensions', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+        batch_op.add_column(sa.Column('scope_directory', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+        batch_op.add_column(sa.Column('match_filename_only', sa.Boolean(), nullable=False, server_default=sa.false()))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('filechangepattern', schema=None) as batch_op:
+        batch_op.drop_column('match_filename_only')
+        batch_op.drop_column('scope_directory')
+        batch_op.drop_column('scope_extensions')
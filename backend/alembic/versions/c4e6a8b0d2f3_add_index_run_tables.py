@@ -0,0 +1,60 @@
+"""Add index run tables for resumable indexing
+
+Revision ID: c4e6a8b0d2f3
+Revises: b3d5f7a9c1e2
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+import app.domain.custom_types
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e6a8b0d2f3'
+down_revision: Union[str, None] = 'b3d5f7a9c1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('indexrun',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('root_path', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('params', app.domain.custom_types.JsonEncodedDict(), nullable=True),
+    sa.Column('seen_count', sa.Integer(), nullable=False),
+    sa.Column('added_count', sa.Integer(), nullable=False),
+    sa.Column('changed_count', sa.Integer(), nullable=False),
+    sa.Column('committed_batch_count', sa.Integer(), nullable=False),
+    sa.Column('last_committed_path', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_indexrun_root_path'), 'indexrun', ['root_path'], unique=False)
+    op.create_index(op.f('ix_indexrun_status'), 'indexrun', ['status'], unique=False)
+    op.create_table('indexrundirectory',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('index_run_id', sa.Integer(), nullable=False),
+    sa.Column('path', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.ForeignKeyConstraint(['index_run_id'], ['indexrun.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_indexrundirectory_index_run_id'), 'indexrundirectory', ['index_run_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_indexrundirectory_index_run_id'), table_name='indexrundirectory')
+    op.drop_table('indexrundirectory')
+    op.drop_index(op.f('ix_indexrun_status'), table_name='indexrun')
+    op.drop_index(op.f('ix_indexrun_root_path'), table_name='indexrun')
+    op.drop_table('indexrun')
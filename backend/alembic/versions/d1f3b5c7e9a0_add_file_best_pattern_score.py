@@ -0,0 +1,42 @@
+"""Add best_pattern_id and best_field_count to file
+
+Revision ID: d1f3b5c7e9a0
+Revises: c0e2a4b6d8f9
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f3b5c7e9a0'
+down_revision: Union[str, None] = 'c0e2a4b6d8f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('best_pattern_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('best_field_count', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_file_best_pattern_id'), ['best_pattern_id'], unique=False)
+    # 이미 추출된 파일은 저장된 추출 데이터의 패턴과 extracted_info의 키 수로 채웁니다.
+    op.execute(
+        "UPDATE file SET "
+        "best_pattern_id = (SELECT MIN(extracteddata.pattern_id) FROM extracteddata WHERE extracteddata.file_id = file.id), "
+        "best_field_count = (SELECT COUNT(*) FROM json_each(file.extracted_info)) "
+        "WHERE extraction_failed = 0 AND extracted_info IS NOT NULL AND extracted_info != '{}' "
+        "AND EXISTS (SELECT 1 FROM extracteddata WHERE extracteddata.file_id = file.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_file_best_pattern_id'))
+        batch_op.drop_column('best_field_count')
+        batch_op.drop_column('best_pattern_id')
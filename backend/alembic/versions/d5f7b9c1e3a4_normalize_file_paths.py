@@ -0,0 +1,140 @@
+"""Normalize file paths into root and directory tables
+
+Revision ID: d5f7b9c1e3a4
+Revises: c4e6a8b0d2f3
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+import os
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f7b9c1e3a4'
+down_revision: Union[str, None] = 'c4e6a8b0d2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _parent_path(path):
+    parent = os.path.dirname(path)
+    return parent if parent != path else None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('root',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('path', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_root_path'), 'root', ['path'], unique=True)
+    with op.batch_alter_table('directory', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('root_id', sa.Integer(), nullable=True))
+        batch_op.alter_column('mtime_ns', existing_type=sa.Integer(), nullable=True)
+        batch_op.alter_column('last_scanned_at', existing_type=sa.DateTime(), nullable=True)
+        batch_op.create_index(batch_op.f('ix_directory_root_id'), ['root_id'], unique=False)
+        batch_op.create_foreign_key('fk_directory_root_id_root', 'root', ['root_id'], ['id'])
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('directory_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('name', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+    # 기존 파일 경로를 디렉토리 행과 파일 이름으로 옮깁니다.
+    connection = op.get_bind()
+    now = datetime.utcnow()
+    roots = [
+        path for (path,) in connection.execute(
+            sa.text("SELECT path FROM directory WHERE parent_path IS NULL")
+        )
+    ]
+    known = {path for (path,) in connection.execute(sa.text("SELECT path FROM directory"))}
+    missing = {
+        directory for (directory,) in connection.execute(sa.text("SELECT DISTINCT directory FROM file"))
+    } - known
+    if missing:
+        connection.execute(
+            sa.text(
+                "INSERT INTO directory (created_at, updated_at, path, parent_path, mtime_ns, child_count) "
+                "VALUES (:now, :now, :path, :parent_path, NULL, 0)"
+            ),
+            [{"now": now, "path": path, "parent_path": _parent_path(path)} for path in sorted(missing)],
+        )
+    # 시작 경로도 상위 디렉토리 경로를 가지며, 시작 경로 목록은 root 테이블에 기록합니다.
+    for path in roots:
+        connection.execute(
+            sa.text("UPDATE directory SET parent_path = :parent_path WHERE path = :path"),
+            {"path": path, "parent_path": _parent_path(path)},
+        )
+        root_id = connection.execute(
+            sa.text("INSERT INTO root (created_at, updated_at, path) VALUES (:now, :now, :path) RETURNING id"),
+            {"now": now, "path": path},
+        ).scalar_one()
+        connection.execute(
+            sa.text("UPDATE directory SET root_id = :root_id WHERE path = :path OR path LIKE :prefix"),
+            {"root_id": root_id, "path": path, "prefix": path.rstrip(os.sep) + os.sep + "%"},
+        )
+    directory_ids = dict(connection.execute(sa.text("SELECT path, id FROM directory")).all())
+    rows = connection.execute(sa.text("SELECT id, directory, full_path FROM file")).all()
+    if rows:
+        connection.execute(
+            sa.text("UPDATE file SET directory_id = :directory_id, name = :name WHERE id = :id"),
+            [
+                {"id": file_id, "directory_id": directory_ids[directory], "name": os.path.basename(full_path)}
+                for file_id, directory, full_path in rows
+            ],
+        )
+
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.drop_index('ix_file_full_path')
+        batch_op.drop_column('full_path')
+        batch_op.drop_column('directory')
+        batch_op.alter_column('name', existing_type=sqlmodel.sql.sqltypes.AutoString(), nullable=False)
+        batch_op.create_foreign_key('fk_file_directory_id_directory', 'directory', ['directory_id'], ['id'])
+        batch_op.create_unique_constraint('uq_file_directory_id_name', ['directory_id', 'name'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('directory', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+        batch_op.add_column(sa.Column('full_path', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+
+    connection = op.get_bind()
+    paths = dict(connection.execute(sa.text("SELECT id, path FROM directory")).all())
+    rows = connection.execute(sa.text("SELECT id, directory_id, name FROM file")).all()
+    if rows:
+        connection.execute(
+            sa.text("UPDATE file SET directory = :directory, full_path = :full_path WHERE id = :id"),
+            [
+                {"id": file_id, "directory": paths[directory_id], "full_path": os.path.join(paths[directory_id], name)}
+                for file_id, directory_id, name in rows
+            ],
+        )
+    # 시작 경로는 다시 상위 디렉토리가 없는 디렉토리로 표시하고, 목록을 읽지 않은 디렉토리는 삭제합니다.
+    connection.execute(sa.text("UPDATE directory SET parent_path = NULL WHERE path IN (SELECT path FROM root)"))
+
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_file_directory_id_name', type_='unique')
+        batch_op.drop_constraint('fk_file_directory_id_directory', type_='foreignkey')
+        batch_op.drop_column('name')
+        batch_op.drop_column('directory_id')
+        batch_op.alter_column('directory', existing_type=sqlmodel.sql.sqltypes.AutoString(), nullable=False)
+        batch_op.alter_column('full_path', existing_type=sqlmodel.sql.sqltypes.AutoString(), nullable=False)
+        batch_op.create_index('ix_file_full_path', ['full_path'], unique=True)
+
+    connection.execute(sa.text("DELETE FROM directory WHERE mtime_ns IS NULL"))
+    with op.batch_alter_table('directory', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_directory_root_id_root', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_directory_root_id'))
+        batch_op.drop_column('root_id')
+        batch_op.alter_column('last_scanned_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.alter_column('mtime_ns', existing_type=sa.Integer(), nullable=False)
+    op.drop_index(op.f('ix_root_path'), table_name='root')
+    op.drop_table('root')
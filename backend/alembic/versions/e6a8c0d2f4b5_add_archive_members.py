@@ -0,0 +1,36 @@
+"""Add archive member columns to file
+
+Revision ID: e6a8c0d2f4b5
+Revises: d5f7b9c1e3a4
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a8c0d2f4b5'
+down_revision: Union[str, None] = 'd5f7b9c1e3a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('archive_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('archive_members_listed', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.create_index(batch_op.f('ix_file_archive_id'), ['archive_id'], unique=False)
+        batch_op.create_foreign_key('fk_file_archive_id_file', 'file', ['archive_id'], ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_file_archive_id_file', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_file_archive_id'))
+        batch_op.drop_column('archive_members_listed')
+        batch_op.drop_column('archive_id')
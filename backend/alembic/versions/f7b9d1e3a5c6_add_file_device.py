@@ -0,0 +1,32 @@
+"""Add device column and (device, inode) index to file
+
+Revision ID: f7b9d1e3a5c6
+Revises: e6a8c0d2f4b5
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b9d1e3a5c6'
+down_revision: Union[str, None] = 'e6a8c0d2f4b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('device', sa.Integer(), nullable=True))
+        batch_op.create_index('ix_file_device_inode', ['device', 'inode'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('file', schema=None) as batch_op:
+        batch_op.drop_index('ix_file_device_inode')
+        batch_op.drop_column('device')
@@ -25,3 +25,20 @@ class FileOperationException(UseCaseException):
 class FileChangeRequestNotFoundException(UseCaseException):
     """파일 변경 요청을 찾을 수 없을 때 발생하는 예외"""
     pass
+
+class JobNotFoundException(UseCaseException):
+    """백그라운드 작업을 찾을 수 없을 때 발생하는 예외"""
+    pass
+
+class JobCancelledException(UseCaseException):
+    """작업 취소 요청으로 실행을 중단할 때 발생하는 예외"""
+    def __init__(self, message: str = "작업이 취소되었습니다."):
+        super().__init__(message)
+
+class IndexRunNotFoundException(UseCaseException):
+    """인덱싱 실행 기록을 찾을 수 없을 때 발생하는 예외"""
+    pass
+
+class IndexRunNotResumableException(UseCaseException):
+    """이어서 실행하거나 포기할 수 없는 상태의 인덱싱 실행일 때 발생하는 예외"""
+    pass
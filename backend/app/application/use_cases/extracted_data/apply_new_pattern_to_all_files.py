@@ -0,0 +1,57 @@
+from typing import Any, Callable, Dict, List, Optional
+from app.domain.extracted_data.model import ExtractionResult
+from app.domain.extracted_data.repository import ExtractedDataRepository
+from app.domain.file.repository import FileRepository
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.application.use_cases.extracted_data.extract_data_from_file import ExtractDataFromFileUseCase
+
+
+BATCH_SIZE = 500  # 한 번에 처리할 파일 수
+
+
+class ApplyNewPatternToAllFilesUseCase:
+    """새로 추가된 패턴 하나만 모든 파일에 적용합니다.
+
+    파일에 저장된 최고 키 수(best_field_count)보다 많이 추출한 파일만 결과를 바꿉니다.
+    새 패턴은 ID가 가장 크므로 키 수가 같으면 기존 패턴이 유지되며, 전체 재적용과 같은 결과가 됩니다.
+    """
+
+    def __init__(
+        self,
+        file_repository: FileRepository,
+        extracted_data_repository: ExtractedDataRepository,
+        extract_data_from_file_use_case: ExtractDataFromFileUseCase,
+    ):
+        self.file_repository = file_repository
+        self.extracted_data_repository = extracted_data_repository
+        self.extract_data_from_file_use_case = extract_data_from_file_use_case
+
+    def execute(
+        self,
+        pattern: FileChangePattern,
+        progress_callback: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """결과가 바뀐 파일 수를 반환합니다. progress_callback과 checkpoint는 전체 재적용과 같은 형식입니다."""
+        state = checkpoint or {}
+        last_id = state.get("last_id", 0)
+        processed_count = state.get("processed_count", 0)
+        updated_count = state.get("updated_count", 0)
+        for files in self.file_repository.iter_after_id(last_id, BATCH_SIZE):
+            results: List[ExtractionResult] = []
+            for file in files:
+                extracted_values = self.extract_data_from_file_use_case.execute(file, pattern)
+                best_field_count = file.best_field_count if file.best_field_count is not None else -1
+                if extracted_values and len(extracted_values) > best_field_count:
+                    results.append(ExtractionResult(file.id, pattern.id, extracted_values))
+            self.extracted_data_repository.save_extraction_results(results)
+
+            last_id = files[-1].id
+            processed_count += len(files)
+            updated_count += len(results)
+            if progress_callback:
+                progress_callback(
+                    {"processed_count": processed_count, "updated_count": updated_count},
+                    {"last_id": last_id, "processed_count": processed_count, "updated_count": updated_count},
+                )
+        return updated_count
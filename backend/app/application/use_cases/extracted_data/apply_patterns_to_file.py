@@ -1,47 +1,75 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from app.domain.file.model import File
 from app.domain.file.repository import FileRepository  # 추가
 from app.domain.file_change_pattern.model import FileChangePattern
-from app.domain.extracted_data.model import ExtractedData
+from app.domain.extracted_data.model import ExtractedData, ExtractionResult
 from app.domain.extracted_data.repository import ExtractedDataRepository
+from app.domain.file_change_pattern.registry import PatternRegistry, PatternSet, pattern_registry as default_pattern_registry
 from app.application.use_cases.extracted_data.extract_data_from_file import (
     ExtractDataFromFileUseCase,
 )
 
 
+NO_MATCH_REASON = "모든 패턴을 적용했지만 데이터를 추출하지 못했습니다."
+
+
 class ApplyPatternsToFileUseCase:
     def __init__(
         self,
         extracted_data_repository: ExtractedDataRepository,
         extract_data_from_file_use_case: ExtractDataFromFileUseCase,
         file_repository: FileRepository,  # 추가
+        pattern_registry: Optional[PatternRegistry] = None,
     ):
         self.extracted_data_repository = extracted_data_repository
         self.extract_data_from_file_use_case = extract_data_from_file_use_case
         self.file_repository = file_repository  # 추가
+        self.pattern_registry = pattern_registry or default_pattern_registry
+        self._patterns: Optional[List[FileChangePattern]] = None
+        self._pattern_set: Optional[PatternSet] = None
+        self._pattern_set_version = -1
+
+    def _get_pattern_set(self, patterns: List[FileChangePattern]) -> PatternSet:
+        # 같은 패턴 목록으로 여러 파일을 처리하는 동안에는 한 번 만든 PatternSet을 재사용합니다.
+        version = self.pattern_registry.version
+        if patterns is not self._patterns or version != self._pattern_set_version:
+            self._pattern_set = self.pattern_registry.pattern_set(patterns)
+            self._patterns = patterns
+            self._pattern_set_version = version
+        return self._pattern_set
+
+    def _select_best(
+        self, file: File, patterns: List[FileChangePattern]
+    ) -> Tuple[Optional[FileChangePattern], Optional[Dict[str, Any]]]:
+        # 적용 범위에 들고 필수 리터럴이 모두 있는 패턴만, 더 많은 키를 낼 수 있는 동안만 검사합니다.
+        # 선택되는 패턴은 모든 패턴을 순서대로 검사한 결과와 같습니다.
+        position, best_match_data = self._get_pattern_set(patterns).select_best(
+            file, lambda position: self.extract_data_from_file_use_case.execute(file, patterns[position])
+        )
+        return (patterns[position] if position is not None else None), best_match_data
+
+    def execute_batch(self, files: List[File], patterns: List[FileChangePattern]) -> None:
+        """여러 파일에 패턴을 적용하고, 결과를 파일마다 커밋하지 않고 한 트랜잭션으로 저장합니다."""
+        results: List[ExtractionResult] = []
+        for file in files:
+            best_match_pattern, best_match_data = self._select_best(file, patterns)
+            if best_match_data and best_match_pattern:
+                results.append(ExtractionResult(file.id, best_match_pattern.id, best_match_data))
+            else:
+                results.append(ExtractionResult(file.id, None, {}, NO_MATCH_REASON))
+        self.extracted_data_repository.save_extraction_results(results)
 
     def execute(
         self, file: File, patterns: List[FileChangePattern]
     ) -> Optional[ExtractedData]:
-        best_match_data: Optional[Dict[str, Any]] = None
-        best_match_pattern: Optional[FileChangePattern] = None
-        max_extracted_fields = -1
-
         # 파일의 추출 실패 상태 초기화
         file.extraction_failed = False
         file.extraction_failure_reason = None
         file.extracted_info = {} # extracted_info 초기화
+        file.best_pattern_id = None
+        file.best_field_count = None
 
-        for pattern in patterns:
-            extracted_values = self.extract_data_from_file_use_case.execute(
-                file, pattern
-            )
-            if extracted_values is not None:
-                num_fields = len(extracted_values)
-                if num_fields > max_extracted_fields:
-                    max_extracted_fields = num_fields
-                    best_match_data = extracted_values
-                    best_match_pattern = pattern
+        best_match_pattern, best_match_data = self._select_best(file, patterns)
 
         if best_match_data and best_match_pattern:
             # 기존에 추출된 데이터가 있다면 삭제 (새로운 최적의 패턴 적용을 위해)
@@ -53,14 +81,14 @@ class ApplyPatternsToFileUseCase:
                 extracted_values=best_match_data,
             )
             file.extracted_info = best_match_data # extracted_info 업데이트
+            file.best_pattern_id = best_match_pattern.id
+            file.best_field_count = len(best_match_data)
             self.file_repository.save(file)  # 파일 상태 업데이트
             return self.extracted_data_repository.save(extracted_data)
         else:
             # 추출된 데이터가 없는 경우 실패로 기록
             file.extraction_failed = True
-            file.extraction_failure_reason = (
-                "모든 패턴을 적용했지만 데이터를 추출하지 못했습니다."
-            )
+            file.extraction_failure_reason = NO_MATCH_REASON
             file.extracted_info = {} # 추출 실패 시 extracted_info 초기화
             self.file_repository.save(file)  # 파일 상태 업데이트
             return None
@@ -27,7 +27,7 @@ class ApplyPatternsToSpecificFileUseCase:
         if not file:
             raise FileNotFoundException(file_id)
 
-        patterns = self.file_change_pattern_repository.find_all()
+        patterns = self.file_change_pattern_repository.find_all_active()
         if not patterns:
             raise PatternNotFoundException("적용할 패턴이 없습니다.")
 
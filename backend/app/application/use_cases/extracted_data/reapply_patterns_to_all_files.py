@@ -1,3 +1,4 @@
+from typing import Any, Callable, Dict, Optional
 from app.domain.file.repository import FileRepository
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
 from app.application.use_cases.extracted_data.apply_patterns_to_file import (
@@ -19,20 +20,35 @@ class ReapplyPatternsToAllFilesUseCase:
         self.file_change_pattern_repository = file_change_pattern_repository
         self.apply_patterns_to_file_use_case = apply_patterns_to_file_use_case
 
-    def execute(self) -> None:
-        all_patterns = self.file_change_pattern_repository.find_all()
+    def execute(
+        self,
+        progress_callback: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """모든 파일에 모든 패턴을 다시 적용하고 처리한 파일 수를 반환합니다.
+
+        파일은 ID 순으로 처리하며, progress_callback은 배치마다 (진행 상황, 체크포인트)로 호출됩니다.
+        체크포인트에는 마지막으로 처리한 파일 ID가 담기므로, 도중에 파일이 추가되거나
+        삭제되어도 이어서 처리할 때 건너뛰거나 두 번 처리하는 파일이 없습니다.
+        """
+        all_patterns = self.file_change_pattern_repository.find_all_active()
 
         if not all_patterns:
-            return  # 패턴이 없으면 아무것도 하지 않음
-
-        skip = 0
-        while True:
-            files_batch = self.file_repository.find_all(skip=skip, limit=BATCH_SIZE)
-            if not files_batch:
-                break
-
-            for file in files_batch:
-                # 각 파일에 대해 모든 패턴 적용 시도
-                self.apply_patterns_to_file_use_case.execute(file, all_patterns)
-            
-            skip += BATCH_SIZE
+            return 0  # 패턴이 없으면 아무것도 하지 않음
+
+        state = checkpoint or {}
+        last_id = state.get("last_id", 0)
+        processed_count = state.get("processed_count", 0)
+        for files_batch in self.file_repository.iter_after_id(last_id, BATCH_SIZE):
+            # 배치의 모든 파일에 패턴을 적용하고 결과는 한 트랜잭션으로 저장합니다.
+            self.apply_patterns_to_file_use_case.execute_batch(files_batch, all_patterns)
+
+            last_id = files_batch[-1].id
+            processed_count += len(files_batch)
+            if progress_callback:
+                progress_callback(
+                    {"processed_count": processed_count},
+                    {"last_id": last_id, "processed_count": processed_count},
+                )
+
+        return processed_count
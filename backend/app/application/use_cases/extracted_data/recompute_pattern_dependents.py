@@ -0,0 +1,95 @@
+from typing import List, Optional
+from app.domain.extracted_data.model import ExtractionResult
+from app.domain.extracted_data.repository import ExtractedDataRepository
+from app.domain.file.repository import FileRepository
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_pattern.repository import FileChangePatternRepository
+from app.domain.file_change_pattern.registry import PatternRegistry, pattern_registry as default_pattern_registry
+from app.application.use_cases.extracted_data.apply_patterns_to_file import ApplyPatternsToFileUseCase
+from app.application.use_cases.extracted_data.extract_data_from_file import ExtractDataFromFileUseCase
+
+
+BATCH_SIZE = 500  # 한 번에 처리할 파일 수
+
+
+class RecomputePatternDependentsUseCase:
+    """패턴이 수정되거나 삭제되었을 때 영향을 받는 파일만 다시 계산합니다.
+
+    1. find_dependents(): 패턴이 선택된 파일과 그 패턴의 추출 데이터가 있는 파일을 모읍니다.
+    2. 호출한 쪽에서 패턴을 저장하거나 삭제합니다. 실패하면 추출 결과는 바뀌지 않습니다.
+    3. recompute(): 그 패턴의 추출 데이터를 지우고, 모은 파일에는 모든 패턴을 다시 적용합니다.
+       패턴이 남아 있으면(수정), 저장된 최고 결과를 이 패턴이 이길 수 있는 나머지 파일에 이 패턴만 적용합니다.
+
+    나머지 파일은 이 패턴이 선택되지 않았으므로 다른 패턴의 결과가 그대로이고, 전체 재적용과 같은 결과가 됩니다.
+    """
+
+    def __init__(
+        self,
+        file_repository: FileRepository,
+        file_change_pattern_repository: FileChangePatternRepository,
+        extracted_data_repository: ExtractedDataRepository,
+        apply_patterns_to_file_use_case: ApplyPatternsToFileUseCase,
+        extract_data_from_file_use_case: ExtractDataFromFileUseCase,
+        pattern_registry: Optional[PatternRegistry] = None,
+    ):
+        self.file_repository = file_repository
+        self.file_change_pattern_repository = file_change_pattern_repository
+        self.extracted_data_repository = extracted_data_repository
+        self.apply_patterns_to_file_use_case = apply_patterns_to_file_use_case
+        self.extract_data_from_file_use_case = extract_data_from_file_use_case
+        self.pattern_registry = pattern_registry or default_pattern_registry
+
+    def find_dependents(self, pattern_id: int) -> List[int]:
+        """패턴을 수정/삭제하기 전에 호출합니다. 다시 계산할 파일 ID를 반환합니다."""
+        return self.file_repository.find_ids_depending_on_pattern(pattern_id)
+
+    def recompute(self, pattern_id: int, file_ids: List[int]) -> int:
+        """패턴을 수정/삭제한 후 호출합니다. 다시 계산한 파일 수를 반환합니다."""
+        # 삭제된 패턴의 추출 데이터는 패턴과 함께 지워졌으므로, 수정된 패턴의 이전 결과만 남아 있습니다.
+        self.extracted_data_repository.delete_by_pattern_id(pattern_id)
+        patterns = self.file_change_pattern_repository.find_all_active()
+        for start in range(0, len(file_ids), BATCH_SIZE):
+            files = self.file_repository.find_by_ids(file_ids[start:start + BATCH_SIZE])
+            self.apply_patterns_to_file_use_case.execute_batch(files, patterns)
+
+        pattern = next((p for p in patterns if p.id == pattern_id), None)
+        if pattern is None:
+            return len(file_ids)  # 삭제된 패턴
+
+        compiled = self.pattern_registry.get(pattern)
+        recomputed = set(file_ids)
+        candidate_count = 0
+        after_id = 0
+        while True:
+            # 적용 범위 밖의 파일은 DB에서 거르고, 후보는 ID 키셋으로 BATCH_SIZE개씩 읽습니다.
+            batch_ids = self.file_repository.find_ids_beatable_by_pattern(
+                pattern_id, compiled.field_count, after_id, BATCH_SIZE,
+                extensions=compiled.extensions, directory=compiled.directory_prefix,
+            )
+            if not batch_ids:
+                break
+            after_id = batch_ids[-1]
+            candidate_ids = [file_id for file_id in batch_ids if file_id not in recomputed]
+            candidate_count += len(candidate_ids)
+            self._apply_if_better(pattern, candidate_ids)
+            if len(batch_ids) < BATCH_SIZE:
+                break
+        return len(file_ids) + candidate_count
+
+    def _apply_if_better(self, pattern: FileChangePattern, file_ids: List[int]) -> None:
+        """패턴의 결과가 저장된 최고 결과보다 나은 파일만 결과를 바꿉니다."""
+        if not file_ids:
+            return
+        pattern_id = pattern.id
+        results: List[ExtractionResult] = []
+        for file in self.file_repository.find_by_ids(file_ids):
+            extracted_values = self.extract_data_from_file_use_case.execute(file, pattern)
+            if not extracted_values:
+                continue
+            best_field_count = file.best_field_count if file.best_field_count is not None else -1
+            # 키 수가 같으면 ID가 작은(먼저 등록된) 패턴이 선택됩니다.
+            if len(extracted_values) > best_field_count or (
+                len(extracted_values) == best_field_count and pattern_id < file.best_pattern_id
+            ):
+                results.append(ExtractionResult(file.id, pattern_id, extracted_values))
+        self.extracted_data_repository.save_extraction_results(results)
@@ -0,0 +1,110 @@
+from typing import Iterable, List, Set, Tuple
+from app.domain.file.model import File
+from app.domain.file.repository import FileRepository
+from app.domain.exclusion_pattern.repository import ExclusionPatternRepository
+from app.application.use_cases.index_files import IndexFilesUseCase, BATCH_SIZE
+from app.domain.file.discovery import FileDiscovery
+from app.infrastructure.services.index_watcher import FileSystemChanges
+
+
+class ApplyFileSystemChangesUseCase:
+    def __init__(
+        self,
+        file_repository: FileRepository,
+        exclusion_pattern_repository: ExclusionPatternRepository,
+        index_files_use_case: IndexFilesUseCase,
+        file_discovery_service: FileDiscovery,
+    ):
+        self.file_repository = file_repository
+        self.exclusion_pattern_repository = exclusion_pattern_repository
+        self.index_files_use_case = index_files_use_case
+        self.file_discovery_service = file_discovery_service
+
+    def _upsert_in_batches(self, files: Iterable[File]) -> None:
+        batch: List[File] = []
+        for file in files:
+            batch.append(file)
+            if len(batch) >= BATCH_SIZE:
+                self.file_repository.bulk_upsert(batch)
+                batch = []
+        if batch:
+            self.file_repository.bulk_upsert(batch)
+
+    def _move_files(self, moves: List[Tuple[str, File]]) -> List[int]:
+        """(이전 경로, 새 파일) 쌍마다 기존 행의 경로를 바꿔 추출 결과를 유지합니다.
+
+        새 경로에 이미 행이 있으면 경로가 겹치므로 옮기지 않고, 그런 이전 행의 ID를 반환합니다.
+        """
+        stale_ids: List[int] = []
+        for start in range(0, len(moves), BATCH_SIZE):
+            batch = moves[start:start + BATCH_SIZE]
+            old_entries = self.file_repository.find_index_entries_by_paths([old for old, _ in batch])
+            new_entries = self.file_repository.find_index_entries_by_paths([file.full_path for _, file in batch])
+            rows: List[Tuple[int, File]] = []
+            for old_path, file in batch:
+                entry = old_entries.get(old_path)
+                if entry is None or entry.is_deleted:
+                    continue
+                if file.full_path in new_entries:
+                    stale_ids.append(entry.id)
+                else:
+                    rows.append((entry.id, file))
+            self.file_repository.move_files(rows)
+        return stale_ids
+
+    def execute(self, changes: FileSystemChanges) -> None:
+        """감시 중 모인 파일 시스템 변경을 File 테이블에 반영합니다.
+
+        이동한 파일과 디렉토리는 기존 행의 경로만 바꾸므로 추출 결과와 extracted_info가 유지됩니다.
+        """
+        upserted_files: List[File] = []
+        deleted_paths = set(changes.deleted_paths)
+        deleted_directories: Set[str] = set(changes.deleted_directories)
+        deleted_ids: List[int] = []
+
+        moves: List[Tuple[str, File]] = []
+        for old_path, new_path in changes.moved_paths.items():
+            file = self.file_discovery_service.build_file(new_path)
+            if file is None:
+                deleted_paths.add(old_path)
+            else:
+                moves.append((old_path, file))
+        if changes.moved_directories:
+            exclude_patterns = self.exclusion_pattern_repository.find_active_patterns()
+            for old_directory, new_directory in changes.moved_directories.items():
+                for file in self.file_discovery_service.discover(new_directory, exclude_patterns):
+                    moves.append((old_directory + file.full_path[len(new_directory):], file))
+                # 옮겨지지 않고 이전 디렉토리에 남은 행은 사라진 파일입니다.
+                deleted_directories.add(old_directory)
+        deleted_ids.extend(self._move_files(moves))
+        # 옮긴 뒤에도 크기나 수정 시각이 바뀌었을 수 있고, 기존 행이 없던 파일은 새로 저장해야 합니다.
+        upserted_files.extend(file for _, file in moves)
+
+        for path in changes.upserted_paths:
+            # 이벤트 이후 다시 사라진 파일은 삭제로 처리합니다.
+            file = self.file_discovery_service.build_file(path)
+            if file is None:
+                deleted_paths.add(path)
+            else:
+                upserted_files.append(file)
+        self._upsert_in_batches(upserted_files)
+
+        # 새로 생기거나 이동되어 들어온 디렉토리는 하위 파일을 모두 저장합니다.
+        if changes.scanned_directories:
+            exclude_patterns = self.exclusion_pattern_repository.find_active_patterns()
+            for directory in changes.scanned_directories:
+                self._upsert_in_batches(self.file_discovery_service.discover(directory, exclude_patterns))
+
+        deleted_ids.extend(
+            entry.id
+            for entry in self.file_repository.find_index_entries_by_paths(list(deleted_paths)).values()
+            if not entry.is_deleted
+        )
+        for directory in deleted_directories:
+            deleted_ids.extend(self.file_repository.find_active_directories_by_prefix(directory))
+        if deleted_ids:
+            self.file_repository.mark_deleted(sorted(set(deleted_ids)))
+
+        # 이벤트가 유실된 루트는 변경된 디렉토리만 다시 읽는 증분 인덱싱으로 맞춥니다.
+        for root in changes.rescan_roots:
+            self.index_files_use_case.execute(root, incremental=True)
@@ -48,7 +48,9 @@ class ApplyRenameAndCopyUseCase:
         # 3. 관련 파일 정보 가져오기
         file_ids = [ed.file_id for ed in extracted_data_list]
         files = self.file_repository.find_by_ids(file_ids)
-        files_map = {file.id: file for file in files}
+        # 삭제 표시된 파일과 압축 파일 내부 항목(실제 경로가 없음)은 복사 대상에서 제외합니다.
+        files_map = {file.id: file for file in files if file.archive_id is None}
+        extracted_data_list = [ed for ed in extracted_data_list if ed.file_id in files_map]
 
         success_count = 0
         failed_count = 0
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+from app.domain.file.model import File
+from app.domain.file.repository import FileRepository
+
+
+@dataclass
+class DuplicateGroup:
+    content_hash: str
+    size: int
+    files: List[File] = field(default_factory=list)
+
+
+class GetDuplicateFilesUseCase:
+    """전체 내용 해시가 같은 파일 묶음을 낭비되는 용량이 큰 순으로 조회합니다."""
+
+    def __init__(self, file_repository: FileRepository):
+        self.file_repository = file_repository
+
+    def execute(self, page: int = 1, per_page: int = 10) -> Tuple[List[DuplicateGroup], int]:
+        rows = self.file_repository.find_duplicate_groups(skip=(page - 1) * per_page, limit=per_page)
+        groups: Dict[str, DuplicateGroup] = {
+            content_hash: DuplicateGroup(content_hash=content_hash, size=size)
+            for content_hash, size in rows
+        }
+        for file in self.file_repository.find_by_content_hashes(list(groups)):
+            groups[file.content_hash].files.append(file)
+        return list(groups.values()), self.file_repository.count_duplicate_groups()
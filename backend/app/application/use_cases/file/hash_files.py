@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from app.domain.file.repository import FileRepository
+from app.infrastructure.services.file_hash_service import FileHashService
+
+
+BATCH_SIZE = 200  # 한 번에 해시를 계산하고 저장할 파일 수
+
+STAGE_PARTIAL = "partial"
+STAGE_CONTENT = "content"
+
+
+@dataclass
+class HashSummary:
+    partial_hashed_count: int = 0  # 부분 해시를 계산한 파일 수
+    content_hashed_count: int = 0  # 전체 해시를 계산한 파일 수
+    error_count: int = 0  # 읽을 수 없어 건너뛴 파일 수
+
+
+class HashFilesUseCase:
+    """중복 파일을 찾기 위해 파일 내용 해시를 단계적으로 계산합니다.
+
+    1. 크기가 같은 다른 파일이 있는 파일만 앞/뒤 블록의 부분 해시를 계산합니다.
+    2. 크기와 부분 해시가 모두 같은 다른 파일이 있는 파일만 전체 해시를 계산합니다.
+
+    해시가 없는 파일만 대상으로 하므로 새로 추가되었거나 크기/수정 시각이 바뀐 파일만 계산하며,
+    배치마다 저장하므로 중단된 뒤 다시 실행하면 남은 파일부터 이어서 계산합니다.
+    """
+
+    def __init__(self, file_repository: FileRepository, file_hash_service: FileHashService):
+        self.file_repository = file_repository
+        self.file_hash_service = file_hash_service
+
+    def execute(
+        self,
+        progress_callback: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+    ) -> HashSummary:
+        """progress_callback은 배치마다 (진행 상황, 체크포인트)로 호출되며,
+        checkpoint가 주어지면 해당 단계와 위치부터 이어서 계산합니다.
+        """
+        checkpoint = checkpoint or {}
+        summary = HashSummary(
+            partial_hashed_count=checkpoint.get("partial_hashed_count", 0),
+            content_hashed_count=checkpoint.get("content_hashed_count", 0),
+            error_count=checkpoint.get("error_count", 0),
+        )
+        stages = [STAGE_PARTIAL, STAGE_CONTENT]
+        start_stage = checkpoint.get("stage", STAGE_PARTIAL)
+        for stage in stages[stages.index(start_stage):]:
+            after_id = checkpoint.get("after_id", 0) if stage == start_stage else 0
+            self._run_stage(stage, after_id, summary, progress_callback)
+        return summary
+
+    def _run_stage(
+        self,
+        stage: str,
+        after_id: int,
+        summary: HashSummary,
+        progress_callback: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]],
+    ) -> None:
+        if stage == STAGE_PARTIAL:
+            find_candidates = self.file_repository.find_partial_hash_candidates
+        else:
+            find_candidates = self.file_repository.find_content_hash_candidates
+
+        while True:
+            # 읽지 못한 파일은 해시가 비어 있으므로 ID 기준으로 다음 위치부터 조회합니다.
+            entries = find_candidates(after_id, BATCH_SIZE)
+            if not entries:
+                break
+
+            partial_hashes: Dict[int, str] = {}
+            content_hashes: Dict[int, str] = {}
+            for entry, value in self.file_hash_service.hash_files(entries, full=stage == STAGE_CONTENT):
+                if value is None:
+                    summary.error_count += 1
+                elif stage == STAGE_CONTENT:
+                    content_hashes[entry.id] = value
+                else:
+                    partial_hashes[entry.id] = value
+                    # 작은 파일은 부분 해시가 파일 전체를 읽은 결과이므로 전체 해시로도 사용합니다.
+                    if self.file_hash_service.covers_whole_file(entry.size):
+                        content_hashes[entry.id] = value
+            self.file_repository.save_hashes(partial_hashes, content_hashes)
+
+            summary.partial_hashed_count += len(partial_hashes)
+            summary.content_hashed_count += len(content_hashes)
+            after_id = entries[-1].id
+            if progress_callback:
+                progress_callback(
+                    {"stage": stage, **vars(summary)},
+                    {"stage": stage, "after_id": after_id, **vars(summary)},
+                )
+
+            if len(entries) < BATCH_SIZE:
+                break
@@ -1,11 +1,13 @@
-from typing import List
+from typing import Any, Callable, Dict, List, Optional
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
 from app.domain.file.repository import FileRepository
 from app.domain.extracted_data.repository import ExtractedDataRepository
 from app.domain.file_change_pattern.model import FileChangePattern
 from app.domain.file.model import File
-from app.domain.extracted_data.model import ExtractedData
+from app.domain.extracted_data.model import ExtractionResult
+from app.domain.file_change_pattern.registry import PatternRegistry, PatternSet, pattern_registry as default_pattern_registry
 from app.application.use_cases.extracted_data.extract_data_from_file import ExtractDataFromFileUseCase
+from app.application.use_cases.extracted_data.apply_patterns_to_file import NO_MATCH_REASON
 
 class ApplySavedPatternUseCase:
     def __init__(
@@ -14,13 +16,24 @@ class ApplySavedPatternUseCase:
         file_repository: FileRepository,
         extracted_data_repository: ExtractedDataRepository,
         extract_data_from_file_use_case: ExtractDataFromFileUseCase, # 추가
+        pattern_registry: Optional[PatternRegistry] = None,
     ):
         self.file_change_pattern_repository = file_change_pattern_repository
         self.file_repository = file_repository
         self.extracted_data_repository = extracted_data_repository
         self.extract_data_from_file_use_case = extract_data_from_file_use_case # 추가
+        self.pattern_registry = pattern_registry or default_pattern_registry
 
-    def execute(self, pattern_ids: List[int], file_ids: List[int]):
+    def execute(
+        self,
+        pattern_ids: List[int],
+        file_ids: List[int],
+        progress_callback: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+    ):
+        """progress_callback은 전체 파일 적용 시 배치마다 (진행 상황, 체크포인트)로 호출되며,
+        checkpoint가 주어지면 해당 위치부터 이어서 처리합니다.
+        """
         patterns = self.file_change_pattern_repository.find_by_ids(pattern_ids)
         
         from app.application.exceptions import PatternNotFoundException
@@ -28,60 +41,42 @@ class ApplySavedPatternUseCase:
         if not patterns:
             raise PatternNotFoundException()
 
+        # 파일의 확장자/디렉토리와 필수 리터럴로 검사할 패턴을 고르는 구조는 한 번만 만듭니다.
+        pattern_set = self.pattern_registry.pattern_set(patterns)
+
         if file_ids == ['all']:
             BATCH_SIZE = 100
-            skip = 0
-            while True:
-                files = self.file_repository.find_all(skip=skip, limit=BATCH_SIZE)
-                if not files:
-                    break
+            # 마지막으로 처리한 ID 다음부터 ID 순으로 읽으므로, 도중에 파일이 바뀌어도 위치가 어긋나지 않습니다.
+            state = checkpoint or {}
+            last_id = state.get("last_id", 0)
+            processed_count = state.get("processed_count", 0)
+            for files in self.file_repository.iter_after_id(last_id, BATCH_SIZE):
+                self._process_files(files, patterns, pattern_set)
                 
-                self._process_files(files, patterns)
-                
-                skip += BATCH_SIZE
+                last_id = files[-1].id
+                processed_count += len(files)
+                if progress_callback:
+                    progress_callback(
+                        {"processed_count": processed_count},
+                        {"last_id": last_id, "processed_count": processed_count},
+                    )
         else:
             files = self.file_repository.find_by_ids(file_ids)
-            self._process_files(files, patterns)
+            self._process_files(files, patterns, pattern_set)
 
-    def _process_files(self, files: List[File], patterns: List[FileChangePattern]):
+    def _process_files(self, files: List[File], patterns: List[FileChangePattern], pattern_set: PatternSet):
+        results: List[ExtractionResult] = []
         for file in files:
-            best_pattern = None
-            max_extracted_fields = -1
-            best_extracted_values = None
-
-            for pattern in patterns:
-                extracted_values = self.extract_data_from_file_use_case.execute(file, pattern)
-                if extracted_values is not None:
-                    num_fields = len(extracted_values)
-                    if num_fields > max_extracted_fields:
-                        max_extracted_fields = num_fields
-                        best_pattern = pattern
-                        best_extracted_values = extracted_values
+            position, best_extracted_values = pattern_set.select_best(
+                file, lambda position: self.extract_data_from_file_use_case.execute(file, patterns[position])
+            )
+            best_pattern = patterns[position] if position is not None else None
 
             if best_pattern and best_extracted_values:
-                try:
-                    # 기존 데이터 삭제
-                    self.extracted_data_repository.delete_by_file_id_and_pattern_id(file.id, best_pattern.id)
-
-                    new_data = ExtractedData(
-                        file_id=file.id,
-                        pattern_id=best_pattern.id,
-                        extracted_values=best_extracted_values
-                    )
-                    self.extracted_data_repository.save(new_data)
-
-                    # file.extracted_info 업데이트 및 저장
-                    file.extracted_info = best_extracted_values
-                    self.file_repository.save(file)
-
-                except Exception as e:
-                    print(f"Error applying best pattern for file {file.full_path}: {e}")
-                    continue
+                results.append(ExtractionResult(file.id, best_pattern.id, best_extracted_values))
             else:
-                # 추출된 데이터가 없는 경우 실패로 기록 (선택적)
-                file.extraction_failed = True
-                file.extraction_failure_reason = "모든 패턴을 적용했지만 데이터를 추출하지 못했습니다."
-                file.extracted_info = {} # 추출 실패 시 extracted_info 초기화
-                self.file_repository.save(file)
-
+                # 추출된 데이터가 없는 경우 실패로 기록 (extracted_info 초기화)
+                results.append(ExtractionResult(file.id, None, {}, NO_MATCH_REASON))
 
+        # 배치의 결과를 한 트랜잭션으로 저장합니다. 선택한 패턴의 기존 데이터만 교체합니다.
+        self.extracted_data_repository.save_extraction_results(results, replace_all_patterns=False)
@@ -1,34 +1,67 @@
+from typing import Optional
 from app.domain.file_change_pattern.model import FileChangePattern
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
-from app.application.use_cases.extracted_data.reapply_patterns_to_all_files import ReapplyPatternsToAllFilesUseCase
+from app.application.use_cases.extracted_data.recompute_pattern_dependents import RecomputePatternDependentsUseCase
+from app.application.use_cases.extracted_data.apply_new_pattern_to_all_files import ApplyNewPatternToAllFilesUseCase
 
 class ConfirmFileChangePatternUseCase:
     def __init__(
         self,
         repository: FileChangePatternRepository,
-        reapply_use_case: ReapplyPatternsToAllFilesUseCase,
+        recompute_use_case: RecomputePatternDependentsUseCase,
+        apply_new_pattern_use_case: ApplyNewPatternToAllFilesUseCase,
     ):
         self.repository = repository
-        self.reapply_use_case = reapply_use_case
+        self.recompute_use_case = recompute_use_case
+        self.apply_new_pattern_use_case = apply_new_pattern_use_case
 
-    def execute(self, name: str, regex_pattern: str, replacement_format: str) -> FileChangePattern:
+    def execute(
+        self,
+        name: str,
+        regex_pattern: str,
+        replacement_format: str,
+        scope_extensions: Optional[str] = None,
+        scope_directory: Optional[str] = None,
+        match_filename_only: bool = False,
+    ) -> FileChangePattern:
         # 기존 패턴이 있는지 확인 (이름으로)
         existing_pattern = self.repository.find_by_name(name)
         if existing_pattern:
             # 기존 패턴이 있다면 업데이트
+            previous = (
+                existing_pattern.regex_pattern, existing_pattern.replacement_format,
+                existing_pattern.scope_extensions, existing_pattern.scope_directory,
+                existing_pattern.match_filename_only,
+            )
             existing_pattern.regex_pattern = regex_pattern
             existing_pattern.replacement_format = replacement_format
+            existing_pattern.scope_extensions = scope_extensions or None
+            existing_pattern.scope_directory = scope_directory or None
+            existing_pattern.match_filename_only = match_filename_only
             existing_pattern.is_confirmed = True
+            current = (
+                existing_pattern.regex_pattern, existing_pattern.replacement_format,
+                existing_pattern.scope_extensions, existing_pattern.scope_directory,
+                existing_pattern.match_filename_only,
+            )
+            if current == previous:
+                return self.repository.save(existing_pattern)  # 확인 여부만 바뀌면 추출 결과는 그대로입니다.
+            # 기존 패턴에 의존하는 파일과, 바뀐 패턴이 새로 이길 수 있는 파일만 다시 계산합니다.
+            file_ids = self.recompute_use_case.find_dependents(existing_pattern.id)
             saved_pattern = self.repository.save(existing_pattern)
+            self.recompute_use_case.recompute(saved_pattern.id, file_ids)
         else:
             # 새로운 패턴이라면 생성
             pattern = FileChangePattern(
                 name=name,
                 regex_pattern=regex_pattern,
                 replacement_format=replacement_format,
+                scope_extensions=scope_extensions or None,
+                scope_directory=scope_directory or None,
+                match_filename_only=match_filename_only,
                 is_confirmed=True
             )
             saved_pattern = self.repository.save(pattern)
-        
-        self.reapply_use_case.execute() # 새로운 패턴 추가/업데이트 후 전체 파일에 재적용
+            # 새 패턴만 전체 파일에 적용하고, 더 많이 추출한 파일만 결과를 바꿉니다.
+            self.apply_new_pattern_use_case.execute(saved_pattern)
         return saved_pattern
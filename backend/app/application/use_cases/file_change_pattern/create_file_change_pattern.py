@@ -17,7 +17,14 @@ class CreateFileChangePatternUseCase:
         self.extract_data_from_file_use_case = extract_data_from_file_use_case
 
     def execute(
-        self, name: str, regex_pattern: str, replacement_format: str, file_ids: List[int]
+        self,
+        name: str,
+        regex_pattern: str,
+        replacement_format: str,
+        file_ids: List[int],
+        scope_extensions: Optional[str] = None,
+        scope_directory: Optional[str] = None,
+        match_filename_only: bool = False,
     ) -> Dict[int, Optional[Dict[str, Any]]]:
         results: Dict[int, Optional[Dict[str, Any]]] = {}
 
@@ -26,6 +33,9 @@ class CreateFileChangePatternUseCase:
             name=name,
             regex_pattern=regex_pattern,
             replacement_format=replacement_format,
+            scope_extensions=scope_extensions or None,
+            scope_directory=scope_directory or None,
+            match_filename_only=match_filename_only,
             is_confirmed=False # 테스트용이므로 False
         )
 
@@ -1,8 +1,17 @@
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
+from app.application.use_cases.extracted_data.recompute_pattern_dependents import RecomputePatternDependentsUseCase
 
 class DeleteFileChangePatternUseCase:
-    def __init__(self, repository: FileChangePatternRepository):
+    def __init__(
+        self,
+        repository: FileChangePatternRepository,
+        recompute_use_case: RecomputePatternDependentsUseCase,
+    ):
         self.repository = repository
+        self.recompute_use_case = recompute_use_case
 
     def execute(self, pattern_id: int) -> None:
+        # 패턴은 추출 데이터와 함께 삭제되고, 이 패턴이 선택되었던 파일만 남은 패턴으로 다시 계산합니다.
+        file_ids = self.recompute_use_case.find_dependents(pattern_id)
         self.repository.delete(pattern_id)
+        self.recompute_use_case.recompute(pattern_id, file_ids)
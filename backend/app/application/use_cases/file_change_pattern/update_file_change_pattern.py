@@ -1,8 +1,8 @@
 from typing import Optional
 from app.domain.file_change_pattern.model import FileChangePattern
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
-from app.application.use_cases.extracted_data.reapply_patterns_to_all_files import (
-    ReapplyPatternsToAllFilesUseCase,
+from app.application.use_cases.extracted_data.recompute_pattern_dependents import (
+    RecomputePatternDependentsUseCase,
 )
 from app.application.exceptions import PatternNotFoundException
 
@@ -11,10 +11,10 @@ class UpdateFileChangePatternUseCase:
     def __init__(
         self,
         repository: FileChangePatternRepository,
-        reapply_use_case: ReapplyPatternsToAllFilesUseCase,
+        recompute_use_case: RecomputePatternDependentsUseCase,
     ):
         self.repository = repository
-        self.reapply_use_case = reapply_use_case
+        self.recompute_use_case = recompute_use_case
 
     def execute(
         self,
@@ -22,10 +22,17 @@ class UpdateFileChangePatternUseCase:
         name: Optional[str] = None,
         regex_pattern: Optional[str] = None,
         replacement_format: Optional[str] = None,
+        scope_extensions: Optional[str] = None,
+        scope_directory: Optional[str] = None,
+        match_filename_only: Optional[bool] = None,
     ) -> FileChangePattern:
         pattern = self.repository.find_by_id(pattern_id)
         if not pattern:
             raise PatternNotFoundException(f"패턴을 찾을 수 없습니다: {pattern_id}")
+        previous = (
+            pattern.regex_pattern, pattern.replacement_format,
+            pattern.scope_extensions, pattern.scope_directory, pattern.match_filename_only,
+        )
 
         if name:
             pattern.name = name
@@ -33,7 +40,24 @@ class UpdateFileChangePatternUseCase:
             pattern.regex_pattern = regex_pattern
         if replacement_format:
             pattern.replacement_format = replacement_format
+        # 적용 범위는 None이면 유지하고, 빈 문자열이면 제한을 해제합니다.
+        if scope_extensions is not None:
+            pattern.scope_extensions = scope_extensions or None
+        if scope_directory is not None:
+            pattern.scope_directory = scope_directory or None
+        if match_filename_only is not None:
+            pattern.match_filename_only = match_filename_only
 
+        current = (
+            pattern.regex_pattern, pattern.replacement_format,
+            pattern.scope_extensions, pattern.scope_directory, pattern.match_filename_only,
+        )
+        if current == previous:
+            return self.repository.save(pattern)  # 이름만 바뀌면 추출 결과는 그대로입니다.
+
+        # 이 패턴에 의존하는 파일과, 수정된 패턴이 새로 이길 수 있는 파일만 다시 계산합니다.
+        # 패턴을 먼저 저장하므로 저장에 실패하면(예: 이름 중복) 기존 추출 결과가 그대로 남습니다.
+        file_ids = self.recompute_use_case.find_dependents(pattern_id)
         updated_pattern = self.repository.save(pattern)
-        self.reapply_use_case.execute()  # 패턴 업데이트 후 전체 파일에 재적용
+        self.recompute_use_case.recompute(pattern_id, file_ids)
         return updated_pattern
@@ -1,5 +1,5 @@
 
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Optional
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
 from app.domain.file.repository import FileRepository
 from app.domain.file_change_request.repository import FileChangeRequestRepository
@@ -8,6 +8,8 @@ from app.domain.file_change_request.file_change_request_target_model import File
 from app.infrastructure.services.file_operation_service import FileOperationService
 from app.application.exceptions import PatternNotFoundException, FileOperationException
 
+CHUNK_SIZE = 100  # 진행 상황을 기록할 복사 단위
+
 class CreateFileChangeRequestUseCase:
     def __init__(
         self, 
@@ -25,47 +27,89 @@ class CreateFileChangeRequestUseCase:
         self, 
         file_change_pattern_id: int, 
         rename_pattern_string: str, 
-        destination_path: str
+        destination_path: str,
+        progress_callback: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
     ) -> FileChangeRequest:
+        """파일을 CHUNK_SIZE 단위로 복사하며, progress_callback에 (진행 상황, 체크포인트)를 전달합니다.
+
+        변경 요청은 처음에 진행 중 상태로 저장하고, 청크마다 대상과 건수를 바로 기록합니다.
+        체크포인트에는 요청 ID, 마지막으로 처리한 파일 ID, 건수만 담기므로 파일 수와 관계없이 크기가 일정합니다.
+        checkpoint가 주어지면 last_id 다음 파일부터 ID 순으로 조회해 같은 요청에 이어서 기록하므로,
+        중단된 동안 파일이 추가되거나 삭제되어도 건너뛰거나 두 번 복사하는 파일이 없습니다.
+        """
         pattern = self.file_change_pattern_repository.find_by_id(file_change_pattern_id)
         if not pattern:
             raise PatternNotFoundException(f"Pattern with id {file_change_pattern_id} not found")
 
-        files = self.file_repository.find_by_pattern_id(file_change_pattern_id)
-        
-        success_count = 0
-        failed_count = 0
-        details = []
-        targets = []
+        state = checkpoint or {}
+        request = None
+        if state.get("request_id") is not None:
+            request = self.file_change_request_repository.find_by_id(state["request_id"])
+        if request is None:
+            request = self.file_change_request_repository.save(
+                FileChangeRequest(
+                    file_change_pattern_id=file_change_pattern_id,
+                    rename_pattern_string=rename_pattern_string,
+                    destination_path=destination_path,
+                    status="in_progress",
+                    success_count=0,
+                    failed_count=0,
+                    details="",
+                )
+            )
+            state = {}
+
+        last_id = state.get("last_id", 0)
+        processed_count = state.get("processed_count", 0)
+        total_count = self.file_repository.count_by_pattern_id(file_change_pattern_id) if progress_callback else 0
 
-        if files:
+        while True:
+            chunk = self.file_repository.find_by_pattern_id_after_id(file_change_pattern_id, last_id, CHUNK_SIZE)
+            if not chunk:
+                break
             try:
-                success_count, failed_count, details, copied_files_info = self.file_operation_service.rename_and_copy_files_with_details(
-                    files=files,
+                chunk_success, chunk_failed, chunk_details, chunk_info = self.file_operation_service.rename_and_copy_files_with_details(
+                    files=chunk,
                     rename_pattern_string=rename_pattern_string,
                     destination_path=destination_path
                 )
-                
-                for info in copied_files_info:
-                    targets.append(FileChangeRequestTarget(
+            except Exception as e:
+                chunk_success, chunk_failed, chunk_details, chunk_info = 0, len(chunk), [f"Failed to rename and copy files: {e}"], []
+
+            request.success_count += chunk_success
+            request.failed_count += chunk_failed
+            if chunk_details:
+                request.details = ", ".join(([request.details] if request.details else []) + list(chunk_details))
+            request = self.file_change_request_repository.add_targets(
+                request,
+                [
+                    FileChangeRequestTarget(
                         original_file_id=info['original_file_id'],
                         new_filename=info['new_filename'],
                         status=info['status'],
                         message=info['message']
-                    ))
+                    )
+                    for info in chunk_info
+                ],
+            )
 
-            except Exception as e:
-                failed_count = len(files)
-                details = [f"Failed to rename and copy files: {e}"]
-
-        request = FileChangeRequest(
-            file_change_pattern_id=file_change_pattern_id,
-            rename_pattern_string=rename_pattern_string,
-            destination_path=destination_path,
-            success_count=success_count,
-            failed_count=failed_count,
-            details=", ".join(details),
-            targets=targets
-        )
+            last_id = chunk[-1].id
+            processed_count += len(chunk)
+            if progress_callback:
+                progress_callback(
+                    {"processed_count": processed_count, "total_count": total_count},
+                    {
+                        "request_id": request.id,
+                        "last_id": last_id,
+                        "processed_count": processed_count,
+                        "success_count": request.success_count,
+                        "failed_count": request.failed_count,
+                    },
+                )
+            # 마지막 청크이면 빈 청크를 다시 조회하지 않습니다.
+            if len(chunk) < CHUNK_SIZE:
+                break
 
+        request.status = "completed"
         return self.file_change_request_repository.save(request)
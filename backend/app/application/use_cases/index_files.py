@@ -1,96 +1,652 @@
+import hashlib
+import json
 import os
-import fnmatch
-from typing import List, Optional
-import unicodedata
-from app.domain.file.model import File
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from app.domain.file.model import File, FileMoveCandidate
 from app.domain.file.repository import FileRepository
+from app.domain.file.discovery import DiscoveryState, FileDiscovery
+from app.domain.directory.model import Directory, parent_directory_path
+from app.domain.directory.repository import DirectoryRepository
 from app.domain.exclusion_pattern.repository import ExclusionPatternRepository
+from app.domain.index_run.model import (
+    IndexRun,
+    INDEX_RUN_STATUS_RUNNING,
+    INDEX_RUN_STATUS_COMPLETED,
+    INCOMPLETE_INDEX_RUN_STATUSES,
+)
+from app.domain.index_run.repository import IndexRunRepository
+from app.domain.exclusion_pattern.matcher import ExclusionMatcher
+from app.application.exceptions import IndexRunNotFoundException, IndexRunNotResumableException
 
 BATCH_SIZE = 500  # 한 번에 처리할 파일 수
+PIPELINE_DEPTH = 4  # 탐색 스레드가 저장을 기다리지 않고 미리 만들어 둘 수 있는 배치 수
+
+
+@dataclass
+class IndexSummary:
+    """인덱싱 실행 결과"""
+    saved_files: List[File] = field(default_factory=list) # 새로 저장된 파일
+    added_count: int = 0
+    changed_count: int = 0
+    removed_count: int = 0
+    moved_count: int = 0 # 경로만 바뀐 것으로 판단하여 기존 행을 옮긴 파일 수
+    moved_files: List[Tuple[str, str]] = field(default_factory=list) # 이동한 파일의 (이전 경로, 새 경로)
+    listed_directory_count: int = 0 # 목록을 새로 읽은 디렉토리 수
+    skipped_directory_count: int = 0 # 수정 시각이 같아 건너뛴 디렉토리 수
+    seen_count: int = 0 # 탐색에서 발견한 파일 수
+    excluded_count: int = 0 # 제외 패턴으로 건너뛴 파일 및 디렉토리 수
+    error_count: int = 0 # 접근할 수 없어 건너뛴 파일 및 디렉토리 수
+    index_run_id: Optional[int] = None # 체크포인트가 기록된 인덱싱 실행 ID
+    # 단계별 처리 시간. 탐색 대기 시간이 길면 저장이, 저장 대기 시간이 길면 탐색이 병목입니다.
+    discovery_seconds: float = 0.0 # 탐색 스레드가 파일을 찾는 데 쓴 시간
+    discovery_blocked_seconds: float = 0.0 # 큐가 가득 차서 탐색 스레드가 저장을 기다린 시간
+    write_seconds: float = 0.0 # 배치를 DB에 저장하는 데 쓴 시간
+    write_idle_seconds: float = 0.0 # 큐가 비어서 저장 단계가 탐색을 기다린 시간
+    discovery_files_per_second: float = 0.0
+    write_files_per_second: float = 0.0
+    archive_count: int = 0 # 내부 항목 목록을 읽은 압축 파일 수
+    archive_member_count: int = 0 # 저장한 압축 파일 내부 항목 수
+
+
+@dataclass
+class IndexProgress:
+    """배치를 저장할 때마다 보고되는 인덱싱 진행 상황"""
+    seen_count: int
+    added_count: int
+    changed_count: int
+    excluded_count: int
+    error_count: int
+    current_directory: Optional[str]
+    index_run_id: Optional[int] = None
+
+
+@dataclass
+class _DiscoveredBatch:
+    """탐색 스레드가 저장 단계로 넘기는 배치와, 배치를 만든 시점의 탐색 상태"""
+    files: List[File]
+    completed_directories: List[str] # 이 배치까지 파일을 모두 전달한 디렉토리
+    current_directory: Optional[str]
+    excluded_count: int
+    error_count: int
+
+
+_DISCOVERY_DONE = object()
+
+
+def scan_fingerprint(exclude_patterns: List[str], index_archives: bool) -> str:
+    """디렉토리 목록 결과에 영향을 주는 탐색 옵션의 지문을 반환합니다."""
+    options = {"exclude_patterns": sorted(set(exclude_patterns)), "index_archives": index_archives}
+    return hashlib.sha1(json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()
+
 
 class IndexFilesUseCase:
-    def __init__(self, file_repository: FileRepository, exclusion_pattern_repository: ExclusionPatternRepository):
+    def __init__(
+        self,
+        file_repository: FileRepository,
+        exclusion_pattern_repository: ExclusionPatternRepository,
+        file_discovery_service: FileDiscovery,
+        directory_repository: Optional[DirectoryRepository] = None,
+        index_run_repository: Optional[IndexRunRepository] = None,
+        pipeline_depth: int = PIPELINE_DEPTH,
+    ):
         self.file_repository = file_repository
         self.exclusion_pattern_repository = exclusion_pattern_repository
+        self.directory_repository = directory_repository
+        self.file_discovery_service = file_discovery_service
+        # 주어지면 배치를 저장할 때마다 체크포인트를 기록하여 중단된 실행을 이어서 할 수 있게 합니다.
+        self.index_run_repository = index_run_repository
+        self.pipeline_depth = max(1, pipeline_depth)
 
-    def _discover_files_generator(self, directory_path: str, exclude_patterns: Optional[List[str]] = None):
+    def _discover_files_generator(
+        self,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        state: Optional[DiscoveryState] = None,
+    ):
         """지정된 디렉토리에서 파일을 탐색하고 File 객체를 생성하는 제너레이터입니다."""
-        if exclude_patterns is None:
-            exclude_patterns = []
-
-        for root, _, filenames in os.walk(directory_path):
-            for filename in filenames:
-                full_path = os.path.join(root, filename)
-                
-                # 제외 패턴에 일치하는지 확인
-                if any(fnmatch.fnmatch(full_path, pattern) for pattern in exclude_patterns):
-                    continue
+        return self.file_discovery_service.discover(directory_path, exclude_patterns, state)
 
-                try:
-                    file_size = os.path.getsize(full_path)
-                    base_name, extension = os.path.splitext(filename)
-                    # 확장자에서 선행하는 점(.) 제거
-                    if extension.startswith('.'):
-                        extension = extension[1:]
-                    directory = os.path.dirname(full_path)
-                    
-                    base_name = unicodedata.normalize("NFC", base_name)
-                    extension = unicodedata.normalize("NFC", extension)
-                    full_path = unicodedata.normalize("NFC", full_path)
-                    
-                    yield File(
-                        filename=base_name,
-                        extension=extension,
-                        directory=directory,
-                        full_path=full_path,
-                        size=file_size,
-                    )
-                except OSError:
-                    # 접근할 수 없는 파일은 건너뜁니다.
-                    continue
+    def _discover_batches(
+        self,
+        discover: Callable[[], Iterator[File]],
+        state: DiscoveryState,
+        summary: IndexSummary,
+    ) -> Iterator[_DiscoveredBatch]:
+        """별도 스레드에서 discover()가 생성하는 파일을 배치 단위로 생성합니다.
 
-    def _process_batch(self, batch_files: List[File]) -> List[File]:
-        """파일 배치를 처리하여 중복되지 않은 새 파일만 DB에 저장합니다."""
-        batch_paths = {file.full_path for file in batch_files}
+        탐색 스레드와 DB 저장(호출한 스레드)은 크기가 pipeline_depth인 큐로 연결되어,
+        한 배치를 저장하는 동안 다음 배치의 stat이 진행됩니다. 저장이 밀려 큐가 가득 차면
+        탐색 스레드가 기다립니다. DB 세션은 호출한 스레드에서만 사용합니다.
+        탐색 상태(state)는 탐색 스레드가 끝난 뒤에만 읽어야 합니다.
+        """
+        batches: "queue.Queue[object]" = queue.Queue(maxsize=self.pipeline_depth)
+        stopped = threading.Event()
 
-        # DB에서 이미 존재하는 파일 경로 조회
-        existing_files = self.file_repository.find_by_paths(list(batch_paths))
-        existing_paths = {file.full_path for file in existing_files}
+        def put(item: object) -> bool:
+            started = time.perf_counter()
+            try:
+                while not stopped.is_set():
+                    try:
+                        batches.put(item, timeout=0.1)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
+            finally:
+                summary.discovery_blocked_seconds += time.perf_counter() - started
 
-        # 중복되지 않은 파일만 필터링
-        new_files_in_batch = [
-            file for file in batch_files if file.full_path not in existing_paths
+        def make_batch(files: List[File]) -> _DiscoveredBatch:
+            completed, state.completed_directories = state.completed_directories, []
+            return _DiscoveredBatch(
+                files=files,
+                completed_directories=completed,
+                current_directory=state.current_directory,
+                excluded_count=state.excluded_count,
+                error_count=state.error_count,
+            )
+
+        def produce() -> None:
+            started = time.perf_counter()
+            discovered = None
+            try:
+                discovered = discover()
+                batch = []
+                for file_obj in discovered:
+                    if stopped.is_set():
+                        return
+                    batch.append(file_obj)
+                    if len(batch) >= BATCH_SIZE:
+                        if not put(make_batch(batch)):
+                            return
+                        batch = []
+                # 마지막 남은 배치 처리
+                if batch and not put(make_batch(batch)):
+                    return
+                put(_DISCOVERY_DONE)
+            except BaseException as e:
+                put(e)
+            finally:
+                if discovered is not None:
+                    discovered.close()
+                summary.discovery_seconds = (
+                    time.perf_counter() - started - summary.discovery_blocked_seconds
+                )
+
+        producer = threading.Thread(target=produce, name="index-discovery", daemon=True)
+        producer.start()
+        try:
+            while True:
+                started = time.perf_counter()
+                item = batches.get()
+                summary.write_idle_seconds += time.perf_counter() - started
+                if item is _DISCOVERY_DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # 소비자가 중간에 멈춘 경우에도 탐색 스레드가 종료되도록 합니다.
+            stopped.set()
+            producer.join()
+
+    def _load_discovery_state(
+        self, directory_path: str, force_full_scan: bool, fingerprint: Optional[str] = None
+    ) -> DiscoveryState:
+        """지난 인덱싱에서 기록한 디렉토리 수정 시각으로 탐색 상태를 구성합니다.
+
+        디렉토리를 마지막으로 읽은 인덱싱의 탐색 옵션 지문이 fingerprint와 다르면
+        (제외 패턴이나 압축 파일 인덱싱 여부가 바뀐 경우) 수정 시각이 같아도 다시 읽습니다.
+        """
+        if self.directory_repository is None or force_full_scan:
+            # 모든 디렉토리를 다시 읽지만, 디렉토리 기록은 갱신합니다.
+            return DiscoveryState()
+
+        root_fingerprints = {root.id: root.scan_fingerprint for root in self.directory_repository.find_roots()}
+        known_directories: Dict[str, int] = {}
+        known_children: Dict[str, List[str]] = defaultdict(list)
+        for directory in self.directory_repository.find_by_prefix(directory_path):
+            # 수정 시각이 없는 디렉토리는 파일 저장 시 만들어졌거나 사라진 디렉토리이므로 다시 읽습니다.
+            if directory.mtime_ns is not None and root_fingerprints.get(directory.root_id) == fingerprint:
+                known_directories[directory.path] = directory.mtime_ns
+            if directory.parent_path is not None:
+                known_children[directory.parent_path].append(directory.path)
+        return DiscoveryState(known_directories, known_children)
+
+    def _save_discovery_state(
+        self, directory_path: str, state: DiscoveryState, fingerprint: Optional[str] = None
+    ) -> None:
+        """목록을 새로 읽은 디렉토리를 기록하고, 사라진 디렉토리는 다음 실행에서 다시 읽도록 표시합니다.
+
+        파일 행이 디렉토리 ID를 참조하므로 사라진 디렉토리의 행은 삭제하지 않습니다.
+        """
+        root = self.directory_repository.save_root(directory_path, fingerprint)
+        scanned_at = datetime.now(timezone.utc)
+        self.directory_repository.save_all([
+            Directory(
+                root_id=root.id,
+                path=path,
+                parent_path=parent_directory_path(path),
+                mtime_ns=mtime_ns,
+                child_count=child_count,
+                last_scanned_at=scanned_at,
+            )
+            for path, (mtime_ns, child_count) in state.listed_directories.items()
+        ])
+        vanished = [
+            path for path in state.known_directories
+            if path not in state.listed_directories and path not in state.skipped_directories
         ]
+        self.directory_repository.mark_stale(vanished)
+
+    def _restat_skipped_files(
+        self, previous_files: Dict[int, str], state: DiscoveryState
+    ) -> Iterator[List[File]]:
+        """목록을 건너뛴 디렉토리에 있던 기존 파일을 다시 stat하여 배치로 돌려줍니다.
+
+        파일 내용만 수정되면 디렉토리 수정 시각이 바뀌지 않으므로, 목록을 읽는 대신 알고 있는 파일만 확인합니다.
+        이전 실행에서 저장이 끝난 디렉토리(resumed_directories)의 파일은 확인하지 않습니다.
+        """
+        file_ids = sorted(
+            file_id for file_id, directory in previous_files.items()
+            if directory in state.skipped_directories and directory not in state.resumed_directories
+        )
+        for start in range(0, len(file_ids), BATCH_SIZE):
+            paths = self.file_repository.find_paths_by_ids(file_ids[start:start + BATCH_SIZE])
+            batch_files = [
+                file for file in map(self.file_discovery_service.build_file, paths.values()) if file is not None
+            ]
+            if batch_files:
+                yield batch_files
+
+    def _process_batch(
+        self, batch_files: List[File], incremental: bool = False, seen_ids: Optional[Set[int]] = None
+    ) -> Tuple[List[File], int, List[Tuple[str, str]]]:
+        """파일 배치를 처리하여 (새로 저장된 파일, 변경된 파일 수, 이동한 파일의 (이전 경로, 새 경로))를 반환합니다.
+
+        새 파일은 ORM 세션을 거치지 않고 한 번의 INSERT ... ON CONFLICT로 저장합니다.
+        incremental 모드에서는 크기/수정 시각/inode가 달라진 기존 파일도 같은 문장으로 갱신하고,
+        확인된 기존 파일 ID를 seen_ids에 기록합니다. 새 경로 중 이동/이름 변경된 파일은
+        기존 행의 경로만 바꾸므로 추출 결과가 유지됩니다.
+        """
+        if not incremental:
+            # 이미 존재하는 경로는 DB에서 건너뛰므로 사전 조회가 필요 없습니다.
+            inserted = self.file_repository.bulk_insert(batch_files)
+            return self._assign_ids(batch_files, inserted), 0, []
+        if seen_ids is None:
+            seen_ids = set()
+
+        existing_by_path = self.file_repository.find_index_entries_by_paths(
+            [file.full_path for file in batch_files]
+        )
 
-        if new_files_in_batch:
-            return self.file_repository.save_all(new_files_in_batch)
-        
-        return []
+        pending_files = []
+        changed_count = 0
+        for file in batch_files:
+            existing = existing_by_path.get(file.full_path)
+            if existing is None:
+                pending_files.append(file)
+                continue
+            seen_ids.add(existing.id)
+            if (
+                existing.size != file.size
+                or existing.mtime_ns != file.mtime_ns
+                # manifest에서 읽은 파일은 inode를 알 수 없으므로 비교하지 않습니다.
+                or (file.inode is not None and existing.inode != file.inode)
+                or existing.is_deleted
+            ):
+                pending_files.append(file)
+                changed_count += 1
 
-    def execute(self, directory_path: str, exclude_patterns: Optional[List[str]] = None) -> List[File]:
-        """지정된 디렉토리의 파일을 인덱싱하고 결과를 반환합니다."""
+        moves = self._move_files(
+            [file for file in pending_files if file.full_path not in existing_by_path], seen_ids
+        )
+        if moves:
+            moved_paths = {file.full_path for _, file in moves}
+            pending_files = [file for file in pending_files if file.full_path not in moved_paths]
+
+        upserted = self.file_repository.bulk_upsert(pending_files) if pending_files else {}
+        new_files = [file for file in pending_files if file.full_path not in existing_by_path]
+        return (
+            self._assign_ids(new_files, upserted),
+            changed_count,
+            [(old_path, file.full_path) for old_path, file in moves],
+        )
+
+    def _move_files(self, new_files: List[File], seen_ids: Set[int]) -> List[Tuple[str, File]]:
+        """새 경로의 파일 중 (장치, inode, 크기, 수정 시각)이 같은 기존 파일이 사라진 경우를 이동으로 보고,
+        기존 행의 경로를 바꿉니다. (이전 경로, 새 파일) 목록을 반환합니다.
+
+        이전 경로에 파일이 아직 있으면 하드 링크이므로 이동으로 보지 않습니다.
+        """
+        identities = {
+            (file.device, file.inode, file.size, file.mtime_ns)
+            for file in new_files
+            if file.device is not None and file.inode is not None and file.mtime_ns is not None
+        }
+        if not identities:
+            return []
+        candidates = self.file_repository.find_move_candidates(list(identities))
+        if not candidates:
+            return []
+
+        moves: List[Tuple[str, File]] = []
+        claimed: Set[int] = set()
+        for file in new_files:
+            for candidate in candidates.get((file.device, file.inode, file.size, file.mtime_ns), []):
+                if candidate.id in claimed or not self._has_vanished(candidate, seen_ids):
+                    continue
+                claimed.add(candidate.id)
+                moves.append((candidate.full_path, file))
+                file.id = candidate.id
+                break
+        if moves:
+            self.file_repository.move_files([(file.id, file) for _, file in moves])
+            seen_ids.update(claimed)
+        return moves
+
+    @staticmethod
+    def _has_vanished(candidate: FileMoveCandidate, seen_ids: Set[int]) -> bool:
+        if candidate.id in seen_ids:
+            return False
+        if candidate.is_deleted:
+            return True
+        # 아직 삭제 표시되지 않은 파일은 이번 실행에서 뒤에 발견될 수도 있으므로 이전 경로를 직접 확인합니다.
+        return not os.path.lexists(candidate.full_path)
+
+    def _index_archives(self, batch_files: List[File], matcher: ExclusionMatcher, summary: IndexSummary) -> int:
+        """배치의 압축 파일 중 내부 항목 목록을 아직 읽지 않은 파일의 항목을 저장하고, 읽지 못한 압축 파일 수를 반환합니다.
+
+        목록을 읽었다는 표시는 크기나 수정 시각이 바뀌면 지워지므로, 바뀌지 않은 압축 파일은 다시 읽지 않습니다.
+        """
+        archive_paths = {
+            file.full_path for file in batch_files if self.file_discovery_service.is_archive(file)
+        }
+        if not archive_paths:
+            return 0
+        error_count = 0
+        for archive in self.file_repository.find_by_paths(archive_paths):
+            if archive.archive_members_listed or archive.is_deleted:
+                continue
+            members = self.file_discovery_service.list_archive_members(archive.full_path)
+            if members is None:
+                # 읽을 수 없는 압축 파일도 목록을 읽은 것으로 표시하여, 바뀌기 전까지 다시 시도하지 않습니다.
+                error_count += 1
+                members = []
+            members = [member for member in members if not matcher.matches(member.full_path)]
+            for member in members:
+                member.archive_id = archive.id
+            self.file_repository.save_archive_members(archive.id, members)
+            summary.archive_count += 1
+            summary.archive_member_count += len(members)
+        return error_count
+
+    @staticmethod
+    def _assign_ids(files: List[File], ids_by_path: Dict[str, int]) -> List[File]:
+        """저장 결과로 받은 ID를 파일 객체에 채우고, 실제로 저장된 파일만 반환합니다."""
+        saved_files = []
+        for file in files:
+            file_id = ids_by_path.get(file.full_path)
+            if file_id is not None:
+                file.id = file_id
+                saved_files.append(file)
+        return saved_files
+
+    def execute(
+        self,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        incremental: bool = False,
+        force_full_scan: bool = False,
+        manifest_path: Optional[str] = None,
+        manifest_has_stats: bool = False,
+        index_archives: bool = False,
+    ) -> IndexSummary:
+        """지정된 디렉토리의 파일을 인덱싱하고 결과를 반환합니다.
+
+        incremental 모드에서는 변경된 파일을 갱신하고, 디렉토리에서 사라진 파일을 삭제 표시합니다.
+        변경이 없는 디렉토리를 다시 인덱싱하면 파일/디렉토리 기록에 대한 DB 쓰기가 발생하지 않습니다.
+        (index_run_repository가 있으면 이어서 실행하기 위한 인덱싱 실행 기록은 남깁니다.)
+        지난 인덱싱 이후 수정 시각이 바뀌지 않은 디렉토리는 목록을 다시 읽지 않으며,
+        force_full_scan이면 모든 디렉토리를 다시 읽습니다. incremental 모드에서는 목록을 건너뛴
+        디렉토리의 기존 파일을 하나씩 stat하여 내용만 수정된 파일도 갱신합니다.
+
+        manifest_path가 주어지면 디렉토리를 탐색하지 않고 manifest 파일에 나열된 파일을 인덱싱합니다.
+        이때 incremental 모드는 manifest에 없는 파일을 삭제 표시합니다.
+        manifest_has_stats이면 크기와 수정 시각도 manifest에서 읽습니다
+        (FileDiscovery.discover_manifest 참고).
+
+        index_archives이면 새로 저장되었거나 크기/수정 시각이 바뀐 ZIP/CBZ 파일의 중앙 디렉토리를 읽어
+        내부 항목을 가상 파일로 저장합니다. 압축은 풀지 않습니다.
+        """
+        summary = IndexSummary()
+        for event in self.execute_stream(
+            directory_path, exclude_patterns, incremental, force_full_scan, keep_saved_files=True,
+            manifest_path=manifest_path, manifest_has_stats=manifest_has_stats, index_archives=index_archives,
+        ):
+            if isinstance(event, IndexSummary):
+                summary = event
+        return summary
+
+    def execute_stream(
+        self,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        incremental: bool = False,
+        force_full_scan: bool = False,
+        keep_saved_files: bool = False,
+        manifest_path: Optional[str] = None,
+        manifest_has_stats: bool = False,
+        index_archives: bool = False,
+    ) -> Iterator[Union[IndexProgress, IndexSummary]]:
+        """배치를 저장할 때마다 IndexProgress를 생성하고, 마지막에 IndexSummary를 생성합니다.
+
+        keep_saved_files가 False이면 저장된 파일을 모아두지 않으므로,
+        트리 크기와 관계없이 배치 크기만큼의 메모리만 사용합니다.
+        """
+        index_run = None
+        if self.index_run_repository is not None:
+            index_run = self.index_run_repository.save(IndexRun(
+                root_path=directory_path,
+                params={
+                    "exclude_patterns": exclude_patterns,
+                    "incremental": incremental,
+                    "force_full_scan": force_full_scan,
+                    "manifest_path": manifest_path,
+                    "manifest_has_stats": manifest_has_stats,
+                    "index_archives": index_archives,
+                },
+            ))
+        yield from self._index_stream(
+            directory_path, exclude_patterns, incremental, force_full_scan, keep_saved_files, index_run,
+            manifest_path=manifest_path, manifest_has_stats=manifest_has_stats, index_archives=index_archives,
+        )
+
+    def resume_stream(
+        self, index_run_id: int, keep_saved_files: bool = False
+    ) -> Iterator[Union[IndexProgress, IndexSummary]]:
+        """중단된 인덱싱 실행을 같은 인자로 이어서 실행합니다.
+
+        저장이 끝난 디렉토리는 하위 디렉토리만 찾고 파일은 다시 읽지 않습니다.
+        이 디렉토리들은 목록을 건너뛴 디렉토리와 같이 취급하므로, incremental 모드에서도
+        그 안의 파일은 삭제 표시하지 않습니다.
+        manifest로 인덱싱한 실행은 마지막으로 저장한 레코드 다음부터 이어서 읽으며, 삭제 표시는 하지 않습니다.
+        """
+        if self.index_run_repository is None:
+            raise IndexRunNotResumableException("인덱싱 실행 기록을 사용할 수 없습니다.")
+        index_run = self.index_run_repository.find_by_id(index_run_id)
+        if not index_run:
+            raise IndexRunNotFoundException(f"IndexRun with id {index_run_id} not found")
+        if index_run.status not in INCOMPLETE_INDEX_RUN_STATUSES:
+            raise IndexRunNotResumableException(f"이미 끝난 인덱싱 실행입니다: {index_run.status}")
+
+        completed_directories = self.index_run_repository.find_completed_directories(index_run_id)
+        index_run.status = INDEX_RUN_STATUS_RUNNING
+        index_run = self.index_run_repository.save(index_run)
+        params = index_run.params or {}
+        yield from self._index_stream(
+            index_run.root_path,
+            params.get("exclude_patterns"),
+            params.get("incremental", False),
+            params.get("force_full_scan", False),
+            keep_saved_files,
+            index_run,
+            completed_directories,
+            manifest_path=params.get("manifest_path"),
+            manifest_has_stats=params.get("manifest_has_stats", False),
+            index_archives=params.get("index_archives", False),
+        )
+
+    def _index_stream(
+        self,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]],
+        incremental: bool,
+        force_full_scan: bool,
+        keep_saved_files: bool,
+        index_run: Optional[IndexRun] = None,
+        completed_directories: Optional[Set[str]] = None,
+        manifest_path: Optional[str] = None,
+        manifest_has_stats: bool = False,
+        index_archives: bool = False,
+    ) -> Iterator[Union[IndexProgress, IndexSummary]]:
+        finished = False
+        try:
+            for event in self._run_index(
+                directory_path, exclude_patterns, incremental, force_full_scan, keep_saved_files,
+                index_run, completed_directories, manifest_path, manifest_has_stats, index_archives,
+            ):
+                finished = isinstance(event, IndexSummary)
+                yield event
+        except BaseException:
+            # 오류나 소비자 중단(GeneratorExit)으로 멈춘 실행은 이어서 실행할 수 있게 표시합니다.
+            if index_run is not None and not finished:
+                self.index_run_repository.mark_interrupted(index_run.id)
+            raise
+
+    def _run_index(
+        self,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]],
+        incremental: bool,
+        force_full_scan: bool,
+        keep_saved_files: bool,
+        index_run: Optional[IndexRun],
+        completed_directories: Optional[Set[str]],
+        manifest_path: Optional[str] = None,
+        manifest_has_stats: bool = False,
+        index_archives: bool = False,
+    ) -> Iterator[Union[IndexProgress, IndexSummary]]:
         # DB에서 활성화된 제외 패턴을 가져옵니다.
-        db_exclusion_patterns = [p.pattern for p in self.exclusion_pattern_repository.find_all() if p.is_active]
-        
+        db_exclusion_patterns = self.exclusion_pattern_repository.find_active_patterns()
+
         # API 요청으로 받은 패턴과 DB 패턴을 결합합니다.
         combined_exclusion_patterns = []
         if exclude_patterns:
             combined_exclusion_patterns.extend(exclude_patterns)
         combined_exclusion_patterns.extend(db_exclusion_patterns)
+        fingerprint = scan_fingerprint(combined_exclusion_patterns, index_archives)
 
-        total_saved_files = []
-        batch = []
-        
-        for file_obj in self._discover_files_generator(directory_path, combined_exclusion_patterns):
-            batch.append(file_obj)
-            if len(batch) >= BATCH_SIZE:
-                saved_batch = self._process_batch(batch)
-                total_saved_files.extend(saved_batch)
-                batch = []
+        summary = IndexSummary()
+        if index_run is not None:
+            # 이어서 실행하는 경우 저장이 끝난 배치까지의 집계부터 시작합니다.
+            summary.index_run_id = index_run.id
+            summary.seen_count = index_run.seen_count
+            summary.added_count = index_run.added_count
+            summary.changed_count = index_run.changed_count
+        seen_ids: Set[int] = set()
+        # 삭제 판정은 이번 실행 이전부터 있던 파일만 대상으로 합니다.
+        previous_files: Dict[int, str] = (
+            self.file_repository.find_active_directories_by_prefix(directory_path) if incremental else {}
+        )
+        resume_after = None
+        if manifest_path:
+            # manifest는 디렉토리를 읽지 않으므로 디렉토리 기록을 사용하지도, 갱신하지도 않습니다.
+            state = DiscoveryState()
+            if index_run is not None:
+                resume_after = index_run.last_committed_path
+            discover = partial(
+                self.file_discovery_service.discover_manifest,
+                manifest_path, directory_path, combined_exclusion_patterns, state,
+                has_stats=manifest_has_stats, resume_after=resume_after,
+            )
+        else:
+            state = self._load_discovery_state(directory_path, force_full_scan, fingerprint)
+            state.resumed_directories = completed_directories or set()
+            discover = partial(self._discover_files_generator, directory_path, combined_exclusion_patterns, state)
+
+        archive_matcher = ExclusionMatcher(combined_exclusion_patterns)
+        archive_error_count = 0
+        for discovered in self._discover_batches(discover, state, summary):
+            started = time.perf_counter()
+            batch_files = discovered.files
+            saved_batch, changed_count, moves = self._process_batch(batch_files, incremental, seen_ids)
+            if index_archives:
+                archive_error_count += self._index_archives(batch_files, archive_matcher, summary)
+            if keep_saved_files:
+                summary.saved_files.extend(saved_batch)
+            summary.seen_count += len(batch_files)
+            summary.added_count += len(saved_batch)
+            summary.changed_count += changed_count
+            summary.moved_count += len(moves)
+            if keep_saved_files:
+                summary.moved_files.extend(moves)
+            if index_run is not None:
+                # 이 배치까지 파일을 모두 전달한 디렉토리는 저장이 끝났으므로 함께 기록합니다.
+                self.index_run_repository.record_batch(
+                    index_run.id,
+                    seen_count=summary.seen_count,
+                    added_count=summary.added_count,
+                    changed_count=summary.changed_count,
+                    last_committed_path=batch_files[-1].full_path,
+                    completed_directories=discovered.completed_directories,
+                )
+            summary.write_seconds += time.perf_counter() - started
+            yield IndexProgress(
+                seen_count=summary.seen_count,
+                added_count=summary.added_count,
+                changed_count=summary.changed_count,
+                excluded_count=discovered.excluded_count,
+                error_count=discovered.error_count,
+                current_directory=discovered.current_directory,
+                index_run_id=summary.index_run_id,
+            )
+
+        if incremental:
+            started = time.perf_counter()
+            for batch_files in self._restat_skipped_files(previous_files, state):
+                _, changed_count, _ = self._process_batch(batch_files, incremental, seen_ids)
+                summary.changed_count += changed_count
+            summary.write_seconds += time.perf_counter() - started
+
+        if incremental and resume_after is None:
+            # 이번 탐색에서 발견되지 않은 기존 파일은 삭제된 것으로 표시합니다.
+            # 이어서 읽은 manifest는 앞부분의 파일을 확인하지 않았으므로 삭제 표시하지 않습니다.
+            # 목록을 읽지 않고 건너뛴 디렉토리의 파일은 그대로 둡니다.
+            removed_ids = sorted(
+                file_id for file_id, directory in previous_files.items()
+                if file_id not in seen_ids and directory not in state.skipped_directories
+            )
+            if removed_ids:
+                summary.removed_count = self.file_repository.mark_deleted(removed_ids)
 
-        # 마지막 남은 배치 처리
-        if batch:
-            saved_batch = self._process_batch(batch)
-            total_saved_files.extend(saved_batch)
+        summary.listed_directory_count = len(state.listed_directories)
+        summary.skipped_directory_count = len(state.skipped_directories)
+        summary.excluded_count = state.excluded_count
+        summary.error_count = state.error_count + archive_error_count
+        if summary.discovery_seconds:
+            summary.discovery_files_per_second = summary.seen_count / summary.discovery_seconds
+        if summary.write_seconds:
+            summary.write_files_per_second = summary.seen_count / summary.write_seconds
+        if self.directory_repository is not None and not manifest_path:
+            self._save_discovery_state(directory_path, state, fingerprint)
+        if index_run is not None:
+            self.index_run_repository.finish(index_run.id, INDEX_RUN_STATUS_COMPLETED)
 
-        return total_saved_files
+        yield summary
@@ -0,0 +1,18 @@
+from app.domain.index_run.model import IndexRun, INDEX_RUN_STATUS_INTERRUPTED, INDEX_RUN_STATUS_ABANDONED
+from app.domain.index_run.repository import IndexRunRepository
+from app.application.exceptions import IndexRunNotFoundException, IndexRunNotResumableException
+
+class AbandonIndexRunUseCase:
+    def __init__(self, repository: IndexRunRepository):
+        self.repository = repository
+
+    def execute(self, index_run_id: int) -> IndexRun:
+        """중단된 인덱싱 실행을 포기하고 체크포인트를 삭제합니다. 이미 저장된 파일은 그대로 둡니다."""
+        index_run = self.repository.find_by_id(index_run_id)
+        if not index_run:
+            raise IndexRunNotFoundException(f"IndexRun with id {index_run_id} not found")
+        if index_run.status != INDEX_RUN_STATUS_INTERRUPTED:
+            raise IndexRunNotResumableException(f"중단된 인덱싱 실행만 포기할 수 있습니다: {index_run.status}")
+
+        self.repository.finish(index_run_id, INDEX_RUN_STATUS_ABANDONED)
+        return self.repository.find_by_id(index_run_id)
@@ -0,0 +1,12 @@
+from typing import List, Tuple
+from app.domain.index_run.model import IndexRun
+from app.domain.index_run.repository import IndexRunRepository
+
+class GetIndexRunsUseCase:
+    def __init__(self, repository: IndexRunRepository):
+        self.repository = repository
+
+    def execute(self, skip: int = 0, limit: int = 10, incomplete_only: bool = False) -> Tuple[List[IndexRun], int]:
+        index_runs = self.repository.find_all(skip=skip, limit=limit, incomplete_only=incomplete_only)
+        total_count = self.repository.count_all(incomplete_only=incomplete_only)
+        return index_runs, total_count
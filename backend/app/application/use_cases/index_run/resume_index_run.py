@@ -0,0 +1,21 @@
+from app.domain.index_run.model import IndexRun, INDEX_RUN_STATUS_INTERRUPTED, INDEX_RUN_STATUS_RUNNING
+from app.domain.index_run.repository import IndexRunRepository
+from app.application.exceptions import IndexRunNotFoundException, IndexRunNotResumableException
+
+class ResumeIndexRunUseCase:
+    def __init__(self, repository: IndexRunRepository):
+        self.repository = repository
+
+    def execute(self, index_run_id: int) -> IndexRun:
+        """중단된 인덱싱 실행을 실행 중으로 표시하여, 같은 실행이 두 번 재개되지 않게 합니다.
+
+        실제 인덱싱은 호출한 쪽에서 IndexFilesUseCase.resume_stream으로 이어서 실행합니다.
+        """
+        index_run = self.repository.find_by_id(index_run_id)
+        if not index_run:
+            raise IndexRunNotFoundException(f"IndexRun with id {index_run_id} not found")
+        if index_run.status != INDEX_RUN_STATUS_INTERRUPTED:
+            raise IndexRunNotResumableException(f"중단된 인덱싱 실행만 이어서 실행할 수 있습니다: {index_run.status}")
+
+        index_run.status = INDEX_RUN_STATUS_RUNNING
+        return self.repository.save(index_run)
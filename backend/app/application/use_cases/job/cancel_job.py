@@ -0,0 +1,18 @@
+from app.domain.job.model import Job, UNFINISHED_JOB_STATUSES
+from app.domain.job.repository import JobRepository
+from app.application.exceptions import JobNotFoundException
+
+class CancelJobUseCase:
+    def __init__(self, repository: JobRepository):
+        self.repository = repository
+
+    def execute(self, job_id: int) -> Job:
+        """작업 취소를 요청합니다. 실행 중인 작업은 다음 진행 보고 시점에 중단됩니다."""
+        job = self.repository.find_by_id(job_id)
+        if not job:
+            raise JobNotFoundException(f"Job with id {job_id} not found")
+        if job.status not in UNFINISHED_JOB_STATUSES or job.cancel_requested:
+            return job
+
+        job.cancel_requested = True
+        return self.repository.save(job)
@@ -0,0 +1,13 @@
+from app.domain.job.model import Job
+from app.domain.job.repository import JobRepository
+from app.application.exceptions import JobNotFoundException
+
+class GetJobDetailUseCase:
+    def __init__(self, repository: JobRepository):
+        self.repository = repository
+
+    def execute(self, job_id: int) -> Job:
+        job = self.repository.find_by_id(job_id)
+        if not job:
+            raise JobNotFoundException(f"Job with id {job_id} not found")
+        return job
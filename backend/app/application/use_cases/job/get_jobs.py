@@ -0,0 +1,12 @@
+from typing import List, Tuple
+from app.domain.job.model import Job
+from app.domain.job.repository import JobRepository
+
+class GetJobsUseCase:
+    def __init__(self, repository: JobRepository):
+        self.repository = repository
+
+    def execute(self, skip: int = 0, limit: int = 10) -> Tuple[List[Job], int]:
+        jobs = self.repository.find_all(skip=skip, limit=limit)
+        total_count = self.repository.count_all()
+        return jobs, total_count
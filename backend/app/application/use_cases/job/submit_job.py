@@ -0,0 +1,19 @@
+from typing import Any, Dict
+from app.domain.job.model import Job
+from app.domain.job.repository import JobRepository
+from app.infrastructure.services.job_executor import JobExecutor
+from app.application.exceptions import UseCaseException
+
+class SubmitJobUseCase:
+    def __init__(self, job_repository: JobRepository, job_executor: JobExecutor):
+        self.job_repository = job_repository
+        self.job_executor = job_executor
+
+    def execute(self, job_type: str, params: Dict[str, Any]) -> Job:
+        """작업을 기록하고 백그라운드 실행 대기열에 넣습니다."""
+        if job_type not in self.job_executor.job_types:
+            raise UseCaseException(f"알 수 없는 작업 종류입니다: {job_type}")
+
+        job = self.job_repository.save(Job(job_type=job_type, params=params))
+        self.job_executor.submit(job.id)
+        return job
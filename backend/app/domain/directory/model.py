@@ -0,0 +1,33 @@
+import os
+from datetime import datetime
+from sqlmodel import Field
+from typing import Optional
+from app.domain.base_model import TimestampedBase
+
+def parent_directory_path(path: str) -> Optional[str]:
+    """상위 디렉토리 경로를 반환합니다. 파일 시스템 루트는 상위 디렉토리가 없습니다."""
+    parent = os.path.dirname(path)
+    return parent if parent != path else None
+
+class Root(TimestampedBase, table=True):
+    """인덱싱 시작 경로"""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    path: str = Field(unique=True, index=True)
+    # 마지막 인덱싱의 탐색 옵션(제외 패턴, 압축 파일 인덱싱 여부) 지문. 옵션이 바뀌면 디렉토리를 다시 읽습니다.
+    scan_fingerprint: Optional[str] = Field(default=None)
+
+class Directory(TimestampedBase, table=True):
+    """파일이 속한 디렉토리. 파일은 경로 대신 디렉토리 ID를 저장합니다.
+
+    mtime_ns가 없으면 목록을 읽은 기록이 없는(또는 사라진) 디렉토리이며, 다음 인덱싱에서 건너뛰지 않습니다.
+    archive_id가 있으면 압축 파일 내부 항목의 경로로 만든 가상 디렉토리이며, 디렉토리 탐색에서 제외합니다.
+    """
+    id: Optional[int] = Field(default=None, primary_key=True)
+    root_id: Optional[int] = Field(default=None, foreign_key="root.id", index=True) # 마지막으로 목록을 읽은 인덱싱의 시작 경로
+    path: str = Field(unique=True, index=True) # 디렉토리 경로
+    # 가상 디렉토리가 속한 압축 파일 ID. file 테이블이 directory를 참조하므로 순환 참조를 피하려고 외래 키는 두지 않습니다.
+    archive_id: Optional[int] = Field(default=None)
+    parent_path: Optional[str] = Field(default=None, index=True) # 상위 디렉토리 경로
+    mtime_ns: Optional[int] = Field(default=None) # 마지막 인덱싱 시점의 디렉토리 수정 시각 (나노초)
+    child_count: int = Field(default=0) # 마지막 인덱싱 시점의 하위 항목 수
+    last_scanned_at: Optional[datetime] = Field(default=None) # 마지막으로 목록을 읽은 시각
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.directory.model import Directory, Root
+
+class DirectoryRepository(ABC):
+    @abstractmethod
+    def find_by_prefix(self, directory_path: str) -> List[Directory]:
+        pass
+
+    @abstractmethod
+    def find_roots(self) -> List[Root]:
+        pass
+
+    @abstractmethod
+    def save_root(self, path: str, scan_fingerprint: Optional[str] = None) -> Root:
+        pass
+
+    @abstractmethod
+    def save_all(self, directories: List[Directory]) -> None:
+        pass
+
+    @abstractmethod
+    def mark_stale(self, paths: List[str]) -> None:
+        pass
@@ -0,0 +1,52 @@
+import os
+import re
+import fnmatch
+from typing import Iterable, Optional, Pattern
+
+
+def _translate_prefix(pattern: str) -> str:
+    """패턴이 문자열의 앞부분과 일치하는지 검사하도록 fnmatch의 끝 고정(\\Z)을 제거합니다."""
+    regex = fnmatch.translate(pattern)
+    for anchor in ("\\Z", "\\z"):
+        if regex.endswith(anchor):
+            return regex[: -len(anchor)]
+    return regex
+
+
+def _combine(regexes: Iterable[str]) -> Optional[Pattern[str]]:
+    regexes = list(regexes)
+    if not regexes:
+        return None
+    # fnmatch는 Windows에서 대소문자를 구분하지 않으므로 같은 동작을 유지합니다.
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes), flags)
+
+
+class ExclusionMatcher:
+    """제외 패턴(glob) 전체를 하나의 정규식으로 컴파일하여 경로를 한 번에 검사합니다.
+
+    fnmatch.fnmatch와 같은 규칙을 따르며, 패턴 수와 관계없이 경로당 한 번만 매칭합니다.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = [p for p in patterns if p]
+        self._file_regex = _combine(fnmatch.translate(p) for p in self.patterns)
+        # '*'로 끝나는 패턴은 나머지 접두사가 "디렉토리/"의 앞부분과 일치하면 그 하위의 모든 경로와 일치합니다.
+        # (fnmatch의 '*'는 경로 구분자도 포함하므로) 이런 디렉토리는 탐색 전에 제외할 수 있습니다.
+        self._directory_regex = _combine(
+            _translate_prefix(p[:-1]) for p in self.patterns if p.endswith("*")
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def matches(self, path: str) -> bool:
+        """파일 경로가 제외 패턴 중 하나와 일치하는지 확인합니다."""
+        return self._file_regex is not None and self._file_regex.match(path) is not None
+
+    def prunes_directory(self, directory_path: str) -> bool:
+        """디렉토리 하위의 모든 경로가 제외되어 탐색할 필요가 없는지 확인합니다."""
+        return (
+            self._directory_regex is not None
+            and self._directory_regex.match(directory_path + os.sep) is not None
+        )
@@ -15,6 +15,11 @@ class ExclusionPatternRepository(ABC):
     def find_all(self, skip: int = 0, limit: int = 10) -> List[ExclusionPattern]:
         pass
 
+    @abstractmethod
+    def find_active_patterns(self) -> List[str]:
+        """활성화된 모든 제외 패턴(glob)을 ID 순으로 반환합니다. 페이지 제한이 없습니다."""
+        pass
+
     @abstractmethod
     def count_all(self) -> int:
         pass
@@ -1,5 +1,5 @@
 from sqlmodel import Field, Relationship, JSON, Column
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Optional, Dict, Any, NamedTuple, TYPE_CHECKING
 from datetime import datetime
 from app.domain.base_model import TimestampedBase
 
@@ -22,3 +22,11 @@ class ExtractedData(TimestampedBase, table=True):
     # Relationships
     file: "File" = Relationship(back_populates="extracted_data")
     pattern: "FileChangePattern" = Relationship(back_populates="extracted_data")
+
+
+class ExtractionResult(NamedTuple):
+    """파일 하나에 패턴을 적용한 결과. pattern_id가 None이면 추출 실패입니다."""
+    file_id: int
+    pattern_id: Optional[int]
+    extracted_values: Dict[str, Any]
+    failure_reason: Optional[str] = None
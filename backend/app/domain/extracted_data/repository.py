@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List
-from app.domain.extracted_data.model import ExtractedData
+from app.domain.extracted_data.model import ExtractedData, ExtractionResult
 
 
 class ExtractedDataRepository(ABC):
@@ -17,10 +17,22 @@ class ExtractedDataRepository(ABC):
         pass
 
     @abstractmethod
+    def save_extraction_results(self, results: List[ExtractionResult], replace_all_patterns: bool = True) -> None:
+        """여러 파일의 추출 결과를 한 트랜잭션으로 저장합니다.
+
+        추출에 성공한 파일은 기존 추출 데이터를 지우고 새 데이터를 추가합니다. replace_all_patterns가 False이면
+        같은 패턴의 기존 데이터만 지웁니다. 모든 파일의 extracted_info, 추출 실패 상태와 선택된 패턴/키 수를 갱신합니다.
+        """
+        pass
+
     @abstractmethod
     def find_by_pattern_id(self, pattern_id: int) -> List[ExtractedData]:
         pass
 
+    @abstractmethod
+    def delete_by_pattern_id(self, pattern_id: int) -> None:
+        pass
+
     @abstractmethod
     def delete_by_file_id_and_pattern_id(self, file_id: int, pattern_id: int) -> None:
         pass
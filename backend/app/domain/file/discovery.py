@@ -0,0 +1,82 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from .model import File
+
+
+class DiscoveryState:
+    """한 번의 탐색 실행 동안 디렉토리 목록 결과를 기록합니다.
+
+    known_directories에 이전 인덱싱 시점의 디렉토리 수정 시각이 주어지면,
+    수정 시각이 같은 디렉토리는 목록을 다시 읽지 않고 건너뜁니다.
+    디렉토리의 수정 시각은 항목이 추가/삭제/이름 변경될 때만 바뀌므로,
+    건너뛴 디렉토리 안에서 내용만 수정된 파일은 탐색으로 감지되지 않습니다.
+    (incremental 인덱싱은 건너뛴 디렉토리의 기존 파일을 따로 stat합니다.)
+
+    resumed_directories에 주어진 디렉토리는 중단된 실행에서 파일 저장까지 끝난 디렉토리로 보고,
+    하위 디렉토리만 찾고 파일은 생성하지 않습니다. 이 디렉토리들도 건너뛴 디렉토리로 기록됩니다.
+    """
+
+    def __init__(
+        self,
+        known_directories: Optional[Dict[str, int]] = None,
+        known_children: Optional[Dict[str, List[str]]] = None,
+        resumed_directories: Optional[Set[str]] = None,
+    ):
+        self.known_directories = known_directories or {}  # 경로 -> 이전 mtime_ns
+        self.known_children = known_children or {}  # 경로 -> 이전 하위 디렉토리 목록
+        self.resumed_directories = resumed_directories or set()  # 이전 실행에서 저장이 끝난 디렉토리
+        self.listed_directories: Dict[str, Tuple[int, int]] = {}  # 경로 -> (mtime_ns, 하위 항목 수)
+        self.skipped_directories: Set[str] = set()
+        # 파일을 모두 생성(소비자에게 전달)한 디렉토리. 소비자 스레드에서만 추가합니다.
+        self.completed_directories: List[str] = []
+        # 진행 상황 보고용 집계 (병렬 탐색 시 여러 스레드에서 갱신합니다)
+        self.excluded_count = 0  # 제외 패턴으로 건너뛴 파일 및 디렉토리 수
+        self.error_count = 0  # 접근할 수 없어 건너뛴 파일 및 디렉토리 수
+        self.current_directory: Optional[str] = None  # 마지막으로 읽은 디렉토리
+        self._lock = threading.Lock()
+
+    def record_scan(self, root: str, excluded_count: int = 0, error_count: int = 0) -> None:
+        with self._lock:
+            self.current_directory = root
+            self.excluded_count += excluded_count
+            self.error_count += error_count
+
+
+class FileDiscovery(ABC):
+    """파일 시스템이나 manifest에서 인덱싱할 File 객체를 만드는 탐색기입니다."""
+
+    @abstractmethod
+    def discover(
+        self,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        state: Optional[DiscoveryState] = None,
+    ) -> Iterator[File]:
+        pass
+
+    @abstractmethod
+    def discover_manifest(
+        self,
+        manifest_path: str,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        state: Optional[DiscoveryState] = None,
+        has_stats: bool = False,
+        resume_after: Optional[str] = None,
+    ) -> Iterator[File]:
+        pass
+
+    @abstractmethod
+    def build_file(self, full_path: str) -> Optional[File]:
+        """일반 파일이 아니거나 접근할 수 없으면 None을 반환합니다."""
+        pass
+
+    @abstractmethod
+    def is_archive(self, file: File) -> bool:
+        pass
+
+    @abstractmethod
+    def list_archive_members(self, archive_path: str) -> Optional[List[File]]:
+        """압축 파일을 읽을 수 없으면 None을 반환합니다."""
+        pass
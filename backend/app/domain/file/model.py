@@ -1,22 +1,98 @@
+import os
 from sqlmodel import Field, Relationship, Column
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from sqlalchemy import Index, UniqueConstraint
+from typing import Optional, List, Dict, Any, NamedTuple, TYPE_CHECKING
 from app.domain.base_model import TimestampedBase
 from app.domain.custom_types import JsonEncodedDict
+from app.domain.directory.model import Directory
 
 if TYPE_CHECKING:
     from app.domain.extracted_data.model import ExtractedData
 
 class File(TimestampedBase, table=True):
+    """인덱싱된 파일
+
+    경로는 디렉토리 ID와 파일 이름(name)으로 나누어 저장하며, (directory_id, name)이 경로 조회 키입니다.
+    directory와 full_path는 디렉토리 경로로부터 계산되는 값입니다.
+    압축 파일 내부 항목은 "압축 파일 경로/내부 경로"를 경로로 가지는 가상 파일로 저장합니다.
+    """
+    __table_args__ = (
+        UniqueConstraint("directory_id", "name", name="uq_file_directory_id_name"),
+        # 이동/이름 변경된 파일을 (장치, inode)로 찾습니다.
+        Index("ix_file_device_inode", "device", "inode"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
+    directory_id: Optional[int] = Field(default=None, foreign_key="directory.id") # 저장 시 디렉토리 경로로 채워집니다.
+    name: str # 확장자를 포함한 파일 이름
     filename: str
     extension: str
-    directory: str
-    full_path: str = Field(unique=True, index=True)
-    size: int
+    size: int = Field(index=True)
+    mtime_ns: Optional[int] = Field(default=None) # 마지막 수정 시각 (나노초)
+    inode: Optional[int] = Field(default=None) # 파일 시스템 inode 번호
+    device: Optional[int] = Field(default=None) # 파일 시스템 장치 번호 (inode는 장치 안에서만 고유합니다)
+    is_deleted: bool = Field(default=False, index=True) # 재인덱싱 시 사라진 파일 표시 (tombstone)
+    partial_hash: Optional[str] = Field(default=None) # 앞/뒤 블록의 해시 (크기가 같은 파일이 있을 때만 계산)
+    content_hash: Optional[str] = Field(default=None, index=True) # 전체 내용 해시 (부분 해시가 같은 파일이 있을 때만 계산)
+    archive_id: Optional[int] = Field(default=None, foreign_key="file.id", index=True) # 압축 파일 내부 항목이면 압축 파일 ID
+    archive_members_listed: bool = Field(default=False) # 압축 파일의 내부 항목 목록을 현재 크기/수정 시각 기준으로 읽었는지 여부
 
     extracted_info: Dict[str, Any] = Field(default={}, sa_column=Column(JsonEncodedDict)) # 추출된 정보 필드 추가
 
     extraction_failed: bool = Field(default=False) # 추출 실패 여부
     extraction_failure_reason: Optional[str] = Field(default=None) # 추출 실패 이유
+    # 현재 extracted_info를 만든 패턴과 그 키 수. 새 패턴은 이 값보다 많이 추출할 때만 결과를 바꿉니다.
+    best_pattern_id: Optional[int] = Field(default=None, index=True)
+    best_field_count: Optional[int] = Field(default=None)
 
+    # 파일을 조회할 때 디렉토리 경로도 함께 읽습니다.
+    parent_directory: Optional[Directory] = Relationship(sa_relationship_kwargs={"lazy": "joined"})
     extracted_data: List["ExtractedData"] = Relationship(back_populates="file")
+
+    def __init__(self, directory: Optional[str] = None, full_path: Optional[str] = None, **data):
+        """경로는 directory/full_path 문자열로 지정할 수 있습니다.
+
+        저장 전까지는 경로만 가진 Directory 객체를 가리키며, 저장할 때 리포지토리가 실제 디렉토리 행으로 바꿉니다.
+        """
+        if full_path is not None:
+            directory = directory if directory is not None else os.path.dirname(full_path)
+            data.setdefault("name", os.path.basename(full_path))
+        elif "name" not in data and "filename" in data:
+            extension = data.get("extension")
+            data["name"] = f"{data['filename']}.{extension}" if extension else data["filename"]
+        if directory is not None and "parent_directory" not in data:
+            data["parent_directory"] = Directory(path=directory)
+        super().__init__(**data)
+
+    @property
+    def directory(self) -> Optional[str]:
+        return self.parent_directory.path if self.parent_directory is not None else None
+
+    @property
+    def full_path(self) -> Optional[str]:
+        if self.parent_directory is None:
+            return None
+        return os.path.join(self.parent_directory.path, self.name)
+
+
+class FileIndexEntry(NamedTuple):
+    """재인덱싱 시 변경 여부 판단에 필요한 파일 컬럼만 담은 읽기 전용 행"""
+    id: int
+    size: int
+    mtime_ns: Optional[int]
+    inode: Optional[int]
+    is_deleted: bool
+
+
+class FileMoveCandidate(NamedTuple):
+    """이동/이름 변경 판단에 필요한 기존 파일 컬럼만 담은 읽기 전용 행"""
+    id: int
+    full_path: str
+    is_deleted: bool
+
+
+class FileHashEntry(NamedTuple):
+    """내용 해시 계산에 필요한 파일 컬럼만 담은 읽기 전용 행"""
+    id: int
+    full_path: str
+    size: int
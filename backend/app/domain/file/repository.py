@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Set, Optional
-from .model import File
+from typing import Collection, Dict, Iterator, List, Set, Optional, Tuple
+from .model import File, FileIndexEntry, FileHashEntry, FileMoveCandidate
 
 class FileRepository(ABC):
     @abstractmethod
@@ -17,20 +17,139 @@ class FileRepository(ABC):
 
     @abstractmethod
     def find_by_ids(self, ids: List[int]) -> List[File]:
+        """삭제 표시되지 않은 파일만 조회합니다."""
         pass
 
     @abstractmethod
     def find_all(self, skip: int = 0, limit: int = 10, sort_field: Optional[str] = None, sort_order: Optional[str] = None, filename: Optional[str] = None) -> List[File]:
         pass
 
+    @abstractmethod
+    def find_after_id(self, after_id: int, limit: int) -> List[File]:
+        """after_id보다 큰 ID의 삭제되지 않은 파일을 ID 순으로 최대 limit개 조회합니다."""
+        pass
+
+    def iter_after_id(self, after_id: int, batch_size: int) -> Iterator[List[File]]:
+        """after_id 다음 파일부터 ID 순으로 batch_size개씩 배치를 돌려주는 키셋 순회.
+
+        배치마다 기본 키 범위를 조회하므로 전체 순회 비용이 파일 수에 비례하고(OFFSET 없음),
+        순회 중에 파일이 추가되거나 삭제되어도 건너뛰거나 두 번 읽는 파일이 없습니다.
+        """
+        while True:
+            files = self.find_after_id(after_id, batch_size)
+            if not files:
+                return
+            yield files
+            # 마지막 배치이면 빈 배치를 다시 조회하지 않습니다.
+            if len(files) < batch_size:
+                return
+            after_id = files[-1].id
+
     @abstractmethod
     def count_all(self) -> int:
         pass
 
     @abstractmethod
     def find_by_id(self, file_id: int) -> Optional[File]:
+        """삭제 표시된 파일은 찾지 않습니다."""
         pass
 
     @abstractmethod
     def find_by_pattern_id(self, pattern_id: int) -> List[File]:
+        """패턴의 추출 데이터가 있는 파일 중 복사할 수 있는 파일(삭제 표시되지 않은 일반 파일)을 조회합니다."""
+        pass
+
+    @abstractmethod
+    def find_by_pattern_id_after_id(self, pattern_id: int, after_id: int, limit: int) -> List[File]:
+        """find_by_pattern_id 대상 중 after_id보다 큰 ID의 파일을 ID 순으로 최대 limit개 조회합니다."""
+        pass
+
+    @abstractmethod
+    def count_by_pattern_id(self, pattern_id: int) -> int:
+        """find_by_pattern_id 대상 파일 수를 조회합니다."""
+        pass
+
+    @abstractmethod
+    def find_ids_depending_on_pattern(self, pattern_id: int) -> List[int]:
+        """패턴이 선택되었거나(best_pattern_id) 그 패턴의 추출 데이터가 있는 삭제되지 않은 파일 ID를 ID 순으로 조회합니다."""
+        pass
+
+    @abstractmethod
+    def find_ids_beatable_by_pattern(
+        self,
+        pattern_id: int,
+        field_count: int,
+        after_id: int,
+        limit: int,
+        extensions: Optional[Collection[str]] = None,
+        directory: Optional[str] = None,
+    ) -> List[int]:
+        """저장된 최고 결과를 이 패턴이 이길 수 있는 삭제되지 않은 파일 중 after_id보다 큰 ID를 ID 순으로 최대 limit개 조회합니다.
+
+        추출 결과가 없거나, 키 수가 field_count보다 적거나, 키 수가 같고 ID가 더 큰 패턴이 선택된 파일입니다.
+        extensions(정규화된 확장자)나 directory(하위 디렉토리 포함)가 주어지면 패턴의 적용 범위 안의 파일만 조회합니다.
+        """
+        pass
+
+    @abstractmethod
+    def find_active_directories_by_prefix(self, directory_path: str) -> Dict[int, str]:
+        pass
+
+    @abstractmethod
+    def find_paths_by_ids(self, ids: List[int]) -> Dict[int, str]:
+        """삭제되지 않은 파일의 {파일 ID: 경로}를 조회합니다."""
+        pass
+
+    @abstractmethod
+    def mark_deleted(self, ids: List[int]) -> int:
+        pass
+
+    @abstractmethod
+    def find_index_entries_by_paths(self, paths: List[str]) -> Dict[str, FileIndexEntry]:
+        pass
+
+    @abstractmethod
+    def bulk_insert(self, files: List[File]) -> Dict[str, int]:
+        pass
+
+    @abstractmethod
+    def bulk_upsert(self, files: List[File]) -> Dict[str, int]:
+        pass
+
+    @abstractmethod
+    def find_move_candidates(
+        self, identities: List[Tuple[int, int, int, int]]
+    ) -> Dict[Tuple[int, int, int, int], List[FileMoveCandidate]]:
+        pass
+
+    @abstractmethod
+    def move_files(self, moves: List[Tuple[int, File]]) -> None:
+        pass
+
+    @abstractmethod
+    def save_archive_members(self, archive_id: int, members: List[File]) -> Dict[str, int]:
+        pass
+
+    @abstractmethod
+    def find_partial_hash_candidates(self, after_id: int, limit: int) -> List[FileHashEntry]:
+        pass
+
+    @abstractmethod
+    def find_content_hash_candidates(self, after_id: int, limit: int) -> List[FileHashEntry]:
+        pass
+
+    @abstractmethod
+    def save_hashes(self, partial_hashes: Dict[int, str], content_hashes: Dict[int, str]) -> None:
+        pass
+
+    @abstractmethod
+    def find_duplicate_groups(self, skip: int = 0, limit: int = 10) -> List[Tuple[str, int]]:
+        pass
+
+    @abstractmethod
+    def count_duplicate_groups(self) -> int:
+        pass
+
+    @abstractmethod
+    def find_by_content_hashes(self, content_hashes: List[str]) -> List[File]:
         pass
@@ -0,0 +1,127 @@
+import re
+from re import _constants as sre_constants, _parser as sre_parse  # 정규식 구조 분석에 표준 라이브러리 파서를 사용합니다.
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Pattern, Set, Tuple
+
+MIN_LITERAL_LENGTH = 2  # 한 글자 리터럴은 거의 모든 경로에 있어 거르는 효과가 없습니다.
+MAX_LITERAL_LENGTH = 32  # 긴 리터럴은 앞부분만 써도 필수 조건이 유지됩니다.
+
+
+def _flatten(subpattern) -> Iterator[Tuple]:
+    """대소문자 구분이 유지되는 그룹은 펼쳐서, 그룹 안팎의 리터럴이 이어지도록 합니다."""
+    for op, av in subpattern:
+        if op is sre_constants.SUBPATTERN and not av[1] & re.IGNORECASE:
+            yield from _flatten(av[3])
+        else:
+            yield op, av
+
+
+def _collect_runs(subpattern, runs: List[str]) -> None:
+    current: List[str] = []
+    for op, av in _flatten(subpattern):
+        if op is sre_constants.LITERAL:
+            current.append(chr(av))
+            continue
+        if current:
+            runs.append("".join(current))
+            current = []
+        # 한 번 이상 반복되는 부분의 리터럴도 반드시 나타납니다. 그 외의 구조(분기, 선택적 반복, 전후방 탐색 등)는 건너뜁니다.
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] >= 1:
+            _collect_runs(av[2], runs)
+    if current:
+        runs.append("".join(current))
+
+
+def required_literals(regex: Pattern[str]) -> Tuple[str, ...]:
+    """정규식이 일치하는 모든 문자열에 반드시 들어 있는 리터럴 부분 문자열을 반환합니다.
+
+    확실하지 않은 구조는 건너뛰므로, 반환된 리터럴이 없는 문자열에서는 정규식이 절대 일치하지 않습니다.
+    대소문자를 무시하는 정규식은 리터럴을 뽑지 않습니다.
+    """
+    if regex.flags & re.IGNORECASE:
+        return ()
+    try:
+        parsed = sre_parse.parse(regex.pattern)
+    except Exception:
+        return ()
+    runs: List[str] = []
+    _collect_runs(parsed, runs)
+    literals = {run[:MAX_LITERAL_LENGTH] for run in runs if len(run) >= MIN_LITERAL_LENGTH}
+    return tuple(sorted(literals))
+
+
+def _trie_regex(literals: Iterable[str]) -> str:
+    trie: Dict[str, dict] = {}
+    for literal in literals:
+        node = trie
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # 리터럴의 끝
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # 끝나는 지점에서도 더 긴 리터럴을 먼저 시도하므로, 위치마다 가장 긴 리터럴이 잡힙니다.
+        return f"(?:{body})?" if "" in node else body
+
+    return f"(?=({build(trie)}))"
+
+
+class LiteralIndex:
+    """여러 리터럴을 트라이로 묶은 정규식 하나로, 문자열에 들어 있는 리터럴을 한 번에 찾습니다.
+
+    위치마다 가장 긴 리터럴만 잡히므로, 그 리터럴의 앞부분인 다른 리터럴도 함께 찾은 것으로 봅니다.
+    """
+
+    def __init__(self, literals: List[str]):
+        self.literals = literals
+        self._regex = re.compile(_trie_regex(literals))
+        ids = {literal: i for i, literal in enumerate(literals)}
+        self._prefixes: Dict[str, FrozenSet[int]] = {
+            literal: frozenset(ids[literal[:n]] for n in range(1, len(literal) + 1) if literal[:n] in ids)
+            for literal in literals
+        }
+
+    def find(self, text: str) -> Set[int]:
+        """text에 들어 있는 리터럴의 번호(literals의 인덱스)를 반환합니다."""
+        found: Set[int] = set()
+        for match in self._regex.finditer(text):
+            found |= self._prefixes[match.group(1)]
+        return found
+
+
+class LiteralFilter:
+    """패턴별 필수 리터럴 목록으로, 문자열에서 일치할 수 있는 패턴만 고릅니다.
+
+    각 패턴은 가장 긴 필수 리터럴로 색인하고, 그 리터럴이 나타난 경우에만 나머지 리터럴을 확인합니다.
+    """
+
+    def __init__(self, literal_sets: List[Tuple[str, ...]]):
+        literal_ids: Dict[str, int] = {}
+        self._required: List[FrozenSet[int]] = []
+        self._by_anchor: Dict[int, List[int]] = {}  # 가장 긴 필수 리터럴 -> 패턴 위치
+        self._unfiltered: List[int] = []  # 필수 리터럴이 없어 항상 검사하는 패턴 위치
+        for position, literals in enumerate(literal_sets):
+            self._required.append(
+                frozenset(literal_ids.setdefault(literal, len(literal_ids)) for literal in literals)
+            )
+            if literals:
+                anchor = literal_ids[max(literals, key=len)]
+                self._by_anchor.setdefault(anchor, []).append(position)
+            else:
+                self._unfiltered.append(position)
+        self._index = LiteralIndex(list(literal_ids)) if literal_ids else None
+
+    def candidates(self, subject: str) -> List[int]:
+        """subject에서 일치할 수 있는 패턴의 위치를 순서대로 반환합니다."""
+        if self._index is None:
+            return list(self._unfiltered)
+        found = self._index.find(subject)
+        positions = list(self._unfiltered)
+        for literal_id in found:
+            for position in self._by_anchor.get(literal_id, ()):
+                if self._required[position] <= found:
+                    positions.append(position)
+        positions.sort()
+        return positions
@@ -6,6 +6,20 @@ if TYPE_CHECKING:
     from app.domain.extracted_data.model import ExtractedData
     from app.domain.file_change_request.model import FileChangeRequest
 
+
+def normalize_extension(extension: Optional[str]) -> str:
+    """확장자를 점 없는 소문자로 맞춥니다. ("PDF", ".pdf" -> "pdf")"""
+    return (extension or "").lstrip(".").lower()
+
+
+def parse_extensions(scope_extensions: Optional[str]) -> List[str]:
+    """쉼표로 구분된 확장자 목록을 정규화된 확장자 리스트로 바꿉니다."""
+    if not scope_extensions:
+        return []
+    extensions = (normalize_extension(part.strip()) for part in scope_extensions.split(","))
+    return list(dict.fromkeys(ext for ext in extensions if ext))
+
+
 class FileChangePattern(TimestampedBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(unique=True, index=True) # 패턴 이름
@@ -13,5 +27,10 @@ class FileChangePattern(TimestampedBase, table=True):
     replacement_format: str # 교체 형식 (예: {filename}_{date}.{ext})
     is_confirmed: bool = Field(default=False) # 패턴 확인 여부
 
+    # 적용 범위 (비어 있으면 제한 없음)
+    scope_extensions: Optional[str] = Field(default=None) # 적용할 확장자 목록 (쉼표 구분, 예: "pdf,epub")
+    scope_directory: Optional[str] = Field(default=None) # 이 디렉토리와 그 하위 디렉토리의 파일에만 적용
+    match_filename_only: bool = Field(default=False) # 전체 경로 대신 파일 이름에만 정규식을 적용
+
     extracted_data: List["ExtractedData"] = Relationship(back_populates="pattern")
     change_requests: List["FileChangeRequest"] = Relationship(back_populates="pattern")
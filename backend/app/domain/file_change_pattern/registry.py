@@ -0,0 +1,315 @@
+import json
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Pattern, Tuple, Union
+from app.domain.file.model import File
+from app.domain.file_change_pattern.model import FileChangePattern, normalize_extension, parse_extensions
+from app.domain.file_change_pattern.literal_index import LiteralFilter, required_literals
+
+# replacement_format 값의 "$그룹번호:타입$", "$그룹이름:타입$" 형식
+_INDEX_SPEC = re.compile(r"\$(\d+):([sd])\$")
+_NAME_SPEC = re.compile(r"\$([a-zA-Z_][a-zA-Z0-9_]*):([sd])\$")
+
+# 추출 결과에 항상 추가되는 파일 속성
+FILE_ATTRIBUTES = ("filename", "extension", "directory", "full_path", "size")
+
+
+def _to_int(value: str) -> Optional[int]:
+    try:
+        return int(value)
+    except ValueError:
+        return None  # 변환 실패 시 None
+
+
+_CONVERTERS: Dict[str, Optional[Callable[[str], Any]]] = {"d": _to_int, "s": None}
+
+
+class FormatStep(NamedTuple):
+    """replacement_format의 키 하나를 미리 해석한 결과."""
+    key: str
+    group: Union[int, str, None]  # match.group()에 넘길 그룹 번호나 이름. None이면 literal을 그대로 씁니다.
+    converter: Optional[Callable[[str], Any]]
+    literal: Any
+
+
+def _parse_format(replacement_format: Optional[str], regex: Pattern[str]) -> Optional[Tuple[FormatStep, ...]]:
+    """replacement_format을 키별 FormatStep으로 해석합니다. 변환하지 않고 원래 값을 쓰는 경우 None을 반환합니다."""
+    if not replacement_format:
+        return None
+    try:
+        format_dict = json.loads(replacement_format)
+    except json.JSONDecodeError:
+        return None  # 유효하지 않은 JSON은 변환 없이 기존 추출 값을 반환합니다.
+    if not isinstance(format_dict, dict):
+        return None
+
+    steps: List[FormatStep] = []
+    for key, format_str in format_dict.items():
+        if not isinstance(format_str, str):
+            steps.append(FormatStep(key, None, None, format_str))
+            continue
+        index_spec = _INDEX_SPEC.match(format_str)
+        if index_spec:
+            group_index = int(index_spec.group(1))
+            if group_index < regex.groups:
+                # $0$은 첫 번째 그룹이므로 match.group() 번호로는 1을 더합니다.
+                steps.append(FormatStep(key, group_index + 1, _CONVERTERS[index_spec.group(2)], None))
+            else:
+                steps.append(FormatStep(key, None, None, None))  # 그룹 인덱스 벗어남
+            continue
+        name_spec = _NAME_SPEC.match(format_str)
+        if name_spec:
+            group_name = name_spec.group(1)
+            if group_name in regex.groupindex:
+                steps.append(FormatStep(key, group_name, _CONVERTERS[name_spec.group(2)], None))
+            else:
+                steps.append(FormatStep(key, None, None, None))  # 명명된 그룹 없음
+            continue
+        steps.append(FormatStep(key, None, None, format_str))  # 일반 문자열
+    return tuple(steps)
+
+
+def _normalize_directory(directory: str) -> str:
+    return directory.rstrip(os.sep) or os.sep
+
+
+def _ancestors(directory: Optional[str]) -> List[str]:
+    """디렉토리 자신과 모든 상위 디렉토리 경로를 반환합니다."""
+    if not directory:
+        return []
+    paths = []
+    current = _normalize_directory(directory)
+    while True:
+        paths.append(current)
+        parent = os.path.dirname(current)
+        if parent == current or not parent:
+            return paths
+        current = parent
+
+
+class CompiledPattern:
+    """FileChangePattern의 정규식과 replacement_format을 미리 해석해 둔 것.
+
+    extract()는 파일마다 정규식 검색과 값 채우기만 하며, 문자열 파싱은 하지 않습니다.
+    """
+
+    def __init__(self, pattern: FileChangePattern):
+        self.id = pattern.id
+        self.regex_source = pattern.regex_pattern
+        self.format_source = pattern.replacement_format
+        self.regex = re.compile(pattern.regex_pattern)
+        self.group_count = self.regex.groups
+        self.named_groups = tuple(self.regex.groupindex)
+        self.plan = _parse_format(pattern.replacement_format, self.regex)
+        if self.plan is not None:
+            self.field_count = len(self.plan)
+        else:
+            raw_keys = self.named_groups or tuple(f"group_{i}" for i in range(self.group_count))
+            self.field_count = len(set(raw_keys) | set(FILE_ATTRIBUTES))
+        # 검사 대상 문자열에 이 리터럴이 모두 있어야 정규식이 일치할 수 있습니다.
+        self.required_literals = required_literals(self.regex)
+
+        # 적용 범위. None이면 제한하지 않습니다.
+        self.scope_source = (pattern.scope_extensions, pattern.scope_directory, pattern.match_filename_only)
+        extensions = parse_extensions(pattern.scope_extensions)
+        self.extensions: Optional[FrozenSet[str]] = frozenset(extensions) if extensions else None
+        self.directory_prefix = _normalize_directory(pattern.scope_directory) if pattern.scope_directory else None
+        self.filename_only = bool(pattern.match_filename_only)
+
+    def is_current(self, pattern: FileChangePattern) -> bool:
+        return (
+            self.regex_source == pattern.regex_pattern
+            and self.format_source == pattern.replacement_format
+            and self.scope_source == (pattern.scope_extensions, pattern.scope_directory, pattern.match_filename_only)
+        )
+
+    def in_scope(self, file: File) -> bool:
+        if self.extensions is not None and normalize_extension(file.extension) not in self.extensions:
+            return False
+        if self.directory_prefix is not None and self.directory_prefix not in _ancestors(file.directory):
+            return False
+        return True
+
+    def subject(self, file: File) -> str:
+        """정규식을 검사할 문자열. filename_only이면 경로 대신 확장자를 포함한 파일 이름만 검사합니다."""
+        return file.name if self.filename_only else file.full_path
+
+    def extract(self, file: File) -> Optional[Dict[str, Any]]:
+        """파일에서 값을 추출합니다. 적용 범위 밖이거나 일치하지 않으면 None을 반환합니다.
+
+        일치하면 항상 field_count개의 키를 가진 dict를 반환합니다.
+        """
+        if not self.in_scope(file):
+            return None
+        match = self.regex.search(self.subject(file))
+        if match is None:
+            return None
+        if self.plan is None:
+            return self._raw_values(file, match)
+
+        values: Dict[str, Any] = {}
+        for key, group, converter, literal in self.plan:
+            if group is None:
+                values[key] = literal
+            else:
+                value = match.group(group)
+                values[key] = converter(value) if converter is not None else value
+        return values
+
+    def _raw_values(self, file: File, match: "re.Match[str]") -> Dict[str, Any]:
+        if self.named_groups:
+            values: Dict[str, Any] = match.groupdict()
+        else:
+            values = {f"group_{i}": value for i, value in enumerate(match.groups())}
+        values["filename"] = file.filename
+        values["extension"] = file.extension
+        values["directory"] = file.directory
+        values["full_path"] = file.full_path
+        values["size"] = file.size
+        return values
+
+
+class _Bucket:
+    """적용 범위와 검사 문자열 종류가 같은 패턴들과, 그 필수 리터럴 필터."""
+
+    def __init__(self, filename_only: bool, positions: List[int], compiled: List[CompiledPattern]):
+        self.filename_only = filename_only
+        self.positions = positions
+        self.literal_filter = LiteralFilter([compiled[position].required_literals for position in positions])
+
+
+class PatternSet:
+    """여러 패턴을 한 번에 적용할 때 쓰는 구조.
+
+    패턴을 (확장자, 디렉토리 접두사, 검사 문자열 종류)별 묶음으로 나누고, 파일의 확장자와 상위 디렉토리로
+    해당하는 묶음만 찾습니다. 묶음 안에서는 필수 리터럴이 모두 있는 패턴만 고릅니다.
+    select_best()는 각 패턴이 선택된 비율을 registry에 패턴 ID별로 기록해, 자주 이기는 패턴부터 검사합니다.
+    """
+
+    def __init__(self, compiled: List[CompiledPattern], registry: Optional["PatternRegistry"] = None):
+        self.compiled = compiled
+        self.registry = registry if registry is not None else PatternRegistry()
+        grouped: Dict[Tuple[Optional[str], Optional[str], bool], List[int]] = {}
+        for position, pattern in enumerate(compiled):
+            for extension in pattern.extensions or (None,):
+                key = (extension, pattern.directory_prefix, pattern.filename_only)
+                grouped.setdefault(key, []).append(position)
+        self._buckets: Dict[Tuple[Optional[str], Optional[str]], List[_Bucket]] = {}
+        for (extension, directory, filename_only), positions in grouped.items():
+            self._buckets.setdefault((extension, directory), []).append(_Bucket(filename_only, positions, compiled))
+
+    def candidates(self, file: File) -> List[int]:
+        """파일에 일치할 수 있는 패턴의 위치를 원래 순서대로 반환합니다."""
+        extension = normalize_extension(file.extension)
+        directories = [None, *_ancestors(file.directory)]
+        positions: List[int] = []
+        for key_extension in (None, extension):
+            for directory in directories:
+                for bucket in self._buckets.get((key_extension, directory), ()):
+                    subject = file.name if bucket.filename_only else file.full_path
+                    positions.extend(bucket.positions[i] for i in bucket.literal_filter.candidates(subject))
+        positions.sort()
+        return positions
+
+    def select_best(
+        self, file: File, extract: Callable[[int], Optional[Dict[str, Any]]]
+    ) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """추출한 키가 가장 많은 패턴의 위치와 값을 반환합니다. 키 수가 같으면 앞선 위치의 패턴을 고릅니다.
+
+        모든 후보를 위치 순으로 검사한 결과와 같습니다. 승률이 높은 패턴부터 검사하고, 남은 패턴의
+        field_count로 보아 현재 결과를 이길 수 없으면 바로 멈춥니다.
+        extract(위치)는 해당 패턴의 추출 결과를 반환해야 합니다.
+        """
+        compiled = self.compiled
+        win_rate = self.registry.win_rate
+        order = sorted(self.candidates(file), key=lambda position: (-win_rate(compiled[position].id), position))
+        # bounds[i]: order[i:]의 패턴이 낼 수 있는 가장 좋은 (키 수, -위치)
+        bounds: List[Tuple[int, int]] = [(0, 0)] * len(order)
+        bound = (-1, 0)
+        for i in range(len(order) - 1, -1, -1):
+            bound = max(bound, (compiled[order[i]].field_count, -order[i]))
+            bounds[i] = bound
+
+        best_key: Optional[Tuple[int, int]] = None
+        best_values: Optional[Dict[str, Any]] = None
+        for i, position in enumerate(order):
+            if best_key is not None and best_key >= bounds[i]:
+                break
+            self.registry.record_attempt(compiled[position].id)
+            values = extract(position)
+            if values is None:
+                continue
+            key = (len(values), -position)
+            if best_key is None or key > best_key:
+                best_key, best_values = key, values
+
+        if best_key is None:
+            return None, None
+        best_position = -best_key[1]
+        self.registry.record_win(compiled[best_position].id)
+        return best_position, best_values
+
+
+class PatternRegistry:
+    """패턴 ID별 CompiledPattern을 프로세스 전체에서 공유하는 캐시.
+
+    패턴이 생성/수정/삭제되면 invalidate()로 버전을 올려 캐시를 비웁니다.
+    다른 프로세스에서 수정된 패턴도 정규식과 형식 문자열을 비교해 다시 컴파일합니다.
+    PatternSet.select_best()가 쓰는 패턴 ID별 선택 횟수도 여기 모아 두므로, 작업과 요청이 바뀌어도
+    유지되고 invalidate()하면 함께 초기화됩니다. 횟수는 검사 순서에만 쓰이므로 잠금 없이 갱신합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._compiled: Dict[int, CompiledPattern] = {}
+        self._wins: Dict[int, int] = {}
+        self._attempts: Dict[int, int] = {}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._compiled = {}
+            self._wins = {}
+            self._attempts = {}
+
+    def win_rate(self, pattern_id: Optional[int]) -> float:
+        """select_best()에서 검사한 횟수 중 선택된 비율. 저장되지 않은 패턴은 0입니다."""
+        attempts = self._attempts.get(pattern_id, 0)
+        return self._wins.get(pattern_id, 0) / attempts if attempts else 0.0
+
+    def record_attempt(self, pattern_id: Optional[int]) -> None:
+        if pattern_id is not None:
+            self._attempts[pattern_id] = self._attempts.get(pattern_id, 0) + 1
+
+    def record_win(self, pattern_id: Optional[int]) -> None:
+        if pattern_id is not None:
+            self._wins[pattern_id] = self._wins.get(pattern_id, 0) + 1
+
+    def get(self, pattern: FileChangePattern) -> CompiledPattern:
+        compiled = self._compiled.get(pattern.id) if pattern.id is not None else None
+        if compiled is not None and compiled.is_current(pattern):
+            return compiled
+
+        version = self._version
+        compiled = CompiledPattern(pattern)
+        if pattern.id is not None:
+            with self._lock:
+                # 컴파일하는 동안 무효화되었다면 이전 내용일 수 있으므로 저장하지 않습니다.
+                if version == self._version:
+                    self._compiled[pattern.id] = compiled
+        return compiled
+
+    def get_all(self, patterns: List[FileChangePattern]) -> List[CompiledPattern]:
+        return [self.get(pattern) for pattern in patterns]
+
+    def pattern_set(self, patterns: List[FileChangePattern]) -> PatternSet:
+        return PatternSet(self.get_all(patterns), self)
+
+
+pattern_registry = PatternRegistry()
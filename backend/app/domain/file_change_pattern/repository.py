@@ -19,10 +19,16 @@ class FileChangePatternRepository(ABC):
     def find_all(self, skip: int = 0, limit: int = 10) -> List[FileChangePattern]:
         pass
 
+    @abstractmethod
+    def find_all_active(self) -> List[FileChangePattern]:
+        """추출에 사용할 모든 패턴을 ID 순으로 반환합니다. 페이지 제한이 없습니다."""
+        pass
+
     @abstractmethod
     def count_all(self) -> int:
         pass
 
     @abstractmethod
     def delete(self, pattern_id: int) -> None:
+        """패턴과 그 패턴의 추출 데이터를 한 트랜잭션으로 삭제합니다."""
         pass
@@ -2,12 +2,18 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from .model import FileChangeRequest
+from .file_change_request_target_model import FileChangeRequestTarget
 
 class FileChangeRequestRepository(ABC):
     @abstractmethod
     def save(self, request: FileChangeRequest) -> FileChangeRequest:
         pass
 
+    @abstractmethod
+    def add_targets(self, request: FileChangeRequest, targets: List[FileChangeRequestTarget]) -> FileChangeRequest:
+        """요청의 변경 내용과 새 대상들을 한 트랜잭션으로 저장합니다."""
+        pass
+
     @abstractmethod
     def find_by_id(self, request_id: int) -> Optional[FileChangeRequest]:
         pass
@@ -0,0 +1,34 @@
+from datetime import datetime
+from sqlmodel import Field, Column
+from typing import Optional, Dict, Any
+from app.domain.base_model import TimestampedBase
+from app.domain.custom_types import JsonEncodedDict
+
+# 인덱싱 실행 상태
+INDEX_RUN_STATUS_RUNNING = "running"
+INDEX_RUN_STATUS_INTERRUPTED = "interrupted" # 실행 중에 프로세스가 종료됨 (이어서 실행 가능)
+INDEX_RUN_STATUS_COMPLETED = "completed"
+INDEX_RUN_STATUS_ABANDONED = "abandoned"
+
+# 완료되지 않은 상태
+INCOMPLETE_INDEX_RUN_STATUSES = (INDEX_RUN_STATUS_RUNNING, INDEX_RUN_STATUS_INTERRUPTED)
+
+
+class IndexRun(TimestampedBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    root_path: str = Field(index=True) # 인덱싱 시작 경로
+    status: str = Field(default=INDEX_RUN_STATUS_RUNNING, index=True)
+    params: Dict[str, Any] = Field(default={}, sa_column=Column(JsonEncodedDict)) # 제외 패턴, 증분 여부 등 실행 인자
+    seen_count: int = Field(default=0) # 저장이 끝난 배치까지 탐색한 파일 수
+    added_count: int = Field(default=0)
+    changed_count: int = Field(default=0)
+    committed_batch_count: int = Field(default=0) # 저장이 끝난 배치 수
+    last_committed_path: Optional[str] = Field(default=None) # 마지막으로 저장된 배치의 마지막 파일 경로
+    finished_at: Optional[datetime] = Field(default=None)
+
+
+class IndexRunDirectory(TimestampedBase, table=True):
+    """인덱싱 실행 중 파일 저장까지 끝난 디렉토리. 이어서 실행할 때 이 디렉토리의 파일은 다시 읽지 않습니다."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    index_run_id: int = Field(foreign_key="indexrun.id", index=True)
+    path: str
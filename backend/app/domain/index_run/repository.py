@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set
+from .model import IndexRun
+
+class IndexRunRepository(ABC):
+    @abstractmethod
+    def save(self, index_run: IndexRun) -> IndexRun:
+        pass
+
+    @abstractmethod
+    def find_by_id(self, index_run_id: int) -> Optional[IndexRun]:
+        pass
+
+    @abstractmethod
+    def find_all(self, skip: int = 0, limit: int = 10, incomplete_only: bool = False) -> List[IndexRun]:
+        pass
+
+    @abstractmethod
+    def count_all(self, incomplete_only: bool = False) -> int:
+        pass
+
+    @abstractmethod
+    def record_batch(
+        self,
+        index_run_id: int,
+        seen_count: int,
+        added_count: int,
+        changed_count: int,
+        last_committed_path: Optional[str],
+        completed_directories: List[str],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def find_completed_directories(self, index_run_id: int) -> Set[str]:
+        pass
+
+    @abstractmethod
+    def finish(self, index_run_id: int, status: str) -> None:
+        pass
+
+    @abstractmethod
+    def mark_interrupted(self, index_run_id: int) -> None:
+        pass
+
+    @abstractmethod
+    def mark_running_as_interrupted(self) -> int:
+        pass
@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlmodel import Field, Column
+from typing import Optional, Dict, Any
+from app.domain.base_model import TimestampedBase
+from app.domain.custom_types import JsonEncodedDict
+
+# 작업 상태
+JOB_STATUS_PENDING = "pending"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUS_CANCELLED = "cancelled"
+
+# 다시 시작하면 이어서 실행해야 하는 상태
+UNFINISHED_JOB_STATUSES = (JOB_STATUS_PENDING, JOB_STATUS_RUNNING)
+
+
+class Job(TimestampedBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_type: str = Field(index=True) # 실행할 작업 종류 (index, reapply_patterns 등)
+    status: str = Field(default=JOB_STATUS_PENDING, index=True)
+    params: Dict[str, Any] = Field(default={}, sa_column=Column(JsonEncodedDict)) # 작업 실행 인자
+    progress: Dict[str, Any] = Field(default={}, sa_column=Column(JsonEncodedDict)) # 진행 상황 (조회용)
+    checkpoint: Dict[str, Any] = Field(default={}, sa_column=Column(JsonEncodedDict)) # 재시작 시 이어서 실행할 위치
+    result: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JsonEncodedDict))
+    error: Optional[str] = Field(default=None)
+    cancel_requested: bool = Field(default=False)
+    started_at: Optional[datetime] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
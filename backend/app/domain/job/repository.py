@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from .model import Job
+
+class JobRepository(ABC):
+    @abstractmethod
+    def save(self, job: Job) -> Job:
+        pass
+
+    @abstractmethod
+    def find_by_id(self, job_id: int) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def find_all(self, skip: int = 0, limit: int = 10) -> List[Job]:
+        pass
+
+    @abstractmethod
+    def count_all(self) -> int:
+        pass
+
+    @abstractmethod
+    def find_unfinished(self) -> List[Job]:
+        pass
+
+    @abstractmethod
+    def update_progress(self, job_id: int, progress: Dict[str, Any], checkpoint: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    @abstractmethod
+    def is_cancel_requested(self, job_id: int) -> bool:
+        pass
@@ -10,5 +10,17 @@ class BaseConfig(BaseSettings):
     APP_NAME: str = "Clear File"
     DEBUG: bool = False
     DATABASE_URL: Optional[str] = None
+    # 파일 인덱싱 시 디렉토리를 동시에 읽을 스레드 수 (1이면 순차 탐색)
+    INDEX_DISCOVERY_WORKERS: int = 1
+    # 파일 인덱싱 시 탐색 스레드가 DB 저장을 기다리지 않고 미리 만들어 둘 수 있는 배치 수
+    INDEX_PIPELINE_DEPTH: int = 4
+    # 중복 파일 검사를 위해 파일 내용 해시를 동시에 계산할 스레드 수
+    HASH_WORKERS: int = 4
+    # 백그라운드 작업을 동시에 실행할 스레드 수
+    JOB_WORKERS: int = 1
+    # 인덱싱된 루트 디렉토리의 변경을 inotify로 감시하여 인덱스에 반영할지 여부 (Linux 전용)
+    INDEX_WATCH_ENABLED: bool = False
+    # 감시 이벤트를 모아서 반영하는 간격 (초)
+    INDEX_WATCH_DEBOUNCE_SECONDS: float = 2.0
 
     model_config = SettingsConfigDict(extra="ignore")
@@ -0,0 +1,67 @@
+import os
+from typing import List, Optional
+from sqlmodel import Session, select, update, or_
+from app.domain.directory.model import Directory, Root
+from app.domain.directory.repository import DirectoryRepository
+
+class DirectoryRepositoryImpl(DirectoryRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def find_by_prefix(self, directory_path: str) -> List[Directory]:
+        stripped = directory_path.rstrip(os.sep)
+        # 압축 파일 내부의 가상 디렉토리는 파일 시스템에 없으므로 탐색 기록에서 제외합니다.
+        statement = select(Directory).where(
+            Directory.archive_id == None,  # noqa: E711
+            or_(
+                Directory.path.in_({directory_path, stripped or os.sep}),
+                Directory.path.startswith(stripped + os.sep, autoescape=True),
+            )
+        )
+        return self.session.exec(statement).all()
+
+    def find_roots(self) -> List[Root]:
+        """인덱싱을 완료한 적이 있는 시작 경로를 조회합니다."""
+        return self.session.exec(select(Root).order_by(Root.path)).all()
+
+    def save_root(self, path: str, scan_fingerprint: Optional[str] = None) -> Root:
+        root = self.session.exec(select(Root).where(Root.path == path)).first()
+        if root is None:
+            root = Root(path=path)
+        root.scan_fingerprint = scan_fingerprint
+        self.session.add(root)
+        self.session.commit()
+        self.session.refresh(root)
+        return root
+
+    def save_all(self, directories: List[Directory]) -> None:
+        """경로가 같은 기존 디렉토리가 있으면 갱신하고, 없으면 새로 저장합니다."""
+        if not directories:
+            return
+        existing = {
+            d.path: d
+            for d in self.session.exec(
+                select(Directory).where(Directory.path.in_([d.path for d in directories]))
+            ).all()
+        }
+        for directory in directories:
+            current = existing.get(directory.path)
+            if current is None:
+                self.session.add(directory)
+                continue
+            current.root_id = directory.root_id
+            current.parent_path = directory.parent_path
+            current.mtime_ns = directory.mtime_ns
+            current.child_count = directory.child_count
+            current.last_scanned_at = directory.last_scanned_at
+            self.session.add(current)
+        self.session.commit()
+
+    def mark_stale(self, paths: List[str]) -> None:
+        """수정 시각 기록을 지워 다음 인덱싱에서 목록을 다시 읽도록 합니다."""
+        if not paths:
+            return
+        self.session.exec(
+            update(Directory).where(Directory.path.in_(paths)).values(mtime_ns=None, child_count=0)
+        )
+        self.session.commit()
@@ -3,6 +3,10 @@ from sqlmodel import Session, select
 from sqlalchemy.sql import func
 from app.domain.exclusion_pattern.model import ExclusionPattern
 from app.domain.exclusion_pattern.repository import ExclusionPatternRepository
+from app.infrastructure.persistence.rule_snapshot import RuleSnapshot
+
+# 인덱싱과 감시에 쓰는 활성 제외 패턴 목록. 패턴이 바뀔 때까지 요청 사이에 재사용합니다.
+_active_patterns: RuleSnapshot[str] = RuleSnapshot()
 
 class ExclusionPatternRepositoryImpl(ExclusionPatternRepository):
     def __init__(self, session: Session):
@@ -12,6 +16,7 @@ class ExclusionPatternRepositoryImpl(ExclusionPatternRepository):
         self.session.add(pattern)
         self.session.commit()
         self.session.refresh(pattern)
+        _active_patterns.invalidate()
         return pattern
 
     def find_by_id(self, pattern_id: int) -> Optional[ExclusionPattern]:
@@ -21,6 +26,20 @@ class ExclusionPatternRepositoryImpl(ExclusionPatternRepository):
         statement = select(ExclusionPattern).offset(skip).limit(limit)
         return self.session.exec(statement).all()
 
+    def find_active_patterns(self) -> List[str]:
+        stamp = self.session.exec(
+            select(func.count(ExclusionPattern.id), func.max(ExclusionPattern.updated_at))
+        ).one()
+        return _active_patterns.get(tuple(stamp), self._load_active_patterns)
+
+    def _load_active_patterns(self) -> List[str]:
+        statement = (
+            select(ExclusionPattern.pattern)
+            .where(ExclusionPattern.is_active == True)  # noqa: E712
+            .order_by(ExclusionPattern.id)
+        )
+        return list(self.session.exec(statement).all())
+
     def count_all(self) -> int:
         statement = select(func.count(ExclusionPattern.id))
         return self.session.exec(statement).one()
@@ -30,3 +49,4 @@ class ExclusionPatternRepositoryImpl(ExclusionPatternRepository):
         if pattern:
             self.session.delete(pattern)
             self.session.commit()
+            _active_patterns.invalidate()
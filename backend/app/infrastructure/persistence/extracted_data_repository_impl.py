@@ -1,6 +1,9 @@
+from datetime import datetime, timezone
 from typing import List
-from sqlmodel import Session, select
-from app.domain.extracted_data.model import ExtractedData
+from sqlmodel import Session, delete, insert, select, update
+from sqlalchemy import tuple_
+from app.domain.extracted_data.model import ExtractedData, ExtractionResult
+from app.domain.file.model import File
 from app.domain.extracted_data.repository import ExtractedDataRepository
 
 
@@ -25,10 +28,51 @@ class ExtractedDataRepositoryImpl(ExtractedDataRepository):
             self.session.delete(data)
         self.session.commit()
 
+    def save_extraction_results(self, results: List[ExtractionResult], replace_all_patterns: bool = True) -> None:
+        if not results:
+            return
+        now = datetime.now(timezone.utc)
+        matched = [result for result in results if result.pattern_id is not None]
+        if matched:
+            if replace_all_patterns:
+                condition = ExtractedData.file_id.in_([result.file_id for result in matched])
+            else:
+                condition = tuple_(ExtractedData.file_id, ExtractedData.pattern_id).in_(
+                    [(result.file_id, result.pattern_id) for result in matched]
+                )
+            self.session.exec(delete(ExtractedData).where(condition))
+            self.session.execute(insert(ExtractedData), [
+                ExtractedData(
+                    file_id=result.file_id,
+                    pattern_id=result.pattern_id,
+                    extracted_values=result.extracted_values,
+                    created_at=now,
+                    updated_at=now,
+                ).model_dump(exclude={"id"})
+                for result in matched
+            ])
+        self.session.execute(update(File), [
+            {
+                "id": result.file_id,
+                "extracted_info": result.extracted_values,
+                "extraction_failed": result.pattern_id is None,
+                "extraction_failure_reason": result.failure_reason,
+                "best_pattern_id": result.pattern_id,
+                "best_field_count": len(result.extracted_values) if result.pattern_id is not None else None,
+                "updated_at": now,
+            }
+            for result in results
+        ])
+        self.session.commit()
+
     def find_by_pattern_id(self, pattern_id: int) -> List[ExtractedData]:
         statement = select(ExtractedData).where(ExtractedData.pattern_id == pattern_id)
         return self.session.exec(statement).all()
 
+    def delete_by_pattern_id(self, pattern_id: int) -> None:
+        self.session.exec(delete(ExtractedData).where(ExtractedData.pattern_id == pattern_id))
+        self.session.commit()
+
     def delete_by_file_id_and_pattern_id(self, file_id: int, pattern_id: int) -> None:
         statement = select(ExtractedData).where(
             ExtractedData.file_id == file_id, ExtractedData.pattern_id == pattern_id
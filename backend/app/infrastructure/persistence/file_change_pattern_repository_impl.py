@@ -1,8 +1,14 @@
 from typing import List, Optional
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, select
 from sqlalchemy.sql import func
+from app.domain.extracted_data.model import ExtractedData
 from app.domain.file_change_pattern.model import FileChangePattern
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
+from app.domain.file_change_pattern.registry import pattern_registry
+from app.infrastructure.persistence.rule_snapshot import RuleSnapshot
+
+# 추출에 쓰는 전체 패턴 목록. 패턴이 바뀔 때까지 요청 사이에 재사용합니다.
+_active_patterns: RuleSnapshot[FileChangePattern] = RuleSnapshot()
 
 class FileChangePatternRepositoryImpl(FileChangePatternRepository):
     def __init__(self, session: Session):
@@ -12,6 +18,7 @@ class FileChangePatternRepositoryImpl(FileChangePatternRepository):
         self.session.add(pattern)
         self.session.commit()
         self.session.refresh(pattern)
+        self._invalidate()
         return pattern
 
     def find_by_id(self, pattern_id: int) -> Optional[FileChangePattern]:
@@ -25,6 +32,25 @@ class FileChangePatternRepositoryImpl(FileChangePatternRepository):
         statement = select(FileChangePattern).offset(skip).limit(limit)
         return self.session.exec(statement).all()
 
+    def find_all_active(self) -> List[FileChangePattern]:
+        stamp = self.session.exec(
+            select(func.count(FileChangePattern.id), func.max(FileChangePattern.updated_at))
+        ).one()
+        return _active_patterns.get(tuple(stamp), self._load_active)
+
+    def _load_active(self) -> List[FileChangePattern]:
+        # 추출에 필요한 컬럼만 읽어 세션에 연결되지 않은 객체로 보관합니다.
+        statement = select(
+            FileChangePattern.id,
+            FileChangePattern.name,
+            FileChangePattern.regex_pattern,
+            FileChangePattern.replacement_format,
+            FileChangePattern.scope_extensions,
+            FileChangePattern.scope_directory,
+            FileChangePattern.match_filename_only,
+        ).order_by(FileChangePattern.id)
+        return [FileChangePattern(**row._asdict()) for row in self.session.exec(statement).all()]
+
     def find_by_ids(self, pattern_ids: List[int]) -> List[FileChangePattern]:
         statement = select(FileChangePattern).where(FileChangePattern.id.in_(pattern_ids))
         return self.session.exec(statement).all()
@@ -36,5 +62,13 @@ class FileChangePatternRepositoryImpl(FileChangePatternRepository):
     def delete(self, pattern_id: int) -> None:
         pattern = self.session.get(FileChangePattern, pattern_id)
         if pattern:
+            # 추출 데이터가 패턴을 참조하므로 같은 트랜잭션에서 먼저 지웁니다.
+            self.session.exec(delete(ExtractedData).where(ExtractedData.pattern_id == pattern_id))
             self.session.delete(pattern)
             self.session.commit()
+            self._invalidate()
+
+    @staticmethod
+    def _invalidate() -> None:
+        pattern_registry.invalidate()
+        _active_patterns.invalidate()
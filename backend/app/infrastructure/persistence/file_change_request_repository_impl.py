@@ -3,6 +3,7 @@ from typing import List, Optional
 from sqlmodel import Session, select
 from sqlalchemy.sql import func
 from app.domain.file_change_request.model import FileChangeRequest
+from app.domain.file_change_request.file_change_request_target_model import FileChangeRequestTarget
 from app.domain.file_change_request.repository import FileChangeRequestRepository
 
 class FileChangeRequestRepositoryImpl(FileChangeRequestRepository):
@@ -15,6 +16,15 @@ class FileChangeRequestRepositoryImpl(FileChangeRequestRepository):
         self.session.refresh(request)
         return request
 
+    def add_targets(self, request: FileChangeRequest, targets: List[FileChangeRequestTarget]) -> FileChangeRequest:
+        for target in targets:
+            target.request_id = request.id
+        self.session.add(request)
+        self.session.add_all(targets)
+        self.session.commit()
+        self.session.refresh(request)
+        return request
+
     def find_by_id(self, request_id: int) -> Optional[FileChangeRequest]:
         return self.session.get(FileChangeRequest, request_id)
 
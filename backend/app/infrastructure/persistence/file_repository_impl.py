@@ -1,62 +1,525 @@
-from typing import List, Set, Optional
-from sqlmodel import Session, select
+import os
+from datetime import datetime, timezone
+from typing import Collection, Dict, Iterable, List, Set, Optional, Tuple
+from sqlmodel import Session, select, update, and_, or_
+from sqlalchemy import case, tuple_
+from sqlalchemy.orm import contains_eager
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.sqlite import insert
 import unicodedata # Added import
-from app.domain.file.model import File
+from app.domain.file.model import File, FileIndexEntry, FileHashEntry, FileMoveCandidate
+from app.domain.directory.model import Directory, parent_directory_path
 from app.domain.extracted_data.model import ExtractedData
 from app.domain.file.repository import FileRepository
 
+
+# SQLite가 한 문장에 바인딩할 수 있는 변수 수(SQLITE_MAX_VARIABLE_NUMBER)를 넘지 않도록 IN 목록을 나눕니다.
+ID_CHUNK_SIZE = 500
+
+
+def _split_path(full_path: str) -> Tuple[str, str]:
+    return os.path.dirname(full_path), os.path.basename(full_path)
+
+
+def _in_directory(directory_path: str):
+    """디렉토리 자신이나 그 하위 디렉토리에 속하는지 비교하는 조건. Directory와 조인해서 사용합니다."""
+    stripped = directory_path.rstrip(os.sep)
+    return or_(
+        Directory.path.in_({directory_path, stripped or os.sep}),
+        Directory.path.startswith(stripped + os.sep, autoescape=True),
+    )
+
+
 class FileRepositoryImpl(FileRepository):
+    """파일은 (디렉토리 ID, 이름)으로 저장하므로, 경로로 조회할 때는 디렉토리 경로를 ID로 바꾼 뒤
+    (directory_id, name) 고유 인덱스로 찾습니다."""
+
     def __init__(self, session: Session):
         self.session = session
 
+    def _directory_ids(self, directory_paths: Iterable[str]) -> Dict[str, int]:
+        directory_paths = set(directory_paths)
+        if not directory_paths:
+            return {}
+        statement = select(Directory.path, Directory.id).where(Directory.path.in_(directory_paths))
+        return dict(self.session.exec(statement).all())
+
+    def _ensure_directories(
+        self, directory_paths: Iterable[str], archive_ids: Optional[Dict[str, int]] = None
+    ) -> Dict[str, int]:
+        """디렉토리 행이 없으면 만들고 {디렉토리 경로: ID}를 반환합니다. 커밋은 호출한 쪽에서 합니다.
+
+        archive_ids에 있는 경로는 압축 파일 내부의 가상 디렉토리로 만듭니다.
+        """
+        archive_ids = archive_ids or {}
+        directory_paths = set(directory_paths)
+        directory_ids = self._directory_ids(directory_paths)
+        missing = directory_paths - directory_ids.keys()
+        if missing:
+            now = datetime.now(timezone.utc)
+            statement = (
+                insert(Directory)
+                .on_conflict_do_nothing(index_elements=["path"])
+                .returning(Directory.path, Directory.id)
+            )
+            result = self.session.execute(statement, [
+                {"path": path, "parent_path": parent_directory_path(path), "child_count": 0,
+                 "archive_id": archive_ids.get(path), "created_at": now, "updated_at": now}
+                for path in sorted(missing)
+            ])
+            directory_ids.update(result.all())
+        return directory_ids
+
+    def _attach_directories(self, files: List[File]) -> None:
+        """경로만 가진 디렉토리를 가리키는 파일을 실제 디렉토리 행에 연결합니다."""
+        pending = [
+            file for file in files
+            if file.parent_directory is not None and file.parent_directory.id is None
+        ]
+        if not pending:
+            return
+        directory_ids = self._ensure_directories(file.directory for file in pending)
+        for file in pending:
+            directory_id = directory_ids[file.directory]
+            file.directory_id = directory_id
+            file.parent_directory = self.session.get(Directory, directory_id)
+
+    def _path_keys(self, paths: Iterable[str]) -> List[Tuple[int, str]]:
+        """경로를 (directory_id, name) 조회 키로 바꿉니다. 디렉토리가 없는 경로는 제외합니다."""
+        split_paths = [_split_path(path) for path in paths]
+        directory_ids = self._directory_ids(directory for directory, _ in split_paths)
+        return [
+            (directory_ids[directory], name)
+            for directory, name in split_paths
+            if directory in directory_ids
+        ]
+
+    def _with_directory(self, statement):
+        # 디렉토리 경로로 정렬하거나 필터링할 수 있도록 명시적으로 조인하고, 조인 결과를 관계에 채웁니다.
+        return statement.join(Directory, File.directory_id == Directory.id).options(
+            contains_eager(File.parent_directory)
+        )
+
     def save(self, file: File) -> File:
+        self._attach_directories([file])
         self.session.add(file)
         self.session.commit()
         self.session.refresh(file)
         return file
 
     def save_all(self, files: List[File]) -> List[File]:
+        self._attach_directories(files)
         self.session.add_all(files)
         self.session.commit()
         return files
 
     def find_by_paths(self, paths: Set[str]) -> List[File]:
-        statement = select(File).where(File.full_path.in_(paths))
+        keys = self._path_keys(paths)
+        if not keys:
+            return []
+        statement = select(File).where(tuple_(File.directory_id, File.name).in_(keys))
         return self.session.exec(statement).all()
 
     def find_by_ids(self, ids: List[int]) -> List[File]:
-        statement = select(File).where(File.id.in_(ids))
+        statement = select(File).where(File.id.in_(ids), File.is_deleted == False)  # noqa: E712
         return self.session.exec(statement).all()
 
+    def _sort_columns(self, sort_field: str):
+        # 경로는 저장된 컬럼이 아니므로 디렉토리 경로와 파일 이름으로 정렬합니다.
+        if sort_field == "full_path":
+            return [Directory.path, File.name]
+        if sort_field == "directory":
+            return [Directory.path]
+        return [getattr(File, sort_field)]
+
     def find_all(self, skip: int = 0, limit: int = 10, sort_field: Optional[str] = None, sort_order: Optional[str] = None, filename: Optional[str] = None) -> List[File]:
-        statement = select(File)
+        statement = self._with_directory(select(File)).where(File.is_deleted == False)  # noqa: E712
         if filename:
             normalized_filename = unicodedata.normalize("NFC", filename)
             statement = statement.where(File.filename.ilike(f"%{normalized_filename}%"))
         if sort_field:
+            columns = self._sort_columns(sort_field)
             if sort_order and sort_order.lower() == "desc":
-                statement = statement.order_by(getattr(File, sort_field).desc())
+                statement = statement.order_by(*(column.desc() for column in columns))
             else:
-                statement = statement.order_by(getattr(File, sort_field).asc())
+                statement = statement.order_by(*(column.asc() for column in columns))
         statement = statement.offset(skip).limit(limit)
         return self.session.exec(statement).all()
 
+    def find_after_id(self, after_id: int, limit: int) -> List[File]:
+        statement = (
+            self._with_directory(select(File))
+            .where(File.is_deleted == False, File.id > after_id)  # noqa: E712
+            .order_by(File.id)
+            .limit(limit)
+        )
+        return self.session.exec(statement).all()
+
     def count_all(self, filename: Optional[str] = None) -> int:
-        statement = select(func.count(File.id))
+        statement = select(func.count(File.id)).where(File.is_deleted == False)  # noqa: E712
         if filename:
             normalized_filename = unicodedata.normalize("NFC", filename)
             statement = statement.where(File.filename.ilike(f"%{normalized_filename}%"))
         return self.session.exec(statement).one()
 
     def find_by_id(self, file_id: int) -> Optional[File]:
-        return self.session.get(File, file_id)
+        statement = select(File).where(File.id == file_id, File.is_deleted == False)  # noqa: E712
+        return self.session.exec(statement).first()
+
+    def _copyable_by_pattern(self, statement, pattern_id: int):
+        # 복사/이름 변경 대상이므로 삭제 표시된 파일과 실제 경로가 없는 압축 파일 내부 항목은 제외합니다.
+        matched = select(ExtractedData.file_id).where(ExtractedData.pattern_id == pattern_id)
+        return statement.where(
+            File.id.in_(matched),
+            File.is_deleted == False,  # noqa: E712
+            File.archive_id.is_(None),
+        )
 
     def find_by_pattern_id(self, pattern_id: int) -> List[File]:
+        statement = self._copyable_by_pattern(select(File), pattern_id).order_by(File.id)
+        return self.session.exec(statement).all()
+
+    def find_by_pattern_id_after_id(self, pattern_id: int, after_id: int, limit: int) -> List[File]:
+        statement = (
+            self._copyable_by_pattern(select(File), pattern_id)
+            .where(File.id > after_id)
+            .order_by(File.id)
+            .limit(limit)
+        )
+        return self.session.exec(statement).all()
+
+    def count_by_pattern_id(self, pattern_id: int) -> int:
+        statement = self._copyable_by_pattern(select(func.count(File.id)), pattern_id)
+        return self.session.exec(statement).one()
+
+    def find_ids_depending_on_pattern(self, pattern_id: int) -> List[int]:
+        matched = select(ExtractedData.file_id).where(ExtractedData.pattern_id == pattern_id)
+        statement = (
+            select(File.id)
+            .where(
+                File.is_deleted == False,  # noqa: E712
+                or_(File.best_pattern_id == pattern_id, File.id.in_(matched)),
+            )
+            .order_by(File.id)
+        )
+        return list(self.session.exec(statement).all())
+
+    def find_ids_beatable_by_pattern(
+        self,
+        pattern_id: int,
+        field_count: int,
+        after_id: int,
+        limit: int,
+        extensions: Optional[Collection[str]] = None,
+        directory: Optional[str] = None,
+    ) -> List[int]:
+        statement = (
+            select(File.id)
+            .where(
+                File.id > after_id,
+                File.is_deleted == False,  # noqa: E712
+                or_(
+                    File.best_field_count.is_(None),
+                    File.best_field_count < field_count,
+                    and_(File.best_field_count == field_count, File.best_pattern_id > pattern_id),
+                ),
+            )
+            .order_by(File.id)
+            .limit(limit)
+        )
+        if extensions:
+            # normalize_extension과 같이 앞의 점을 떼고 소문자로 비교합니다.
+            statement = statement.where(func.lower(func.ltrim(File.extension, ".")).in_(extensions))
+        if directory:
+            statement = statement.join(Directory, File.directory_id == Directory.id).where(_in_directory(directory))
+        return list(self.session.exec(statement).all())
+
+    def find_active_directories_by_prefix(self, directory_path: str) -> Dict[int, str]:
+        """디렉토리 하위의 삭제되지 않은 파일에 대해 {파일 ID: 디렉토리}를 반환합니다.
+
+        압축 파일 내부 항목은 디렉토리 탐색으로 발견되지 않으므로 제외합니다.
+        """
+        statement = (
+            select(File.id, Directory.path)
+            .join(Directory, File.directory_id == Directory.id)
+            .where(
+                File.is_deleted == False,  # noqa: E712
+                File.archive_id.is_(None),
+                _in_directory(directory_path),
+            )
+        )
+        return dict(self.session.exec(statement).all())
+
+    def mark_deleted(self, ids: List[int]) -> int:
+        """파일과 그 압축 파일 내부 항목을 삭제 표시하고, 삭제 표시한 파일 수를 반환합니다.
+
+        큰 하위 트리가 사라지면 ID가 많으므로 ID_CHUNK_SIZE개씩 나누어 갱신하고 한 번에 커밋합니다.
+        """
+        if not ids:
+            return 0
+        removed_count = 0
+        for start in range(0, len(ids), ID_CHUNK_SIZE):
+            chunk = ids[start:start + ID_CHUNK_SIZE]
+            result = self.session.exec(update(File).where(File.id.in_(chunk)).values(is_deleted=True))
+            removed_count += result.rowcount
+            # 사라진 압축 파일의 내부 항목도 함께 삭제 표시합니다.
+            self.session.exec(update(File).where(File.archive_id.in_(chunk)).values(is_deleted=True))
+        self.session.commit()
+        return removed_count
+
+    def find_paths_by_ids(self, ids: List[int]) -> Dict[int, str]:
+        """삭제되지 않은 파일의 {파일 ID: 경로}를 ORM 객체를 만들지 않고 조회합니다."""
+        paths: Dict[int, str] = {}
+        for start in range(0, len(ids), ID_CHUNK_SIZE):
+            statement = (
+                select(File.id, Directory.path, File.name)
+                .join(Directory, File.directory_id == Directory.id)
+                .where(File.id.in_(ids[start:start + ID_CHUNK_SIZE]), File.is_deleted == False)  # noqa: E712
+            )
+            for file_id, directory, name in self.session.exec(statement).all():
+                paths[file_id] = os.path.join(directory, name)
+        return paths
+
+    def find_index_entries_by_paths(self, paths: List[str]) -> Dict[str, FileIndexEntry]:
+        """ORM 객체를 만들지 않고 변경 여부 판단에 필요한 컬럼만 조회합니다."""
+        keys = self._path_keys(paths)
+        if not keys:
+            return {}
+        statement = (
+            select(Directory.path, File.name, File.id, File.size, File.mtime_ns, File.inode, File.is_deleted)
+            .join(Directory, File.directory_id == Directory.id)
+            .where(tuple_(File.directory_id, File.name).in_(keys))
+        )
+        return {
+            os.path.join(directory, name): FileIndexEntry(*row)
+            for directory, name, *row in self.session.exec(statement).all()
+        }
+
+    def _insert_rows(self, files: List[File]) -> Tuple[List[Dict], Dict[int, str]]:
+        """INSERT할 행과 {디렉토리 ID: 디렉토리 경로}를 반환합니다. 없는 디렉토리는 먼저 만듭니다."""
+        directory_ids = self._ensure_directories(
+            (file.directory for file in files),
+            {file.directory: file.archive_id for file in files if file.archive_id is not None},
+        )
+        rows = []
+        for file in files:
+            row = file.model_dump(exclude={"id"})
+            row["directory_id"] = directory_ids[file.directory]
+            rows.append(row)
+        return rows, {directory_id: path for path, directory_id in directory_ids.items()}
+
+    def _execute_insert(self, statement, files: List[File]) -> Dict[str, int]:
+        rows, directory_paths = self._insert_rows(files)
+        result = self.session.execute(statement, rows)
+        saved = {
+            os.path.join(directory_paths[directory_id], name): file_id
+            for directory_id, name, file_id in result.all()
+        }
+        self.session.commit()
+        return saved
+
+    @staticmethod
+    def _upsert_statement(where=None):
+        """기존 파일의 크기/수정 시각/inode를 갱신하고 삭제 표시를 해제하는 INSERT ... ON CONFLICT 문을 만듭니다.
+
+        inode를 알 수 없는 파일(manifest로 인덱싱한 파일)은 기존 inode를 유지합니다.
+        크기나 수정 시각이 바뀐 파일은 내용 해시를 지워 다음 해시 계산 때 다시 계산되게 하고,
+        압축 파일이면 내부 항목 목록도 다시 읽도록 표시합니다. where가 주어지면 그 조건의 기존 행만 갱신합니다.
+        """
+        statement = insert(File)
+        content_changed = or_(
+            File.size != statement.excluded.size,
+            File.mtime_ns.is_distinct_from(statement.excluded.mtime_ns),
+        )
+        return statement.on_conflict_do_update(
+            index_elements=["directory_id", "name"],
+            set_={
+                "size": statement.excluded.size,
+                "mtime_ns": statement.excluded.mtime_ns,
+                "inode": func.coalesce(statement.excluded.inode, File.inode),
+                "device": func.coalesce(statement.excluded.device, File.device),
+                "is_deleted": False,
+                "partial_hash": case((content_changed, None), else_=File.partial_hash),
+                "content_hash": case((content_changed, None), else_=File.content_hash),
+                "archive_members_listed": case((content_changed, False), else_=File.archive_members_listed),
+                "updated_at": statement.excluded.updated_at,
+            },
+            where=where,
+        ).returning(File.directory_id, File.name, File.id)
+
+    def bulk_insert(self, files: List[File]) -> Dict[str, int]:
+        """새 파일만 한 번의 INSERT로 저장합니다. 이미 존재하는 경로는 건너뛰지만,
+        삭제 표시된 파일은 다시 나타난 것이므로 bulk_upsert처럼 갱신하고 삭제 표시를 해제합니다.
+
+        새로 저장되거나 되살아난 파일의 {전체 경로: ID}를 반환합니다.
+        """
+        if not files:
+            return {}
+        return self._execute_insert(self._upsert_statement(where=File.is_deleted), files)
+
+    def bulk_upsert(self, files: List[File]) -> Dict[str, int]:
+        """새 파일은 저장하고, 이미 존재하는 파일은 갱신하며 삭제 표시를 해제합니다(_upsert_statement 참고).
+
+        저장되거나 갱신된 파일의 {전체 경로: ID}를 반환합니다.
+        """
+        if not files:
+            return {}
+        return self._execute_insert(self._upsert_statement(), files)
+
+    def find_move_candidates(
+        self, identities: List[Tuple[int, int, int, int]]
+    ) -> Dict[Tuple[int, int, int, int], List[FileMoveCandidate]]:
+        """(장치, inode, 크기, 수정 시각)이 같은 기존 파일을 조회합니다. 압축 파일 내부 항목은 제외합니다."""
+        if not identities:
+            return {}
+        statement = (
+            select(File.device, File.inode, File.size, File.mtime_ns, File.id, Directory.path, File.name, File.is_deleted)
+            .join(Directory, File.directory_id == Directory.id)
+            .where(
+                tuple_(File.device, File.inode, File.size, File.mtime_ns).in_(identities),
+                File.archive_id.is_(None),
+            )
+            .order_by(File.id)
+        )
+        candidates: Dict[Tuple[int, int, int, int], List[FileMoveCandidate]] = {}
+        for device, inode, size, mtime_ns, file_id, directory, name, is_deleted in self.session.exec(statement).all():
+            candidates.setdefault((device, inode, size, mtime_ns), []).append(
+                FileMoveCandidate(file_id, os.path.join(directory, name), is_deleted)
+            )
+        return candidates
+
+    def move_files(self, moves: List[Tuple[int, File]]) -> None:
+        """기존 파일 행의 경로를 새 파일의 경로로 바꿉니다. 추출 결과 등 나머지 컬럼은 유지합니다.
+
+        이동한 압축 파일은 내부 항목 경로도 바뀌므로 다음 인덱싱에서 내부 항목 목록을 다시 읽습니다.
+        """
+        if not moves:
+            return
+        directory_ids = self._ensure_directories(file.directory for _, file in moves)
+        now = datetime.now(timezone.utc)
+        self.session.execute(update(File), [
+            {
+                "id": file_id,
+                "directory_id": directory_ids[file.directory],
+                "name": file.name,
+                "filename": file.filename,
+                "extension": file.extension,
+                "is_deleted": False,
+                "archive_members_listed": False,
+                "updated_at": now,
+            }
+            for file_id, file in moves
+        ])
+        self.session.commit()
+
+    def save_archive_members(self, archive_id: int, members: List[File]) -> Dict[str, int]:
+        """압축 파일의 내부 항목을 저장하고, 목록에서 사라진 항목은 삭제 표시합니다.
+
+        압축 파일은 내부 항목 목록을 읽은 것으로 표시됩니다. 저장된 항목의 {전체 경로: ID}를 반환합니다.
+        항목 수와 관계없이 바인딩 변수 수가 일정하도록, 기존 항목을 모두 삭제 표시한 뒤
+        upsert로 목록에 있는 항목의 삭제 표시를 해제합니다. 모두 한 트랜잭션에서 실행됩니다.
+        """
+        self.session.exec(update(File).where(File.archive_id == archive_id).values(is_deleted=True))
+        self.session.exec(update(File).where(File.id == archive_id).values(archive_members_listed=True))
+        if not members:
+            self.session.commit()
+            return {}
+        return self.bulk_upsert(members)
+
+    def find_partial_hash_candidates(self, after_id: int, limit: int) -> List[FileHashEntry]:
+        """크기가 같은 다른 파일이 있지만 부분 해시가 없는 파일을 ID 순으로 조회합니다."""
+        shared_sizes = (
+            select(File.size)
+            .where(File.is_deleted == False, File.archive_id.is_(None))  # noqa: E712
+            .group_by(File.size)
+            .having(func.count(File.id) > 1)
+        )
+        statement = (
+            select(File.id, Directory.path, File.name, File.size)
+            .join(Directory, File.directory_id == Directory.id)
+            .where(
+                File.is_deleted == False,  # noqa: E712
+                File.archive_id.is_(None),  # 압축 파일 내부 항목은 직접 읽을 수 없습니다.
+                File.partial_hash.is_(None),
+                File.size.in_(shared_sizes),
+                File.id > after_id,
+            )
+            .order_by(File.id)
+            .limit(limit)
+        )
+        return self._hash_entries(statement)
+
+    def find_content_hash_candidates(self, after_id: int, limit: int) -> List[FileHashEntry]:
+        """크기와 부분 해시가 같은 다른 파일이 있지만 전체 해시가 없는 파일을 ID 순으로 조회합니다."""
+        shared_partial_hashes = (
+            select(File.size, File.partial_hash)
+            .where(File.is_deleted == False, File.partial_hash.is_not(None), File.archive_id.is_(None))  # noqa: E712
+            .group_by(File.size, File.partial_hash)
+            .having(func.count(File.id) > 1)
+        )
+        statement = (
+            select(File.id, Directory.path, File.name, File.size)
+            .join(Directory, File.directory_id == Directory.id)
+            .where(
+                File.is_deleted == False,  # noqa: E712
+                File.archive_id.is_(None),
+                File.content_hash.is_(None),
+                tuple_(File.size, File.partial_hash).in_(shared_partial_hashes),
+                File.id > after_id,
+            )
+            .order_by(File.id)
+            .limit(limit)
+        )
+        return self._hash_entries(statement)
+
+    def _hash_entries(self, statement) -> List[FileHashEntry]:
+        return [
+            FileHashEntry(file_id, os.path.join(directory, name), size)
+            for file_id, directory, name, size in self.session.exec(statement).all()
+        ]
+
+    def save_hashes(self, partial_hashes: Dict[int, str], content_hashes: Dict[int, str]) -> None:
+        """{파일 ID: 해시}를 기본 키 기준 일괄 UPDATE로 저장합니다."""
+        if partial_hashes:
+            self.session.execute(
+                update(File),
+                [{"id": file_id, "partial_hash": value} for file_id, value in partial_hashes.items()],
+            )
+        if content_hashes:
+            self.session.execute(
+                update(File),
+                [{"id": file_id, "content_hash": value} for file_id, value in content_hashes.items()],
+            )
+        self.session.commit()
+
+    def _duplicate_groups_statement(self):
+        return (
+            select(File.content_hash, File.size)
+            .where(File.is_deleted == False, File.content_hash.is_not(None))  # noqa: E712
+            .group_by(File.content_hash, File.size)
+            .having(func.count(File.id) > 1)
+        )
+
+    def find_duplicate_groups(self, skip: int = 0, limit: int = 10) -> List[Tuple[str, int]]:
+        """내용이 같은 파일 묶음의 (내용 해시, 크기)를 낭비되는 용량이 큰 순으로 조회합니다."""
+        statement = (
+            self._duplicate_groups_statement()
+            .order_by((File.size * (func.count(File.id) - 1)).desc(), File.content_hash)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [tuple(row) for row in self.session.exec(statement).all()]
+
+    def count_duplicate_groups(self) -> int:
+        statement = select(func.count()).select_from(self._duplicate_groups_statement().subquery())
+        return self.session.exec(statement).one()
+
+    def find_by_content_hashes(self, content_hashes: List[str]) -> List[File]:
+        if not content_hashes:
+            return []
         statement = (
-            select(File)
-            .join(ExtractedData)
-            .where(ExtractedData.pattern_id == pattern_id)
-            .distinct()
+            self._with_directory(select(File))
+            .where(File.is_deleted == False, File.content_hash.in_(content_hashes))  # noqa: E712
+            .order_by(File.content_hash, Directory.path, File.name)
         )
         return self.session.exec(statement).all()
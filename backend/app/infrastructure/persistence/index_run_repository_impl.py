@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+from typing import List, Optional, Set
+from sqlmodel import Session, select, update, delete
+from sqlalchemy import insert
+from sqlalchemy.sql import func
+from app.domain.index_run.model import (
+    IndexRun,
+    IndexRunDirectory,
+    INDEX_RUN_STATUS_RUNNING,
+    INDEX_RUN_STATUS_INTERRUPTED,
+    INCOMPLETE_INDEX_RUN_STATUSES,
+)
+from app.domain.index_run.repository import IndexRunRepository
+
+class IndexRunRepositoryImpl(IndexRunRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, index_run: IndexRun) -> IndexRun:
+        self.session.add(index_run)
+        self.session.commit()
+        self.session.refresh(index_run)
+        return index_run
+
+    def find_by_id(self, index_run_id: int) -> Optional[IndexRun]:
+        return self.session.get(IndexRun, index_run_id)
+
+    def _filtered(self, statement, incomplete_only: bool):
+        if incomplete_only:
+            statement = statement.where(IndexRun.status.in_(INCOMPLETE_INDEX_RUN_STATUSES))
+        return statement
+
+    def find_all(self, skip: int = 0, limit: int = 10, incomplete_only: bool = False) -> List[IndexRun]:
+        statement = self._filtered(select(IndexRun), incomplete_only)
+        statement = statement.order_by(IndexRun.id.desc()).offset(skip).limit(limit)
+        return self.session.exec(statement).all()
+
+    def count_all(self, incomplete_only: bool = False) -> int:
+        statement = self._filtered(select(func.count(IndexRun.id)), incomplete_only)
+        return self.session.exec(statement).one()
+
+    def record_batch(
+        self,
+        index_run_id: int,
+        seen_count: int,
+        added_count: int,
+        changed_count: int,
+        last_committed_path: Optional[str],
+        completed_directories: List[str],
+    ) -> None:
+        """저장이 끝난 배치의 집계와 완료된 디렉토리를 한 트랜잭션으로 기록합니다."""
+        now = datetime.now(timezone.utc)
+        self.session.exec(
+            update(IndexRun)
+            .where(IndexRun.id == index_run_id)
+            .values(
+                seen_count=seen_count,
+                added_count=added_count,
+                changed_count=changed_count,
+                committed_batch_count=IndexRun.committed_batch_count + 1,
+                last_committed_path=last_committed_path,
+                updated_at=now,
+            )
+        )
+        if completed_directories:
+            self.session.execute(
+                insert(IndexRunDirectory),
+                [
+                    {"index_run_id": index_run_id, "path": path, "created_at": now, "updated_at": now}
+                    for path in completed_directories
+                ],
+            )
+        self.session.commit()
+
+    def find_completed_directories(self, index_run_id: int) -> Set[str]:
+        statement = select(IndexRunDirectory.path).where(IndexRunDirectory.index_run_id == index_run_id)
+        return set(self.session.exec(statement).all())
+
+    def finish(self, index_run_id: int, status: str) -> None:
+        """실행을 끝난 상태로 바꾸고, 더 이상 필요 없는 완료 디렉토리 기록을 삭제합니다."""
+        now = datetime.now(timezone.utc)
+        self.session.exec(
+            update(IndexRun)
+            .where(IndexRun.id == index_run_id)
+            .values(status=status, finished_at=now, updated_at=now)
+        )
+        self.session.exec(delete(IndexRunDirectory).where(IndexRunDirectory.index_run_id == index_run_id))
+        self.session.commit()
+
+    def mark_interrupted(self, index_run_id: int) -> None:
+        # 실행을 중단시킨 오류로 실패한 트랜잭션이 남아 있을 수 있으므로 먼저 되돌립니다.
+        # 저장이 끝난 배치는 모두 커밋되어 있으므로 되돌려지지 않습니다.
+        self.session.rollback()
+        self.session.exec(
+            update(IndexRun)
+            .where(IndexRun.id == index_run_id)
+            .values(status=INDEX_RUN_STATUS_INTERRUPTED, updated_at=datetime.now(timezone.utc))
+        )
+        self.session.commit()
+
+    def mark_running_as_interrupted(self) -> int:
+        """프로세스 시작 시 호출하여, 이전 프로세스에서 실행 중이던 실행을 중단된 것으로 표시합니다."""
+        result = self.session.exec(
+            update(IndexRun)
+            .where(IndexRun.status == INDEX_RUN_STATUS_RUNNING)
+            .values(status=INDEX_RUN_STATUS_INTERRUPTED, updated_at=datetime.now(timezone.utc))
+        )
+        self.session.commit()
+        return result.rowcount
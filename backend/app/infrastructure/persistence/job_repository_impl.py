@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from sqlmodel import Session, select, update
+from sqlalchemy.sql import func
+from app.domain.job.model import Job, UNFINISHED_JOB_STATUSES
+from app.domain.job.repository import JobRepository
+
+class JobRepositoryImpl(JobRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, job: Job) -> Job:
+        self.session.add(job)
+        self.session.commit()
+        self.session.refresh(job)
+        return job
+
+    def find_by_id(self, job_id: int) -> Optional[Job]:
+        return self.session.get(Job, job_id)
+
+    def find_all(self, skip: int = 0, limit: int = 10) -> List[Job]:
+        statement = select(Job).order_by(Job.id.desc()).offset(skip).limit(limit)
+        return self.session.exec(statement).all()
+
+    def count_all(self) -> int:
+        statement = select(func.count(Job.id))
+        return self.session.exec(statement).one()
+
+    def find_unfinished(self) -> List[Job]:
+        statement = select(Job).where(Job.status.in_(UNFINISHED_JOB_STATUSES)).order_by(Job.id)
+        return self.session.exec(statement).all()
+
+    def update_progress(self, job_id: int, progress: Dict[str, Any], checkpoint: Optional[Dict[str, Any]] = None) -> None:
+        """진행 상황(과 체크포인트)만 갱신합니다. 작업 객체를 다시 읽지 않도록 UPDATE 문으로 처리합니다."""
+        values: Dict[str, Any] = {"progress": progress, "updated_at": datetime.now(timezone.utc)}
+        if checkpoint is not None:
+            values["checkpoint"] = checkpoint
+        self.session.exec(update(Job).where(Job.id == job_id).values(**values))
+        self.session.commit()
+
+    def is_cancel_requested(self, job_id: int) -> bool:
+        statement = select(Job.cancel_requested).where(Job.id == job_id)
+        return bool(self.session.exec(statement).one_or_none())
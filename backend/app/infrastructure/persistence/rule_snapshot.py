@@ -0,0 +1,35 @@
+import threading
+from typing import Callable, Generic, Hashable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class RuleSnapshot(Generic[T]):
+    """패턴처럼 자주 읽고 드물게 바뀌는 규칙 목록을 프로세스 메모리에 보관합니다.
+
+    같은 프로세스의 변경은 invalidate()로 바로 반영하고, 다른 프로세스의 변경은
+    호출자가 넘기는 stamp(예: 행 수와 최근 수정 시각)가 달라지는 것으로 감지합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._stamp: Optional[Hashable] = None
+        self._rules: Optional[List[T]] = None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._rules = None
+
+    def get(self, stamp: Hashable, load: Callable[[], List[T]]) -> List[T]:
+        rules = self._rules
+        if rules is None or self._stamp != stamp:
+            version = self._version
+            rules = load()
+            with self._lock:
+                # 읽는 동안 무효화되었다면 이전 내용일 수 있으므로 보관하지 않습니다.
+                if version == self._version:
+                    self._rules, self._stamp = rules, stamp
+        # 호출자가 목록을 바꿔도 보관한 스냅샷에는 영향이 없도록 복사본을 반환합니다.
+        return list(rules)
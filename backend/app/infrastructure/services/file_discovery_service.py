@@ -0,0 +1,409 @@
+import logging
+import mmap
+import os
+import queue
+import stat
+import threading
+import time
+import unicodedata
+import zipfile
+from collections import deque
+from decimal import Decimal, InvalidOperation
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Iterator, List, Optional, Tuple
+from app.domain.file.model import File
+from app.domain.file.discovery import DiscoveryState, FileDiscovery
+from app.domain.exclusion_pattern.matcher import ExclusionMatcher
+
+
+ARCHIVE_EXTENSIONS = {"zip", "cbz"}  # 내부 항목을 인덱싱할 수 있는 압축 파일 확장자 (소문자)
+MANIFEST_SNIFF_SIZE = 64 * 1024  # 구분자(NUL/줄바꿈)를 판단하기 위해 살펴볼 manifest 앞부분 크기
+
+logger = logging.getLogger(__name__)
+
+
+def _to_nfc(value: str) -> str:
+    """ASCII 문자열은 NFC 정규화 결과가 항상 동일하므로 정규화를 건너뜁니다."""
+    if value.isascii():
+        return value
+    return unicodedata.normalize("NFC", value)
+
+
+class FileDiscoveryService(FileDiscovery):
+    """os.scandir 기반으로 디렉토리를 탐색하여 File 객체를 생성합니다.
+
+    DirEntry가 제공하는 stat 정보를 재사용하므로 파일당 추가 stat 호출이 없습니다.
+    workers가 2 이상이면 여러 스레드가 디렉토리를 동시에 읽어 네트워크 마운트처럼
+    지연 시간이 큰 환경에서의 탐색 시간을 줄입니다. 이때 생성 순서는 보장되지 않습니다.
+    """
+
+    def __init__(self, workers: int = 1):
+        self.workers = max(1, workers)
+
+    def _build_file(self, entry: os.DirEntry, directory: str) -> File:
+        # DirEntry.stat()은 결과를 캐시하며 크기, 수정 시각, inode를 한 번에 제공합니다.
+        return self._file_from_stat(entry.name, entry.path, directory, entry.stat(follow_symlinks=True))
+
+    def build_file(self, full_path: str) -> Optional[File]:
+        """경로 하나의 File 객체를 생성합니다. 일반 파일이 아니거나 접근할 수 없으면 None을 반환합니다."""
+        try:
+            stat_result = os.stat(full_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        return self._file_from_stat(
+            os.path.basename(full_path), full_path, os.path.dirname(full_path), stat_result
+        )
+
+    def _file_from_stat(self, name: str, path: str, directory: str, stat_result: os.stat_result) -> File:
+        return self._make_file(
+            name, path, directory, stat_result.st_size, stat_result.st_mtime_ns,
+            stat_result.st_ino, stat_result.st_dev,
+        )
+
+    def _make_file(
+        self,
+        name: str,
+        path: str,
+        directory: str,
+        size: int,
+        mtime_ns: Optional[int],
+        inode: Optional[int],
+        device: Optional[int] = None,
+    ) -> File:
+        base_name, extension = os.path.splitext(name)
+        # 확장자에서 선행하는 점(.) 제거
+        if extension.startswith('.'):
+            extension = extension[1:]
+
+        return File(
+            filename=_to_nfc(base_name),
+            extension=_to_nfc(extension),
+            directory=directory,
+            full_path=_to_nfc(path),
+            size=size,
+            mtime_ns=mtime_ns,
+            inode=inode,
+            device=device,
+        )
+
+    def _scan_directory(
+        self, root: str, matcher: ExclusionMatcher, state: Optional[DiscoveryState] = None
+    ) -> Tuple[List[File], List[str]]:
+        """디렉토리 하나를 읽어 (파일 목록, 하위 디렉토리 목록)을 반환합니다."""
+        mtime_ns = None
+        resumed = state is not None and root in state.resumed_directories
+        if state is not None:
+            # 목록을 읽기 전에 수정 시각을 기록해야 읽는 도중의 변경이 다음 실행에서 감지됩니다.
+            try:
+                mtime_ns = os.stat(root).st_mtime_ns
+            except OSError:
+                state.record_scan(root, error_count=1)
+                return [], []
+            if state.known_directories.get(root) == mtime_ns:
+                state.skipped_directories.add(root)
+                state.record_scan(root)
+                return [], [
+                    path for path in state.known_children.get(root, [])
+                    if not matcher.prunes_directory(path)
+                ]
+
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            # 접근할 수 없는 디렉토리는 건너뜁니다.
+            if state is not None:
+                state.record_scan(root, error_count=1)
+            return [], []
+
+        if resumed:
+            state.skipped_directories.add(root)
+        elif state is not None:
+            state.listed_directories[root] = (mtime_ns, len(entries))
+
+        files = []
+        sub_directories = []
+        excluded_count = 0
+        error_count = 0
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # os.walk 기본 동작과 같이 심볼릭 링크 디렉토리는 따라가지 않으며,
+                # 하위 경로가 모두 제외되는 디렉토리는 내려가지 않습니다.
+                if entry.is_symlink():
+                    continue
+                if matcher.prunes_directory(entry.path):
+                    excluded_count += 1
+                else:
+                    sub_directories.append(entry.path)
+                continue
+
+            if resumed:
+                # 이미 저장한 디렉토리는 하위 디렉토리만 찾습니다.
+                continue
+
+            # 제외 패턴에 일치하는지 확인
+            if matcher.matches(entry.path):
+                excluded_count += 1
+                continue
+
+            try:
+                files.append(self._build_file(entry, root))
+            except OSError:
+                # 접근할 수 없는 파일은 건너뜁니다.
+                error_count += 1
+                continue
+
+        if state is not None:
+            state.record_scan(root, excluded_count, error_count)
+        return files, sub_directories
+
+    def discover(
+        self,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        state: Optional[DiscoveryState] = None,
+    ) -> Iterator[File]:
+        """지정된 디렉토리 하위의 파일을 생성합니다."""
+        # 제외 패턴은 실행마다 한 번만 컴파일합니다.
+        matcher = ExclusionMatcher(exclude_patterns or [])
+
+        if self.workers > 1:
+            return self._discover_parallel(directory_path, matcher, state)
+        return self._discover_sequential(directory_path, matcher, state)
+
+    def _discover_sequential(
+        self, directory_path: str, matcher: ExclusionMatcher, state: Optional[DiscoveryState] = None
+    ) -> Iterator[File]:
+        """os.walk와 같은 순서(하향식)로 파일을 생성합니다."""
+        stack = [directory_path]
+        while stack:
+            root = stack.pop()
+            files, sub_directories = self._scan_directory(root, matcher, state)
+            yield from files
+            if state is not None:
+                state.completed_directories.append(root)
+            # os.walk와 동일한 방문 순서를 위해 역순으로 스택에 쌓습니다.
+            stack.extend(reversed(sub_directories))
+
+    def _discover_parallel(
+        self, directory_path: str, matcher: ExclusionMatcher, state: Optional[DiscoveryState] = None
+    ) -> Iterator[File]:
+        """워커별 디렉토리 큐와 작업 훔치기(work stealing)로 여러 디렉토리를 동시에 읽습니다."""
+        # 각 워커는 자신의 큐 끝에서 꺼내고(LIFO), 비어 있으면 다른 워커 큐의 앞에서 훔쳐옵니다.
+        work_queues: List[Deque[str]] = [deque() for _ in range(self.workers)]
+        work_queues[0].append(directory_path)
+        lock = threading.Lock()
+        work_available = threading.Condition(lock)
+        control = {"pending": 1, "stopped": False}  # 큐에 있거나 처리 중인 디렉토리 수
+        # (디렉토리, 파일 목록), 워커에서 발생한 예외, 또는 워커 종료를 알리는 None
+        results: "queue.Queue[object]" = queue.Queue(maxsize=self.workers * 4)
+
+        def take(worker_index: int) -> Optional[str]:
+            with work_available:
+                while True:
+                    if control["stopped"] or control["pending"] == 0:
+                        return None
+                    own = work_queues[worker_index]
+                    if own:
+                        return own.pop()
+                    for offset in range(1, self.workers):
+                        victim = work_queues[(worker_index + offset) % self.workers]
+                        if victim:
+                            return victim.popleft()
+                    work_available.wait()
+
+        def publish(item: object) -> None:
+            # 소비자가 멈춘 경우 큐가 가득 찬 채로 워커가 영원히 대기하지 않도록 합니다.
+            while not control["stopped"]:
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def worker(worker_index: int) -> None:
+            try:
+                while True:
+                    root = take(worker_index)
+                    if root is None:
+                        break
+                    sub_directories: List[str] = []
+                    try:
+                        files, sub_directories = self._scan_directory(root, matcher, state)
+                        if files or state is not None:
+                            publish((root, files))
+                    finally:
+                        # 예외가 발생해도 처리 중인 디렉토리 수를 줄여야 다른 워커가 끝없이 기다리지 않습니다.
+                        with work_available:
+                            work_queues[worker_index].extend(reversed(sub_directories))
+                            control["pending"] += len(sub_directories) - 1
+                            work_available.notify_all()
+            except BaseException as e:
+                # 스레드 풀의 Future는 예외를 삼키므로 소비자에게 전달하여 다시 발생시킵니다.
+                publish(e)
+            finally:
+                publish(None)
+
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="file-discovery")
+        for worker_index in range(self.workers):
+            executor.submit(worker, worker_index)
+
+        try:
+            finished_workers = 0
+            while finished_workers < self.workers:
+                item = results.get()
+                if item is None:
+                    finished_workers += 1
+                    continue
+                if isinstance(item, BaseException):
+                    raise item
+                root, files = item
+                yield from files
+                if state is not None:
+                    state.completed_directories.append(root)
+        finally:
+            # 소비자가 중간에 멈춘 경우에도 워커가 종료되도록 합니다.
+            with work_available:
+                control["stopped"] = True
+                work_available.notify_all()
+            executor.shutdown(wait=True)
+
+    def discover_manifest(
+        self,
+        manifest_path: str,
+        directory_path: str,
+        exclude_patterns: Optional[List[str]] = None,
+        state: Optional[DiscoveryState] = None,
+        has_stats: bool = False,
+        resume_after: Optional[str] = None,
+    ) -> Iterator[File]:
+        """디렉토리를 읽지 않고 manifest 파일에 나열된 경로로 File 객체를 생성합니다.
+
+        manifest는 mmap으로 열어 레코드 단위로 읽으므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+        레코드는 파일 경로이며 NUL 또는 줄바꿈으로 구분합니다. 앞부분에 NUL이 있으면 NUL 구분
+        (find -type f -print0)으로 봅니다. has_stats이면 각 레코드는 "크기<TAB>수정 시각(초)<TAB>경로" 형식이며
+        (find -type f -printf '%s\\t%T@\\t%p\\0'), 아니면 경로마다 stat을 호출합니다.
+        상대 경로는 directory_path 기준이며, directory_path 밖의 경로는 제외합니다.
+        resume_after가 주어지면 그 경로의 레코드까지 건너뜁니다. manifest가 바뀌어 그 경로가 없으면
+        경고를 남기고 처음부터 다시 읽습니다(이미 저장된 파일은 저장할 때 건너뜁니다).
+        """
+        matcher = ExclusionMatcher(exclude_patterns or [])
+        root = os.path.normpath(directory_path)
+        prefix = root.rstrip(os.sep) + os.sep
+        # 진행 상황 집계는 디렉토리가 바뀔 때만 반영하여 레코드마다 잠금을 잡지 않습니다.
+        current_directory = None
+        excluded_count = 0
+        error_count = 0
+
+        for record in self._manifest_records(manifest_path):
+            size = mtime_ns = None
+            if has_stats:
+                fields = record.split(b"\t", 2)
+                try:
+                    size = int(fields[0])
+                    mtime_ns = int(Decimal(fields[1].decode("ascii")) * 1_000_000_000)
+                    record = fields[2]
+                except (IndexError, ValueError, InvalidOperation):
+                    # 건너뛰는 레코드의 오류는 처음부터 다시 읽을 때 두 번 세지 않도록 세지 않습니다.
+                    if resume_after is None:
+                        error_count += 1
+                    continue
+
+            path = os.path.normpath(os.path.join(root, os.fsdecode(record)))
+            directory, name = os.path.split(path)
+            if directory != current_directory:
+                if state is not None and current_directory is not None:
+                    state.record_scan(current_directory, excluded_count, error_count)
+                    excluded_count = error_count = 0
+                current_directory = directory
+
+            if resume_after is not None:
+                # 레코드 순서는 실행마다 같으므로, 마지막으로 저장한 경로까지는 이미 저장된 레코드입니다.
+                if _to_nfc(path) == resume_after:
+                    resume_after = None
+                continue
+            if not path.startswith(prefix) or matcher.matches(path):
+                excluded_count += 1
+                continue
+
+            if has_stats:
+                yield self._make_file(name, path, directory, size, mtime_ns, None)
+                continue
+            file = self.build_file(path)
+            if file is None:
+                error_count += 1
+                continue
+            yield file
+
+        if resume_after is not None:
+            logger.warning(
+                "manifest %s does not contain resume path %s; reading it from the beginning",
+                manifest_path, resume_after,
+            )
+            yield from self.discover_manifest(manifest_path, directory_path, exclude_patterns, state, has_stats)
+            return
+        if state is not None:
+            state.record_scan(current_directory, excluded_count, error_count)
+
+    @staticmethod
+    def _manifest_records(manifest_path: str) -> Iterator[bytes]:
+        """manifest의 비어 있지 않은 레코드를 순서대로 생성합니다."""
+        with open(manifest_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    # 앞에서부터 한 번만 읽으므로 커널이 미리 읽고 읽은 페이지를 먼저 회수하도록 알립니다.
+                    data.madvise(mmap.MADV_SEQUENTIAL)
+                delimiter = b"\0" if data.find(b"\0", 0, MANIFEST_SNIFF_SIZE) != -1 else b"\n"
+                position = 0
+                end_of_data = len(data)
+                while position < end_of_data:
+                    end = data.find(delimiter, position)
+                    if end == -1:
+                        end = end_of_data
+                    record = data[position:end]
+                    position = end + 1
+                    if delimiter == b"\n" and record.endswith(b"\r"):
+                        record = record[:-1]
+                    if record:
+                        yield record
+
+    @staticmethod
+    def is_archive(file: File) -> bool:
+        return file.extension.lower() in ARCHIVE_EXTENSIONS
+
+    def list_archive_members(self, archive_path: str) -> Optional[List[File]]:
+        """압축 파일의 내부 항목을 "압축 파일 경로/내부 경로"를 경로로 가지는 File 객체로 반환합니다.
+
+        ZIP의 중앙 디렉토리만 읽으며 항목의 압축은 풀지 않습니다. 크기는 압축 해제 후 크기입니다.
+        압축 파일을 읽을 수 없으면 None을 반환합니다.
+        """
+        try:
+            with zipfile.ZipFile(archive_path) as archive:
+                infos = archive.infolist()
+        except (OSError, zipfile.BadZipFile):
+            return None
+
+        members = []
+        for info in infos:
+            parts = info.filename.split("/")
+            # 디렉토리 항목과 압축 파일 밖을 가리키는 경로는 건너뜁니다.
+            if info.is_dir() or not parts[0] or ".." in parts:
+                continue
+            path = os.path.join(archive_path, *parts)
+            try:
+                # ZIP의 수정 시각은 시간대 정보가 없는 현지 시각입니다.
+                mtime_ns = int(time.mktime(info.date_time + (0, 0, -1))) * 1_000_000_000
+            except (OverflowError, ValueError):
+                mtime_ns = None
+            members.append(self._make_file(
+                parts[-1], path, os.path.dirname(path), info.file_size, mtime_ns, None
+            ))
+        return members
@@ -0,0 +1,75 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
+
+from app.domain.file.model import FileHashEntry
+
+BLOCK_SIZE = 64 * 1024  # 부분 해시에 사용할 앞/뒤 블록 크기
+READ_SIZE = 1024 * 1024  # 전체 해시 계산 시 한 번에 읽을 크기
+
+
+def _new_hash():
+    return hashlib.blake2b(digest_size=20)
+
+
+class FileHashService:
+    """파일 내용의 부분 해시(앞/뒤 블록)와 전체 해시를 계산합니다.
+
+    hashlib은 큰 버퍼를 처리할 때 GIL을 해제하므로 스레드 풀로 여러 파일을 동시에 읽고 계산합니다.
+    """
+
+    def __init__(self, workers: int = 1, block_size: int = BLOCK_SIZE):
+        self.workers = max(1, workers)
+        self.block_size = block_size
+
+    def covers_whole_file(self, size: int) -> bool:
+        """부분 해시가 파일 전체를 읽는 크기이면 부분 해시를 전체 해시로 사용할 수 있습니다."""
+        return size <= self.block_size * 2
+
+    def partial_hash(self, full_path: str) -> Optional[str]:
+        """파일의 앞/뒤 블록 해시를 반환합니다. 읽을 수 없으면 None을 반환합니다."""
+        try:
+            with open(full_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if self.covers_whole_file(size):
+                    digest = _new_hash()
+                    digest.update(f.read())
+                    return digest.hexdigest()
+                digest = _new_hash()
+                digest.update(f.read(self.block_size))
+                f.seek(size - self.block_size)
+                digest.update(f.read(self.block_size))
+                return digest.hexdigest()
+        except OSError:
+            return None
+
+    def content_hash(self, full_path: str) -> Optional[str]:
+        """파일 전체 내용의 해시를 반환합니다. 읽을 수 없으면 None을 반환합니다."""
+        digest = _new_hash()
+        buffer = bytearray(READ_SIZE)
+        view = memoryview(buffer)
+        try:
+            with open(full_path, "rb", buffering=0) as f:
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    digest.update(view[:read])
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def hash_files(
+        self, entries: Iterable[FileHashEntry], full: bool = False
+    ) -> Iterator[Tuple[FileHashEntry, Optional[str]]]:
+        """(파일, 해시)를 입력 순서대로 생성합니다. full이 False이면 부분 해시를 계산합니다."""
+        hash_function = self.content_hash if full else self.partial_hash
+        if self.workers == 1:
+            for entry in entries:
+                yield entry, hash_function(entry.full_path)
+            return
+
+        entries = list(entries)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="file-hash") as executor:
+            yield from zip(entries, executor.map(hash_function, [entry.full_path for entry in entries]))
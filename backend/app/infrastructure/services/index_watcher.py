@@ -0,0 +1,276 @@
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from app.domain.exclusion_pattern.matcher import ExclusionMatcher
+from app.infrastructure.services.inotify import (
+    Inotify,
+    InotifyEvent,
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_DELETE,
+    IN_DELETE_SELF,
+    IN_IGNORED,
+    IN_ISDIR,
+    IN_MOVED_FROM,
+    IN_MOVED_TO,
+    IN_ONLYDIR,
+    IN_Q_OVERFLOW,
+)
+
+logger = logging.getLogger(__name__)
+
+WATCH_MASK = (
+    IN_CREATE | IN_CLOSE_WRITE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR
+)
+
+
+@dataclass
+class FileSystemChanges:
+    """한 번에 반영할 파일 시스템 변경 묶음. 같은 경로의 이벤트는 마지막 이벤트만 남습니다."""
+    upserted_paths: Set[str] = field(default_factory=set) # 생성/수정/이동되어 들어온 파일
+    deleted_paths: Set[str] = field(default_factory=set) # 삭제/이동되어 나간 파일
+    deleted_directories: Set[str] = field(default_factory=set) # 삭제/이동되어 나간 디렉토리
+    scanned_directories: Set[str] = field(default_factory=set) # 새로 생기거나 이동되어 들어온 디렉토리
+    rescan_roots: Set[str] = field(default_factory=set) # 이벤트 유실로 다시 탐색해야 하는 감시 루트
+    moved_paths: Dict[str, str] = field(default_factory=dict) # 감시 범위 안에서 이동한 파일 (이전 경로 -> 새 경로)
+    moved_directories: Dict[str, str] = field(default_factory=dict) # 감시 범위 안에서 이동한 디렉토리
+
+    def upsert(self, path: str) -> None:
+        self.deleted_paths.discard(path)
+        self.upserted_paths.add(path)
+
+    def delete(self, path: str) -> None:
+        self.upserted_paths.discard(path)
+        self.deleted_paths.add(path)
+        # 이동해 온 파일이 다시 삭제되면 이동 전 경로의 파일이 삭제된 것입니다.
+        source = self._move_source(path)
+        if source is not None:
+            del self.moved_paths[source]
+            self.deleted_paths.add(source)
+
+    def move(self, old_path: str, new_path: str) -> None:
+        self.upserted_paths.discard(old_path)
+        self.deleted_paths.discard(new_path)
+        # 같은 묶음 안에서 이어진 이동은 처음 경로에서 마지막 경로로의 이동 하나로 합칩니다.
+        source = self._move_source(old_path)
+        if source is not None:
+            del self.moved_paths[source]
+            old_path = source
+        if old_path == new_path:
+            self.upserted_paths.add(new_path)
+        else:
+            self.moved_paths[old_path] = new_path
+
+    def move_directory(self, old_path: str, new_path: str) -> None:
+        # 같은 묶음에서 새로 생긴 디렉토리는 아직 저장된 파일이 없으므로 새 경로를 탐색하면 됩니다.
+        if old_path in self.scanned_directories:
+            self.scanned_directories.discard(old_path)
+            self.scanned_directories.add(new_path)
+        else:
+            self.moved_directories[old_path] = new_path
+
+    def _move_source(self, new_path: str) -> Optional[str]:
+        for source, destination in self.moved_paths.items():
+            if destination == new_path:
+                return source
+        return None
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.upserted_paths or self.deleted_paths or self.deleted_directories
+            or self.scanned_directories or self.rescan_roots
+            or self.moved_paths or self.moved_directories
+        )
+
+
+class IndexWatcher:
+    """inotify로 인덱싱된 루트 디렉토리를 감시하고, 변경을 모아 on_changes로 전달합니다.
+
+    이벤트는 첫 이벤트 이후 debounce_seconds 동안 모아 한 번에 전달합니다.
+    IN_MOVED_FROM/IN_MOVED_TO는 cookie로 짝지어 이동으로 전달하고, 짝이 없는 IN_MOVED_FROM은 전달 시점에 삭제로 봅니다.
+    커널 이벤트 큐가 넘치면(IN_Q_OVERFLOW) 유실된 변경을 알 수 없으므로 모든 루트를 다시 탐색하도록 요청합니다.
+    """
+
+    def __init__(
+        self,
+        roots_provider: Callable[[], List[str]],
+        patterns_provider: Callable[[], List[str]],
+        on_changes: Callable[[FileSystemChanges], None],
+        debounce_seconds: float = 2.0,
+        poll_interval: float = 0.5,
+    ):
+        self.roots_provider = roots_provider
+        self.patterns_provider = patterns_provider
+        self.on_changes = on_changes
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval = poll_interval
+        self._inotify: Optional[Inotify] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._watches: Dict[int, str] = {}  # watch descriptor -> 디렉토리 경로
+        self._roots: List[str] = []
+        self._matcher = ExclusionMatcher([])
+        self._changes = FileSystemChanges()
+        self._first_change_at: Optional[float] = None
+        self._pending_moves: Dict[int, Tuple[str, bool]] = {}  # cookie -> (이동 전 경로, 디렉토리 여부)
+
+    def start(self) -> None:
+        self._inotify = Inotify()
+        self._matcher = ExclusionMatcher(self.patterns_provider())
+        self._roots = self.roots_provider()
+        for root in self._roots:
+            self._watch_tree(root)
+        self._thread = threading.Thread(target=self._run, name="index-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._inotify is not None:
+            self._inotify.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            for event in self._inotify.read_events(timeout=self.poll_interval):
+                self._handle_event(event)
+            if (
+                (self._changes or self._pending_moves)
+                and time.monotonic() - self._first_change_at >= self.debounce_seconds
+            ):
+                self._flush()
+        if self._changes or self._pending_moves:
+            self._flush()
+
+    def _watch_tree(self, root: str) -> None:
+        """디렉토리와 하위 디렉토리를 모두 감시 대상에 추가합니다. 제외되는 디렉토리는 건너뜁니다."""
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                wd = self._inotify.add_watch(directory, WATCH_MASK)
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                # 감시 개수 한도(max_user_watches) 초과나 접근 권한 문제는 해당 디렉토리만 건너뜁니다.
+                logger.warning("index watcher cannot watch %s: %s", directory, e)
+                continue
+            self._watches[wd] = directory
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir and not self._matcher.prunes_directory(entry.path):
+                    stack.append(entry.path)
+
+    def _unwatch_tree(self, directory: str) -> None:
+        prefix = directory + os.sep
+        for wd, path in list(self._watches.items()):
+            if path == directory or path.startswith(prefix):
+                del self._watches[wd]
+                self._inotify.rm_watch(wd)
+
+    def _rename_watches(self, old_directory: str, new_directory: str) -> None:
+        # 커널의 감시는 이동한 디렉토리를 계속 따라가므로 기록한 경로만 바꿉니다.
+        prefix = old_directory + os.sep
+        for wd, path in self._watches.items():
+            if path == old_directory or path.startswith(prefix):
+                self._watches[wd] = new_directory + path[len(old_directory):]
+
+    def _handle_event(self, event: InotifyEvent) -> None:
+        if self._first_change_at is None:
+            self._first_change_at = time.monotonic()
+
+        if event.mask & IN_Q_OVERFLOW:
+            self._changes.rescan_roots.update(self._roots)
+            return
+        if event.mask & IN_IGNORED:
+            self._watches.pop(event.wd, None)
+            return
+
+        directory = self._watches.get(event.wd)
+        if directory is None or not event.name:
+            return
+        path = os.path.join(directory, event.name)
+
+        if event.mask & IN_MOVED_FROM:
+            self._pending_moves[event.cookie] = (path, bool(event.mask & IN_ISDIR))
+            return
+        if event.mask & IN_MOVED_TO and event.cookie in self._pending_moves:
+            old_path, _ = self._pending_moves.pop(event.cookie)
+            if event.mask & IN_ISDIR:
+                self._handle_directory_move(old_path, path)
+            else:
+                self._handle_file_move(old_path, path)
+            return
+
+        if event.mask & IN_ISDIR:
+            if event.mask & (IN_CREATE | IN_MOVED_TO):
+                self._handle_new_directory(path)
+            elif event.mask & IN_DELETE:
+                self._handle_removed_directory(path)
+            return
+
+        if self._matcher.matches(path):
+            return
+        if event.mask & (IN_CREATE | IN_MOVED_TO | IN_CLOSE_WRITE):
+            self._changes.upsert(path)
+        elif event.mask & IN_DELETE:
+            self._changes.delete(path)
+
+    def _handle_new_directory(self, path: str) -> None:
+        if not self._matcher.prunes_directory(path):
+            # 감시를 추가하기 전에 생긴 파일이 있을 수 있으므로 디렉토리를 탐색합니다.
+            self._watch_tree(path)
+            self._changes.scanned_directories.add(path)
+
+    def _handle_removed_directory(self, path: str) -> None:
+        self._unwatch_tree(path)
+        self._changes.scanned_directories.discard(path)
+        self._changes.deleted_directories.add(path)
+
+    def _handle_file_move(self, old_path: str, new_path: str) -> None:
+        # 제외 대상과 감시 대상 사이의 이동은 한쪽의 생성이나 삭제로 봅니다.
+        old_excluded = self._matcher.matches(old_path)
+        new_excluded = self._matcher.matches(new_path)
+        if old_excluded and not new_excluded:
+            self._changes.upsert(new_path)
+        elif new_excluded and not old_excluded:
+            self._changes.delete(old_path)
+        elif not old_excluded:
+            self._changes.move(old_path, new_path)
+
+    def _handle_directory_move(self, old_path: str, new_path: str) -> None:
+        old_pruned = self._matcher.prunes_directory(old_path)
+        new_pruned = self._matcher.prunes_directory(new_path)
+        if old_pruned and not new_pruned:
+            self._handle_new_directory(new_path)
+        elif new_pruned and not old_pruned:
+            self._handle_removed_directory(old_path)
+        elif not old_pruned:
+            self._rename_watches(old_path, new_path)
+            self._changes.move_directory(old_path, new_path)
+
+    def _resolve_pending_moves(self) -> None:
+        """짝이 오지 않은 IN_MOVED_FROM은 감시 범위 밖으로 나간 것이므로 삭제로 처리합니다."""
+        for path, is_directory in self._pending_moves.values():
+            if is_directory:
+                self._handle_removed_directory(path)
+            elif not self._matcher.matches(path):
+                self._changes.delete(path)
+        self._pending_moves.clear()
+
+    def _flush(self) -> None:
+        self._resolve_pending_moves()
+        changes, self._changes = self._changes, FileSystemChanges()
+        self._first_change_at = None
+        try:
+            self.on_changes(changes)
+            # 제외 패턴 변경을 다음 이벤트부터 반영합니다.
+            self._matcher = ExclusionMatcher(self.patterns_provider())
+        except Exception:
+            logger.exception("index watcher failed to apply changes")
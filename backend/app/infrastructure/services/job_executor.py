@@ -0,0 +1,128 @@
+import logging
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from sqlmodel import Session
+from app.domain.job.model import (
+    Job,
+    JOB_STATUS_PENDING,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_CANCELLED,
+    UNFINISHED_JOB_STATUSES,
+)
+from app.infrastructure.persistence.job_repository_impl import JobRepositoryImpl
+from app.application.exceptions import JobCancelledException
+
+logger = logging.getLogger(__name__)
+
+# (진행 상황, 체크포인트)를 받아 기록하는 콜백
+ProgressCallback = Callable[[Dict[str, Any], Optional[Dict[str, Any]]], None]
+# (작업용 세션, 실행 인자, 마지막 체크포인트, 진행 콜백)을 받아 결과를 반환하는 작업 핸들러
+JobHandler = Callable[[Session, Dict[str, Any], Dict[str, Any], ProgressCallback], Optional[Dict[str, Any]]]
+
+
+class _JobInterrupted(Exception):
+    """서버 종료로 작업을 중단할 때 사용합니다. 작업은 대기 상태로 남아 다음 시작 시 이어서 실행됩니다."""
+
+
+class JobExecutor:
+    """DB에 기록된 작업을 백그라운드 스레드에서 실행합니다.
+
+    핸들러가 진행 콜백으로 전달한 체크포인트는 작업 테이블에 저장되며,
+    서버가 다시 시작되면 완료되지 않은 작업을 마지막 체크포인트부터 이어서 실행합니다.
+    취소 요청은 다음 진행 보고 시점에 확인합니다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], handlers: Dict[str, JobHandler], max_workers: int = 1):
+        self.session_factory = session_factory
+        self.handlers = handlers
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="job-executor")
+        self._stopping = threading.Event()
+
+    @property
+    def job_types(self) -> List[str]:
+        return list(self.handlers)
+
+    def submit(self, job_id: int) -> None:
+        self._executor.submit(self._run, job_id)
+
+    def resume_unfinished(self) -> List[int]:
+        """이전 실행에서 완료되지 않은 작업을 다시 실행 대기열에 넣습니다."""
+        with self.session_factory() as session:
+            repository = JobRepositoryImpl(session)
+            job_ids = []
+            for job in repository.find_unfinished():
+                if job.status == JOB_STATUS_RUNNING:
+                    job.status = JOB_STATUS_PENDING
+                    repository.save(job)
+                job_ids.append(job.id)
+        for job_id in job_ids:
+            self.submit(job_id)
+        return job_ids
+
+    def shutdown(self, wait: bool = True) -> None:
+        """실행 중인 작업은 다음 진행 보고 시점에 중단되어 대기 상태로 남습니다."""
+        self._stopping.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job_id: int) -> None:
+        with self.session_factory() as session:
+            repository = JobRepositoryImpl(session)
+            job = repository.find_by_id(job_id)
+            if job is None or job.status not in UNFINISHED_JOB_STATUSES:
+                return
+            if job.cancel_requested:
+                self._finish(repository, job, JOB_STATUS_CANCELLED)
+                return
+
+            handler = self.handlers.get(job.job_type)
+            if handler is None:
+                self._finish(repository, job, JOB_STATUS_FAILED, error=f"알 수 없는 작업 종류입니다: {job.job_type}")
+                return
+
+            job.status = JOB_STATUS_RUNNING
+            job.started_at = job.started_at or datetime.now(timezone.utc)
+            job = repository.save(job)
+            params = dict(job.params or {})
+            checkpoint = dict(job.checkpoint or {})
+
+            def report(progress: Dict[str, Any], new_checkpoint: Optional[Dict[str, Any]] = None) -> None:
+                repository.update_progress(job_id, progress, new_checkpoint)
+                if self._stopping.is_set():
+                    raise _JobInterrupted()
+                if repository.is_cancel_requested(job_id):
+                    raise JobCancelledException()
+
+            try:
+                # 작업 데이터는 진행 기록과 분리된 세션에서 처리합니다.
+                with self.session_factory() as work_session:
+                    result = handler(work_session, params, checkpoint, report)
+            except _JobInterrupted:
+                job.status = JOB_STATUS_PENDING
+                repository.save(job)
+            except JobCancelledException:
+                self._finish(repository, job, JOB_STATUS_CANCELLED)
+            except Exception:
+                logger.exception("job %s (%s) failed", job_id, job.job_type)
+                # 작업 목록에서 실패 원인을 확인할 수 있도록 traceback 전체를 기록합니다.
+                self._finish(repository, job, JOB_STATUS_FAILED, error=traceback.format_exc())
+            else:
+                self._finish(repository, job, JOB_STATUS_COMPLETED, result=result)
+
+    def _finish(
+        self,
+        repository: JobRepositoryImpl,
+        job: Job,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = datetime.now(timezone.utc)
+        repository.save(job)
@@ -1,7 +1,7 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlmodel import Session
 
-from app.infrastructure.app_config import get_session
+from app.infrastructure.app_config import get_session, settings
 from app.application.use_cases.file_change_pattern.create_file_change_pattern import (
     CreateFileChangePatternUseCase,
 )
@@ -20,6 +20,7 @@ from app.application.use_cases.file_change_pattern.update_file_change_pattern im
 from app.application.use_cases.index_files import IndexFilesUseCase
 from app.domain.extracted_data.repository import ExtractedDataRepository
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
+from app.domain.file_change_pattern.registry import pattern_registry
 from app.infrastructure.persistence.extracted_data_repository_impl import (
     ExtractedDataRepositoryImpl,
 )
@@ -27,6 +28,8 @@ from app.infrastructure.persistence.file_change_pattern_repository_impl import (
     FileChangePatternRepositoryImpl,
 )
 from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+from app.domain.directory.repository import DirectoryRepository
+from app.infrastructure.persistence.directory_repository_impl import DirectoryRepositoryImpl
 
 # Exclusion Pattern imports
 from app.domain.exclusion_pattern.repository import ExclusionPatternRepository
@@ -58,9 +61,17 @@ from app.application.use_cases.extracted_data.extract_data_from_file import (
 from app.application.use_cases.extracted_data.reapply_patterns_to_all_files import (
     ReapplyPatternsToAllFilesUseCase,
 )
+from app.application.use_cases.extracted_data.apply_new_pattern_to_all_files import (
+    ApplyNewPatternToAllFilesUseCase,
+)
+from app.application.use_cases.extracted_data.recompute_pattern_dependents import (
+    RecomputePatternDependentsUseCase,
+)
 from app.application.use_cases.file.get_files import GetFilesUseCase
 from app.application.use_cases.file.apply_rename_and_copy import ApplyRenameAndCopyUseCase # New import
 from app.infrastructure.services.file_operation_service import FileOperationService
+from app.infrastructure.services.file_discovery_service import FileDiscoveryService
+from app.domain.file.discovery import FileDiscovery
 
 
 def get_file_repository(session: Session = Depends(get_session)) -> FileRepository:
@@ -74,15 +85,37 @@ def get_exclusion_pattern_repository(
     return ExclusionPatternRepositoryImpl(session=session)
 
 
+def get_directory_repository(session: Session = Depends(get_session)) -> DirectoryRepository:
+    return DirectoryRepositoryImpl(session=session)
+
+
+from app.domain.index_run.repository import IndexRunRepository
+from app.infrastructure.persistence.index_run_repository_impl import IndexRunRepositoryImpl
+
+def get_index_run_repository(session: Session = Depends(get_session)) -> IndexRunRepository:
+    return IndexRunRepositoryImpl(session=session)
+
+
+def get_file_discovery_service() -> FileDiscovery:
+    return FileDiscoveryService(workers=settings.INDEX_DISCOVERY_WORKERS)
+
+
 def get_index_files_use_case(
     file_repository: FileRepository = Depends(get_file_repository),
     exclusion_pattern_repository: ExclusionPatternRepository = Depends(
         get_exclusion_pattern_repository
     ),
+    directory_repository: DirectoryRepository = Depends(get_directory_repository),
+    file_discovery_service: FileDiscovery = Depends(get_file_discovery_service),
+    index_run_repository: IndexRunRepository = Depends(get_index_run_repository),
 ) -> IndexFilesUseCase:
     return IndexFilesUseCase(
         file_repository=file_repository,
         exclusion_pattern_repository=exclusion_pattern_repository,
+        file_discovery_service=file_discovery_service,
+        directory_repository=directory_repository,
+        index_run_repository=index_run_repository,
+        pipeline_depth=settings.INDEX_PIPELINE_DEPTH,
     )
 
 
@@ -99,7 +132,7 @@ def get_extracted_data_repository(
 
 
 def get_extract_data_from_file_use_case() -> ExtractDataFromFileUseCase:
-    return ExtractDataFromFileUseCase()
+    return ExtractDataFromFileUseCase(pattern_registry=pattern_registry)
 
 
 def get_apply_patterns_to_file_use_case(
@@ -115,6 +148,7 @@ def get_apply_patterns_to_file_use_case(
         extracted_data_repository=extracted_data_repository,
         extract_data_from_file_use_case=extract_data_from_file_use_case,
         file_repository=file_repository,
+        pattern_registry=pattern_registry,
     )
 
 
@@ -134,6 +168,47 @@ def get_reapply_patterns_to_all_files_use_case(
     )
 
 
+def get_apply_new_pattern_to_all_files_use_case(
+    file_repository: FileRepository = Depends(get_file_repository),
+    extracted_data_repository: ExtractedDataRepository = Depends(
+        get_extracted_data_repository
+    ),
+    extract_data_from_file_use_case: ExtractDataFromFileUseCase = Depends(
+        get_extract_data_from_file_use_case
+    ),
+) -> ApplyNewPatternToAllFilesUseCase:
+    return ApplyNewPatternToAllFilesUseCase(
+        file_repository=file_repository,
+        extracted_data_repository=extracted_data_repository,
+        extract_data_from_file_use_case=extract_data_from_file_use_case,
+    )
+
+
+def get_recompute_pattern_dependents_use_case(
+    file_repository: FileRepository = Depends(get_file_repository),
+    file_change_pattern_repository: FileChangePatternRepository = Depends(
+        get_file_change_pattern_repository
+    ),
+    extracted_data_repository: ExtractedDataRepository = Depends(
+        get_extracted_data_repository
+    ),
+    apply_patterns_to_file_use_case: ApplyPatternsToFileUseCase = Depends(
+        get_apply_patterns_to_file_use_case
+    ),
+    extract_data_from_file_use_case: ExtractDataFromFileUseCase = Depends(
+        get_extract_data_from_file_use_case
+    ),
+) -> RecomputePatternDependentsUseCase:
+    return RecomputePatternDependentsUseCase(
+        file_repository=file_repository,
+        file_change_pattern_repository=file_change_pattern_repository,
+        extracted_data_repository=extracted_data_repository,
+        apply_patterns_to_file_use_case=apply_patterns_to_file_use_case,
+        extract_data_from_file_use_case=extract_data_from_file_use_case,
+        pattern_registry=pattern_registry,
+    )
+
+
 def get_create_file_change_pattern_use_case(
     repository: FileChangePatternRepository = Depends(
         get_file_change_pattern_repository
@@ -154,12 +229,17 @@ def get_confirm_file_change_pattern_use_case(
     repository: FileChangePatternRepository = Depends(
         get_file_change_pattern_repository
     ),
-    reapply_use_case: ReapplyPatternsToAllFilesUseCase = Depends(
-        get_reapply_patterns_to_all_files_use_case
+    recompute_use_case: RecomputePatternDependentsUseCase = Depends(
+        get_recompute_pattern_dependents_use_case
+    ),
+    apply_new_pattern_use_case: ApplyNewPatternToAllFilesUseCase = Depends(
+        get_apply_new_pattern_to_all_files_use_case
     ),
 ) -> ConfirmFileChangePatternUseCase:
     return ConfirmFileChangePatternUseCase(
-        repository=repository, reapply_use_case=reapply_use_case
+        repository=repository,
+        recompute_use_case=recompute_use_case,
+        apply_new_pattern_use_case=apply_new_pattern_use_case,
     )
 
 
@@ -192,12 +272,12 @@ def get_update_file_change_pattern_use_case(
     repository: FileChangePatternRepository = Depends(
         get_file_change_pattern_repository
     ),
-    reapply_use_case: ReapplyPatternsToAllFilesUseCase = Depends(
-        get_reapply_patterns_to_all_files_use_case
+    recompute_use_case: RecomputePatternDependentsUseCase = Depends(
+        get_recompute_pattern_dependents_use_case
     ),
 ) -> UpdateFileChangePatternUseCase:
     return UpdateFileChangePatternUseCase(
-        repository=repository, reapply_use_case=reapply_use_case
+        repository=repository, recompute_use_case=recompute_use_case
     )
 
 
@@ -205,8 +285,13 @@ def get_delete_file_change_pattern_use_case(
     repository: FileChangePatternRepository = Depends(
         get_file_change_pattern_repository
     ),
+    recompute_use_case: RecomputePatternDependentsUseCase = Depends(
+        get_recompute_pattern_dependents_use_case
+    ),
 ) -> DeleteFileChangePatternUseCase:
-    return DeleteFileChangePatternUseCase(repository=repository)
+    return DeleteFileChangePatternUseCase(
+        repository=repository, recompute_use_case=recompute_use_case
+    )
 
 
 def get_apply_patterns_to_specific_file_use_case(
@@ -251,6 +336,7 @@ def get_apply_saved_pattern_use_case(
         file_repository=file_repository,
         extracted_data_repository=extracted_data_repository,
         extract_data_from_file_use_case=extract_data_from_file_use_case,
+        pattern_registry=pattern_registry,
     )
 
 
@@ -300,6 +386,25 @@ def get_file_operation_service() -> FileOperationService:
     return FileOperationService()
 
 
+from app.infrastructure.services.file_hash_service import FileHashService
+from app.application.use_cases.file.hash_files import HashFilesUseCase
+from app.application.use_cases.file.get_duplicate_files import GetDuplicateFilesUseCase
+
+def get_file_hash_service() -> FileHashService:
+    return FileHashService(workers=settings.HASH_WORKERS)
+
+def get_hash_files_use_case(
+    file_repository: FileRepository = Depends(get_file_repository),
+    file_hash_service: FileHashService = Depends(get_file_hash_service),
+) -> HashFilesUseCase:
+    return HashFilesUseCase(file_repository=file_repository, file_hash_service=file_hash_service)
+
+def get_get_duplicate_files_use_case(
+    file_repository: FileRepository = Depends(get_file_repository),
+) -> GetDuplicateFilesUseCase:
+    return GetDuplicateFilesUseCase(file_repository=file_repository)
+
+
 from app.application.use_cases.file.rename_and_copy_by_pattern import RenameAndCopyByPatternUseCase
 
 from app.domain.file_change_request.repository import FileChangeRequestRepository
@@ -374,3 +479,60 @@ def get_rename_and_copy_by_pattern_use_case(
         file_change_pattern_repository=file_change_pattern_repository,
         file_operation_service=file_operation_service,
     )
+
+
+from app.domain.job.repository import JobRepository
+from app.infrastructure.persistence.job_repository_impl import JobRepositoryImpl
+from app.infrastructure.services.job_executor import JobExecutor
+from app.application.use_cases.job.submit_job import SubmitJobUseCase
+from app.application.use_cases.job.get_jobs import GetJobsUseCase
+from app.application.use_cases.job.get_job_detail import GetJobDetailUseCase
+from app.application.use_cases.job.cancel_job import CancelJobUseCase
+
+def get_job_repository(session: Session = Depends(get_session)) -> JobRepository:
+    return JobRepositoryImpl(session)
+
+def get_job_executor(request: Request) -> JobExecutor:
+    # 애플리케이션 시작 시 생성된 실행기를 사용합니다.
+    return request.app.state.job_executor
+
+def get_submit_job_use_case(
+    job_repository: JobRepository = Depends(get_job_repository),
+    job_executor: JobExecutor = Depends(get_job_executor),
+) -> SubmitJobUseCase:
+    return SubmitJobUseCase(job_repository=job_repository, job_executor=job_executor)
+
+def get_get_jobs_use_case(
+    repository: JobRepository = Depends(get_job_repository),
+) -> GetJobsUseCase:
+    return GetJobsUseCase(repository=repository)
+
+def get_get_job_detail_use_case(
+    repository: JobRepository = Depends(get_job_repository),
+) -> GetJobDetailUseCase:
+    return GetJobDetailUseCase(repository=repository)
+
+def get_cancel_job_use_case(
+    repository: JobRepository = Depends(get_job_repository),
+) -> CancelJobUseCase:
+    return CancelJobUseCase(repository=repository)
+
+
+from app.application.use_cases.index_run.get_index_runs import GetIndexRunsUseCase
+from app.application.use_cases.index_run.resume_index_run import ResumeIndexRunUseCase
+from app.application.use_cases.index_run.abandon_index_run import AbandonIndexRunUseCase
+
+def get_get_index_runs_use_case(
+    repository: IndexRunRepository = Depends(get_index_run_repository),
+) -> GetIndexRunsUseCase:
+    return GetIndexRunsUseCase(repository=repository)
+
+def get_resume_index_run_use_case(
+    repository: IndexRunRepository = Depends(get_index_run_repository),
+) -> ResumeIndexRunUseCase:
+    return ResumeIndexRunUseCase(repository=repository)
+
+def get_abandon_index_run_use_case(
+    repository: IndexRunRepository = Depends(get_index_run_repository),
+) -> AbandonIndexRunUseCase:
+    return AbandonIndexRunUseCase(repository=repository)
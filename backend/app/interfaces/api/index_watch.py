@@ -0,0 +1,54 @@
+from typing import List
+from sqlmodel import Session
+
+from app.infrastructure.app_config import engine, settings
+from app.infrastructure.services.index_watcher import FileSystemChanges, IndexWatcher
+from app.application.use_cases.file.apply_file_system_changes import ApplyFileSystemChangesUseCase
+from app.interfaces.api.dependencies import (
+    get_file_repository,
+    get_exclusion_pattern_repository,
+    get_directory_repository,
+    get_file_discovery_service,
+    get_index_files_use_case,
+    get_index_run_repository,
+)
+
+
+def load_watch_roots() -> List[str]:
+    """인덱싱 시작 경로로 기록된 디렉토리를 감시합니다."""
+    with Session(engine) as session:
+        return [directory.path for directory in get_directory_repository(session).find_roots()]
+
+
+def load_exclusion_patterns() -> List[str]:
+    with Session(engine) as session:
+        return get_exclusion_pattern_repository(session).find_active_patterns()
+
+
+def apply_changes(changes: FileSystemChanges) -> None:
+    with Session(engine) as session:
+        file_repository = get_file_repository(session)
+        exclusion_pattern_repository = get_exclusion_pattern_repository(session)
+        file_discovery_service = get_file_discovery_service()
+        use_case = ApplyFileSystemChangesUseCase(
+            file_repository=file_repository,
+            exclusion_pattern_repository=exclusion_pattern_repository,
+            index_files_use_case=get_index_files_use_case(
+                file_repository=file_repository,
+                exclusion_pattern_repository=exclusion_pattern_repository,
+                directory_repository=get_directory_repository(session),
+                file_discovery_service=file_discovery_service,
+                index_run_repository=get_index_run_repository(session),
+            ),
+            file_discovery_service=file_discovery_service,
+        )
+        use_case.execute(changes)
+
+
+def build_index_watcher() -> IndexWatcher:
+    return IndexWatcher(
+        roots_provider=load_watch_roots,
+        patterns_provider=load_exclusion_patterns,
+        on_changes=apply_changes,
+        debounce_seconds=settings.INDEX_WATCH_DEBOUNCE_SECONDS,
+    )
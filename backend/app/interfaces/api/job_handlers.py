@@ -0,0 +1,195 @@
+from typing import Any, Dict, Optional
+from sqlmodel import Session
+
+from app.infrastructure.app_config import engine, settings
+from app.infrastructure.services.job_executor import JobExecutor, ProgressCallback
+from app.application.use_cases.index_files import IndexProgress, IndexSummary
+from app.interfaces.api.dependencies import (
+    get_file_repository,
+    get_exclusion_pattern_repository,
+    get_directory_repository,
+    get_index_run_repository,
+    get_file_discovery_service,
+    get_index_files_use_case,
+    get_file_change_pattern_repository,
+    get_extracted_data_repository,
+    get_extract_data_from_file_use_case,
+    get_apply_patterns_to_file_use_case,
+    get_reapply_patterns_to_all_files_use_case,
+    get_apply_saved_pattern_use_case,
+    get_file_change_request_repository,
+    get_create_file_change_request_use_case,
+    get_file_operation_service,
+    get_file_hash_service,
+    get_hash_files_use_case,
+)
+
+# 작업 종류
+JOB_TYPE_INDEX = "index"
+JOB_TYPE_REAPPLY_PATTERNS = "reapply_patterns"
+JOB_TYPE_APPLY_SAVED_PATTERN = "apply_saved_pattern"
+JOB_TYPE_CREATE_FILE_CHANGE_REQUEST = "create_file_change_request"
+JOB_TYPE_HASH_FILES = "hash_files"
+
+
+def run_index_job(
+    session: Session, params: Dict[str, Any], checkpoint: Dict[str, Any], report: ProgressCallback
+) -> Optional[Dict[str, Any]]:
+    """파일 인덱싱 작업. 이미 저장된 파일은 INSERT 충돌로 건너뛰므로 다시 실행해도 중복 저장되지 않습니다.
+
+    인덱싱 실행 ID를 체크포인트에 기록하므로, 재시작 후에는 저장이 끝난 디렉토리를 건너뛰고 이어서 실행합니다.
+    params에 index_run_id가 있으면 중단된 인덱싱 실행을 이어서 실행합니다.
+    compute_hashes가 지정되면 인덱싱이 끝난 뒤 중복 검사용 내용 해시를 이어서 계산합니다.
+    """
+    if checkpoint.get("stage") == "hash":
+        # 인덱싱을 마치고 해시 계산 중에 중단된 작업은 해시 계산만 이어서 실행합니다.
+        return {**checkpoint["index_result"], "hash": run_hash_files_job(session, params, checkpoint, report)}
+
+    use_case = get_index_files_use_case(
+        file_repository=get_file_repository(session),
+        exclusion_pattern_repository=get_exclusion_pattern_repository(session),
+        directory_repository=get_directory_repository(session),
+        file_discovery_service=get_file_discovery_service(),
+        index_run_repository=get_index_run_repository(session),
+    )
+    index_run_id = checkpoint.get("index_run_id") or params.get("index_run_id")
+    if index_run_id is not None:
+        events = use_case.resume_stream(index_run_id)
+    else:
+        events = use_case.execute_stream(
+            params["directory_path"],
+            params.get("exclude_patterns"),
+            incremental=params.get("incremental", False),
+            force_full_scan=params.get("force_full_scan", False),
+            manifest_path=params.get("manifest_path"),
+            manifest_has_stats=params.get("manifest_has_stats", False),
+            index_archives=params.get("index_archives", False),
+        )
+    summary = IndexSummary()
+    for event in events:
+        if isinstance(event, IndexProgress):
+            report(vars(event), {"index_run_id": event.index_run_id})
+        else:
+            summary = event
+    result = {
+        "seen_count": summary.seen_count,
+        "added_count": summary.added_count,
+        "changed_count": summary.changed_count,
+        "removed_count": summary.removed_count,
+        "moved_count": summary.moved_count,
+        "excluded_count": summary.excluded_count,
+        "error_count": summary.error_count,
+        "archive_member_count": summary.archive_member_count,
+        "discovery_files_per_second": summary.discovery_files_per_second,
+        "write_files_per_second": summary.write_files_per_second,
+        "discovery_blocked_seconds": summary.discovery_blocked_seconds,
+        "write_idle_seconds": summary.write_idle_seconds,
+    }
+    if params.get("compute_hashes"):
+        # 재시작 시 인덱싱을 반복하지 않도록 해시 단계로 넘어갔음을 체크포인트에 기록합니다.
+        hash_checkpoint = {"stage": "hash", "index_result": result}
+        report(result, hash_checkpoint)
+        result = {**result, "hash": run_hash_files_job(session, params, hash_checkpoint, report)}
+    return result
+
+
+def run_hash_files_job(
+    session: Session, params: Dict[str, Any], checkpoint: Dict[str, Any], report: ProgressCallback
+) -> Optional[Dict[str, Any]]:
+    """새로 추가되었거나 변경된 파일의 중복 검사용 내용 해시를 계산하는 작업"""
+    use_case = get_hash_files_use_case(
+        file_repository=get_file_repository(session),
+        file_hash_service=get_file_hash_service(),
+    )
+    hash_checkpoint = checkpoint.get("hash") or {}
+
+    def report_hash(progress: Dict[str, Any], next_checkpoint: Dict[str, Any]) -> None:
+        report(progress, {**checkpoint, "hash": next_checkpoint})
+
+    summary = use_case.execute(progress_callback=report_hash, checkpoint=hash_checkpoint)
+    return vars(summary)
+
+
+def run_reapply_patterns_job(
+    session: Session, params: Dict[str, Any], checkpoint: Dict[str, Any], report: ProgressCallback
+) -> Optional[Dict[str, Any]]:
+    """모든 파일에 모든 패턴을 다시 적용하는 작업"""
+    file_repository = get_file_repository(session)
+    extracted_data_repository = get_extracted_data_repository(session)
+    use_case = get_reapply_patterns_to_all_files_use_case(
+        file_repository=file_repository,
+        file_change_pattern_repository=get_file_change_pattern_repository(session),
+        apply_patterns_to_file_use_case=get_apply_patterns_to_file_use_case(
+            extracted_data_repository=extracted_data_repository,
+            extract_data_from_file_use_case=get_extract_data_from_file_use_case(),
+            file_repository=file_repository,
+        ),
+    )
+    processed_count = use_case.execute(progress_callback=report, checkpoint=checkpoint)
+    return {"processed_count": processed_count}
+
+
+def run_apply_saved_pattern_job(
+    session: Session, params: Dict[str, Any], checkpoint: Dict[str, Any], report: ProgressCallback
+) -> Optional[Dict[str, Any]]:
+    """저장된 패턴 중 가장 많은 값을 추출하는 패턴을 파일에 적용하는 작업"""
+    use_case = get_apply_saved_pattern_use_case(
+        file_change_pattern_repository=get_file_change_pattern_repository(session),
+        file_repository=get_file_repository(session),
+        extracted_data_repository=get_extracted_data_repository(session),
+        extract_data_from_file_use_case=get_extract_data_from_file_use_case(),
+    )
+    use_case.execute(
+        pattern_ids=params["pattern_ids"],
+        file_ids=params["file_ids"],
+        progress_callback=report,
+        checkpoint=checkpoint,
+    )
+    return None
+
+
+def run_create_file_change_request_job(
+    session: Session, params: Dict[str, Any], checkpoint: Dict[str, Any], report: ProgressCallback
+) -> Optional[Dict[str, Any]]:
+    """패턴에 연결된 파일의 이름을 바꿔 복사하고 변경 요청을 기록하는 작업"""
+    use_case = get_create_file_change_request_use_case(
+        file_repository=get_file_repository(session),
+        file_change_pattern_repository=get_file_change_pattern_repository(session),
+        file_change_request_repository=get_file_change_request_repository(session),
+        file_operation_service=get_file_operation_service(),
+    )
+    change_request = use_case.execute(
+        file_change_pattern_id=params["file_change_pattern_id"],
+        rename_pattern_string=params["rename_pattern_string"],
+        destination_path=params["destination_path"],
+        progress_callback=report,
+        checkpoint=checkpoint,
+    )
+    return {
+        "file_change_request_id": change_request.id,
+        "success_count": change_request.success_count,
+        "failed_count": change_request.failed_count,
+    }
+
+
+JOB_HANDLERS = {
+    JOB_TYPE_INDEX: run_index_job,
+    JOB_TYPE_REAPPLY_PATTERNS: run_reapply_patterns_job,
+    JOB_TYPE_APPLY_SAVED_PATTERN: run_apply_saved_pattern_job,
+    JOB_TYPE_CREATE_FILE_CHANGE_REQUEST: run_create_file_change_request_job,
+    JOB_TYPE_HASH_FILES: run_hash_files_job,
+}
+
+
+def build_job_executor() -> JobExecutor:
+    return JobExecutor(
+        session_factory=lambda: Session(engine),
+        handlers=JOB_HANDLERS,
+        max_workers=settings.JOB_WORKERS,
+    )
+
+
+def interrupt_running_index_runs() -> int:
+    """이전 프로세스에서 실행 중이던 인덱싱 실행을 중단된 것으로 표시합니다. 작업을 재개하기 전에 호출해야 합니다."""
+    with Session(engine) as session:
+        return get_index_run_repository(session).mark_running_as_interrupted()
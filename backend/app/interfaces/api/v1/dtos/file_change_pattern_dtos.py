@@ -6,16 +6,26 @@ class FileChangePatternCreate(BaseModel):
     regex_pattern: str
     replacement_format: str
     file_ids: List[int] # 테스트할 파일 ID 목록
+    scope_extensions: Optional[str] = None # 적용할 확장자 목록 (쉼표 구분)
+    scope_directory: Optional[str] = None # 적용할 디렉토리 (하위 디렉토리 포함)
+    match_filename_only: bool = False # 파일 이름에만 정규식 적용
 
 class ConfirmFileChangePatternRequest(BaseModel):
     name: str
     regex_pattern: str
     replacement_format: str
+    scope_extensions: Optional[str] = None
+    scope_directory: Optional[str] = None
+    match_filename_only: bool = False
 
 class FileChangePatternUpdate(BaseModel):
     name: Optional[str] = None
     regex_pattern: Optional[str] = None
     replacement_format: Optional[str] = None
+    # 적용 범위는 빈 문자열을 보내면 제한을 해제합니다.
+    scope_extensions: Optional[str] = None
+    scope_directory: Optional[str] = None
+    match_filename_only: Optional[bool] = None
 
 class FileChangePatternResponse(BaseModel):
     id: int
@@ -23,6 +33,9 @@ class FileChangePatternResponse(BaseModel):
     regex_pattern: str
     replacement_format: str
     is_confirmed: bool # is_confirmed 필드 추가
+    scope_extensions: Optional[str] = None
+    scope_directory: Optional[str] = None
+    match_filename_only: bool = False
 
     class Config:
         from_attributes = True
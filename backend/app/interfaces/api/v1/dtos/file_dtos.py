@@ -1,10 +1,19 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 
 
 class IndexRequest(BaseModel):
     directory_path: str
     exclude_patterns: Optional[List[str]] = None
+    incremental: bool = False # 변경/삭제된 파일까지 반영하는 증분 재인덱싱 여부
+    force_full_scan: bool = False # 수정되지 않은 디렉토리도 모두 다시 읽을지 여부
+    manifest_path: Optional[str] = None # 디렉토리 대신 읽을 파일 목록(NUL 또는 줄바꿈 구분) 경로
+    manifest_has_stats: bool = False # manifest 레코드가 "크기<TAB>수정 시각<TAB>경로" 형식인지 여부
+    index_archives: bool = False # ZIP/CBZ 파일의 내부 항목도 인덱싱할지 여부
+
+
+class IndexJobRequest(IndexRequest):
+    compute_hashes: bool = False # 인덱싱 후 중복 검사용 내용 해시를 계산할지 여부
 
 
 class FileResponse(BaseModel):
@@ -14,6 +23,7 @@ class FileResponse(BaseModel):
     directory: str
     full_path: str
     size: int
+    archive_id: Optional[int] = None # 압축 파일 내부 항목이면 압축 파일 ID
     extracted_info: Optional[Dict[str, Any]] # 추출된 정보 필드 추가
     extraction_failed: bool
     extraction_failure_reason: Optional[str]
@@ -22,8 +32,63 @@ class FileResponse(BaseModel):
         from_attributes = True
 
 
+class DuplicateGroupResponse(BaseModel):
+    content_hash: str
+    size: int
+    files: List[FileResponse]
+
+    class Config:
+        from_attributes = True
+
+
+class MovedFileResponse(BaseModel):
+    old_path: str
+    new_path: str
+
+
 class IndexResponse(BaseModel):
     indexed_files: List[FileResponse]
+    added_count: int = 0
+    changed_count: int = 0
+    removed_count: int = 0
+    moved_count: int = 0
+    moved_files: List[MovedFileResponse] = [] # 이동/이름 변경이 감지되어 기존 행을 옮긴 파일
+    listed_directory_count: int = 0
+    skipped_directory_count: int = 0
+    archive_member_count: int = 0
+
+
+class IndexProgressEvent(BaseModel):
+    """스트리밍 인덱싱에서 배치를 저장할 때마다 전송되는 진행 이벤트"""
+    event: Literal["progress"] = "progress"
+    seen_count: int
+    added_count: int
+    changed_count: int
+    excluded_count: int
+    error_count: int
+    current_directory: Optional[str] = None
+    index_run_id: Optional[int] = None # 중단 시 이어서 실행할 인덱싱 실행 ID
+
+
+class IndexSummaryEvent(BaseModel):
+    """스트리밍 인덱싱의 마지막에 전송되는 요약 이벤트"""
+    event: Literal["summary"] = "summary"
+    seen_count: int
+    added_count: int
+    changed_count: int
+    removed_count: int
+    moved_count: int = 0
+    excluded_count: int
+    error_count: int
+    listed_directory_count: int
+    skipped_directory_count: int
+    archive_member_count: int = 0
+    index_run_id: Optional[int] = None
+    # 단계별 처리량. 병목 단계를 확인하는 데 사용합니다.
+    discovery_files_per_second: float = 0.0
+    write_files_per_second: float = 0.0
+    discovery_blocked_seconds: float = 0.0 # 저장이 밀려 탐색이 기다린 시간
+    write_idle_seconds: float = 0.0 # 탐색이 밀려 저장이 기다린 시간
 
 
 class ApplyRenameAndCopyRequestDto(BaseModel):
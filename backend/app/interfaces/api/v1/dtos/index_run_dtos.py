@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Optional, Dict, Any
+from datetime import datetime
+
+class IndexRunResponse(BaseModel):
+    id: int
+    root_path: str
+    status: str
+    params: Optional[Dict[str, Any]]
+    seen_count: int
+    added_count: int
+    changed_count: int
+    committed_batch_count: int
+    last_committed_path: Optional[str]
+    finished_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
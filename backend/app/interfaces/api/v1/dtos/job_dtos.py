@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Optional, Dict, Any
+from datetime import datetime
+
+class JobResponse(BaseModel):
+    id: int
+    job_type: str
+    status: str
+    params: Optional[Dict[str, Any]]
+    progress: Optional[Dict[str, Any]]
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    cancel_requested: bool
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
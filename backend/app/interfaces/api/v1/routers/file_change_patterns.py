@@ -48,7 +48,10 @@ def test_and_prepare_pattern(
             name=request.name,
             regex_pattern=request.regex_pattern,
             replacement_format=request.replacement_format,
-            file_ids=request.file_ids
+            file_ids=request.file_ids,
+            scope_extensions=request.scope_extensions,
+            scope_directory=request.scope_directory,
+            match_filename_only=request.match_filename_only
         )
         return TestPatternResultResponse(results=results)
     except UseCaseException as e:
@@ -67,7 +70,10 @@ def confirm_pattern(
         pattern = use_case.execute(
             name=request.name,
             regex_pattern=request.regex_pattern,
-            replacement_format=request.replacement_format
+            replacement_format=request.replacement_format,
+            scope_extensions=request.scope_extensions,
+            scope_directory=request.scope_directory,
+            match_filename_only=request.match_filename_only
         )
         return FileChangePatternResponse.model_validate(pattern)
     except UseCaseException as e:
@@ -166,7 +172,10 @@ def update_pattern(
             pattern_id=pattern_id,
             name=request.name,
             regex_pattern=request.regex_pattern,
-            replacement_format=request.replacement_format
+            replacement_format=request.replacement_format,
+            scope_extensions=request.scope_extensions,
+            scope_directory=request.scope_directory,
+            match_filename_only=request.match_filename_only
         )
         return FileChangePatternResponse.model_validate(updated_pattern)
     except PatternNotFoundException as e:
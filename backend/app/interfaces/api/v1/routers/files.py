@@ -1,24 +1,36 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from typing import List, Optional
-from app.application.use_cases.index_files import IndexFilesUseCase
+from sqlmodel import Session
+from app.application.use_cases.index_files import IndexFilesUseCase, IndexProgress
+from app.infrastructure.app_config import engine
 from app.interfaces.api.dependencies import (
+    get_file_repository,
+    get_exclusion_pattern_repository,
+    get_directory_repository,
+    get_index_run_repository,
+    get_file_discovery_service,
     get_index_files_use_case,
     get_apply_patterns_to_specific_file_use_case,
     get_get_files_use_case,
     get_apply_rename_and_copy_use_case,
     get_rename_and_copy_by_pattern_use_case,
+    get_get_duplicate_files_use_case,
 )
 from app.interfaces.api.v1.dtos.file_dtos import (
     IndexRequest,
     FileResponse,
     IndexResponse,
+    MovedFileResponse,
+    IndexProgressEvent,
+    IndexSummaryEvent,
+    DuplicateGroupResponse,
     ApplyRenameAndCopyRequestDto, # New import
     ApplyRenameAndCopyResponseDto, # New import
 )
 from app.application.use_cases.extracted_data.apply_patterns_to_specific_file import (
     ApplyPatternsToSpecificFileUseCase,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from app.application.exceptions import (
     FileNotFoundException,
     PatternNotFoundException,
@@ -28,6 +40,7 @@ from app.application.exceptions import (
 from app.application.use_cases.file.get_files import GetFilesUseCase
 from app.application.use_cases.file.apply_rename_and_copy import ApplyRenameAndCopyUseCase
 from app.application.use_cases.file.rename_and_copy_by_pattern import RenameAndCopyByPatternUseCase
+from app.application.use_cases.file.get_duplicate_files import GetDuplicateFilesUseCase
 
 router = APIRouter()
 
@@ -37,13 +50,71 @@ def index_files(
     request: IndexRequest,
     use_case: IndexFilesUseCase = Depends(get_index_files_use_case),
 ):
-    indexed_files = use_case.execute(request.directory_path, request.exclude_patterns)
+    summary = use_case.execute(
+        request.directory_path,
+        request.exclude_patterns,
+        incremental=request.incremental,
+        force_full_scan=request.force_full_scan,
+        manifest_path=request.manifest_path,
+        manifest_has_stats=request.manifest_has_stats,
+        index_archives=request.index_archives,
+    )
 
     response_files = [
-        FileResponse.model_validate(f) for f in indexed_files
+        FileResponse.model_validate(f) for f in summary.saved_files
     ]
 
-    return IndexResponse(indexed_files=response_files)
+    return IndexResponse(
+        indexed_files=response_files,
+        added_count=summary.added_count,
+        changed_count=summary.changed_count,
+        removed_count=summary.removed_count,
+        moved_count=summary.moved_count,
+        moved_files=[
+            MovedFileResponse(old_path=old_path, new_path=new_path)
+            for old_path, new_path in summary.moved_files
+        ],
+        listed_directory_count=summary.listed_directory_count,
+        skipped_directory_count=summary.skipped_directory_count,
+        archive_member_count=summary.archive_member_count,
+    )
+
+
+@router.post("/index/stream")
+def index_files_stream(request: IndexRequest):
+    """배치가 저장될 때마다 진행 상황을 NDJSON(한 줄에 JSON 하나)으로 전송하고, 마지막 줄에 요약을 전송합니다.
+
+    응답 본문은 요청 처리가 끝난 뒤에 생성되므로 요청 범위 세션 대신 스트림 전용 세션을 엽니다
+    (백그라운드 작업 핸들러와 같은 방식).
+    """
+    def event_lines():
+        session = Session(engine)
+        try:
+            use_case = get_index_files_use_case(
+                file_repository=get_file_repository(session),
+                exclusion_pattern_repository=get_exclusion_pattern_repository(session),
+                directory_repository=get_directory_repository(session),
+                file_discovery_service=get_file_discovery_service(),
+                index_run_repository=get_index_run_repository(session),
+            )
+            for event in use_case.execute_stream(
+                request.directory_path,
+                request.exclude_patterns,
+                incremental=request.incremental,
+                force_full_scan=request.force_full_scan,
+                manifest_path=request.manifest_path,
+                manifest_has_stats=request.manifest_has_stats,
+                index_archives=request.index_archives,
+            ):
+                if isinstance(event, IndexProgress):
+                    payload = IndexProgressEvent.model_validate(event, from_attributes=True)
+                else:
+                    payload = IndexSummaryEvent.model_validate(event, from_attributes=True)
+                yield payload.model_dump_json() + "\n"
+        finally:
+            session.close()
+
+    return StreamingResponse(event_lines(), media_type="application/x-ndjson")
 
 
 @router.get("/", response_model=List[FileResponse])
@@ -77,6 +148,27 @@ def get_all_files(
     )
 
 
+@router.get("/duplicates", response_model=List[DuplicateGroupResponse])
+def get_duplicate_files(
+    use_case: GetDuplicateFilesUseCase = Depends(get_get_duplicate_files_use_case),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(10, ge=1, le=100),
+):
+    """내용 해시가 같은 파일 묶음을 조회합니다. 해시 계산 작업(/api/v1/jobs/hash)을 먼저 실행해야 합니다."""
+    groups, total_count = use_case.execute(page=page, per_page=per_page)
+
+    content_range_start = (page - 1) * per_page
+    content_range_end = content_range_start + len(groups) - 1
+    content_range = f"duplicates {content_range_start}-{content_range_end}/{total_count}"
+
+    response_data = [DuplicateGroupResponse.model_validate(g).model_dump() for g in groups]
+
+    return JSONResponse(
+        content=response_data,
+        headers={"Content-Range": content_range}
+    )
+
+
 @router.post(
     "/{file_id}/apply-patterns",
     response_model=FileResponse,
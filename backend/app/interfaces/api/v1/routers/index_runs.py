@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from typing import List
+from app.application.use_cases.index_run.get_index_runs import GetIndexRunsUseCase
+from app.application.use_cases.index_run.resume_index_run import ResumeIndexRunUseCase
+from app.application.use_cases.index_run.abandon_index_run import AbandonIndexRunUseCase
+from app.application.use_cases.job.submit_job import SubmitJobUseCase
+from app.interfaces.api.dependencies import (
+    get_get_index_runs_use_case,
+    get_resume_index_run_use_case,
+    get_abandon_index_run_use_case,
+    get_submit_job_use_case,
+)
+from app.interfaces.api.job_handlers import JOB_TYPE_INDEX
+from app.interfaces.api.v1.dtos.index_run_dtos import IndexRunResponse
+from app.interfaces.api.v1.dtos.job_dtos import JobResponse
+from app.application.exceptions import IndexRunNotFoundException, IndexRunNotResumableException
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[IndexRunResponse])
+def get_all_index_runs(
+    use_case: GetIndexRunsUseCase = Depends(get_get_index_runs_use_case),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(10, ge=1, le=100),
+    incomplete: bool = Query(False), # 완료되지 않은 실행만 조회
+    response: Response = None
+):
+    index_runs, total_count = use_case.execute(
+        skip=(page - 1) * per_page, limit=per_page, incomplete_only=incomplete
+    )
+
+    content_range_start = (page - 1) * per_page
+    content_range_end = content_range_start + len(index_runs) - 1
+    response.headers["Content-Range"] = f"index-runs {content_range_start}-{content_range_end}/{total_count}"
+
+    return [IndexRunResponse.model_validate(index_run) for index_run in index_runs]
+
+
+@router.post("/{index_run_id}/resume", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def resume_index_run(
+    index_run_id: int,
+    use_case: ResumeIndexRunUseCase = Depends(get_resume_index_run_use_case),
+    submit_job_use_case: SubmitJobUseCase = Depends(get_submit_job_use_case),
+):
+    """중단된 인덱싱 실행을 백그라운드 작업으로 이어서 실행합니다."""
+    try:
+        index_run = use_case.execute(index_run_id)
+    except IndexRunNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except IndexRunNotResumableException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    job = submit_job_use_case.execute(JOB_TYPE_INDEX, {"index_run_id": index_run.id})
+    return JobResponse.model_validate(job)
+
+
+@router.post("/{index_run_id}/abandon", response_model=IndexRunResponse)
+def abandon_index_run(
+    index_run_id: int,
+    use_case: AbandonIndexRunUseCase = Depends(get_abandon_index_run_use_case),
+):
+    try:
+        return IndexRunResponse.model_validate(use_case.execute(index_run_id))
+    except IndexRunNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except IndexRunNotResumableException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
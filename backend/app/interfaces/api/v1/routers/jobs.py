@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from typing import List
+from app.application.use_cases.job.submit_job import SubmitJobUseCase
+from app.application.use_cases.job.get_jobs import GetJobsUseCase
+from app.application.use_cases.job.get_job_detail import GetJobDetailUseCase
+from app.application.use_cases.job.cancel_job import CancelJobUseCase
+from app.interfaces.api.dependencies import (
+    get_submit_job_use_case,
+    get_get_jobs_use_case,
+    get_get_job_detail_use_case,
+    get_cancel_job_use_case,
+)
+from app.interfaces.api.job_handlers import (
+    JOB_TYPE_INDEX,
+    JOB_TYPE_REAPPLY_PATTERNS,
+    JOB_TYPE_APPLY_SAVED_PATTERN,
+    JOB_TYPE_CREATE_FILE_CHANGE_REQUEST,
+    JOB_TYPE_HASH_FILES,
+)
+from app.interfaces.api.v1.dtos.job_dtos import JobResponse
+from app.interfaces.api.v1.dtos.file_dtos import IndexJobRequest
+from app.interfaces.api.v1.dtos.file_change_pattern_dtos import ApplySavedPatternRequest
+from app.interfaces.api.v1.dtos.file_change_request_dtos import CreateFileChangeRequestDto
+from app.application.exceptions import JobNotFoundException
+
+router = APIRouter()
+
+
+@router.post("/index", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_index_job(
+    request: IndexJobRequest,
+    use_case: SubmitJobUseCase = Depends(get_submit_job_use_case),
+):
+    job = use_case.execute(JOB_TYPE_INDEX, request.model_dump())
+    return JobResponse.model_validate(job)
+
+
+@router.post("/hash", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_hash_files_job(
+    use_case: SubmitJobUseCase = Depends(get_submit_job_use_case),
+):
+    job = use_case.execute(JOB_TYPE_HASH_FILES, {})
+    return JobResponse.model_validate(job)
+
+
+@router.post("/reapply-patterns", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_reapply_patterns_job(
+    use_case: SubmitJobUseCase = Depends(get_submit_job_use_case),
+):
+    job = use_case.execute(JOB_TYPE_REAPPLY_PATTERNS, {})
+    return JobResponse.model_validate(job)
+
+
+@router.post("/apply-saved-pattern", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_apply_saved_pattern_job(
+    request: ApplySavedPatternRequest,
+    use_case: SubmitJobUseCase = Depends(get_submit_job_use_case),
+):
+    job = use_case.execute(JOB_TYPE_APPLY_SAVED_PATTERN, request.model_dump())
+    return JobResponse.model_validate(job)
+
+
+@router.post("/file-change-requests", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_create_file_change_request_job(
+    request: CreateFileChangeRequestDto,
+    use_case: SubmitJobUseCase = Depends(get_submit_job_use_case),
+):
+    job = use_case.execute(JOB_TYPE_CREATE_FILE_CHANGE_REQUEST, request.model_dump())
+    return JobResponse.model_validate(job)
+
+
+@router.get("/", response_model=List[JobResponse])
+def get_all_jobs(
+    use_case: GetJobsUseCase = Depends(get_get_jobs_use_case),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(10, ge=1, le=100),
+    response: Response = None
+):
+    jobs, total_count = use_case.execute(skip=(page - 1) * per_page, limit=per_page)
+
+    content_range_start = (page - 1) * per_page
+    content_range_end = content_range_start + len(jobs) - 1
+    response.headers["Content-Range"] = f"jobs {content_range_start}-{content_range_end}/{total_count}"
+
+    return [JobResponse.model_validate(job) for job in jobs]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job_detail(
+    job_id: int,
+    use_case: GetJobDetailUseCase = Depends(get_get_job_detail_use_case),
+):
+    try:
+        return JobResponse.model_validate(use_case.execute(job_id))
+    except JobNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def cancel_job(
+    job_id: int,
+    use_case: CancelJobUseCase = Depends(get_cancel_job_use_case),
+):
+    try:
+        return JobResponse.model_validate(use_case.execute(job_id))
+    except JobNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
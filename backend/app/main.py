@@ -1,23 +1,46 @@
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from app.infrastructure.app_config import create_db_and_tables
+from app.infrastructure.app_config import create_db_and_tables, settings
 from app.interfaces.api.v1.routers import (
     files as files_router,
     file_change_patterns as file_change_patterns_router,
     exclusion_patterns as exclusion_patterns_router,
     file_change_requests as file_change_requests_router,
+    jobs as jobs_router,
+    index_runs as index_runs_router,
 )
+from app.interfaces.api.job_handlers import build_job_executor, interrupt_running_index_runs
+from app.interfaces.api.index_watch import build_index_watcher
 from app.interfaces.api.v1.routers import test as test_router
 
+logger = logging.getLogger(__name__)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시 실행
     print("INFO:     startup event")
     create_db_and_tables()
+    # 이전 실행에서 중단된 인덱싱은 목록 조회 API로 확인하여 이어서 실행하거나 포기할 수 있습니다.
+    interrupt_running_index_runs()
+    # 이전 실행에서 완료되지 않은 백그라운드 작업을 이어서 실행합니다.
+    app.state.job_executor = build_job_executor()
+    app.state.job_executor.resume_unfinished()
+    index_watcher = None
+    if settings.INDEX_WATCH_ENABLED:
+        index_watcher = build_index_watcher()
+        try:
+            index_watcher.start()
+        except OSError as e:
+            logger.warning("index watcher disabled: %s", e)
+            index_watcher = None
     yield
     # 종료 시 실행 (필요 시)
+    if index_watcher is not None:
+        index_watcher.stop()
+    app.state.job_executor.shutdown()
 
 from app.interfaces.exception_handler import register_exception_handlers
 
@@ -57,6 +80,16 @@ app.include_router(
     prefix="/api/v1/file-change-requests",
     tags=["file-change-requests"],
 )
+app.include_router(
+    jobs_router.router,
+    prefix="/api/v1/jobs",
+    tags=["jobs"],
+)
+app.include_router(
+    index_runs_router.router,
+    prefix="/api/v1/index-runs",
+    tags=["index-runs"],
+)
 app.include_router(
     test_router.router,
     prefix="/api/v1",
@@ -0,0 +1,49 @@
+"""파일마다 fnmatch로 패턴을 하나씩 검사하는 기존 방식과 컴파일된 ExclusionMatcher를 비교하는 벤치마크입니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_exclusion_matcher --paths 20000
+"""
+import argparse
+import fnmatch
+import time
+
+from app.domain.exclusion_pattern.matcher import ExclusionMatcher
+
+
+def generate_paths(count: int):
+    return [f"/media/series_{i // 100}/season_{i // 10}/episode_{i:05d}.mkv" for i in range(count)]
+
+
+def generate_patterns(count: int):
+    # 어떤 경로와도 일치하지 않는 패턴이 최악의 경우(모든 패턴을 검사)입니다.
+    return [f"*/excluded_{i}/*" if i % 2 == 0 else f"*.tmp{i}" for i in range(count)]
+
+
+def measure(func, paths, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            func(path)
+        best = min(best, time.perf_counter() - start)
+    return best / len(paths) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = generate_paths(args.paths)
+    print(f"{'patterns':>8} {'fnmatch ns/file':>16} {'compiled ns/file':>17}")
+    for pattern_count in (1, 5, 10, 25, 50, 100):
+        patterns = generate_patterns(pattern_count)
+        matcher = ExclusionMatcher(patterns)
+        legacy = measure(lambda p: any(fnmatch.fnmatch(p, pattern) for pattern in patterns), paths, args.repeat)
+        compiled = measure(matcher.matches, paths, args.repeat)
+        print(f"{pattern_count:>8} {legacy:>16,.0f} {compiled:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""파일마다 커밋하는 기존 추출 결과 저장과 배치 단위 저장(execute_batch)을 비교하는 벤치마크입니다.
+
+커밋 비용이 드러나도록 임시 디렉토리의 SQLite 파일을 사용합니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_extraction_writes --files 5000
+"""
+import argparse
+import importlib
+import os
+import tempfile
+import time
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.domain.directory.model import Directory
+from app.domain.file.model import File
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_pattern.registry import PatternRegistry
+from app.application.use_cases.extracted_data.apply_patterns_to_file import ApplyPatternsToFileUseCase
+from app.application.use_cases.extracted_data.extract_data_from_file import ExtractDataFromFileUseCase
+from app.infrastructure.persistence.extracted_data_repository_impl import ExtractedDataRepositoryImpl
+from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+
+# 매퍼 초기화를 위해 관계가 걸린 모델들을 등록합니다.
+for _module in (
+    "app.domain.file_change_request.model",
+    "app.domain.file_change_request.file_change_request_target_model",
+):
+    importlib.import_module(_module)
+
+BATCH_SIZE = 500
+
+
+def populate(session: Session, count: int) -> None:
+    directory = Directory(path="/media/Show")
+    session.add(directory)
+    session.flush()
+    session.bulk_insert_mappings(File, [
+        {"directory_id": directory.id, "name": f"Show.S01E{i:05d}.mkv", "filename": f"Show.S01E{i:05d}",
+         "extension": "mkv", "size": i, "extracted_info": {}}
+        for i in range(count)
+    ])
+    session.add(FileChangePattern(
+        name="episode", regex_pattern=r"(?P<title>\w+)\.S(?P<season>\d+)E(?P<episode>\d+)",
+        replacement_format='{"title": "$title:s$", "season": "$season:d$", "episode": "$episode:d$"}',
+    ))
+    session.commit()
+
+
+def run(count: int, batched: bool) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            populate(session, count)
+            file_repository = FileRepositoryImpl(session)
+            use_case = ApplyPatternsToFileUseCase(
+                extracted_data_repository=ExtractedDataRepositoryImpl(session),
+                extract_data_from_file_use_case=ExtractDataFromFileUseCase(),
+                file_repository=file_repository,
+                pattern_registry=PatternRegistry(),
+            )
+            patterns = session.exec(select(FileChangePattern)).all()
+            start = time.perf_counter()
+            for files in file_repository.iter_after_id(0, BATCH_SIZE):
+                if batched:
+                    use_case.execute_batch(files, patterns)
+                else:
+                    for file in files:
+                        use_case.execute(file, patterns)
+            elapsed = time.perf_counter() - start
+        engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'files':>8} {'per-file s':>11} {'batched s':>10} {'speedup':>8}")
+    for count in (args.files // 4, args.files // 2, args.files):
+        per_file = run(count, batched=False)
+        batched = run(count, batched=True)
+        print(f"{count:>8,} {per_file:>11.2f} {batched:>10.2f} {per_file / batched:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""os.walk 기반 기존 탐색과 scandir 기반 FileDiscoveryService를 비교하는 벤치마크입니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_file_discovery --dirs 200 --files 100
+"""
+import argparse
+import importlib
+import os
+import tempfile
+import time
+import unicodedata
+
+from app.domain.file.model import File
+from app.infrastructure.services.file_discovery_service import FileDiscoveryService
+
+# 매퍼 초기화를 위해 관계가 걸린 모델들을 등록합니다.
+for _module in (
+    "app.domain.extracted_data.model",
+    "app.domain.file_change_pattern.model",
+    "app.domain.file_change_request.model",
+    "app.domain.file_change_request.file_change_request_target_model",
+):
+    importlib.import_module(_module)
+
+
+def legacy_discover(directory_path: str):
+    """기존 IndexFilesUseCase의 os.walk + os.path.getsize 탐색 방식"""
+    for root, _, filenames in os.walk(directory_path):
+        for filename in filenames:
+            full_path = os.path.join(root, filename)
+            try:
+                file_size = os.path.getsize(full_path)
+                base_name, extension = os.path.splitext(filename)
+                if extension.startswith('.'):
+                    extension = extension[1:]
+                directory = os.path.dirname(full_path)
+                yield File(
+                    filename=unicodedata.normalize("NFC", base_name),
+                    extension=unicodedata.normalize("NFC", extension),
+                    directory=directory,
+                    full_path=unicodedata.normalize("NFC", full_path),
+                    size=file_size,
+                )
+            except OSError:
+                continue
+
+
+def generate_tree(root: str, num_dirs: int, files_per_dir: int) -> None:
+    for d in range(num_dirs):
+        directory = os.path.join(root, f"series_{d // 10}", f"season_{d}")
+        os.makedirs(directory, exist_ok=True)
+        for f in range(files_per_dir):
+            with open(os.path.join(directory, f"episode_{f:04d}.mkv"), "wb") as fp:
+                fp.write(b"x" * (f % 64))
+
+
+def measure(label: str, func, directory_path: str, repeat: int) -> float:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in func(directory_path))
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<10} {count:>8} files  {best:.3f}s  {count / best:,.0f} files/s")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dirs", type=int, default=200)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4, help="병렬 탐색 스레드 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        generate_tree(root, args.dirs, args.files)
+        legacy = measure("os.walk", legacy_discover, root, args.repeat)
+        scandir = measure("scandir", FileDiscoveryService().discover, root, args.repeat)
+        print(f"speedup    {legacy / scandir:.2f}x")
+        parallel = measure(
+            f"parallel{args.workers}", FileDiscoveryService(workers=args.workers).discover, root, args.repeat
+        )
+        print(f"speedup    {legacy / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
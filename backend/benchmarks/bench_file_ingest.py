@@ -0,0 +1,78 @@
+"""조회 후 ORM으로 저장하는 기존 방식과 INSERT ... ON CONFLICT 일괄 저장을 비교하는 벤치마크입니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_file_ingest --files 50000
+"""
+import argparse
+import importlib
+import os
+import tempfile
+import time
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.domain.file.model import File
+from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+
+# 매퍼 초기화를 위해 관계가 걸린 모델들을 등록합니다.
+for _module in (
+    "app.domain.extracted_data.model",
+    "app.domain.file_change_pattern.model",
+    "app.domain.file_change_request.model",
+    "app.domain.file_change_request.file_change_request_target_model",
+):
+    importlib.import_module(_module)
+
+BATCH_SIZE = 500
+
+
+def generate_files(count: int):
+    return [
+        File(
+            filename=f"episode_{i:06d}",
+            extension="mkv",
+            directory=f"/media/season_{i // 100}",
+            full_path=f"/media/season_{i // 100}/episode_{i:06d}.mkv",
+            size=i,
+            mtime_ns=i,
+            inode=i,
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_ingest(repository: FileRepositoryImpl, batch):
+    existing = {f.full_path for f in repository.find_by_paths([f.full_path for f in batch])}
+    repository.save_all([f for f in batch if f.full_path not in existing])
+
+
+def bulk_ingest(repository: FileRepositoryImpl, batch):
+    repository.bulk_insert(batch)
+
+
+def measure(label: str, ingest, count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        files = generate_files(count)
+        with Session(engine) as session:
+            repository = FileRepositoryImpl(session)
+            start = time.perf_counter()
+            for offset in range(0, count, BATCH_SIZE):
+                ingest(repository, files[offset:offset + BATCH_SIZE])
+            elapsed = time.perf_counter() - start
+        engine.dispose()
+    print(f"{label:<8} {count:>8} rows  {elapsed:.3f}s  {count / elapsed:,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=50000)
+    args = parser.parse_args()
+
+    measure("legacy", legacy_ingest, args.files)
+    measure("bulk", bulk_ingest, args.files)
+
+
+if __name__ == "__main__":
+    main()
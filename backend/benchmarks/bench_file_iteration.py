@@ -0,0 +1,81 @@
+"""OFFSET으로 전체 파일을 배치 조회하는 기존 방식과 ID 키셋 순회(iter_after_id)를 비교하는 벤치마크입니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_file_iteration --files 200000
+"""
+import argparse
+import importlib
+import time
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.domain.directory.model import Directory
+from app.domain.file.model import File
+from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+
+# 매퍼 초기화를 위해 관계가 걸린 모델들을 등록합니다.
+for _module in (
+    "app.domain.extracted_data.model",
+    "app.domain.file_change_pattern.model",
+    "app.domain.file_change_request.model",
+    "app.domain.file_change_request.file_change_request_target_model",
+):
+    importlib.import_module(_module)
+
+BATCH_SIZE = 500
+
+
+def populate(session: Session, count: int) -> None:
+    directory = Directory(path="/media")
+    session.add(directory)
+    session.flush()
+    session.bulk_insert_mappings(File, [
+        {"directory_id": directory.id, "name": f"file_{i:07d}.mkv", "filename": f"file_{i:07d}",
+         "extension": "mkv", "size": i, "extracted_info": {}}
+        for i in range(count)
+    ])
+    session.commit()
+
+
+def offset_scan(repository: FileRepositoryImpl) -> int:
+    total, skip = 0, 0
+    while True:
+        files = repository.find_all(skip=skip, limit=BATCH_SIZE, sort_field="id")
+        if not files:
+            return total
+        total += len(files)
+        skip += BATCH_SIZE
+        repository.session.expunge_all()
+
+
+def keyset_scan(repository: FileRepositoryImpl) -> int:
+    total = 0
+    for files in repository.iter_after_id(0, BATCH_SIZE):
+        total += len(files)
+        repository.session.expunge_all()
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"{'files':>9} {'offset s':>10} {'keyset s':>10} {'speedup':>8}")
+    for count in (args.files // 8, args.files // 4, args.files // 2, args.files):
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            populate(session, count)
+            repository = FileRepositoryImpl(session)
+            start = time.perf_counter()
+            assert offset_scan(repository) == count
+            offset_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            assert keyset_scan(repository) == count
+            keyset_seconds = time.perf_counter() - start
+        print(f"{count:>9,} {offset_seconds:>10.2f} {keyset_seconds:>10.2f} {offset_seconds / keyset_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
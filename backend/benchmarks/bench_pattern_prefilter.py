@@ -0,0 +1,77 @@
+"""모든 패턴의 정규식을 검사하는 기존 방식과 필수 리터럴로 후보를 거르는 PatternSet을 비교하는 벤치마크입니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_pattern_prefilter --paths 5000
+"""
+import argparse
+import importlib
+import time
+
+from app.domain.file.model import File
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_pattern.registry import PatternRegistry
+
+# 매퍼 초기화를 위해 관계가 걸린 모델들을 등록합니다.
+for _module in (
+    "app.domain.extracted_data.model",
+    "app.domain.file_change_request.model",
+    "app.domain.file_change_request.file_change_request_target_model",
+):
+    importlib.import_module(_module)
+
+
+def generate_paths(count: int):
+    return [f"/media/series_{i % 50}/[Group{i % 7}] Title {i % 50} - {i % 24:02d} [1080p].mkv" for i in range(count)]
+
+
+def generate_patterns(count: int):
+    # 패턴마다 서로 다른 제목을 기대하므로, 경로 하나에는 소수의 패턴만 일치합니다.
+    return [
+        FileChangePattern(
+            id=i,
+            name=f"p{i}",
+            regex_pattern=rf"\[(?P<group>[^\]]+)\] Title {i} - (?P<episode>\d+) \[(?P<quality>\d+p)\]",
+            replacement_format="",
+        )
+        for i in range(count)
+    ]
+
+
+def brute_force(compiled, file: File):
+    return [i for i, pattern in enumerate(compiled) if pattern.extract(file) is not None]
+
+
+def prefiltered(pattern_set, file: File):
+    compiled = pattern_set.compiled
+    return [i for i in pattern_set.candidates(file) if compiled[i].extract(file) is not None]
+
+
+def measure(func, files, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for file in files:
+            func(file)
+        best = min(best, time.perf_counter() - start)
+    return best / len(files) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    files = [File(filename="x", extension="mkv", directory="/media", full_path=p, size=0) for p in generate_paths(args.paths)]
+    print(f"{'patterns':>8} {'all regexes us/file':>20} {'prefiltered us/file':>20} {'speedup':>8}")
+    for pattern_count in (10, 50, 100, 200, 500, 1000):
+        pattern_set = PatternRegistry().pattern_set(generate_patterns(pattern_count))
+        # 두 방식의 결과가 같은지 먼저 확인합니다.
+        assert all(brute_force(pattern_set.compiled, f) == prefiltered(pattern_set, f) for f in files[:500])
+        legacy = measure(lambda f: brute_force(pattern_set.compiled, f), files, args.repeat)
+        filtered = measure(lambda f: prefiltered(pattern_set, f), files, args.repeat)
+        print(f"{pattern_count:>8} {legacy:>20,.1f} {filtered:>20,.1f} {legacy / filtered:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from sqlmodel import select
+
+from app.application.use_cases.extracted_data.apply_new_pattern_to_all_files import ApplyNewPatternToAllFilesUseCase
+from app.application.use_cases.extracted_data.apply_patterns_to_file import ApplyPatternsToFileUseCase
+from app.application.use_cases.extracted_data.extract_data_from_file import ExtractDataFromFileUseCase
+from app.application.use_cases.extracted_data.reapply_patterns_to_all_files import ReapplyPatternsToAllFilesUseCase
+from app.domain.extracted_data.model import ExtractedData
+from app.domain.file.model import File
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_pattern.registry import PatternRegistry
+from app.infrastructure.persistence.extracted_data_repository_impl import ExtractedDataRepositoryImpl
+from app.infrastructure.persistence.file_change_pattern_repository_impl import FileChangePatternRepositoryImpl
+from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+
+PATHS = [
+    "/media/Show/Show.S01E02.mkv",
+    "/media/Show/Show.S01E03.1080p.mkv",
+    "/books/Title_01_002.pdf",
+    "/books/Other.pdf",
+    "/misc/readme.txt",
+]
+
+PATTERNS = [
+    (r"(\w+)\.S(\d+)E(\d+)", '{"title": "$0:s$", "season": "$1:d$"}'),
+    (r"(\w+)_(\d+)_(\d+)", '{"title": "$0:s$", "start": "$1:d$"}'),
+    # 새 패턴: 에피소드 파일에서는 키가 더 많고, 책 파일에서는 기존 패턴과 키 수가 같습니다.
+    (r"(\w+)\.S(\d+)E(\d+)(?:\.(\d+p))?", '{"title": "$0:s$", "season": "$1:d$", "episode": "$2:d$"}'),
+    (r"(\w+)_(\d+)_(\d+)", '{"name": "$0:s$", "end": "$2:d$"}'),
+]
+
+
+def _use_cases(session):
+    file_repository = FileRepositoryImpl(session)
+    extracted_data_repository = ExtractedDataRepositoryImpl(session)
+    extract = ExtractDataFromFileUseCase(pattern_registry=PatternRegistry())
+    reapply = ReapplyPatternsToAllFilesUseCase(
+        file_repository=file_repository,
+        file_change_pattern_repository=FileChangePatternRepositoryImpl(session),
+        apply_patterns_to_file_use_case=ApplyPatternsToFileUseCase(
+            extracted_data_repository=extracted_data_repository,
+            extract_data_from_file_use_case=extract,
+            file_repository=file_repository,
+            pattern_registry=PatternRegistry(),
+        ),
+    )
+    apply_new = ApplyNewPatternToAllFilesUseCase(
+        file_repository=file_repository,
+        extracted_data_repository=extracted_data_repository,
+        extract_data_from_file_use_case=extract,
+    )
+    return reapply, apply_new
+
+
+def _state(session):
+    files = sorted(
+        (f.id, f.extracted_info, f.extraction_failed, f.best_pattern_id, f.best_field_count)
+        for f in session.exec(select(File)).all()
+    )
+    data = sorted((d.file_id, d.pattern_id, d.extracted_values) for d in session.exec(select(ExtractedData)).all())
+    return files, data
+
+
+def test_new_pattern_only_same_as_full_reapply(session):
+    """새 패턴만 적용한 결과가 모든 패턴을 다시 적용한 결과와 같은지 확인"""
+    FileRepositoryImpl(session).save_all([
+        File(filename=p.rsplit("/", 1)[1].rsplit(".", 1)[0], extension=p.rsplit(".", 1)[1], full_path=p, size=1)
+        for p in PATHS
+    ])
+    pattern_repository = FileChangePatternRepositoryImpl(session)
+    for i, (regex, replacement) in enumerate(PATTERNS[:2]):
+        pattern_repository.save(FileChangePattern(name=f"p{i}", regex_pattern=regex, replacement_format=replacement))
+    reapply, apply_new = _use_cases(session)
+    reapply.execute()
+
+    for i, (regex, replacement) in enumerate(PATTERNS[2:], start=2):
+        pattern = pattern_repository.save(
+            FileChangePattern(name=f"p{i}", regex_pattern=regex, replacement_format=replacement)
+        )
+        apply_new.execute(pattern)
+    incremental = _state(session)
+
+    reapply.execute()
+    assert _state(session) == incremental
+    # 에피소드 파일 두 개만 새 패턴으로 바뀝니다.
+    assert [f[3] for f in incremental[0]] == [3, 3, 2, None, None]
@@ -7,7 +7,8 @@ from app.application.use_cases.extracted_data.extract_data_from_file import Extr
 from app.domain.file.model import File
 from app.domain.file.repository import FileRepository
 from app.domain.file_change_pattern.model import FileChangePattern
-from app.domain.extracted_data.model import ExtractedData
+from app.domain.file_change_pattern.registry import PatternRegistry
+from app.domain.extracted_data.model import ExtractedData, ExtractionResult
 from app.domain.extracted_data.repository import ExtractedDataRepository
 
 @pytest.fixture
@@ -31,7 +32,9 @@ def apply_patterns_to_file_use_case(
     return ApplyPatternsToFileUseCase(
         extracted_data_repository=mock_extracted_data_repository,
         extract_data_from_file_use_case=mock_extract_data_from_file_use_case,
-        file_repository=mock_file_repository
+        file_repository=mock_file_repository,
+        # 패턴 승률이 테스트 사이에 공유되지 않도록 테스트마다 새 레지스트리를 씁니다.
+        pattern_registry=PatternRegistry(),
     )
 
 @pytest.fixture
@@ -154,3 +157,26 @@ def test_apply_patterns_no_extracted_fields(apply_patterns_to_file_use_case,
     mock_file_repository.save.assert_called_once_with(sample_file)
     assert sample_file.extraction_failed
     assert sample_file.extraction_failure_reason == "모든 패턴을 적용했지만 데이터를 추출하지 못했습니다."
+
+def test_execute_batch_saves_results_at_once(apply_patterns_to_file_use_case,
+                                             mock_extracted_data_repository,
+                                             mock_extract_data_from_file_use_case,
+                                             mock_file_repository,
+                                             sample_file, sample_patterns):
+    """여러 파일의 결과를 파일마다 저장하지 않고 한 번에 저장하는지 확인"""
+    other_file = File(id=2, filename="document", extension=".pdf", directory="/path/to/other",
+                      full_path="/path/to/other/document.pdf", size=1)
+    mock_extract_data_from_file_use_case.execute.side_effect = [
+        {"num": "ument"}, {"num": "ument", "ext": "pdf"},  # sample_file: Pattern B
+        None, None,                                         # other_file: 일치 없음
+    ]
+
+    apply_patterns_to_file_use_case.execute_batch([sample_file, other_file], sample_patterns)
+
+    mock_extracted_data_repository.save_extraction_results.assert_called_once_with([
+        ExtractionResult(sample_file.id, sample_patterns[1].id, {"num": "ument", "ext": "pdf"}),
+        ExtractionResult(other_file.id, None, {}, "모든 패턴을 적용했지만 데이터를 추출하지 못했습니다."),
+    ])
+    mock_extracted_data_repository.delete_by_file_id.assert_not_called()
+    mock_extracted_data_repository.save.assert_not_called()
+    mock_file_repository.save.assert_not_called()
@@ -63,7 +63,7 @@ def test_execute_success(apply_patterns_to_specific_file_use_case,
                          sample_file, sample_patterns):
     """파일과 패턴이 모두 존재하고 추출 성공 시 올바른 데이터 반환 및 파일 상태 초기화 확인"""
     mock_file_repository.find_by_id.return_value = sample_file
-    mock_file_change_pattern_repository.find_all.return_value = sample_patterns
+    mock_file_change_pattern_repository.find_all_active.return_value = sample_patterns
     
     mock_extracted_data = ExtractedData(file_id=sample_file.id, pattern_id=1, extracted_values={"key": "value"})
     mock_apply_patterns_to_file_use_case.execute.return_value = mock_extracted_data
@@ -73,7 +73,7 @@ def test_execute_success(apply_patterns_to_specific_file_use_case,
 
     assert result == sample_file # 이제 File 객체를 반환
     mock_file_repository.find_by_id.assert_called_once_with(sample_file.id)
-    mock_file_change_pattern_repository.find_all.assert_called_once()
+    mock_file_change_pattern_repository.find_all_active.assert_called_once()
     mock_apply_patterns_to_file_use_case.execute.assert_called_once_with(sample_file, sample_patterns)
     mock_file_repository.save.assert_called_once_with(sample_file)
     assert not sample_file.extraction_failed
@@ -96,14 +96,14 @@ def test_execute_no_patterns(apply_patterns_to_specific_file_use_case,
                              sample_file):
     """패턴이 존재하지 않을 때 PatternNotFoundException이 발생하는지 확인"""
     mock_file_repository.find_by_id.return_value = sample_file
-    mock_file_change_pattern_repository.find_all.return_value = []
+    mock_file_change_pattern_repository.find_all_active.return_value = []
 
     with pytest.raises(PatternNotFoundException) as excinfo:
         apply_patterns_to_specific_file_use_case.execute(sample_file.id)
 
     assert "적용할 패턴이 없습니다." in str(excinfo.value)
     mock_file_repository.find_by_id.assert_called_once_with(sample_file.id)
-    mock_file_change_pattern_repository.find_all.assert_called_once()
+    mock_file_change_pattern_repository.find_all_active.assert_called_once()
 
 def test_execute_apply_patterns_fails(apply_patterns_to_specific_file_use_case,
                                      mock_file_repository,
@@ -112,7 +112,7 @@ def test_execute_apply_patterns_fails(apply_patterns_to_specific_file_use_case,
                                      sample_file, sample_patterns):
     """패턴 적용이 실패했을 때 FileProcessingException이 발생하는지 확인"""
     mock_file_repository.find_by_id.return_value = sample_file
-    mock_file_change_pattern_repository.find_all.return_value = sample_patterns
+    mock_file_change_pattern_repository.find_all_active.return_value = sample_patterns
     mock_apply_patterns_to_file_use_case.execute.return_value = None
     mock_file_repository.save.side_effect = lambda x: x # Mock save to update the file object
 
@@ -121,7 +121,7 @@ def test_execute_apply_patterns_fails(apply_patterns_to_specific_file_use_case,
 
     assert "파일에서 데이터를 추출하지 못했습니다." in str(excinfo.value)
     mock_file_repository.find_by_id.assert_called_once_with(sample_file.id)
-    mock_file_change_pattern_repository.find_all.assert_called_once()
+    mock_file_change_pattern_repository.find_all_active.assert_called_once()
     mock_apply_patterns_to_file_use_case.execute.assert_called_once_with(sample_file, sample_patterns)
     mock_file_repository.save.assert_called_once() # 추출 실패 시에도 파일 상태 업데이트를 위해 save 호출
     assert sample_file.extraction_failed is True
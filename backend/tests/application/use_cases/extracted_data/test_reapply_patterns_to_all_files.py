@@ -11,7 +11,12 @@ from app.domain.file_change_pattern.repository import FileChangePatternRepositor
 
 @pytest.fixture
 def mock_file_repository(mocker) -> MagicMock:
-    return mocker.MagicMock(spec=FileRepository)
+    repository = mocker.MagicMock(spec=FileRepository)
+    # 키셋 순회는 실제 구현을 써서 find_after_id 호출로 확인합니다.
+    repository.iter_after_id.side_effect = (
+        lambda after_id, batch_size: FileRepository.iter_after_id(repository, after_id, batch_size)
+    )
+    return repository
 
 @pytest.fixture
 def mock_file_change_pattern_repository(mocker) -> MagicMock:
@@ -53,14 +58,14 @@ def test_execute_no_patterns(reapply_patterns_to_all_files_use_case,
                              mock_apply_patterns_to_file_use_case,
                              sample_files):
     """패턴이 없을 때 아무 작업도 수행하지 않는지 확인"""
-    mock_file_repository.find_all.return_value = sample_files
-    mock_file_change_pattern_repository.find_all.return_value = []
+    mock_file_repository.find_after_id.side_effect = [sample_files, []]
+    mock_file_change_pattern_repository.find_all_active.return_value = []
 
     reapply_patterns_to_all_files_use_case.execute()
 
-    mock_file_repository.find_all.assert_called_once()
-    mock_file_change_pattern_repository.find_all.assert_called_once()
-    mock_apply_patterns_to_file_use_case.execute.assert_not_called()
+    mock_file_repository.find_after_id.assert_not_called()
+    mock_file_change_pattern_repository.find_all_active.assert_called_once()
+    mock_apply_patterns_to_file_use_case.execute_batch.assert_not_called()
 
 def test_execute_no_files(reapply_patterns_to_all_files_use_case,
                           mock_file_repository,
@@ -68,14 +73,14 @@ def test_execute_no_files(reapply_patterns_to_all_files_use_case,
                           mock_apply_patterns_to_file_use_case,
                           sample_patterns):
     """파일이 없을 때 아무 작업도 수행하지 않는지 확인"""
-    mock_file_repository.find_all.return_value = []
-    mock_file_change_pattern_repository.find_all.return_value = sample_patterns
+    mock_file_repository.find_after_id.return_value = []
+    mock_file_change_pattern_repository.find_all_active.return_value = sample_patterns
 
     reapply_patterns_to_all_files_use_case.execute()
 
-    mock_file_repository.find_all.assert_called_once()
-    mock_file_change_pattern_repository.find_all.assert_called_once()
-    mock_apply_patterns_to_file_use_case.execute.assert_not_called()
+    mock_file_repository.find_after_id.assert_called_once()
+    mock_file_change_pattern_repository.find_all_active.assert_called_once()
+    mock_apply_patterns_to_file_use_case.execute_batch.assert_not_called()
 
 def test_execute_files_and_patterns_exist(reapply_patterns_to_all_files_use_case,
                                          mock_file_repository,
@@ -83,15 +88,33 @@ def test_execute_files_and_patterns_exist(reapply_patterns_to_all_files_use_case
                                          mock_apply_patterns_to_file_use_case,
                                          sample_files, sample_patterns):
     """파일과 패턴이 모두 존재할 때 각 파일에 대해 패턴 적용이 호출되는지 확인"""
-    mock_file_repository.find_all.return_value = sample_files
-    mock_file_change_pattern_repository.find_all.return_value = sample_patterns
+    mock_file_repository.find_after_id.side_effect = [sample_files, []]
+    mock_file_change_pattern_repository.find_all_active.return_value = sample_patterns
 
     reapply_patterns_to_all_files_use_case.execute()
 
-    mock_file_repository.find_all.assert_called_once()
-    mock_file_change_pattern_repository.find_all.assert_called_once()
+    mock_file_repository.find_after_id.assert_called_once()
+    mock_file_change_pattern_repository.find_all_active.assert_called_once()
     
-    # Verify that apply_patterns_to_file_use_case.execute was called for each file
-    assert mock_apply_patterns_to_file_use_case.execute.call_count == len(sample_files)
-    mock_apply_patterns_to_file_use_case.execute.assert_any_call(sample_files[0], sample_patterns)
-    mock_apply_patterns_to_file_use_case.execute.assert_any_call(sample_files[1], sample_patterns)
+    # 배치의 모든 파일에 대해 패턴 적용이 한 번에 호출되는지 확인
+    mock_apply_patterns_to_file_use_case.execute_batch.assert_called_once_with(sample_files, sample_patterns)
+
+def test_execute_resumes_from_checkpoint(reapply_patterns_to_all_files_use_case,
+                                         mock_file_repository,
+                                         mock_file_change_pattern_repository,
+                                         mock_apply_patterns_to_file_use_case,
+                                         sample_files, sample_patterns):
+    """체크포인트 위치부터 처리하고 배치마다 진행 상황을 보고하는지 확인"""
+    mock_file_repository.find_after_id.side_effect = [sample_files, []]
+    mock_file_change_pattern_repository.find_all_active.return_value = sample_patterns
+    progress_callback = MagicMock()
+
+    processed_count = reapply_patterns_to_all_files_use_case.execute(
+        progress_callback=progress_callback, checkpoint={"last_id": 1000, "processed_count": 900}
+    )
+
+    assert processed_count == 902
+    mock_file_repository.find_after_id.assert_called_once_with(1000, 500)
+    progress_callback.assert_called_once_with(
+        {"processed_count": 902}, {"last_id": 2, "processed_count": 902}
+    )
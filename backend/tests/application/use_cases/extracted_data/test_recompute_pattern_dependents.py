@@ -0,0 +1,155 @@
+import random
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+
+from app.application.use_cases.extracted_data.apply_patterns_to_file import ApplyPatternsToFileUseCase
+from app.application.use_cases.extracted_data.extract_data_from_file import ExtractDataFromFileUseCase
+from app.application.use_cases.extracted_data.reapply_patterns_to_all_files import ReapplyPatternsToAllFilesUseCase
+from app.application.use_cases.extracted_data.recompute_pattern_dependents import RecomputePatternDependentsUseCase
+from app.application.use_cases.file_change_pattern.delete_file_change_pattern import DeleteFileChangePatternUseCase
+from app.application.use_cases.file_change_pattern.update_file_change_pattern import UpdateFileChangePatternUseCase
+from app.domain.extracted_data.model import ExtractedData
+from app.domain.file.model import File
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_pattern.registry import PatternRegistry
+from app.infrastructure.persistence.extracted_data_repository_impl import ExtractedDataRepositoryImpl
+from app.infrastructure.persistence.file_change_pattern_repository_impl import FileChangePatternRepositoryImpl
+from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+
+REGEXES = [r"(\w+)\.S(\d+)E(\d+)", r"(\w+)_(\d+)_(\d+)", r"(\w+)_(\d+)", r"(\d+)", r"S(\d+)", r"([a-z]+)\.(\w+)$"]
+FORMATS = ['{"a": "$0:s$"}', '{"a": "$0:s$", "b": "$1:d$"}', '{"a": "$0:s$", "b": "$1:d$", "c": "$2:s$"}']
+
+
+def _paths(rng):
+    stems = ["Show.S01E02", "Title_01_002", "Vol_3", "readme", "Other.S2E10", "x_9_9", "abc"]
+    return [f"/lib/d{i}/{rng.choice(stems)}.{rng.choice(['mkv', 'pdf', 'PDF', 'txt'])}" for i in range(30)]
+
+
+def _random_pattern(rng, name):
+    return FileChangePattern(
+        name=name,
+        regex_pattern=rng.choice(REGEXES),
+        replacement_format=rng.choice(FORMATS),
+        # 적용 범위가 있는 패턴은 후보 파일을 DB에서 거르므로, 확장자 정규화와 디렉토리 경계도 함께 확인합니다.
+        scope_extensions=rng.choice([None, None, "pdf", "MKV,.txt"]),
+        scope_directory=rng.choice([None, None, "/lib/d1", "/lib/"]),
+    )
+
+
+def _state(session):
+    session.expire_all()
+    files = sorted(
+        (f.id, f.extracted_info, f.extraction_failed, f.best_pattern_id, f.best_field_count)
+        for f in session.exec(select(File)).all()
+    )
+    data = sorted((d.file_id, d.pattern_id, d.extracted_values) for d in session.exec(select(ExtractedData)).all())
+    return files, data
+
+
+def test_update_and_delete_same_as_full_reapply(session, mocker):
+    """패턴 수정/삭제 후 영향받는 파일만 다시 계산한 결과가 전체 재적용 결과와 같은지 무작위로 확인"""
+    rng = random.Random(11)
+    # 후보 파일을 여러 배치로 나누어 읽도록 배치 크기를 줄입니다.
+    mocker.patch("app.application.use_cases.extracted_data.recompute_pattern_dependents.BATCH_SIZE", 4)
+    file_repository = FileRepositoryImpl(session)
+    pattern_repository = FileChangePatternRepositoryImpl(session)
+    extracted_data_repository = ExtractedDataRepositoryImpl(session)
+    file_repository.save_all([
+        File(filename=p.rsplit("/", 1)[1].rsplit(".", 1)[0], extension=p.rsplit(".", 1)[1], full_path=p, size=1)
+        for p in _paths(rng)
+    ])
+    for i in range(6):
+        pattern_repository.save(_random_pattern(rng, f"p{i}"))
+
+    extract = ExtractDataFromFileUseCase(pattern_registry=PatternRegistry())
+    apply_patterns = ApplyPatternsToFileUseCase(
+        extracted_data_repository=extracted_data_repository,
+        extract_data_from_file_use_case=extract,
+        file_repository=file_repository,
+        pattern_registry=PatternRegistry(),
+    )
+    reapply = ReapplyPatternsToAllFilesUseCase(
+        file_repository=file_repository,
+        file_change_pattern_repository=pattern_repository,
+        apply_patterns_to_file_use_case=apply_patterns,
+    )
+    recompute = RecomputePatternDependentsUseCase(
+        file_repository=file_repository,
+        file_change_pattern_repository=pattern_repository,
+        extracted_data_repository=extracted_data_repository,
+        apply_patterns_to_file_use_case=apply_patterns,
+        extract_data_from_file_use_case=extract,
+        pattern_registry=PatternRegistry(),
+    )
+    update = UpdateFileChangePatternUseCase(repository=pattern_repository, recompute_use_case=recompute)
+    delete = DeleteFileChangePatternUseCase(repository=pattern_repository, recompute_use_case=recompute)
+    reapply.execute()
+
+    for step in range(12):
+        pattern_ids = [p.id for p in pattern_repository.find_all_active()]
+        pattern_id = rng.choice(pattern_ids)
+        if step % 4 == 3 and len(pattern_ids) > 2:
+            delete.execute(pattern_id)
+        else:
+            edit = _random_pattern(rng, "")
+            update.execute(
+                pattern_id,
+                regex_pattern=edit.regex_pattern,
+                replacement_format=edit.replacement_format,
+                scope_extensions=edit.scope_extensions,
+                scope_directory=edit.scope_directory,
+            )
+        incremental = _state(session)
+
+        reapply.execute()
+        assert _state(session) == incremental, f"step {step}"
+
+
+def test_failed_update_keeps_extraction_results(session, mocker):
+    """패턴 저장이 실패하면 그 패턴의 추출 데이터와 파일의 선택 결과가 그대로 남는지 확인"""
+    file_repository = FileRepositoryImpl(session)
+    pattern_repository = FileChangePatternRepositoryImpl(session)
+    extracted_data_repository = ExtractedDataRepositoryImpl(session)
+    file_repository.save_all([
+        File(filename="Show.S01E02", extension="mkv", full_path="/lib/Show.S01E02.mkv", size=1),
+    ])
+    pattern = pattern_repository.save(FileChangePattern(
+        name="episode", regex_pattern=REGEXES[0], replacement_format=FORMATS[2]
+    ))
+    pattern_repository.save(FileChangePattern(name="other", regex_pattern=REGEXES[3], replacement_format=FORMATS[0]))
+
+    extract = ExtractDataFromFileUseCase(pattern_registry=PatternRegistry())
+    apply_patterns = ApplyPatternsToFileUseCase(
+        extracted_data_repository=extracted_data_repository,
+        extract_data_from_file_use_case=extract,
+        file_repository=file_repository,
+        pattern_registry=PatternRegistry(),
+    )
+    ReapplyPatternsToAllFilesUseCase(
+        file_repository=file_repository,
+        file_change_pattern_repository=pattern_repository,
+        apply_patterns_to_file_use_case=apply_patterns,
+    ).execute()
+    update = UpdateFileChangePatternUseCase(
+        repository=pattern_repository,
+        recompute_use_case=RecomputePatternDependentsUseCase(
+            file_repository=file_repository,
+            file_change_pattern_repository=pattern_repository,
+            extracted_data_repository=extracted_data_repository,
+            apply_patterns_to_file_use_case=apply_patterns,
+            extract_data_from_file_use_case=extract,
+            pattern_registry=PatternRegistry(),
+        ),
+    )
+    before = _state(session)
+    assert before[0][0][3] == pattern.id
+
+    # 커밋 시점의 실패(예: 동시에 같은 이름으로 저장된 패턴)를 흉내 냅니다.
+    mocker.patch.object(pattern_repository, "save", side_effect=IntegrityError("UPDATE", {}, Exception("UNIQUE")))
+    with pytest.raises(IntegrityError):
+        update.execute(pattern.id, regex_pattern=REGEXES[2])
+    session.rollback()
+
+    assert _state(session) == before
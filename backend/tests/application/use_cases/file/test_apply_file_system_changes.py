@@ -0,0 +1,102 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.application.use_cases.file.apply_file_system_changes import ApplyFileSystemChangesUseCase
+from app.application.use_cases.index_files import IndexFilesUseCase
+from app.domain.exclusion_pattern.repository import ExclusionPatternRepository
+from app.domain.file.model import FileIndexEntry
+from app.domain.file.repository import FileRepository
+from app.infrastructure.services.file_discovery_service import FileDiscoveryService
+from app.infrastructure.services.index_watcher import FileSystemChanges
+
+@pytest.fixture
+def mock_file_repository(mocker) -> MagicMock:
+    repository = mocker.MagicMock(spec=FileRepository)
+    repository.find_index_entries_by_paths.return_value = {}
+    repository.find_active_directories_by_prefix.return_value = {}
+    return repository
+
+@pytest.fixture
+def mock_index_files_use_case(mocker) -> MagicMock:
+    return mocker.MagicMock(spec=IndexFilesUseCase)
+
+@pytest.fixture
+def use_case(mocker, mock_file_repository, mock_index_files_use_case) -> ApplyFileSystemChangesUseCase:
+    exclusion_pattern_repository = mocker.MagicMock(spec=ExclusionPatternRepository)
+    exclusion_pattern_repository.find_active_patterns.return_value = []
+    return ApplyFileSystemChangesUseCase(
+        file_repository=mock_file_repository,
+        exclusion_pattern_repository=exclusion_pattern_repository,
+        index_files_use_case=mock_index_files_use_case,
+        file_discovery_service=FileDiscoveryService(),
+    )
+
+def test_execute_upserts_existing_and_deletes_vanished(use_case, mock_file_repository, tmp_path):
+    """존재하는 파일은 저장하고, 이벤트 이후 사라진 파일과 삭제된 파일은 삭제 표시하는지 확인"""
+    (tmp_path / "new.mkv").write_bytes(b"12")
+    changes = FileSystemChanges(
+        upserted_paths={str(tmp_path / "new.mkv"), str(tmp_path / "vanished.mkv")},
+        deleted_paths={str(tmp_path / "gone.mkv")},
+        deleted_directories={str(tmp_path / "old_season")},
+    )
+    mock_file_repository.find_index_entries_by_paths.return_value = {
+        str(tmp_path / "gone.mkv"): FileIndexEntry(1, 1, 0, 0, False),
+        str(tmp_path / "vanished.mkv"): FileIndexEntry(2, 1, 0, 0, True),
+    }
+    mock_file_repository.find_active_directories_by_prefix.return_value = {3: str(tmp_path / "old_season")}
+
+    use_case.execute(changes)
+
+    upserted = mock_file_repository.bulk_upsert.call_args[0][0]
+    assert [(f.full_path, f.size) for f in upserted] == [(str(tmp_path / "new.mkv"), 2)]
+    assert set(mock_file_repository.find_index_entries_by_paths.call_args[0][0]) == {
+        str(tmp_path / "gone.mkv"), str(tmp_path / "vanished.mkv")
+    }
+    # 이미 삭제 표시된 파일은 다시 표시하지 않습니다.
+    mock_file_repository.mark_deleted.assert_called_once_with([1, 3])
+
+def test_execute_scans_new_directories_and_rescans_roots(use_case, mock_file_repository, mock_index_files_use_case, tmp_path):
+    """새 디렉토리의 파일을 저장하고, 이벤트가 유실된 루트는 증분 인덱싱하는지 확인"""
+    (tmp_path / "season1").mkdir()
+    (tmp_path / "season1" / "ep1.mkv").write_bytes(b"1")
+    changes = FileSystemChanges(scanned_directories={str(tmp_path / "season1")}, rescan_roots={str(tmp_path)})
+
+    use_case.execute(changes)
+
+    upserted = mock_file_repository.bulk_upsert.call_args[0][0]
+    assert [f.full_path for f in upserted] == [str(tmp_path / "season1" / "ep1.mkv")]
+    mock_file_repository.mark_deleted.assert_not_called()
+    mock_index_files_use_case.execute.assert_called_once_with(str(tmp_path), incremental=True)
+
+def test_execute_moves_existing_rows(use_case, mock_file_repository, tmp_path):
+    """이동한 파일과 디렉토리는 기존 행의 경로를 바꾸고, 남은 이전 행만 삭제 표시하는지 확인"""
+    (tmp_path / "renamed.mkv").write_bytes(b"1")
+    (tmp_path / "Season 1").mkdir()
+    (tmp_path / "Season 1" / "ep1.mkv").write_bytes(b"1")
+    changes = FileSystemChanges(
+        moved_paths={str(tmp_path / "old.mkv"): str(tmp_path / "renamed.mkv")},
+        moved_directories={str(tmp_path / "season1"): str(tmp_path / "Season 1")},
+    )
+    mock_file_repository.find_index_entries_by_paths.side_effect = lambda paths: {
+        path: entry
+        for path, entry in {
+            str(tmp_path / "old.mkv"): FileIndexEntry(1, 1, 0, 0, False),
+            str(tmp_path / "season1" / "ep1.mkv"): FileIndexEntry(2, 1, 0, 0, False),
+        }.items()
+        if path in paths
+    }
+    mock_file_repository.find_active_directories_by_prefix.return_value = {3: str(tmp_path / "season1")}
+
+    use_case.execute(changes)
+
+    moved = mock_file_repository.move_files.call_args[0][0]
+    assert sorted((file_id, f.full_path) for file_id, f in moved) == [
+        (1, str(tmp_path / "renamed.mkv")),
+        (2, str(tmp_path / "Season 1" / "ep1.mkv")),
+    ]
+    # 옮긴 뒤 통계를 갱신하도록 새 경로도 저장합니다.
+    assert {f.full_path for f in mock_file_repository.bulk_upsert.call_args[0][0]} == {
+        str(tmp_path / "renamed.mkv"), str(tmp_path / "Season 1" / "ep1.mkv")
+    }
+    mock_file_repository.find_active_directories_by_prefix.assert_called_once_with(str(tmp_path / "season1"))
+    mock_file_repository.mark_deleted.assert_called_once_with([3])
@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.application.use_cases.file.hash_files import HashFilesUseCase
+from app.domain.file.model import FileHashEntry
+from app.domain.file.repository import FileRepository
+from app.infrastructure.services.file_hash_service import FileHashService
+
+@pytest.fixture
+def mock_file_repository(mocker) -> MagicMock:
+    repository = mocker.MagicMock(spec=FileRepository)
+    repository.find_partial_hash_candidates.return_value = []
+    repository.find_content_hash_candidates.return_value = []
+    return repository
+
+@pytest.fixture
+def use_case(mock_file_repository) -> HashFilesUseCase:
+    return HashFilesUseCase(
+        file_repository=mock_file_repository,
+        file_hash_service=FileHashService(workers=2, block_size=4),
+    )
+
+def _entry(file_id, path) -> FileHashEntry:
+    return FileHashEntry(file_id, str(path), path.stat().st_size if path.exists() else 0)
+
+def test_execute_hashes_in_two_stages(use_case, mock_file_repository, tmp_path):
+    """부분 해시는 앞/뒤 블록만 비교하고, 부분 해시가 같은 파일만 전체 해시가 달라지는지 확인"""
+    (tmp_path / "a").write_bytes(b"HEAD" + b"x" * 10 + b"TAIL")
+    (tmp_path / "b").write_bytes(b"HEAD" + b"y" * 10 + b"TAIL")
+    (tmp_path / "small").write_bytes(b"abc")
+    entries = [_entry(1, tmp_path / "a"), _entry(2, tmp_path / "b"), _entry(3, tmp_path / "small"), _entry(4, tmp_path / "gone")]
+    mock_file_repository.find_partial_hash_candidates.return_value = entries
+    mock_file_repository.find_content_hash_candidates.return_value = entries[:2]
+
+    summary = use_case.execute()
+
+    (partial_hashes, small_content_hashes), (_, content_hashes) = [
+        c.args for c in mock_file_repository.save_hashes.call_args_list
+    ]
+    assert partial_hashes[1] == partial_hashes[2]
+    # 작은 파일은 부분 해시가 곧 전체 해시입니다.
+    assert small_content_hashes == {3: partial_hashes[3]}
+    assert content_hashes[1] != content_hashes[2]
+    assert (summary.partial_hashed_count, summary.content_hashed_count, summary.error_count) == (3, 3, 1)
+
+def test_execute_resumes_from_checkpoint(use_case, mock_file_repository):
+    """체크포인트의 단계와 위치부터 이어서 계산하는지 확인"""
+    summary = use_case.execute(
+        checkpoint={"stage": "content", "after_id": 42, "partial_hashed_count": 7},
+    )
+
+    mock_file_repository.find_partial_hash_candidates.assert_not_called()
+    mock_file_repository.find_content_hash_candidates.assert_called_once_with(42, 200)
+    assert summary.partial_hashed_count == 7
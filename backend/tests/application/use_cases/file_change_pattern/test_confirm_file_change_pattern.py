@@ -0,0 +1,82 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.application.use_cases.file_change_pattern.confirm_file_change_pattern import ConfirmFileChangePatternUseCase
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_pattern.repository import FileChangePatternRepository
+from app.application.use_cases.extracted_data.recompute_pattern_dependents import RecomputePatternDependentsUseCase
+from app.application.use_cases.extracted_data.apply_new_pattern_to_all_files import ApplyNewPatternToAllFilesUseCase
+
+@pytest.fixture
+def mock_file_change_pattern_repository(mocker) -> MagicMock:
+    repository = mocker.MagicMock(spec=FileChangePatternRepository)
+    repository.save.side_effect = lambda pattern: pattern
+    return repository
+
+@pytest.fixture
+def mock_recompute_use_case(mocker) -> MagicMock:
+    recompute_use_case = mocker.MagicMock(spec=RecomputePatternDependentsUseCase)
+    recompute_use_case.find_dependents.return_value = [10, 11]
+    return recompute_use_case
+
+@pytest.fixture
+def mock_apply_new_pattern_use_case(mocker) -> MagicMock:
+    return mocker.MagicMock(spec=ApplyNewPatternToAllFilesUseCase)
+
+@pytest.fixture
+def confirm_file_change_pattern_use_case(
+    mock_file_change_pattern_repository,
+    mock_recompute_use_case,
+    mock_apply_new_pattern_use_case
+) -> ConfirmFileChangePatternUseCase:
+    return ConfirmFileChangePatternUseCase(
+        repository=mock_file_change_pattern_repository,
+        recompute_use_case=mock_recompute_use_case,
+        apply_new_pattern_use_case=mock_apply_new_pattern_use_case
+    )
+
+@pytest.fixture
+def existing_pattern() -> FileChangePattern:
+    return FileChangePattern(id=1, name="Episode", regex_pattern="old_regex", replacement_format="old_format")
+
+def test_confirm_changed_existing_pattern_recomputes_dependents(confirm_file_change_pattern_use_case,
+                                                                mock_file_change_pattern_repository,
+                                                                mock_recompute_use_case,
+                                                                mock_apply_new_pattern_use_case,
+                                                                existing_pattern):
+    """기존 패턴이 바뀌면 전체 재적용 대신 영향받는 파일만 다시 계산하는지 확인"""
+    mock_file_change_pattern_repository.find_by_name.return_value = existing_pattern
+
+    result = confirm_file_change_pattern_use_case.execute("Episode", "new_regex", "new_format")
+
+    assert (result.regex_pattern, result.is_confirmed) == ("new_regex", True)
+    mock_recompute_use_case.find_dependents.assert_called_once_with(1)
+    mock_file_change_pattern_repository.save.assert_called_once_with(existing_pattern)
+    mock_recompute_use_case.recompute.assert_called_once_with(1, [10, 11])
+    mock_apply_new_pattern_use_case.execute.assert_not_called()
+
+def test_confirm_unchanged_existing_pattern_skips_recompute(confirm_file_change_pattern_use_case,
+                                                            mock_file_change_pattern_repository,
+                                                            mock_recompute_use_case,
+                                                            existing_pattern):
+    """추출에 영향을 주는 값이 그대로면 확인 여부만 저장하는지 확인"""
+    mock_file_change_pattern_repository.find_by_name.return_value = existing_pattern
+
+    result = confirm_file_change_pattern_use_case.execute("Episode", "old_regex", "old_format")
+
+    assert result.is_confirmed is True
+    mock_file_change_pattern_repository.save.assert_called_once_with(existing_pattern)
+    mock_recompute_use_case.find_dependents.assert_not_called()
+    mock_recompute_use_case.recompute.assert_not_called()
+
+def test_confirm_new_pattern_applies_only_new_pattern(confirm_file_change_pattern_use_case,
+                                                      mock_file_change_pattern_repository,
+                                                      mock_recompute_use_case,
+                                                      mock_apply_new_pattern_use_case):
+    """새 패턴은 저장한 뒤 그 패턴만 전체 파일에 적용하는지 확인"""
+    mock_file_change_pattern_repository.find_by_name.return_value = None
+
+    result = confirm_file_change_pattern_use_case.execute("Episode", "regex", "format")
+
+    mock_apply_new_pattern_use_case.execute.assert_called_once_with(result)
+    mock_recompute_use_case.recompute.assert_not_called()
@@ -2,45 +2,54 @@ import pytest
 from unittest.mock import MagicMock
 
 from app.application.use_cases.file_change_pattern.create_file_change_pattern import CreateFileChangePatternUseCase
+from app.application.use_cases.extracted_data.extract_data_from_file import ExtractDataFromFileUseCase
+from app.domain.file.model import File
+from app.domain.file.repository import FileRepository
 from app.domain.file_change_pattern.model import FileChangePattern
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
-from app.application.use_cases.extracted_data.reapply_patterns_to_all_files import ReapplyPatternsToAllFilesUseCase
 
 @pytest.fixture
 def mock_file_change_pattern_repository(mocker) -> MagicMock:
     return mocker.MagicMock(spec=FileChangePatternRepository)
 
 @pytest.fixture
-def mock_reapply_use_case(mocker) -> MagicMock:
-    return mocker.MagicMock(spec=ReapplyPatternsToAllFilesUseCase)
+def mock_file_repository(mocker) -> MagicMock:
+    return mocker.MagicMock(spec=FileRepository)
+
+@pytest.fixture
+def mock_extract_data_from_file_use_case(mocker) -> MagicMock:
+    return mocker.MagicMock(spec=ExtractDataFromFileUseCase)
 
 @pytest.fixture
 def create_file_change_pattern_use_case(
     mock_file_change_pattern_repository,
-    mock_reapply_use_case
+    mock_file_repository,
+    mock_extract_data_from_file_use_case
 ) -> CreateFileChangePatternUseCase:
     return CreateFileChangePatternUseCase(
         repository=mock_file_change_pattern_repository,
-        reapply_use_case=mock_reapply_use_case
+        file_repository=mock_file_repository,
+        extract_data_from_file_use_case=mock_extract_data_from_file_use_case
     )
 
-def test_create_pattern_and_reapply(create_file_change_pattern_use_case,
-                                    mock_file_change_pattern_repository,
-                                    mock_reapply_use_case):
-    """새로운 패턴이 생성되고 저장되며, 모든 파일에 패턴 재적용이 호출되는지 확인"""
-    name = "Test Pattern"
-    regex_pattern = r"test_regex"
-    replacement_format = "test_format"
-
-    # Mock the save method to return a FileChangePattern instance
-    mock_file_change_pattern_repository.save.side_effect = lambda pattern: pattern
-
-    result = create_file_change_pattern_use_case.execute(name, regex_pattern, replacement_format)
-
-    assert isinstance(result, FileChangePattern)
-    assert result.name == name
-    assert result.regex_pattern == regex_pattern
-    assert result.replacement_format == replacement_format
+def test_create_pattern_previews_without_saving(create_file_change_pattern_use_case,
+                                                mock_file_change_pattern_repository,
+                                                mock_file_repository,
+                                                mock_extract_data_from_file_use_case):
+    """저장하지 않은 임시 패턴으로 각 파일의 추출 결과를 미리 보여주는지 확인"""
+    file = File(id=1, filename="doc1", extension=".txt", size=100)
+    mock_file_repository.find_by_id.side_effect = lambda file_id: file if file_id == 1 else None
+    mock_extract_data_from_file_use_case.execute.return_value = {"title": "doc1"}
+
+    result = create_file_change_pattern_use_case.execute(
+        "Test Pattern", r"(?P<title>.+)", "{title}", [1, 2]
+    )
 
-    mock_file_change_pattern_repository.save.assert_called_once()
-    mock_reapply_use_case.execute.assert_called_once()
+    assert result == {1: {"title": "doc1"}, 2: None}
+    mock_extract_data_from_file_use_case.execute.assert_called_once()
+    called_file, temp_pattern = mock_extract_data_from_file_use_case.execute.call_args.args
+    assert called_file is file
+    assert isinstance(temp_pattern, FileChangePattern)
+    assert temp_pattern.regex_pattern == r"(?P<title>.+)"
+    assert temp_pattern.is_confirmed is False
+    mock_file_change_pattern_repository.save.assert_not_called()
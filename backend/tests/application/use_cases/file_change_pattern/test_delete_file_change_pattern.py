@@ -3,24 +3,36 @@ from unittest.mock import MagicMock
 
 from app.application.use_cases.file_change_pattern.delete_file_change_pattern import DeleteFileChangePatternUseCase
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
+from app.application.use_cases.extracted_data.recompute_pattern_dependents import RecomputePatternDependentsUseCase
 
 @pytest.fixture
 def mock_file_change_pattern_repository(mocker) -> MagicMock:
     return mocker.MagicMock(spec=FileChangePatternRepository)
 
+@pytest.fixture
+def mock_recompute_use_case(mocker) -> MagicMock:
+    recompute_use_case = mocker.MagicMock(spec=RecomputePatternDependentsUseCase)
+    recompute_use_case.find_dependents.return_value = [10]
+    return recompute_use_case
+
 @pytest.fixture
 def delete_file_change_pattern_use_case(
-    mock_file_change_pattern_repository
+    mock_file_change_pattern_repository,
+    mock_recompute_use_case
 ) -> DeleteFileChangePatternUseCase:
     return DeleteFileChangePatternUseCase(
-        repository=mock_file_change_pattern_repository
+        repository=mock_file_change_pattern_repository,
+        recompute_use_case=mock_recompute_use_case
     )
 
 def test_delete_pattern(delete_file_change_pattern_use_case,
-                        mock_file_change_pattern_repository):
+                        mock_file_change_pattern_repository,
+                        mock_recompute_use_case):
     """주어진 ID로 패턴이 올바르게 삭제되는지 확인"""
     pattern_id = 1
 
     delete_file_change_pattern_use_case.execute(pattern_id)
 
     mock_file_change_pattern_repository.delete.assert_called_once_with(pattern_id)
+    mock_recompute_use_case.find_dependents.assert_called_once_with(pattern_id)
+    mock_recompute_use_case.recompute.assert_called_once_with(pattern_id, [10])
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 from app.application.use_cases.file_change_pattern.update_file_change_pattern import UpdateFileChangePatternUseCase
 from app.domain.file_change_pattern.model import FileChangePattern
 from app.domain.file_change_pattern.repository import FileChangePatternRepository
-from app.application.use_cases.extracted_data.reapply_patterns_to_all_files import ReapplyPatternsToAllFilesUseCase
+from app.application.use_cases.extracted_data.recompute_pattern_dependents import RecomputePatternDependentsUseCase
 from app.application.exceptions import PatternNotFoundException
 
 @pytest.fixture
@@ -12,17 +12,19 @@ def mock_file_change_pattern_repository(mocker) -> MagicMock:
     return mocker.MagicMock(spec=FileChangePatternRepository)
 
 @pytest.fixture
-def mock_reapply_use_case(mocker) -> MagicMock:
-    return mocker.MagicMock(spec=ReapplyPatternsToAllFilesUseCase)
+def mock_recompute_use_case(mocker) -> MagicMock:
+    recompute_use_case = mocker.MagicMock(spec=RecomputePatternDependentsUseCase)
+    recompute_use_case.find_dependents.return_value = [10, 11]
+    return recompute_use_case
 
 @pytest.fixture
 def update_file_change_pattern_use_case(
     mock_file_change_pattern_repository,
-    mock_reapply_use_case
+    mock_recompute_use_case
 ) -> UpdateFileChangePatternUseCase:
     return UpdateFileChangePatternUseCase(
         repository=mock_file_change_pattern_repository,
-        reapply_use_case=mock_reapply_use_case
+        recompute_use_case=mock_recompute_use_case
     )
 
 @pytest.fixture
@@ -36,7 +38,7 @@ def sample_pattern() -> FileChangePattern:
 
 def test_update_pattern_success(update_file_change_pattern_use_case,
                                mock_file_change_pattern_repository,
-                               mock_reapply_use_case,
+                               mock_recompute_use_case,
                                sample_pattern):
     """패턴이 올바르게 업데이트되고 저장되며, 재적용이 호출되는지 확인"""
     mock_file_change_pattern_repository.find_by_id.return_value = sample_pattern
@@ -60,11 +62,12 @@ def test_update_pattern_success(update_file_change_pattern_use_case,
 
     mock_file_change_pattern_repository.find_by_id.assert_called_once_with(sample_pattern.id)
     mock_file_change_pattern_repository.save.assert_called_once_with(sample_pattern)
-    mock_reapply_use_case.execute.assert_called_once()
+    mock_recompute_use_case.find_dependents.assert_called_once_with(sample_pattern.id)
+    mock_recompute_use_case.recompute.assert_called_once_with(sample_pattern.id, [10, 11])
 
 def test_update_pattern_not_found(update_file_change_pattern_use_case,
                                  mock_file_change_pattern_repository,
-                                 mock_reapply_use_case):
+                                 mock_recompute_use_case):
     """패턴이 존재하지 않을 때 PatternNotFoundException이 발생하는지 확인"""
     mock_file_change_pattern_repository.find_by_id.return_value = None
 
@@ -74,11 +77,12 @@ def test_update_pattern_not_found(update_file_change_pattern_use_case,
     assert "패턴을 찾을 수 없습니다: 999" in str(excinfo.value)
     mock_file_change_pattern_repository.find_by_id.assert_called_once_with(999)
     mock_file_change_pattern_repository.save.assert_not_called()
-    mock_reapply_use_case.execute.assert_not_called()
+    mock_recompute_use_case.find_dependents.assert_not_called()
+    mock_recompute_use_case.recompute.assert_not_called()
 
 def test_update_pattern_partial_update(update_file_change_pattern_use_case,
                                       mock_file_change_pattern_repository,
-                                      mock_reapply_use_case,
+                                      mock_recompute_use_case,
                                       sample_pattern):
     """일부 필드만 업데이트 요청이 왔을 때 해당 필드만 변경되는지 확인"""
     mock_file_change_pattern_repository.find_by_id.return_value = sample_pattern
@@ -98,4 +102,6 @@ def test_update_pattern_partial_update(update_file_change_pattern_use_case,
 
     mock_file_change_pattern_repository.find_by_id.assert_called_once_with(sample_pattern.id)
     mock_file_change_pattern_repository.save.assert_called_once_with(sample_pattern)
-    mock_reapply_use_case.execute.assert_called_once()
+    # 이름만 바뀌면 추출 결과가 그대로이므로 다시 계산하지 않습니다.
+    mock_recompute_use_case.find_dependents.assert_not_called()
+    mock_recompute_use_case.recompute.assert_not_called()
@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock
+
+from app.domain.file.model import File
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_request.model import FileChangeRequest
+from app.application.use_cases.file_change_request.create_file_change_request import (
+    CHUNK_SIZE,
+    CreateFileChangeRequestUseCase,
+)
+
+
+def _copy_result(files, rename_pattern_string, destination_path):
+    infos = [
+        {"original_file_id": f.id, "new_filename": f"{f.id}.txt", "status": "copied", "message": None}
+        for f in files
+    ]
+    return len(files), 0, [f"copied {f.id}" for f in files], infos
+
+
+def _build_use_case(file_count):
+    file_repo = MagicMock()
+    pattern_repo = MagicMock()
+    request_repo = MagicMock()
+    file_op_service = MagicMock()
+
+    pattern_repo.find_by_id.return_value = FileChangePattern(id=1, name="p", regex_pattern=".*", replacement_format="{}")
+    files = [
+        File(id=i, filename=str(i), extension="txt", full_path=f"/src/{i}.txt") for i in range(1, file_count + 1)
+    ]
+    file_repo.find_by_pattern_id_after_id.side_effect = (
+        lambda pattern_id, after_id, limit: [f for f in files if f.id > after_id][:limit]
+    )
+    file_repo.count_by_pattern_id.return_value = len(files)
+
+    def save(request):
+        if request.id is None:
+            request.id = 7
+        return request
+
+    request_repo.save.side_effect = save
+    request_repo.add_targets.side_effect = lambda request, targets: request
+    file_op_service.rename_and_copy_files_with_details.side_effect = _copy_result
+
+    use_case = CreateFileChangeRequestUseCase(
+        file_repository=file_repo,
+        file_change_pattern_repository=pattern_repo,
+        file_change_request_repository=request_repo,
+        file_operation_service=file_op_service,
+    )
+    return use_case, request_repo, file_repo
+
+
+def test_execute_persists_targets_per_chunk_with_small_checkpoint():
+    """청크마다 대상을 바로 저장하고, 체크포인트에는 누적 목록 없이 위치와 건수만 담는지 확인"""
+    use_case, request_repo, _ = _build_use_case(CHUNK_SIZE + 5)
+    progress_callback = MagicMock()
+
+    request = use_case.execute(1, "{}", "/dest", progress_callback=progress_callback)
+
+    assert request.status == "completed"
+    assert request.success_count == CHUNK_SIZE + 5
+    assert request.details.split(", ")[-1] == f"copied {CHUNK_SIZE + 5}"
+    assert [len(c.args[1]) for c in request_repo.add_targets.call_args_list] == [CHUNK_SIZE, 5]
+    assert progress_callback.call_args_list[-1].args[0] == {
+        "processed_count": CHUNK_SIZE + 5,
+        "total_count": CHUNK_SIZE + 5,
+    }
+    assert progress_callback.call_args_list[-1].args[1] == {
+        "request_id": 7,
+        "last_id": CHUNK_SIZE + 5,
+        "processed_count": CHUNK_SIZE + 5,
+        "success_count": CHUNK_SIZE + 5,
+        "failed_count": 0,
+    }
+
+
+def test_execute_resumes_into_existing_request():
+    """체크포인트의 요청에 이어서 last_id 다음 파일만 복사하는지 확인"""
+    use_case, request_repo, file_repo = _build_use_case(CHUNK_SIZE + 5)
+    existing = FileChangeRequest(
+        id=7, file_change_pattern_id=1, rename_pattern_string="{}", destination_path="/dest",
+        status="in_progress", success_count=CHUNK_SIZE, failed_count=0, details="earlier",
+    )
+    request_repo.find_by_id.return_value = existing
+
+    request = use_case.execute(
+        1, "{}", "/dest",
+        checkpoint={
+            "request_id": 7, "last_id": CHUNK_SIZE, "processed_count": CHUNK_SIZE,
+            "success_count": CHUNK_SIZE, "failed_count": 0,
+        },
+    )
+
+    assert request is existing
+    assert request.success_count == CHUNK_SIZE + 5
+    assert request.details.startswith("earlier, copied ")
+    request_repo.add_targets.assert_called_once()
+    assert [t.original_file_id for t in request_repo.add_targets.call_args.args[1]] == list(
+        range(CHUNK_SIZE + 1, CHUNK_SIZE + 6)
+    )
+    assert file_repo.find_by_pattern_id_after_id.call_args_list[0].args == (1, CHUNK_SIZE, CHUNK_SIZE)
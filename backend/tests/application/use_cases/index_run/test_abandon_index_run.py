@@ -0,0 +1,37 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.application.exceptions import IndexRunNotFoundException, IndexRunNotResumableException
+from app.application.use_cases.index_run.abandon_index_run import AbandonIndexRunUseCase
+from app.domain.index_run.model import IndexRun, INDEX_RUN_STATUS_ABANDONED
+from app.domain.index_run.repository import IndexRunRepository
+
+@pytest.fixture
+def mock_repository(mocker) -> MagicMock:
+    return mocker.MagicMock(spec=IndexRunRepository)
+
+@pytest.fixture
+def use_case(mock_repository) -> AbandonIndexRunUseCase:
+    return AbandonIndexRunUseCase(repository=mock_repository)
+
+def test_abandon_interrupted_run(use_case, mock_repository):
+    """중단된 실행은 포기 상태로 바뀌고 체크포인트가 삭제되는지 확인"""
+    mock_repository.find_by_id.return_value = IndexRun(id=1, root_path="/library", status="interrupted")
+
+    use_case.execute(1)
+
+    mock_repository.finish.assert_called_once_with(1, INDEX_RUN_STATUS_ABANDONED)
+
+def test_abandon_running_run_is_rejected(use_case, mock_repository):
+    """실행 중인 실행은 포기할 수 없는지 확인"""
+    mock_repository.find_by_id.return_value = IndexRun(id=1, root_path="/library", status="running")
+
+    with pytest.raises(IndexRunNotResumableException):
+        use_case.execute(1)
+    mock_repository.finish.assert_not_called()
+
+def test_abandon_unknown_run(use_case, mock_repository):
+    mock_repository.find_by_id.return_value = None
+
+    with pytest.raises(IndexRunNotFoundException):
+        use_case.execute(1)
@@ -0,0 +1,42 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.application.exceptions import JobNotFoundException
+from app.application.use_cases.job.cancel_job import CancelJobUseCase
+from app.domain.job.model import Job
+from app.domain.job.repository import JobRepository
+
+@pytest.fixture
+def mock_job_repository(mocker) -> MagicMock:
+    repository = mocker.MagicMock(spec=JobRepository)
+    repository.save.side_effect = lambda job: job
+    return repository
+
+@pytest.fixture
+def cancel_job_use_case(mock_job_repository) -> CancelJobUseCase:
+    return CancelJobUseCase(repository=mock_job_repository)
+
+def test_execute_requests_cancel_for_running_job(cancel_job_use_case, mock_job_repository):
+    """실행 중인 작업에 취소 요청이 기록되는지 확인"""
+    mock_job_repository.find_by_id.return_value = Job(id=1, job_type="index", status="running")
+
+    job = cancel_job_use_case.execute(1)
+
+    assert job.cancel_requested is True
+    mock_job_repository.save.assert_called_once_with(job)
+
+def test_execute_ignores_finished_job(cancel_job_use_case, mock_job_repository):
+    """이미 끝난 작업은 변경하지 않는지 확인"""
+    mock_job_repository.find_by_id.return_value = Job(id=1, job_type="index", status="completed")
+
+    job = cancel_job_use_case.execute(1)
+
+    assert job.cancel_requested is False
+    mock_job_repository.save.assert_not_called()
+
+def test_execute_job_not_found(cancel_job_use_case, mock_job_repository):
+    """작업이 없으면 JobNotFoundException이 발생하는지 확인"""
+    mock_job_repository.find_by_id.return_value = None
+
+    with pytest.raises(JobNotFoundException):
+        cancel_job_use_case.execute(1)
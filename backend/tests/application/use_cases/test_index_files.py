@@ -1,122 +1,729 @@
 import os
+import threading
+import time
+import unicodedata
 from unittest.mock import MagicMock
 from typing import List
 import pytest
+from sqlalchemy import event
 
-from app.application.use_cases.index_files import IndexFilesUseCase, BATCH_SIZE
-from app.domain.file.model import File
+from app.application.use_cases.index_files import (
+    IndexFilesUseCase, IndexProgress, IndexSummary, BATCH_SIZE, scan_fingerprint,
+)
+from app.domain.file.model import File, FileIndexEntry
 from app.domain.file.repository import FileRepository
-
-# Mock os.walk and os.path.getsize for consistent testing
-@pytest.fixture(autouse=True)
-def mock_os_functions(mocker):
-    mocker.patch("os.walk")
-    mocker.patch("os.path.getsize")
+from app.domain.exclusion_pattern.repository import ExclusionPatternRepository
+from app.domain.file.discovery import DiscoveryState
+from app.infrastructure.services.file_discovery_service import FileDiscoveryService
+from app.domain.directory.model import Directory, Root
+from app.domain.directory.repository import DirectoryRepository
+from app.infrastructure.persistence.directory_repository_impl import DirectoryRepositoryImpl
+from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+from app.infrastructure.persistence.index_run_repository_impl import IndexRunRepositoryImpl
+from app.domain.index_run.model import INDEX_RUN_STATUS_INTERRUPTED, INDEX_RUN_STATUS_COMPLETED
 
 @pytest.fixture
 def mock_file_repository(mocker) -> MagicMock:
     return mocker.MagicMock(spec=FileRepository)
 
 @pytest.fixture
-def index_files_use_case(mock_file_repository) -> IndexFilesUseCase:
-    return IndexFilesUseCase(file_repository=mock_file_repository)
+def mock_exclusion_pattern_repository(mocker) -> MagicMock:
+    repository = mocker.MagicMock(spec=ExclusionPatternRepository)
+    repository.find_active_patterns.return_value = []
+    return repository
+
+@pytest.fixture
+def index_files_use_case(mock_file_repository, mock_exclusion_pattern_repository) -> IndexFilesUseCase:
+    return IndexFilesUseCase(
+        file_repository=mock_file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+    )
+
+def _assign_ids(files: List[File]) -> dict:
+    # bulk_insert/bulk_upsert처럼 저장된 파일의 {전체 경로: ID}를 반환합니다.
+    return {file.full_path: index for index, file in enumerate(files, start=1)}
 
-def _setup_mock_files(mocker, files_data: List[dict]):
-    # Mock os.walk to return specified files
-    walk_return_value = []
+def _setup_mock_files(tmp_path, files_data: List[dict]):
+    # 실제 임시 디렉토리에 지정된 크기의 파일을 생성합니다.
     for data in files_data:
-        full_path = data["full_path"]
-        root = os.path.dirname(full_path)
-        filename = os.path.basename(full_path)
-        # Ensure unique root for each file for simplicity in mock
-        # In real os.walk, multiple files can be in the same root
-        walk_return_value.append((root, [], [filename]))
-    mocker.patch("os.walk", return_value=walk_return_value)
-
-    # Mock os.path.getsize for each file
-    def mock_getsize(path):
-        for data in files_data:
-            if data["full_path"] == path:
-                return data["size"]
-        raise FileNotFoundError(f"File not found: {path}")
-    mocker.patch("os.path.getsize", side_effect=mock_getsize)
-
-
-def test_execute_empty_directory(index_files_use_case, mock_file_repository, mocker):
+        full_path = tmp_path / data["full_path"].lstrip("/")
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_bytes(b"0" * data["size"])
+
+
+def test_execute_empty_directory(index_files_use_case, mock_file_repository, tmp_path):
     """빈 디렉토리가 주어졌을 때 파일이 저장되지 않고 빈 리스트가 반환되는지 확인"""
-    _setup_mock_files(mocker, [])
-    
-    saved_files = index_files_use_case.execute("/test/empty_dir")
+    _setup_mock_files(tmp_path, [])
+
+    saved_files = index_files_use_case.execute(str(tmp_path)).saved_files
 
     assert saved_files == []
-    mock_file_repository.find_by_paths.assert_not_called()
-    mock_file_repository.save_all.assert_not_called()
+    mock_file_repository.bulk_insert.assert_not_called()
 
-def test_execute_new_files(index_files_use_case, mock_file_repository, mocker):
+def test_execute_new_files(index_files_use_case, mock_file_repository, tmp_path):
     """새로운 파일들이 주어졌을 때 모든 파일이 올바르게 저장되는지 확인"""
     files_data = [
-        {"full_path": "/test/dir1/file1.txt", "size": 100},
-        {"full_path": "/test/dir1/file2.txt", "size": 200},
+        {"full_path": "/dir1/file1.txt", "size": 100},
+        {"full_path": "/dir1/file2.txt", "size": 200},
     ]
-    _setup_mock_files(mocker, files_data)
+    _setup_mock_files(tmp_path, files_data)
 
-    # Mock find_by_paths to return no existing files
-    mock_file_repository.find_by_paths.return_value = []
-    # Mock save_all to return the files it was given (as if they were saved)
-    mock_file_repository.save_all.side_effect = lambda files: files
+    # 전달된 파일이 모두 새로 저장된 것처럼 ID를 반환합니다.
+    mock_file_repository.bulk_insert.side_effect = _assign_ids
 
-    saved_files = index_files_use_case.execute("/test/dir1")
+    saved_files = index_files_use_case.execute(str(tmp_path / "dir1")).saved_files
 
     assert len(saved_files) == 2
-    assert saved_files[0].full_path == "/test/dir1/file1.txt"
-    assert saved_files[1].full_path == "/test/dir1/file2.txt"
-    mock_file_repository.find_by_paths.assert_called()
-    mock_file_repository.save_all.assert_called_once()
-    assert len(mock_file_repository.save_all.call_args[0][0]) == 2
+    saved_files = sorted(saved_files, key=lambda f: f.full_path)
+    assert saved_files[0].full_path == str(tmp_path / "dir1" / "file1.txt")
+    assert saved_files[0].size == 100
+    assert saved_files[1].full_path == str(tmp_path / "dir1" / "file2.txt")
+    assert saved_files[1].size == 200
+    assert all(f.id is not None for f in saved_files)
+    mock_file_repository.bulk_insert.assert_called_once()
+    assert len(mock_file_repository.bulk_insert.call_args[0][0]) == 2
+    # 새 파일 저장에는 사전 조회가 필요 없습니다.
+    mock_file_repository.find_by_paths.assert_not_called()
 
-def test_execute_existing_files(index_files_use_case, mock_file_repository, mocker):
+def test_execute_existing_files(index_files_use_case, mock_file_repository, tmp_path):
     """이미 존재하는 파일과 새로운 파일이 섞여 있을 때, 새로운 파일만 저장되고 기존 파일은 건너뛰는지 확인"""
     files_data = [
-        {"full_path": "/test/dir2/existing.txt", "size": 150},
-        {"full_path": "/test/dir2/new.txt", "size": 250},
+        {"full_path": "/dir2/existing.txt", "size": 150},
+        {"full_path": "/dir2/new.txt", "size": 250},
     ]
-    _setup_mock_files(mocker, files_data)
+    _setup_mock_files(tmp_path, files_data)
+    directory = str(tmp_path / "dir2")
 
-    # Mock find_by_paths to return one existing file
-    mock_file_repository.find_by_paths.return_value = [
-        File(filename="existing", extension=".txt", directory="/test/dir2", full_path="/test/dir2/existing.txt", size=150)
-    ]
-    mock_file_repository.save_all.side_effect = lambda files: files
+    # 이미 존재하는 경로는 충돌로 건너뛰어 새 파일의 ID만 반환됩니다.
+    mock_file_repository.bulk_insert.return_value = {os.path.join(directory, "new.txt"): 2}
 
-    saved_files = index_files_use_case.execute("/test/dir2")
+    saved_files = index_files_use_case.execute(directory).saved_files
 
     assert len(saved_files) == 1
-    assert saved_files[0].full_path == "/test/dir2/new.txt"
-    mock_file_repository.find_by_paths.assert_called()
-    mock_file_repository.save_all.assert_called_once()
-    assert len(mock_file_repository.save_all.call_args[0][0]) == 1
-    assert mock_file_repository.save_all.call_args[0][0][0].full_path == "/test/dir2/new.txt"
+    assert saved_files[0].full_path == os.path.join(directory, "new.txt")
+    assert saved_files[0].id == 2
+    mock_file_repository.bulk_insert.assert_called_once()
+    assert len(mock_file_repository.bulk_insert.call_args[0][0]) == 2
 
-def test_execute_multiple_batches(index_files_use_case, mock_file_repository, mocker):
+def test_execute_multiple_batches(index_files_use_case, mock_file_repository, tmp_path):
     """BATCH_SIZE보다 많은 파일이 있을 때, 파일들이 배치 단위로 올바르게 처리되는지 확인"""
     num_files = BATCH_SIZE * 2 + 1 # 2 full batches + 1 remaining
     files_data = [
-        {"full_path": f"/test/dir3/file{i}.txt", "size": 100 + i}
+        {"full_path": f"/dir3/file{i}.txt", "size": i}
         for i in range(num_files)
     ]
-    _setup_mock_files(mocker, files_data)
+    _setup_mock_files(tmp_path, files_data)
 
-    mock_file_repository.find_by_paths.return_value = []
-    mock_file_repository.save_all.side_effect = lambda files: files
+    mock_file_repository.bulk_insert.side_effect = _assign_ids
 
-    saved_files = index_files_use_case.execute("/test/dir3")
+    saved_files = index_files_use_case.execute(str(tmp_path / "dir3")).saved_files
 
     assert len(saved_files) == num_files
-    # Check that save_all was called multiple times
-    assert mock_file_repository.save_all.call_count == 3 # 2 full batches + 1 partial batch
-    
-    # Verify the sizes of the batches passed to save_all
-    calls = mock_file_repository.save_all.call_args_list
+    # Check that bulk_insert was called multiple times
+    assert mock_file_repository.bulk_insert.call_count == 3 # 2 full batches + 1 partial batch
+
+    # Verify the sizes of the batches passed to bulk_insert
+    calls = mock_file_repository.bulk_insert.call_args_list
     assert len(calls[0].args[0]) == BATCH_SIZE
     assert len(calls[1].args[0]) == BATCH_SIZE
     assert len(calls[2].args[0]) == 1 # Remaining file
+
+def _legacy_walk(directory_path: str) -> List[File]:
+    # os.walk + os.path.getsize 기반의 기존 탐색 방식
+    files = []
+    for root, _, filenames in os.walk(directory_path):
+        for filename in filenames:
+            full_path = os.path.join(root, filename)
+            base_name, extension = os.path.splitext(filename)
+            files.append(File(
+                filename=unicodedata.normalize("NFC", base_name),
+                extension=unicodedata.normalize("NFC", extension.lstrip(".")),
+                directory=os.path.dirname(full_path),
+                full_path=unicodedata.normalize("NFC", full_path),
+                size=os.path.getsize(full_path),
+            ))
+    return files
+
+def test_discover_matches_legacy_walk(index_files_use_case, tmp_path):
+    """scandir 기반 탐색 결과가 기존 os.walk 기반 탐색 결과와 동일한지 확인"""
+    files_data = [
+        {"full_path": "/a/plain.txt", "size": 1},
+        {"full_path": "/a/b/archive.tar.gz", "size": 2},
+        {"full_path": "/a/b/c/noext", "size": 3},
+        {"full_path": "/a/\u1112\u1161\u11ab.mp4", "size": 4}, # NFD 한글 파일명
+    ]
+    _setup_mock_files(tmp_path, files_data)
+    os.symlink(tmp_path / "a" / "b", tmp_path / "a" / "link_to_b")
+
+    expected = _legacy_walk(str(tmp_path))
+    discovered = list(index_files_use_case._discover_files_generator(str(tmp_path)))
+
+    def as_tuple(f: File):
+        return (f.filename, f.extension, f.directory, f.full_path, f.size)
+
+    assert [as_tuple(f) for f in discovered] == [as_tuple(f) for f in expected]
+
+def test_parallel_discover_matches_sequential(tmp_path):
+    """병렬 탐색 결과가 순서와 무관하게 순차 탐색 결과와 같은 파일 집합인지 확인"""
+    files_data = [
+        {"full_path": f"/root{d % 3}/dir{d}/sub{s}/file{i}.txt", "size": i}
+        for d in range(6) for s in range(3) for i in range(4)
+    ]
+    _setup_mock_files(tmp_path, files_data)
+
+    def as_tuple(f: File):
+        return (f.filename, f.extension, f.directory, f.full_path, f.size)
+
+    sequential = {as_tuple(f) for f in FileDiscoveryService(workers=1).discover(str(tmp_path))}
+    parallel = [as_tuple(f) for f in FileDiscoveryService(workers=4).discover(str(tmp_path))]
+
+    assert len(parallel) == len(files_data)
+    assert set(parallel) == sequential
+
+def test_parallel_discover_stops_when_consumer_stops(tmp_path):
+    """소비자가 중간에 탐색을 멈춰도 워커 스레드가 정상 종료되는지 확인"""
+    files_data = [{"full_path": f"/dir{d}/file{i}.txt", "size": 1} for d in range(20) for i in range(10)]
+    _setup_mock_files(tmp_path, files_data)
+
+    generator = FileDiscoveryService(workers=2).discover(str(tmp_path))
+    next(generator)
+    generator.close()
+
+def test_parallel_discover_raises_worker_errors(tmp_path, mocker):
+    """워커에서 처리되지 않은 예외가 발생하면 멈추지 않고 소비자에게 다시 발생하는지 확인"""
+    files_data = [{"full_path": f"/dir{d}/file{i}.txt", "size": 1} for d in range(8) for i in range(3)]
+    _setup_mock_files(tmp_path, files_data)
+    scan_directory = FileDiscoveryService._scan_directory
+
+    def failing_scan(self, root, matcher, state=None):
+        if root.endswith("dir3"):
+            raise ValueError("boom")
+        return scan_directory(self, root, matcher, state)
+
+    mocker.patch.object(FileDiscoveryService, "_scan_directory", failing_scan)
+
+    with pytest.raises(ValueError, match="boom"):
+        list(FileDiscoveryService(workers=2).discover(str(tmp_path)))
+
+def test_execute_incremental_updates_changed_and_marks_removed(index_files_use_case, mock_file_repository, tmp_path):
+    """증분 모드에서 변경된 파일은 갱신하고, 사라진 파일은 삭제 표시하는지 확인"""
+    _setup_mock_files(tmp_path, [
+        {"full_path": "/same.txt", "size": 10},
+        {"full_path": "/changed.txt", "size": 20},
+    ])
+    same_stat = os.stat(tmp_path / "same.txt")
+    directory = str(tmp_path)
+
+    changed_path = os.path.join(directory, "changed.txt")
+    mock_file_repository.find_active_directories_by_prefix.return_value = {1: directory, 2: directory, 3: directory}
+    mock_file_repository.find_index_entries_by_paths.return_value = {
+        os.path.join(directory, "same.txt"): FileIndexEntry(1, 10, same_stat.st_mtime_ns, same_stat.st_ino, False),
+        changed_path: FileIndexEntry(2, 5, 0, 0, False),
+    }
+    mock_file_repository.bulk_upsert.return_value = {changed_path: 2}
+    mock_file_repository.mark_deleted.side_effect = lambda ids: len(ids)
+
+    summary = index_files_use_case.execute(directory, incremental=True)
+
+    assert summary.added_count == 0
+    assert summary.changed_count == 1
+    assert summary.removed_count == 1
+    upserted = mock_file_repository.bulk_upsert.call_args[0][0]
+    assert [(f.full_path, f.size) for f in upserted] == [(changed_path, 20)]
+    mock_file_repository.bulk_insert.assert_not_called()
+    mock_file_repository.mark_deleted.assert_called_once_with([3])
+
+def test_execute_incremental_unchanged_has_no_writes(index_files_use_case, mock_file_repository, tmp_path):
+    """변경이 없는 디렉토리를 증분 인덱싱하면 DB 쓰기가 발생하지 않는지 확인"""
+    _setup_mock_files(tmp_path, [{"full_path": "/same.txt", "size": 10}])
+    stat_result = os.stat(tmp_path / "same.txt")
+    directory = str(tmp_path)
+    mock_file_repository.find_active_directories_by_prefix.return_value = {1: directory}
+    mock_file_repository.find_index_entries_by_paths.return_value = {
+        os.path.join(directory, "same.txt"): FileIndexEntry(1, 10, stat_result.st_mtime_ns, stat_result.st_ino, False),
+    }
+
+    summary = index_files_use_case.execute(directory, incremental=True)
+
+    assert (summary.added_count, summary.changed_count, summary.removed_count) == (0, 0, 0)
+    mock_file_repository.bulk_upsert.assert_not_called()
+    mock_file_repository.bulk_insert.assert_not_called()
+    mock_file_repository.mark_deleted.assert_not_called()
+
+def test_execute_skips_unchanged_directories(mock_file_repository, mock_exclusion_pattern_repository, session, tmp_path):
+    """수정 시각이 바뀌지 않은 디렉토리는 다시 읽지 않고, 새 디렉토리만 읽는지 확인"""
+    _setup_mock_files(tmp_path, [
+        {"full_path": "/show/season1/ep1.mkv", "size": 1},
+        {"full_path": "/show/season2/ep1.mkv", "size": 1},
+    ])
+    use_case = IndexFilesUseCase(
+        file_repository=mock_file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        directory_repository=DirectoryRepositoryImpl(session),
+    )
+    mock_file_repository.find_index_entries_by_paths.return_value = {}
+    mock_file_repository.bulk_upsert.side_effect = _assign_ids
+    mock_file_repository.find_active_directories_by_prefix.return_value = {}
+
+    first = use_case.execute(str(tmp_path), incremental=True)
+    assert first.added_count == 2
+    assert first.listed_directory_count == 4
+
+    # 새 에피소드 폴더가 추가되면 상위 디렉토리와 새 폴더만 다시 읽습니다.
+    _setup_mock_files(tmp_path, [{"full_path": "/show/season3/ep1.mkv", "size": 1}])
+    second = use_case.execute(str(tmp_path), incremental=True)
+    assert [f.full_path for f in second.saved_files] == [str(tmp_path / "show" / "season3" / "ep1.mkv")]
+    assert second.listed_directory_count == 2
+    assert second.skipped_directory_count == 3
+
+    # 변경이 없으면 모든 디렉토리를 건너뜁니다.
+    third = use_case.execute(str(tmp_path), incremental=True)
+    assert third.listed_directory_count == 0
+    assert third.skipped_directory_count == 5
+
+    # 전체 재탐색을 강제하면 모든 디렉토리를 다시 읽습니다.
+    forced = use_case.execute(str(tmp_path), incremental=True, force_full_scan=True)
+    assert forced.listed_directory_count == 5
+    assert forced.skipped_directory_count == 0
+
+def test_execute_unchanged_rescan_does_not_write(mock_exclusion_pattern_repository, session, tmp_path):
+    """변경이 없는 트리를 다시 인덱싱하면 파일뿐 아니라 시작 경로/디렉토리 기록도 쓰지 않는지 확인"""
+    _setup_mock_files(tmp_path, [{"full_path": "/show/ep1.mkv", "size": 1}])
+    use_case = IndexFilesUseCase(
+        file_repository=FileRepositoryImpl(session),
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        directory_repository=DirectoryRepositoryImpl(session),
+    )
+    use_case.execute(str(tmp_path), incremental=True)
+    writes = []
+    event.listen(
+        session.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, *args: writes.append(statement)
+        if statement.startswith(("INSERT", "UPDATE", "DELETE")) else None,
+    )
+
+    summary = use_case.execute(str(tmp_path), incremental=True)
+
+    assert summary.skipped_directory_count == 2
+    assert writes == []
+
+def test_execute_rescans_directories_when_scan_options_change(mock_exclusion_pattern_repository, session, tmp_path):
+    """제외 패턴이나 압축 파일 인덱싱 여부가 바뀌면 수정 시각이 같은 디렉토리도 다시 읽는지 확인"""
+    import zipfile
+
+    _setup_mock_files(tmp_path, [
+        {"full_path": "/show/ep1.mkv", "size": 1},
+        {"full_path": "/show/ep1.tmp", "size": 1},
+    ])
+    with zipfile.ZipFile(tmp_path / "show" / "ep2.cbz", "w") as archive:
+        archive.writestr("page1.jpg", b"x")
+    file_repository = FileRepositoryImpl(session)
+    use_case = IndexFilesUseCase(
+        file_repository=file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        directory_repository=DirectoryRepositoryImpl(session),
+    )
+
+    first = use_case.execute(str(tmp_path), ["*.tmp"], incremental=True)
+    assert first.added_count == 2
+    assert use_case.execute(str(tmp_path), ["*.tmp"], incremental=True).listed_directory_count == 0
+
+    # 제외 패턴을 없애면 제외되었던 파일을 찾습니다.
+    second = use_case.execute(str(tmp_path), incremental=True)
+    assert second.listed_directory_count == 2
+    assert [f.name for f in second.saved_files] == ["ep1.tmp"]
+
+    # 압축 파일 인덱싱을 켜면 이미 저장된 압축 파일의 내부 항목을 읽습니다.
+    third = use_case.execute(str(tmp_path), incremental=True, index_archives=True)
+    assert third.listed_directory_count == 2
+    assert (third.archive_count, third.archive_member_count) == (1, 1)
+    assert use_case.execute(str(tmp_path), incremental=True, index_archives=True).listed_directory_count == 0
+
+def test_normal_index_revives_file_tombstoned_by_incremental_run(mock_exclusion_pattern_repository, session, tmp_path):
+    """증분 실행에서 삭제 표시된 파일이 다시 생기면 일반 인덱싱에서도 삭제 표시가 해제되는지 확인"""
+    _setup_mock_files(tmp_path, [{"full_path": "/a.mkv", "size": 1}, {"full_path": "/b.mkv", "size": 1}])
+    file_repository = FileRepositoryImpl(session)
+    use_case = IndexFilesUseCase(
+        file_repository=file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+    )
+    use_case.execute(str(tmp_path), incremental=True)
+    (tmp_path / "b.mkv").unlink()
+    assert use_case.execute(str(tmp_path), incremental=True).removed_count == 1
+
+    _setup_mock_files(tmp_path, [{"full_path": "/b.mkv", "size": 2}])
+    summary = use_case.execute(str(tmp_path))
+
+    assert [f.name for f in summary.saved_files] == ["b.mkv"]
+    assert sorted((f.name, f.size) for f in file_repository.find_all()) == [("a.mkv", 1), ("b.mkv", 2)]
+
+def test_execute_incremental_keeps_files_in_skipped_directories(mock_file_repository, mock_exclusion_pattern_repository, mocker, tmp_path):
+    """건너뛴 디렉토리의 기존 파일은 삭제 표시되지 않는지 확인"""
+    _setup_mock_files(tmp_path, [{"full_path": "/cold/old.mkv", "size": 1}])
+    cold = str(tmp_path / "cold")
+    directory_repository = mocker.MagicMock(spec=DirectoryRepository)
+    directory_repository.find_roots.return_value = [
+        Root(id=1, path=str(tmp_path), scan_fingerprint=scan_fingerprint([], False))
+    ]
+    directory_repository.find_by_prefix.return_value = [
+        Directory(root_id=1, path=str(tmp_path), mtime_ns=os.stat(tmp_path).st_mtime_ns, child_count=1),
+        Directory(root_id=1, path=cold, parent_path=str(tmp_path), mtime_ns=os.stat(cold).st_mtime_ns, child_count=1),
+    ]
+    use_case = IndexFilesUseCase(
+        file_repository=mock_file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        directory_repository=directory_repository,
+    )
+    old_path = os.path.join(cold, "old.mkv")
+    stat_result = os.stat(old_path)
+    mock_file_repository.find_active_directories_by_prefix.return_value = {1: cold}
+    mock_file_repository.find_paths_by_ids.return_value = {1: old_path}
+    mock_file_repository.find_index_entries_by_paths.return_value = {
+        old_path: FileIndexEntry(1, 1, stat_result.st_mtime_ns, stat_result.st_ino, False)
+    }
+
+    summary = use_case.execute(str(tmp_path), incremental=True)
+
+    assert summary.skipped_directory_count == 2
+    assert (summary.removed_count, summary.changed_count) == (0, 0)
+    # 디렉토리 목록 대신 알고 있는 파일만 확인합니다.
+    mock_file_repository.find_paths_by_ids.assert_called_once_with([1])
+    mock_file_repository.bulk_upsert.assert_not_called()
+    mock_file_repository.mark_deleted.assert_not_called()
+
+def test_execute_incremental_detects_in_place_edits_in_skipped_directories(mock_exclusion_pattern_repository, session, tmp_path):
+    """디렉토리 수정 시각이 그대로여도 내용만 수정된 파일을 incremental 모드에서 갱신하는지 확인"""
+    _setup_mock_files(tmp_path, [{"full_path": "/show/ep1.mkv", "size": 1}, {"full_path": "/show/ep2.mkv", "size": 1}])
+    file_repository = FileRepositoryImpl(session)
+    use_case = IndexFilesUseCase(
+        file_repository=file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        directory_repository=DirectoryRepositoryImpl(session),
+    )
+    use_case.execute(str(tmp_path), incremental=True)
+
+    show = tmp_path / "show"
+    directory_mtime_ns = os.stat(show).st_mtime_ns
+    (show / "ep1.mkv").write_bytes(b"x" * 5)
+    os.utime(show, ns=(directory_mtime_ns, directory_mtime_ns))
+    summary = use_case.execute(str(tmp_path), incremental=True)
+
+    assert (summary.listed_directory_count, summary.changed_count, summary.removed_count) == (0, 1, 0)
+    session.expire_all()
+    assert sorted((f.name, f.size) for f in file_repository.find_all()) == [("ep1.mkv", 5), ("ep2.mkv", 1)]
+
+def test_discover_prunes_excluded_directories(tmp_path, mocker):
+    """제외 패턴에 일치하는 디렉토리는 목록을 읽지 않고 건너뛰는지 확인"""
+    _setup_mock_files(tmp_path, [
+        {"full_path": "/show/episode.mkv", "size": 1},
+        {"full_path": "/show/.git/objects/blob", "size": 1},
+        {"full_path": "/show/episode.tmp", "size": 1},
+    ])
+    scandir = mocker.spy(os, "scandir")
+
+    files = list(FileDiscoveryService().discover(str(tmp_path), ["*/.git/*", "*.tmp"]))
+
+    assert [f.full_path for f in files] == [str(tmp_path / "show" / "episode.mkv")]
+    scanned = {call.args[0] for call in scandir.call_args_list}
+    assert str(tmp_path / "show" / ".git") not in scanned
+
+def test_execute_stream_reports_progress_per_batch(index_files_use_case, mock_file_repository, tmp_path):
+    """배치마다 진행 상황을 생성하고 마지막에 저장 파일 없이 요약을 생성하는지 확인"""
+    _setup_mock_files(tmp_path, [
+        {"full_path": f"/dir/file{i}.txt", "size": 1} for i in range(BATCH_SIZE + 1)
+    ] + [{"full_path": "/dir/skip.tmp", "size": 1}])
+    mock_file_repository.bulk_insert.side_effect = _assign_ids
+
+    events = list(index_files_use_case.execute_stream(str(tmp_path), ["*.tmp"]))
+
+    assert [type(e) for e in events] == [IndexProgress, IndexProgress, IndexSummary]
+    assert [e.seen_count for e in events[:2]] == [BATCH_SIZE, BATCH_SIZE + 1]
+    assert events[0].current_directory == str(tmp_path / "dir")
+    summary = events[-1]
+    assert (summary.seen_count, summary.added_count, summary.excluded_count) == (BATCH_SIZE + 1, BATCH_SIZE + 1, 1)
+    assert summary.saved_files == []
+
+def test_resume_stream_skips_committed_directories(mock_exclusion_pattern_repository, session, mocker, tmp_path):
+    """중단된 실행을 이어서 실행하면 저장이 끝난 디렉토리의 파일은 다시 읽지 않는지 확인"""
+    _setup_mock_files(tmp_path, [
+        {"full_path": f"/{season}/ep{i}.mkv", "size": 1} for season in ("s1", "s2", "s3") for i in (1, 2)
+    ])
+    mocker.patch("app.application.use_cases.index_files.BATCH_SIZE", 2)
+    index_run_repository = IndexRunRepositoryImpl(session)
+    use_case = IndexFilesUseCase(
+        file_repository=FileRepositoryImpl(session),
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        index_run_repository=index_run_repository,
+    )
+
+    # 두 번째 배치를 저장한 뒤 중단합니다.
+    events = use_case.execute_stream(str(tmp_path))
+    next(events)
+    index_run_id = next(events).index_run_id
+    events.close()
+
+    index_run = index_run_repository.find_by_id(index_run_id)
+    session.refresh(index_run)
+    assert index_run.status == INDEX_RUN_STATUS_INTERRUPTED
+    assert (index_run.committed_batch_count, index_run.added_count) == (2, 4)
+    completed = index_run_repository.find_completed_directories(index_run_id)
+    # 루트와 첫 번째 시즌 디렉토리는 저장이 끝났고, 두 번째 시즌은 마지막 파일 이후 중단되어 아직 기록되지 않았습니다.
+    assert len(completed) == 2 and str(tmp_path) in completed
+
+    build_file = mocker.spy(FileDiscoveryService, "_build_file")
+    summary = list(use_case.resume_stream(index_run_id))[-1]
+
+    assert build_file.call_count == 4
+    assert (summary.added_count, summary.index_run_id) == (6, index_run_id)
+    assert FileRepositoryImpl(session).count_all() == 6
+    session.refresh(index_run)
+    assert index_run.status == INDEX_RUN_STATUS_COMPLETED
+    assert index_run_repository.find_completed_directories(index_run_id) == set()
+
+def test_execute_overlaps_discovery_and_writes(mock_file_repository, mock_exclusion_pattern_repository, mocker, tmp_path):
+    """저장이 느리면 탐색 스레드가 큐가 빌 때까지 기다리고, 단계별 시간이 집계되는지 확인"""
+    _setup_mock_files(tmp_path, [{"full_path": f"/dir/file{i}.txt", "size": 1} for i in range(4)])
+    mocker.patch("app.application.use_cases.index_files.BATCH_SIZE", 1)
+    use_case = IndexFilesUseCase(
+        file_repository=mock_file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        pipeline_depth=1,
+    )
+
+    def slow_insert(files):
+        time.sleep(0.05)
+        return _assign_ids(files)
+
+    mock_file_repository.bulk_insert.side_effect = slow_insert
+
+    summary = use_case.execute(str(tmp_path))
+
+    assert summary.added_count == 4
+    assert summary.write_seconds >= 0.2
+    assert summary.discovery_blocked_seconds > 0
+    assert summary.write_files_per_second > 0 and summary.discovery_files_per_second > 0
+
+def test_execute_stream_stops_discovery_thread_when_consumer_stops(index_files_use_case, mock_file_repository, mocker, tmp_path):
+    """소비자가 중간에 멈추면 탐색 스레드도 종료되는지 확인"""
+    _setup_mock_files(tmp_path, [{"full_path": f"/dir/file{i}.txt", "size": 1} for i in range(10)])
+    mocker.patch("app.application.use_cases.index_files.BATCH_SIZE", 1)
+    mock_file_repository.bulk_insert.side_effect = _assign_ids
+
+    events = index_files_use_case.execute_stream(str(tmp_path))
+    next(events)
+    events.close()
+
+    assert not any(t.name == "index-discovery" for t in threading.enumerate())
+
+def test_execute_raises_discovery_errors(index_files_use_case, mocker, tmp_path):
+    """탐색 스레드에서 발생한 오류가 호출한 쪽으로 전달되는지 확인"""
+    mocker.patch.object(FileDiscoveryService, "discover", side_effect=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        index_files_use_case.execute(str(tmp_path))
+
+def test_execute_from_manifest_with_stats(mock_exclusion_pattern_repository, session, mocker, tmp_path):
+    """크기/수정 시각이 포함된 NUL 구분 manifest로 디렉토리를 읽지 않고 인덱싱하는지 확인"""
+    root = tmp_path / "nas"
+    manifest = tmp_path / "files.manifest"
+    manifest.write_bytes(b"".join([
+        b"10\t1700000000.5000000000\t" + str(root / "a" / "ep1.mkv").encode() + b"\0",
+        b"20\t1700000001\ta/ep2.mkv\0",            # 상대 경로는 root 기준입니다.
+        b"30\t1700000002\ta/ep3.tmp\0",            # 제외 패턴
+        b"40\t1700000003\t/elsewhere/x.mkv\0",     # root 밖의 경로
+        b"broken\0",
+    ]))
+    use_case = IndexFilesUseCase(
+        file_repository=FileRepositoryImpl(session),
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        directory_repository=DirectoryRepositoryImpl(session),
+    )
+    scandir = mocker.spy(os, "scandir")
+
+    summary = use_case.execute(str(root), ["*.tmp"], manifest_path=str(manifest), manifest_has_stats=True)
+
+    scandir.assert_not_called()
+    assert {f.full_path: (f.size, f.mtime_ns) for f in summary.saved_files} == {
+        str(root / "a" / "ep1.mkv"): (10, 1_700_000_000_500_000_000),
+        str(root / "a" / "ep2.mkv"): (20, 1_700_000_001_000_000_000),
+    }
+    assert (summary.excluded_count, summary.error_count) == (2, 1)
+
+    # 증분 모드에서는 manifest에 없는 파일을 삭제 표시합니다.
+    manifest.write_bytes(b"11\t1700000000.5\ta/ep1.mkv\n")
+    summary = use_case.execute(
+        str(root), incremental=True, manifest_path=str(manifest), manifest_has_stats=True
+    )
+
+    assert (summary.changed_count, summary.removed_count) == (1, 1)
+    assert [(f.full_path, f.size) for f in FileRepositoryImpl(session).find_all()] == [
+        (str(root / "a" / "ep1.mkv"), 11)
+    ]
+
+def test_resume_manifest_after_last_committed_path(mock_exclusion_pattern_repository, session, mocker, tmp_path):
+    """줄바꿈 구분 manifest는 경로마다 stat으로 읽고, 이어서 실행하면 마지막으로 저장한 레코드 다음부터 읽는지 확인"""
+    _setup_mock_files(tmp_path, [{"full_path": f"/ep{i}.mkv", "size": i} for i in range(1, 6)])
+    manifest = tmp_path / "files.txt"
+    manifest.write_text("".join(f"ep{i}.mkv\n" for i in range(1, 6)) + "missing.mkv\n")
+    mocker.patch("app.application.use_cases.index_files.BATCH_SIZE", 2)
+    index_run_repository = IndexRunRepositoryImpl(session)
+    use_case = IndexFilesUseCase(
+        file_repository=FileRepositoryImpl(session),
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        index_run_repository=index_run_repository,
+    )
+
+    events = use_case.execute_stream(str(tmp_path), manifest_path=str(manifest))
+    index_run_id = next(events).index_run_id
+    events.close()
+
+    build_file = mocker.spy(FileDiscoveryService, "build_file")
+    summary = list(use_case.resume_stream(index_run_id))[-1]
+
+    assert build_file.call_count == 4
+    assert (summary.added_count, summary.error_count) == (5, 1)
+    assert FileRepositoryImpl(session).count_all() == 5
+
+def test_resume_manifest_with_nfd_directory(tmp_path):
+    """manifest의 디렉토리 이름이 NFD여도 NFC로 저장된 마지막 경로 다음부터 읽는지 확인"""
+    directory = unicodedata.normalize("NFD", "시즌 1")
+    manifest = tmp_path / "files.manifest"
+    manifest.write_bytes(b"".join(
+        f"{i}\t1700000000\t{directory}/ep{i}.mkv\0".encode() for i in range(1, 5)
+    ))
+    resume_after = unicodedata.normalize("NFC", os.path.join(str(tmp_path), directory, "ep2.mkv"))
+
+    files = list(FileDiscoveryService().discover_manifest(
+        str(manifest), str(tmp_path), has_stats=True, resume_after=resume_after
+    ))
+
+    assert [f.size for f in files] == [3, 4]
+
+def test_resume_manifest_restarts_when_resume_path_is_missing(tmp_path, caplog):
+    """마지막으로 저장한 경로가 manifest에 없으면 레코드를 모두 건너뛰지 않고 처음부터 다시 읽는지 확인"""
+    manifest = tmp_path / "files.manifest"
+    manifest.write_bytes(b"".join(f"{i}\t1700000000\tep{i}.mkv\0".encode() for i in range(1, 4)) + b"broken\0")
+    state = DiscoveryState()
+
+    files = list(FileDiscoveryService().discover_manifest(
+        str(manifest), str(tmp_path), state=state, has_stats=True,
+        resume_after=os.path.join(str(tmp_path), "removed.mkv"),
+    ))
+
+    assert [f.size for f in files] == [1, 2, 3]
+    assert state.error_count == 1
+    assert "does not contain resume path" in caplog.text
+
+def test_execute_indexes_archive_members(mock_exclusion_pattern_repository, session, mocker, tmp_path):
+    """압축 파일 내부 항목을 가상 파일로 저장하고, 바뀐 압축 파일만 다시 읽는지 확인"""
+    import zipfile
+
+    archive_path = tmp_path / "show" / "ep1.cbz"
+    archive_path.parent.mkdir()
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("ep1/", "")
+        archive.writestr("ep1/[Group] Show - 01.jpg", b"x" * 10)
+        archive.writestr("ep1/thumbs.db", b"x")
+        archive.writestr("../escape.jpg", b"x")
+    (tmp_path / "show" / "broken.zip").write_bytes(b"not a zip")
+    file_repository = FileRepositoryImpl(session)
+    use_case = IndexFilesUseCase(
+        file_repository=file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+    )
+
+    summary = use_case.execute(str(tmp_path), ["*.db"], incremental=True, index_archives=True)
+
+    member_path = os.path.join(str(archive_path), "ep1", "[Group] Show - 01.jpg")
+    archive = file_repository.find_by_paths({str(archive_path)})[0]
+    member = file_repository.find_by_paths({member_path})[0]
+    assert (member.archive_id, member.size, member.filename) == (archive.id, 10, "[Group] Show - 01")
+    assert (summary.archive_count, summary.archive_member_count, summary.error_count) == (2, 1, 1)
+
+    # 바뀌지 않은 압축 파일은 다시 읽지 않고, 내부 항목도 삭제 표시하지 않습니다.
+    list_members = mocker.spy(FileDiscoveryService, "list_archive_members")
+    summary = use_case.execute(str(tmp_path), ["*.db"], incremental=True, index_archives=True)
+    list_members.assert_not_called()
+    assert summary.removed_count == 0
+    assert file_repository.count_all() == 3
+
+    # 압축 파일이 바뀌면 다시 읽어 사라진 항목을 삭제 표시하고, 압축 파일이 사라지면 항목도 삭제 표시합니다.
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("cover.jpg", b"x" * 3)
+    summary = use_case.execute(str(tmp_path), ["*.db"], incremental=True, index_archives=True)
+    assert list_members.call_count == 1
+    session.expire_all()
+    assert file_repository.find_by_id(member.id) is None
+    assert session.get(File, member.id).is_deleted
+
+    archive_path.unlink()
+    use_case.execute(str(tmp_path), incremental=True, index_archives=True)
+    session.expire_all()
+    assert [f.name for f in file_repository.find_all()] == ["broken.zip"]
+
+def test_execute_incremental_moves_renamed_files_in_place(mock_exclusion_pattern_repository, session, tmp_path):
+    """이동/이름 변경된 파일은 기존 행의 경로만 바뀌어 추출 결과가 유지되고, 하드 링크는 새 파일로 저장되는지 확인"""
+    _setup_mock_files(tmp_path, [
+        {"full_path": "/inbox/ep1.mkv", "size": 1},
+        {"full_path": "/inbox/ep2.mkv", "size": 2},
+    ])
+    file_repository = FileRepositoryImpl(session)
+    use_case = IndexFilesUseCase(
+        file_repository=file_repository,
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+    )
+    use_case.execute(str(tmp_path), incremental=True)
+    original = file_repository.find_by_paths({str(tmp_path / "inbox" / "ep1.mkv")})[0]
+    original.extracted_info = {"episode": "1"}
+    file_repository.save(original)
+
+    (tmp_path / "show").mkdir()
+    os.rename(tmp_path / "inbox" / "ep1.mkv", tmp_path / "show" / "Show - 01.mkv")
+    os.link(tmp_path / "inbox" / "ep2.mkv", tmp_path / "show" / "ep2-link.mkv")
+    summary = use_case.execute(str(tmp_path), incremental=True)
+
+    assert summary.moved_files == [(str(tmp_path / "inbox" / "ep1.mkv"), str(tmp_path / "show" / "Show - 01.mkv"))]
+    assert (summary.moved_count, summary.added_count, summary.removed_count) == (1, 1, 0)
+    session.expire_all()
+    moved = file_repository.find_by_id(original.id)
+    assert (moved.full_path, moved.filename, moved.extracted_info) == (
+        str(tmp_path / "show" / "Show - 01.mkv"), "Show - 01", {"episode": "1"}
+    )
+    assert file_repository.count_all() == 3
+
+def test_rescan_skips_archive_member_directories(mock_exclusion_pattern_repository, session, tmp_path):
+    """압축 파일 내부 항목의 가상 디렉토리는 다시 탐색할 때 읽으려 하지 않는지 확인"""
+    import zipfile
+
+    (tmp_path / "show").mkdir()
+    with zipfile.ZipFile(tmp_path / "show" / "ep1.cbz", "w") as archive:
+        archive.writestr("cover.jpg", b"x")
+        archive.writestr("ep1/pages/001.jpg", b"x")
+    use_case = IndexFilesUseCase(
+        file_repository=FileRepositoryImpl(session),
+        exclusion_pattern_repository=mock_exclusion_pattern_repository,
+        file_discovery_service=FileDiscoveryService(),
+        directory_repository=DirectoryRepositoryImpl(session),
+    )
+
+    first = use_case.execute(str(tmp_path), incremental=True, index_archives=True)
+    assert (first.archive_member_count, first.error_count) == (2, 0)
+
+    for _ in range(2):
+        summary = use_case.execute(str(tmp_path), incremental=True, index_archives=True)
+        assert (summary.error_count, summary.removed_count) == (0, 0)
+        assert (summary.listed_directory_count, summary.skipped_directory_count) == (0, 2)
+
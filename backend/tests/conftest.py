@@ -0,0 +1,31 @@
+# 관계(Relationship)가 문자열로 선언된 모델들이 매퍼 초기화 시 서로를 찾을 수 있도록
+# 테스트 시작 전에 모든 도메인 모델을 등록합니다.
+from app.domain.file.model import File  # noqa: F401
+from app.domain.extracted_data.model import ExtractedData  # noqa: F401
+from app.domain.file_change_pattern.model import FileChangePattern  # noqa: F401
+from app.domain.exclusion_pattern.model import ExclusionPattern  # noqa: F401
+from app.domain.directory.model import Directory, Root  # noqa: F401
+from app.domain.job.model import Job  # noqa: F401
+from app.domain.index_run.model import IndexRun, IndexRunDirectory  # noqa: F401
+from app.domain.file_change_request.model import FileChangeRequest  # noqa: F401
+from app.domain.file_change_request.file_change_request_target_model import (  # noqa: F401
+    FileChangeRequestTarget,
+)
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+
+@pytest.fixture
+def session():
+    """리포지토리 구현체 테스트용 인메모리 SQLite 세션"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
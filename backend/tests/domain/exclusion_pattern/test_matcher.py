@@ -0,0 +1,49 @@
+import fnmatch
+import os
+
+import pytest
+
+from app.domain.exclusion_pattern.matcher import ExclusionMatcher
+
+
+PATTERNS = ["*/.git/*", "*.tmp", "*/@eaDir/*", "/media/cache*", "*/[Ss]ample/*.mkv"]
+PATHS = [
+    "/media/show/.git/config",
+    "/media/show/episode.tmp",
+    "/media/show/@eaDir/thumb.jpg",
+    "/media/cache/a.mkv",
+    "/media/cached.mkv",
+    "/media/show/Sample/a.mkv",
+    "/media/show/sample/a.txt",
+    "/media/show/episode.mkv",
+    "/media/show/.gitignore",
+]
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_matches_same_as_fnmatch(path):
+    """컴파일된 정규식의 결과가 패턴별 fnmatch 결과와 같은지 확인"""
+    matcher = ExclusionMatcher(PATTERNS)
+
+    assert matcher.matches(path) == any(fnmatch.fnmatch(path, p) for p in PATTERNS)
+
+
+def test_prunes_directory_only_when_all_descendants_excluded():
+    """하위 경로가 모두 제외되는 디렉토리만 탐색 전에 제외되는지 확인"""
+    matcher = ExclusionMatcher(PATTERNS)
+
+    assert matcher.prunes_directory(os.path.join("/media/show", ".git"))
+    assert matcher.prunes_directory(os.path.join("/media/show", "@eaDir"))
+    assert matcher.prunes_directory("/media/cache")
+    # 일부 파일만 제외되는 디렉토리는 탐색해야 합니다.
+    assert not matcher.prunes_directory("/media/show/Sample")
+    assert not matcher.prunes_directory("/media/show")
+
+
+def test_empty_patterns_match_nothing():
+    """패턴이 없으면 어떤 경로도 제외하지 않는지 확인"""
+    matcher = ExclusionMatcher([])
+
+    assert not matcher
+    assert not matcher.matches("/media/show/episode.mkv")
+    assert not matcher.prunes_directory("/media/show")
@@ -0,0 +1,80 @@
+import random
+import re
+
+import pytest
+
+from app.domain.file_change_pattern.literal_index import LiteralFilter, LiteralIndex, required_literals
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_pattern.registry import PatternRegistry
+
+
+@pytest.mark.parametrize("regex,expected", [
+    (r"Show\.S(\d+)E(\d+)\.mkv", ("Show.S", ".mkv")),
+    (r"(?P<title>[^/]+)_(?P<vol>\d+)권", ()),
+    (r"/(?:manga)/(\w+)", ("/manga/",)),
+    (r"(?:abc)+x|yz", ()),
+    (r"(?:abc)+xy", ("abc", "xy")),
+    (r"(?:abc)?xy", ("xy",)),
+    (r"(?i)show\.s01", ()),
+    (r"(?i:show)\.s01", (".s01",)),
+    (r"(?=abc)de", ("de",)),
+    (r"ep(?:01|02)", ("ep0",)),
+])
+def test_required_literals(regex, expected):
+    """정규식에서 반드시 나타나는 리터럴만 뽑는지 확인"""
+    assert required_literals(re.compile(regex)) == tuple(sorted(expected))
+
+
+def test_literal_index_finds_overlapping_literals():
+    """위치가 겹치거나 다른 리터럴의 앞부분인 리터럴도 모두 찾는지 확인"""
+    literals = ["ab", "abc", "bc", "cd", "zz"]
+    index = LiteralIndex(literals)
+
+    found = index.find("xabcd")
+
+    assert {literals[i] for i in found} == {"ab", "abc", "bc", "cd"}
+
+
+ALPHABET = "abcS01E_.-/x"
+PIECES = ["a", "b", "ab", "S", "E", "0", "1", r"\d", r"\w", ".", r"\.", "_", "x", "/"]
+
+
+def _random_regex(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(1, 5)):
+        piece = "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 3)))
+        kind = rng.random()
+        if kind < 0.15:
+            piece = f"(?:{piece})?"
+        elif kind < 0.3:
+            piece = f"({piece})+"
+        elif kind < 0.4:
+            piece = f"(?:{piece}|{rng.choice(PIECES)})"
+        elif kind < 0.45:
+            piece = f"(?i:{piece})"
+        elif kind < 0.5:
+            piece = f"(?={piece})"
+        parts.append(piece)
+    return "".join(parts)
+
+
+def test_candidates_never_drop_a_matching_pattern():
+    """필수 리터럴로 거른 후보가 정규식을 모두 검사한 결과와 같은지 무작위로 확인"""
+    rng = random.Random(17)
+    registry = PatternRegistry()
+    patterns = [
+        FileChangePattern(id=i, name=str(i), regex_pattern=_random_regex(rng), replacement_format="")
+        for i in range(300)
+    ]
+    compiled = registry.get_all(patterns)
+    literal_filter = LiteralFilter([c.required_literals for c in compiled])
+    subjects = ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30))) for _ in range(500)]
+
+    filtered_total = 0
+    for subject in subjects:
+        brute_force = [i for i, c in enumerate(compiled) if c.regex.search(subject)]
+        candidates = literal_filter.candidates(subject)
+        assert [i for i in candidates if compiled[i].regex.search(subject)] == brute_force
+        filtered_total += len(patterns) - len(candidates)
+    # 거르는 효과가 실제로 있어야 합니다.
+    assert filtered_total > 0
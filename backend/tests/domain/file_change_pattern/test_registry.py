@@ -0,0 +1,223 @@
+import json
+import random
+import re
+
+import pytest
+
+from app.domain.file.model import File
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.domain.file_change_pattern.registry import CompiledPattern, PatternRegistry
+
+
+def _reference_extract(file, pattern):
+    """레지스트리 도입 전 ExtractDataFromFileUseCase의 동작"""
+    match = re.search(pattern.regex_pattern, file.full_path)
+    if not match:
+        return None
+    raw = {}
+    if match.groupdict():
+        raw.update(match.groupdict())
+    else:
+        for i, value in enumerate(match.groups()):
+            raw[f"group_{i}"] = value
+    raw.update(filename=file.filename, extension=file.extension, directory=file.directory,
+               full_path=file.full_path, size=file.size)
+    if not pattern.replacement_format:
+        return raw
+    try:
+        format_dict = json.loads(pattern.replacement_format)
+    except json.JSONDecodeError:
+        return raw
+    result = {}
+    for key, format_str in format_dict.items():
+        index_spec = re.match(r"\$(\d+):([sd])\$", format_str)
+        name_spec = re.match(r"\$([a-zA-Z_][a-zA-Z0-9_]*):([sd])\$", format_str)
+        if index_spec:
+            index, group, data_type = int(index_spec.group(1)), None, index_spec.group(2)
+            if index < len(match.groups()):
+                group = match.groups()[index]
+            else:
+                result[key] = None
+                continue
+        elif name_spec:
+            data_type = name_spec.group(2)
+            if name_spec.group(1) not in match.groupdict():
+                result[key] = None
+                continue
+            group = match.groupdict()[name_spec.group(1)]
+        else:
+            result[key] = format_str
+            continue
+        if data_type == "d":
+            try:
+                group = int(group)
+            except ValueError:
+                group = None
+        result[key] = group
+    return result
+
+
+FILE = File(id=1, filename="Show.S01E02", extension="mkv", directory="/media/Show",
+            full_path="/media/Show/Show.S01E02.mkv", size=10)
+
+PATTERNS = [
+    (r"(?P<title>\w+)\.S(?P<season>\d+)E(?P<episode>\d+)", ""),
+    (r"(\w+)\.S(\d+)E(\d+)", ""),
+    (r"Show", ""),
+    (r"(\w+)\.S(\d+)E(\d+)", '{"title": "$0:s$", "season": "$1:d$", "bad": "$9:d$", "kind": "tv"}'),
+    (r"(?P<title>\w+)\.S(?P<season>\w+)E", '{"title": "$title:s$", "season": "$season:d$", "x": "$nope:s$"}'),
+    (r"(?P<filename>\w+)\.S", ""),
+    (r"(\w+)\.S", "not json"),
+    (r"Missing(\d+)", '{"n": "$0:d$"}'),
+]
+
+
+@pytest.mark.parametrize("regex_pattern,replacement_format", PATTERNS)
+def test_extract_same_as_reference(regex_pattern, replacement_format):
+    """미리 해석한 패턴의 추출 결과와 키 개수가 기존 방식과 같은지 확인"""
+    pattern = FileChangePattern(id=1, name="p", regex_pattern=regex_pattern, replacement_format=replacement_format)
+
+    compiled = CompiledPattern(pattern)
+    expected = _reference_extract(FILE, pattern)
+
+    assert compiled.extract(FILE) == expected
+    if expected is not None:
+        assert len(expected) == compiled.field_count
+
+
+def test_registry_reuses_until_invalidated():
+    """같은 패턴은 다시 컴파일하지 않고, 무효화되거나 내용이 바뀌면 새로 컴파일하는지 확인"""
+    registry = PatternRegistry()
+    pattern = FileChangePattern(id=1, name="p", regex_pattern=r"Show", replacement_format="")
+
+    first = registry.get(pattern)
+    assert registry.get(pattern) is first
+
+    pattern.regex_pattern = r"S01"
+    changed = registry.get(pattern)
+    assert changed is not first and changed.regex.pattern == r"S01"
+
+    registry.invalidate()
+    assert registry.version == 1
+    assert registry.get(pattern) is not changed
+
+
+def _file(path, size=1):
+    name = path.rsplit("/", 1)[1]
+    stem, _, extension = name.rpartition(".")
+    return File(id=1, filename=stem, extension=extension, full_path=path, size=size)
+
+
+def test_scope_limits_extension_directory_and_subject():
+    """확장자/디렉토리 범위 밖의 파일은 건너뛰고, filename_only이면 파일 이름만 검사하는지 확인"""
+    pdf_in_books = _file("/data/books/Vol_01.PDF")
+    mkv_in_books = _file("/data/books/Vol_01.mkv")
+    pdf_elsewhere = _file("/data/bookshelf/Vol_01.pdf")
+
+    scoped = CompiledPattern(FileChangePattern(
+        id=1, name="p", regex_pattern=r"Vol_(\d+)", replacement_format="",
+        scope_extensions=".pdf, epub", scope_directory="/data/books/",
+    ))
+    assert scoped.extract(pdf_in_books) is not None
+    assert scoped.extract(mkv_in_books) is None
+    assert scoped.extract(pdf_elsewhere) is None  # 접두사가 같아도 하위 디렉토리가 아니면 제외
+
+    anchored = FileChangePattern(id=2, name="q", regex_pattern=r"^Vol_", replacement_format="")
+    assert CompiledPattern(anchored).extract(pdf_in_books) is None
+    anchored.match_filename_only = True
+    assert CompiledPattern(anchored).extract(pdf_in_books) is not None
+
+
+def test_pattern_set_dispatch_same_as_checking_every_pattern():
+    """확장자/디렉토리로 고른 후보가 모든 패턴을 검사한 결과와 같은지 무작위로 확인"""
+    rng = random.Random(3)
+    directories = [None, "/", "/data", "/data/books", "/data/books/manga", "/media"]
+    extensions = [None, "pdf", "PDF,epub", "mkv", ".zip,cbz"]
+    regexes = [r"Vol", r"_(\d+)", r"^Vol", r"books/", r"\.pdf$", r"manga", r"x"]
+    patterns = [
+        FileChangePattern(
+            id=i, name=str(i), regex_pattern=rng.choice(regexes), replacement_format="",
+            scope_extensions=rng.choice(extensions), scope_directory=rng.choice(directories),
+            match_filename_only=rng.random() < 0.3,
+        )
+        for i in range(200)
+    ]
+    pattern_set = PatternRegistry().pattern_set(patterns)
+    paths = [
+        f"{directory}/{stem}.{extension}"
+        for directory in ("/data/books", "/data/books/manga/x", "/data/bookshelf", "/media", "/tmp")
+        for stem in ("Vol_01", "x_2", "manga")
+        for extension in ("pdf", "EPUB", "mkv", "cbz", "txt")
+    ]
+
+    for path in paths:
+        file = _file(path)
+        brute_force = [i for i, c in enumerate(pattern_set.compiled) if c.extract(file) is not None]
+        candidates = pattern_set.candidates(file)
+        assert candidates == sorted(set(candidates))
+        assert [i for i in candidates if pattern_set.compiled[i].extract(file) is not None] == brute_force
+
+
+def test_select_best_same_as_exhaustive_search():
+    """승률 순서와 조기 종료를 써도 모든 패턴을 순서대로 검사한 결과(동점이면 앞선 패턴)와 같은지 확인"""
+    rng = random.Random(5)
+    formats = ["", '{"a": "$0:s$"}', '{"a": "$0:s$", "b": "x"}', '{"a": "$0:s$", "b": "x", "c": "y"}', "{}"]
+    patterns = [
+        FileChangePattern(
+            id=i, name=str(i), replacement_format=rng.choice(formats),
+            regex_pattern=rng.choice([r"(Vol)", r"(\d+)", r"(?P<n>\d+)_(?P<m>\w)", r"(books)", r"(zz)"]),
+        )
+        for i in range(40)
+    ]
+    pattern_set = PatternRegistry().pattern_set(patterns)
+    files = [_file(f"/data/{d}/{s}.pdf") for d in ("books", "misc") for s in ("Vol_01", "12_a", "zz", "none")]
+
+    calls = 0
+
+    def extract(file):
+        def run(position):
+            nonlocal calls
+            calls += 1
+            return pattern_set.compiled[position].extract(file)
+        return run
+
+    # 여러 번 반복해 승률이 쌓이고 검사 순서가 바뀐 뒤에도 결과가 같아야 합니다.
+    for _ in range(3):
+        for file in files:
+            expected, max_fields = (None, None), -1
+            for position, compiled in enumerate(pattern_set.compiled):
+                values = compiled.extract(file)
+                if values is not None and len(values) > max_fields:
+                    expected, max_fields = (position, values), len(values)
+            assert pattern_set.select_best(file, extract(file)) == expected
+    # 조기 종료로 모든 패턴을 검사하지는 않아야 합니다.
+    assert calls < 3 * len(files) * len(patterns)
+
+
+def test_select_best_win_rates_shared_across_pattern_sets_until_invalidate():
+    """승률이 같은 레지스트리의 다른 PatternSet에도 이어지고, invalidate()하면 초기화되는지 확인"""
+    registry = PatternRegistry()
+    patterns = [
+        FileChangePattern(id=10, name="a", regex_pattern=r"(a)", replacement_format='{"x": "$0:s$"}'),
+        FileChangePattern(id=20, name="b", regex_pattern=r"(b)", replacement_format='{"x": "$0:s$", "y": "z"}'),
+    ]
+
+    def checked_positions(pattern_set, file):
+        positions = []
+
+        def extract(position):
+            positions.append(position)
+            return pattern_set.compiled[position].extract(file)
+
+        pattern_set.select_best(file, extract)
+        return positions
+
+    assert checked_positions(registry.pattern_set(patterns), _file("/d/b.pdf")) == [0, 1]
+    assert registry.win_rate(20) == 1.0 and registry.win_rate(10) == 0.0
+
+    # 새 PatternSet도 이전에 이긴 패턴부터 검사하고, 더 이길 패턴이 없으므로 바로 멈춥니다.
+    assert checked_positions(registry.pattern_set(patterns), _file("/d/ab.pdf")) == [1]
+
+    registry.invalidate()
+    assert registry.win_rate(20) == 0.0
+    assert checked_positions(registry.pattern_set(patterns), _file("/d/ab.pdf")) == [0, 1]
@@ -0,0 +1,59 @@
+from sqlmodel import select
+from app.domain.extracted_data.model import ExtractedData, ExtractionResult
+from app.domain.file.model import File
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.infrastructure.persistence.extracted_data_repository_impl import ExtractedDataRepositoryImpl
+from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+
+
+def _setup(session):
+    files = FileRepositoryImpl(session).save_all([
+        File(filename=name, extension="txt", full_path=f"/library/{name}.txt", size=1) for name in "abc"
+    ])
+    patterns = [FileChangePattern(name=f"p{i}", regex_pattern="x", replacement_format="") for i in range(2)]
+    session.add_all(patterns)
+    session.commit()
+    for file in files:
+        session.add(ExtractedData(file_id=file.id, pattern_id=patterns[0].id, extracted_values={"old": 1}))
+        session.add(ExtractedData(file_id=file.id, pattern_id=patterns[1].id, extracted_values={"old": 2}))
+    session.commit()
+    return [file.id for file in files], [pattern.id for pattern in patterns]
+
+
+def _rows(session):
+    return sorted(
+        (data.file_id, data.pattern_id, data.extracted_values)
+        for data in session.exec(select(ExtractedData)).all()
+    )
+
+
+def test_save_extraction_results_replaces_all_patterns(session):
+    """추출에 성공한 파일은 기존 데이터를 모두 교체하고, 실패한 파일은 상태만 갱신되는지 확인"""
+    (a, b, c), (p0, p1) = _setup(session)
+    repository = ExtractedDataRepositoryImpl(session)
+
+    repository.save_extraction_results([
+        ExtractionResult(a, p1, {"new": "a"}),
+        ExtractionResult(b, None, {}, "no match"),
+    ])
+
+    assert _rows(session) == [
+        (a, p1, {"new": "a"}),
+        (b, p0, {"old": 1}), (b, p1, {"old": 2}),
+        (c, p0, {"old": 1}), (c, p1, {"old": 2}),
+    ]
+    file_a, file_b = session.get(File, a), session.get(File, b)
+    assert file_a.extracted_info == {"new": "a"} and not file_a.extraction_failed
+    assert file_b.extracted_info == {} and file_b.extraction_failed
+    assert file_b.extraction_failure_reason == "no match"
+
+
+def test_save_extraction_results_keeps_other_patterns(session):
+    """replace_all_patterns=False이면 같은 패턴의 기존 데이터만 교체되는지 확인"""
+    (a, b, c), (p0, p1) = _setup(session)
+
+    ExtractedDataRepositoryImpl(session).save_extraction_results(
+        [ExtractionResult(a, p1, {"new": "a"})], replace_all_patterns=False
+    )
+
+    assert [row for row in _rows(session) if row[0] == a] == [(a, p0, {"old": 1}), (a, p1, {"new": "a"})]
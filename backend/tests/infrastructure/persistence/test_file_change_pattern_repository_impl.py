@@ -0,0 +1,34 @@
+from app.domain.exclusion_pattern.model import ExclusionPattern
+from app.domain.file_change_pattern.model import FileChangePattern
+from app.infrastructure.persistence.exclusion_pattern_repository_impl import ExclusionPatternRepositoryImpl
+from app.infrastructure.persistence.file_change_pattern_repository_impl import FileChangePatternRepositoryImpl
+
+
+def test_find_all_active_returns_every_pattern_and_reuses_snapshot(session, mocker):
+    """기본 페이지 크기(10)와 관계없이 모든 패턴을 반환하고, 바뀌기 전까지 다시 읽지 않는지 확인"""
+    repository = FileChangePatternRepositoryImpl(session)
+    for i in range(12):
+        repository.save(FileChangePattern(name=f"p{i}", regex_pattern=f"p{i}", replacement_format=""))
+    load = mocker.spy(FileChangePatternRepositoryImpl, "_load_active")
+
+    assert [p.name for p in repository.find_all_active()] == [f"p{i}" for i in range(12)]
+    assert len(repository.find_all_active()) == 12
+    assert load.call_count == 1
+
+    repository.delete(repository.find_by_name("p0").id)
+    assert [p.name for p in repository.find_all_active()][0] == "p1"
+    assert load.call_count == 2
+
+
+def test_find_active_patterns_skips_inactive(session):
+    """비활성 제외 패턴은 빠지고, 활성 상태가 바뀌면 바로 반영되는지 확인"""
+    repository = ExclusionPatternRepositoryImpl(session)
+    for i in range(11):
+        repository.save(ExclusionPattern(name=f"e{i}", pattern=f"*.e{i}", is_active=i != 3))
+
+    assert repository.find_active_patterns() == [f"*.e{i}" for i in range(11) if i != 3]
+
+    pattern = repository.find_by_id(5)  # e4
+    pattern.is_active = False
+    repository.save(pattern)
+    assert "*.e4" not in repository.find_active_patterns()
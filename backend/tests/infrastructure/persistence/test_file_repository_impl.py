@@ -0,0 +1,295 @@
+import sqlite3
+from sqlalchemy import event
+from sqlmodel import select
+from sqlalchemy.sql import func
+from app.domain.directory.model import Directory
+from app.domain.extracted_data.model import ExtractedData
+from app.domain.file.model import File
+from app.infrastructure.persistence.file_repository_impl import FileRepositoryImpl
+
+
+def _file(directory: str, name: str, **kwargs) -> File:
+    return File(
+        filename=name,
+        extension="txt",
+        directory=directory,
+        full_path=f"{directory}/{name}.txt",
+        size=kwargs.pop("size", 1),
+        **kwargs,
+    )
+
+
+def test_find_active_directories_by_prefix(session):
+    """디렉토리 하위의 삭제되지 않은 파일 ID만 조회되는지 확인"""
+    repository = FileRepositoryImpl(session)
+    files = repository.save_all([
+        _file("/library", "a"),
+        _file("/library/sub", "b"),
+        _file("/library_other", "c"),       # 접두사만 같은 다른 디렉토리
+        _file("/library/sub", "d", is_deleted=True),
+        _file("/lib%", "e"),                # LIKE 와일드카드 문자 포함
+    ])
+    ids = {f.full_path: f.id for f in files}
+
+    assert set(repository.find_active_directories_by_prefix("/library")) == {
+        ids["/library/a.txt"], ids["/library/sub/b.txt"]
+    }
+    assert set(repository.find_active_directories_by_prefix("/library/")) == {
+        ids["/library/a.txt"], ids["/library/sub/b.txt"]
+    }
+    assert set(repository.find_active_directories_by_prefix("/lib%")) == {ids["/lib%/e.txt"]}
+
+
+def test_mark_deleted_hides_files_from_listing(session):
+    """삭제 표시된 파일이 목록 조회와 개수에서 제외되는지 확인"""
+    repository = FileRepositoryImpl(session)
+    files = repository.save_all([_file("/library", "a"), _file("/library", "b")])
+
+    assert repository.mark_deleted([files[0].id]) == 1
+
+    assert [f.full_path for f in repository.find_all()] == ["/library/b.txt"]
+    assert repository.count_all() == 1
+
+
+def test_mark_deleted_splits_ids_beyond_sqlite_variable_limit(session):
+    """SQLite 바인딩 변수 한도보다 많은 ID도 한 번의 호출로 삭제 표시되는지 확인"""
+    repository = FileRepositoryImpl(session)
+    files = repository.save_all([_file("/library", "a"), _file("/library", "b"), _file("/library", "c")])
+    # 빌드마다 기본 한도가 다르므로 오래된 SQLite의 기본값(999)으로 낮추고, 존재하지 않는 ID를 섞어 넘깁니다.
+    connection = session.connection().connection.dbapi_connection
+    connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    ids = [files[0].id, *range(1000, 3000), files[1].id]
+
+    assert repository.mark_deleted(ids) == 2
+
+    assert [f.full_path for f in repository.find_all()] == ["/library/c.txt"]
+
+
+def test_find_after_id_pages_by_id(session):
+    """삭제되지 않은 파일을 마지막 ID 다음부터 ID 순으로 조회하는지 확인"""
+    repository = FileRepositoryImpl(session)
+    files = repository.save_all([_file("/library", name) for name in "abcde"])
+    repository.mark_deleted([files[1].id])
+
+    first = repository.find_after_id(0, 2)
+    rest = repository.find_after_id(first[-1].id, 10)
+
+    assert [f.name for f in first] == ["a.txt", "c.txt"]
+    assert [f.name for f in rest] == ["d.txt", "e.txt"]
+    assert repository.find_after_id(rest[-1].id, 10) == []
+
+
+def test_iter_after_id_sees_each_file_once_while_rows_change(session):
+    """순회 중에 파일이 추가/삭제되어도 이미 읽은 파일은 다시 읽지 않고, 새 파일은 끝에서 읽는지 확인"""
+    repository = FileRepositoryImpl(session)
+    repository.save_all([_file("/library", name) for name in "abcde"])
+
+    seen = []
+    for batch in repository.iter_after_id(0, 2):
+        seen.extend(f.name for f in batch)
+        if len(seen) == 2:
+            # 앞쪽 파일 삭제는 위치에 영향을 주지 않습니다.
+            repository.mark_deleted([batch[0].id])
+            repository.save_all([_file("/library", "f")])
+
+    assert seen == ["a.txt", "b.txt", "c.txt", "d.txt", "e.txt", "f.txt"]
+
+
+def test_bulk_insert_skips_existing_paths(session):
+    """이미 존재하는 경로는 건너뛰고 새 파일의 ID만 반환하는지 확인"""
+    repository = FileRepositoryImpl(session)
+    existing = repository.save_all([_file("/library", "a", size=1)])[0]
+
+    inserted = repository.bulk_insert([_file("/library", "a", size=99), _file("/library", "b")])
+
+    assert list(inserted) == ["/library/b.txt"]
+    assert repository.find_by_id(inserted["/library/b.txt"]).extracted_info == {}
+    session.refresh(existing)
+    assert existing.size == 1
+
+
+def test_bulk_upsert_updates_stats_and_revives(session):
+    """기존 파일의 크기/수정 시각/inode를 갱신하고 삭제 표시를 해제하는지 확인"""
+    repository = FileRepositoryImpl(session)
+    existing = repository.save_all([_file("/library", "a", size=1, is_deleted=True)])[0]
+
+    upserted = repository.bulk_upsert([
+        _file("/library", "a", size=2, mtime_ns=10, inode=7),
+        _file("/library", "b"),
+    ])
+
+    assert upserted["/library/a.txt"] == existing.id
+    assert set(upserted) == {"/library/a.txt", "/library/b.txt"}
+    entries = repository.find_index_entries_by_paths(["/library/a.txt", "/library/missing.txt"])
+    assert list(entries) == ["/library/a.txt"]
+    assert entries["/library/a.txt"] == (existing.id, 2, 10, 7, False)
+
+
+def test_hash_candidates_only_include_shared_sizes(session):
+    """크기가 겹치는 파일만 부분 해시 대상이고, 부분 해시까지 겹치는 파일만 전체 해시 대상인지 확인"""
+    repository = FileRepositoryImpl(session)
+    files = repository.save_all([
+        _file("/library", "a", size=10),
+        _file("/library", "b", size=10),
+        _file("/library", "c", size=10),
+        _file("/library", "unique", size=20),
+        _file("/library", "deleted", size=20, is_deleted=True),
+    ])
+    ids = {f.filename: f.id for f in files}
+
+    candidates = repository.find_partial_hash_candidates(after_id=0, limit=10)
+    assert [entry.id for entry in candidates] == [ids["a"], ids["b"], ids["c"]]
+    assert [entry.id for entry in repository.find_partial_hash_candidates(after_id=ids["a"], limit=1)] == [ids["b"]]
+
+    repository.save_hashes({ids["a"]: "p1", ids["b"]: "p1", ids["c"]: "p2"}, {})
+    assert repository.find_partial_hash_candidates(after_id=0, limit=10) == []
+    assert [entry.id for entry in repository.find_content_hash_candidates(after_id=0, limit=10)] == [ids["a"], ids["b"]]
+
+
+def test_bulk_upsert_clears_hashes_of_changed_files(session):
+    """크기나 수정 시각이 바뀐 파일만 해시가 지워지는지 확인"""
+    repository = FileRepositoryImpl(session)
+    files = repository.save_all([
+        _file("/library", "same", mtime_ns=1, partial_hash="p", content_hash="c"),
+        _file("/library", "changed", mtime_ns=1, partial_hash="p", content_hash="c"),
+    ])
+
+    repository.bulk_upsert([
+        _file("/library", "same", mtime_ns=1),
+        _file("/library", "changed", mtime_ns=2),
+    ])
+
+    for file in files:
+        session.refresh(file)
+    assert (files[0].partial_hash, files[0].content_hash) == ("p", "c")
+    assert (files[1].partial_hash, files[1].content_hash) == (None, None)
+
+
+def test_find_duplicate_groups(session):
+    """내용 해시가 같은 삭제되지 않은 파일 묶음이 낭비 용량 순으로 조회되는지 확인"""
+    repository = FileRepositoryImpl(session)
+    repository.save_all([
+        _file("/library", "small1", size=1, content_hash="s"),
+        _file("/library", "small2", size=1, content_hash="s"),
+        _file("/library", "small3", size=1, content_hash="s"),
+        _file("/library", "big1", size=100, content_hash="b"),
+        _file("/library", "big2", size=100, content_hash="b"),
+        _file("/library", "lonely1", size=5, content_hash="l"),
+        _file("/library", "lonely2", size=5, content_hash="l", is_deleted=True),
+    ])
+
+    assert repository.find_duplicate_groups() == [("b", 100), ("s", 1)]
+    assert repository.count_duplicate_groups() == 2
+    assert [f.filename for f in repository.find_by_content_hashes(["b"])] == ["big1", "big2"]
+
+
+def test_files_share_directory_rows(session):
+    """같은 디렉토리의 파일이 디렉토리 행 하나를 공유하고, 경로로 조회/정렬되는지 확인"""
+    repository = FileRepositoryImpl(session)
+    repository.save_all([_file("/library/b", "x")])
+    inserted = repository.bulk_insert([_file("/library/a", "y"), _file("/library/b", "z")])
+
+    assert session.exec(select(func.count(Directory.id))).one() == 2
+    directory = session.exec(select(Directory).where(Directory.path == "/library/b")).one()
+    assert directory.parent_path == "/library"
+    assert directory.mtime_ns is None
+    assert repository.find_by_id(inserted["/library/b/z.txt"]).directory_id == directory.id
+
+    assert [f.full_path for f in repository.find_by_paths({"/library/a/y.txt", "/missing/y.txt"})] == [
+        "/library/a/y.txt"
+    ]
+    assert [f.full_path for f in repository.find_all(sort_field="full_path", sort_order="desc")] == [
+        "/library/b/z.txt", "/library/b/x.txt", "/library/a/y.txt"
+    ]
+
+
+def test_find_ids_by_pattern_dependency_and_score(session):
+    """패턴이 선택되었거나 추출 데이터가 있는 파일과, 저장된 점수를 이길 수 있는 파일을 조회하는지 확인"""
+    repository = FileRepositoryImpl(session)
+    won, matched, weaker, tied_later, tied_earlier, failed = repository.save_all([
+        _file("/library", "won", best_pattern_id=2, best_field_count=3),
+        _file("/library", "matched", best_pattern_id=1, best_field_count=5),
+        _file("/library", "weaker", best_pattern_id=1, best_field_count=2),
+        _file("/library", "tied_later", best_pattern_id=4, best_field_count=3),
+        _file("/library", "tied_earlier", best_pattern_id=1, best_field_count=3),
+        _file("/library", "failed", extraction_failed=True),
+    ])
+    session.add(ExtractedData(file_id=matched.id, pattern_id=2, extracted_values={}))
+    session.commit()
+
+    assert repository.find_ids_depending_on_pattern(2) == [won.id, matched.id]
+    assert repository.find_ids_beatable_by_pattern(2, 3, 0, 10) == [weaker.id, tied_later.id, failed.id]
+    assert repository.find_ids_beatable_by_pattern(2, 3, weaker.id, 1) == [tied_later.id]
+
+
+def test_find_ids_beatable_by_pattern_applies_scope(session):
+    """패턴의 확장자/디렉토리 적용 범위 밖의 파일은 후보로 조회하지 않는지 확인"""
+    repository = FileRepositoryImpl(session)
+    in_scope, upper, other_extension, sibling, nested = repository.save_all([
+        _file("/library", "a"),
+        File(filename="b", extension=".TXT", full_path="/library/b.TXT", size=1),
+        File(filename="c", extension="pdf", full_path="/library/c.pdf", size=1),
+        _file("/library2", "d"),                # 접두사만 같은 다른 디렉토리
+        _file("/library/sub", "e"),
+    ])
+
+    assert repository.find_ids_beatable_by_pattern(1, 1, 0, 10, extensions={"txt"}, directory="/library/") == [
+        in_scope.id, upper.id, nested.id
+    ]
+
+
+def test_pattern_and_id_lookups_skip_tombstones_and_archive_members(session):
+    """삭제 표시된 파일은 ID/패턴 조회에서, 압축 파일 내부 항목은 복사 대상(패턴 조회)에서 제외되는지 확인"""
+    repository = FileRepositoryImpl(session)
+    active, deleted, archive = repository.save_all([_file("/library", name) for name in ("a", "b", "c")])
+    member, = repository.save_all([_file("/library/c.txt", "inner", archive_id=archive.id)])
+    repository.mark_deleted([deleted.id])
+    for file in (active, deleted, member):
+        session.add(ExtractedData(file_id=file.id, pattern_id=1, extracted_values={}))
+    session.commit()
+
+    assert {f.id for f in repository.find_by_ids([active.id, deleted.id, member.id])} == {active.id, member.id}
+    assert repository.find_by_id(active.id) is active
+    assert repository.find_by_id(deleted.id) is None
+    assert repository.find_paths_by_ids([active.id, deleted.id]) == {active.id: active.full_path}
+    assert [f.id for f in repository.find_by_pattern_id(1)] == [active.id]
+
+
+def test_save_archive_members_marks_missing_members_with_constant_bindings(session):
+    """목록에서 사라진 항목만 삭제 표시하고, 남은 항목은 ID를 유지하며, 항목 ID를 바인딩하지 않는지 확인"""
+    repository = FileRepositoryImpl(session)
+    archive, = repository.save_all([_file("/library", "book")])
+    first = repository.save_archive_members(archive.id, [_file("/library/book.txt", name, archive_id=archive.id) for name in "abc"])
+    statements = []
+    event.listen(
+        session.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, parameters, context, executemany: statements.append((statement, parameters)),
+    )
+
+    second = repository.save_archive_members(archive.id, [_file("/library/book.txt", name, archive_id=archive.id) for name in "acd"])
+
+    assert second["/library/book.txt/a.txt"] == first["/library/book.txt/a.txt"]
+    assert second["/library/book.txt/c.txt"] == first["/library/book.txt/c.txt"]
+    active = session.exec(select(File.name).where(File.archive_id == archive.id, File.is_deleted == False)).all()  # noqa: E712
+    assert sorted(active) == ["a.txt", "c.txt", "d.txt"]
+    updates = [parameters for statement, parameters in statements if statement.startswith("UPDATE")]
+    assert updates and all(len(parameters) <= 3 for parameters in updates)
+    session.refresh(archive)
+    assert archive.archive_members_listed
+
+
+def test_find_by_pattern_id_after_id_pages_by_id(session):
+    """패턴 대상 파일을 last_id 다음부터 ID 순으로 나누어 조회하고, 대상 수를 세는지 확인"""
+    repository = FileRepositoryImpl(session)
+    files = repository.save_all([_file("/library", name) for name in ("a", "b", "c", "d")])
+    repository.mark_deleted([files[1].id])
+    for file in files[:3]:
+        session.add(ExtractedData(file_id=file.id, pattern_id=1, extracted_values={}))
+        # 여러 키로 추출되어도 파일은 한 번만 조회되어야 합니다.
+        session.add(ExtractedData(file_id=file.id, pattern_id=1, extracted_values={"k": "v"}))
+    session.commit()
+
+    assert [f.id for f in repository.find_by_pattern_id_after_id(1, 0, 1)] == [files[0].id]
+    assert [f.id for f in repository.find_by_pattern_id_after_id(1, files[0].id, 10)] == [files[2].id]
+    assert repository.find_by_pattern_id_after_id(1, files[2].id, 10) == []
+    assert repository.count_by_pattern_id(1) == 2
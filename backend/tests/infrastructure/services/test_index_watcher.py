@@ -0,0 +1,133 @@
+import time
+
+import pytest
+
+from app.infrastructure.services.index_watcher import FileSystemChanges, IndexWatcher
+from app.infrastructure.services.inotify import InotifyEvent, IN_Q_OVERFLOW
+
+try:
+    from app.infrastructure.services.inotify import Inotify
+    Inotify().close()
+except OSError:
+    pytest.skip("inotify를 사용할 수 없는 환경입니다.", allow_module_level=True)
+
+
+@pytest.fixture
+def watcher_factory(tmp_path):
+    watchers = []
+    received = []
+
+    def factory(patterns=None):
+        watcher = IndexWatcher(
+            roots_provider=lambda: [str(tmp_path)],
+            patterns_provider=lambda: patterns or [],
+            on_changes=received.append,
+            debounce_seconds=0.1,
+            poll_interval=0.02,
+        )
+        watcher.start()
+        watchers.append(watcher)
+        return watcher
+
+    yield factory, received
+    for watcher in watchers:
+        watcher.stop()
+
+
+def _merged(received, timeout=3.0) -> FileSystemChanges:
+    # 전달된 변경 묶음을 하나로 합칩니다.
+    deadline = time.monotonic() + timeout
+    while not received and time.monotonic() < deadline:
+        time.sleep(0.02)
+    time.sleep(0.2)
+    merged = FileSystemChanges()
+    for changes in received:
+        for name in ("upserted_paths", "deleted_paths", "deleted_directories", "scanned_directories", "rescan_roots"):
+            getattr(merged, name).update(getattr(changes, name))
+        merged.moved_paths.update(changes.moved_paths)
+        merged.moved_directories.update(changes.moved_directories)
+    return merged
+
+
+def test_create_delete_and_rename_are_coalesced(watcher_factory, tmp_path):
+    """생성/삭제/이름 변경 이벤트가 경로별 마지막 상태로 모여 전달되는지 확인"""
+    (tmp_path / "old.mkv").write_bytes(b"1")
+    (tmp_path / "gone.mkv").write_bytes(b"1")
+    factory, received = watcher_factory
+    factory()
+
+    (tmp_path / "new.mkv").write_bytes(b"1")
+    (tmp_path / "old.mkv").rename(tmp_path / "renamed.mkv")
+    (tmp_path / "gone.mkv").unlink()
+    (tmp_path / "temp.mkv").write_bytes(b"1")
+    (tmp_path / "temp.mkv").unlink()
+
+    changes = _merged(received)
+    assert changes.upserted_paths == {str(tmp_path / "new.mkv")}
+    assert changes.deleted_paths == {str(tmp_path / "gone.mkv"), str(tmp_path / "temp.mkv")}
+    assert changes.moved_paths == {str(tmp_path / "old.mkv"): str(tmp_path / "renamed.mkv")}
+
+
+def test_moves_are_paired_by_cookie(watcher_factory, tmp_path):
+    """이동은 cookie로 짝지어 전달되고, 이동한 디렉토리 안의 이후 변경은 새 경로로 전달되는지 확인"""
+    (tmp_path / "a.mkv").write_bytes(b"1")
+    (tmp_path / "season1").mkdir()
+    (tmp_path / "season1" / "ep1.mkv").write_bytes(b"1")
+    (tmp_path / "out.mkv").write_bytes(b"1")
+    outside = tmp_path.parent / f"{tmp_path.name}-outside"
+    outside.mkdir()
+    factory, received = watcher_factory
+    factory()
+
+    (tmp_path / "a.mkv").rename(tmp_path / "b.mkv")
+    (tmp_path / "b.mkv").rename(tmp_path / "c.mkv")
+    (tmp_path / "season1").rename(tmp_path / "Season 1")
+    (tmp_path / "out.mkv").rename(outside / "out.mkv")
+
+    changes = _merged(received)
+    assert changes.moved_paths == {str(tmp_path / "a.mkv"): str(tmp_path / "c.mkv")}
+    assert changes.moved_directories == {str(tmp_path / "season1"): str(tmp_path / "Season 1")}
+    # 감시 범위 밖으로 나간 파일은 짝이 없으므로 삭제로 전달됩니다.
+    assert changes.deleted_paths == {str(tmp_path / "out.mkv")}
+
+    received.clear()
+    (tmp_path / "Season 1" / "ep2.mkv").write_bytes(b"1")
+    assert _merged(received).upserted_paths == {str(tmp_path / "Season 1" / "ep2.mkv")}
+
+
+def test_new_directory_is_watched_and_scanned(watcher_factory, tmp_path):
+    """새 디렉토리는 탐색 대상으로 전달되고, 이후 그 안의 변경도 감시되는지 확인"""
+    factory, received = watcher_factory
+    factory()
+
+    (tmp_path / "season1").mkdir()
+    changes = _merged(received)
+    assert changes.scanned_directories == {str(tmp_path / "season1")}
+
+    received.clear()
+    (tmp_path / "season1" / "ep1.mkv").write_bytes(b"1")
+    assert _merged(received).upserted_paths == {str(tmp_path / "season1" / "ep1.mkv")}
+
+
+def test_excluded_paths_are_ignored(watcher_factory, tmp_path):
+    """제외 패턴에 일치하는 파일과 디렉토리의 이벤트는 무시되는지 확인"""
+    (tmp_path / ".git").mkdir()
+    factory, received = watcher_factory
+    factory(["*/.git/*", "*.tmp"])
+
+    (tmp_path / ".git" / "index").write_bytes(b"1")
+    (tmp_path / "part.tmp").write_bytes(b"1")
+    (tmp_path / "kept.mkv").write_bytes(b"1")
+
+    changes = _merged(received)
+    assert changes.upserted_paths == {str(tmp_path / "kept.mkv")}
+
+
+def test_queue_overflow_requests_root_rescan(watcher_factory, tmp_path):
+    """이벤트 큐가 넘치면 감시 루트 전체를 다시 탐색하도록 요청하는지 확인"""
+    factory, received = watcher_factory
+    watcher = factory()
+
+    watcher._handle_event(InotifyEvent(-1, IN_Q_OVERFLOW, 0, ""))
+
+    assert watcher._changes.rescan_roots == {str(tmp_path)}
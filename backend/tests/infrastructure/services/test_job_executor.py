@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.domain.job.model import Job
+from app.infrastructure.persistence.job_repository_impl import JobRepositoryImpl
+from app.infrastructure.services.job_executor import JobExecutor
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield lambda: Session(engine)
+    engine.dispose()
+
+
+def _create_job(session_factory, **kwargs) -> int:
+    with session_factory() as session:
+        return JobRepositoryImpl(session).save(Job(job_type="count", **kwargs)).id
+
+
+def _load_job(session_factory, job_id: int) -> Job:
+    with session_factory() as session:
+        job = JobRepositoryImpl(session).find_by_id(job_id)
+        session.expunge(job)
+        return job
+
+
+def _count_handler(calls):
+    # 체크포인트의 위치부터 5까지 세며 매 단계 진행 상황을 보고합니다.
+    def handler(session, params, checkpoint, report):
+        position = checkpoint.get("position", 0)
+        while position < params["until"]:
+            position += 1
+            calls.append(position)
+            report({"position": position}, {"position": position})
+        return {"position": position}
+    return handler
+
+
+def test_run_completes_job_and_records_progress(session_factory):
+    """작업이 완료되면 결과와 마지막 진행 상황이 기록되는지 확인"""
+    calls = []
+    executor = JobExecutor(session_factory, {"count": _count_handler(calls)})
+    job_id = _create_job(session_factory, params={"until": 3})
+
+    executor._run(job_id)
+
+    job = _load_job(session_factory, job_id)
+    assert job.status == "completed"
+    assert job.result == {"position": 3}
+    assert job.progress == {"position": 3}
+    assert job.finished_at is not None
+    assert calls == [1, 2, 3]
+
+
+def test_run_resumes_from_checkpoint(session_factory):
+    """중단된 작업이 저장된 체크포인트부터 이어서 실행되는지 확인"""
+    calls = []
+    executor = JobExecutor(session_factory, {"count": _count_handler(calls)})
+    job_id = _create_job(session_factory, params={"until": 5}, status="running", checkpoint={"position": 3})
+
+    executor.submit = executor._run  # 테스트에서는 같은 스레드에서 실행합니다.
+    assert executor.resume_unfinished() == [job_id]
+
+    assert calls == [4, 5]
+    assert _load_job(session_factory, job_id).status == "completed"
+
+
+def test_run_stops_when_cancel_requested(session_factory):
+    """진행 보고 시점에 취소 요청이 확인되면 작업이 취소 상태로 끝나는지 확인"""
+    calls = []
+    job_id = _create_job(session_factory, params={"until": 5})
+
+    def cancelling_handler(session, params, checkpoint, report):
+        calls.append(1)
+        with session_factory() as other:
+            job = JobRepositoryImpl(other).find_by_id(job_id)
+            job.cancel_requested = True
+            JobRepositoryImpl(other).save(job)
+        report({"position": 1}, {"position": 1})
+        calls.append(2)
+
+    JobExecutor(session_factory, {"count": cancelling_handler})._run(job_id)
+
+    job = _load_job(session_factory, job_id)
+    assert job.status == "cancelled"
+    assert job.checkpoint == {"position": 1}
+    assert calls == [1]
+
+
+def test_run_records_failure(session_factory, caplog):
+    """핸들러에서 예외가 발생하면 실패 상태와 traceback이 기록되고 로그로 남는지 확인"""
+    def failing_handler(session, params, checkpoint, report):
+        raise ValueError("boom")
+
+    job_id = _create_job(session_factory)
+    JobExecutor(session_factory, {"count": failing_handler})._run(job_id)
+
+    job = _load_job(session_factory, job_id)
+    assert job.status == "failed"
+    assert job.error.startswith("Traceback")
+    assert job.error.rstrip().endswith("ValueError: boom")
+    assert "failing_handler" in job.error
+    assert [record.levelname for record in caplog.records] == ["ERROR"]
+    assert caplog.records[0].exc_info is not None
+
+
+def test_shutdown_leaves_running_job_pending(session_factory):
+    """서버 종료로 중단된 작업은 다음 시작 시 이어서 실행되도록 대기 상태로 남는지 확인"""
+    calls = []
+    executor = JobExecutor(session_factory, {"count": _count_handler(calls)})
+    job_id = _create_job(session_factory, params={"until": 5})
+    executor._stopping.set()
+
+    executor._run(job_id)
+
+    job = _load_job(session_factory, job_id)
+    assert job.status == "pending"
+    assert job.checkpoint == {"position": 1}
+    executor.shutdown()
@@ -0,0 +1,29 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.domain.file.model import File
+from app.interfaces.api.v1.routers import files
+
+
+def test_index_stream_saves_every_batch_with_its_own_session(session, mocker, tmp_path):
+    """스트리밍 인덱싱이 요청 범위 세션이 아닌 스트림 전용 세션으로 여러 배치를 저장하고 닫는지 확인"""
+    for name in ("a", "b", "c", "d", "e"):
+        (tmp_path / f"{name}.mkv").write_bytes(b"x")
+    mocker.patch("app.application.use_cases.index_files.BATCH_SIZE", 2)
+    mocker.patch.object(files, "engine", session.get_bind())
+    close = mocker.spy(Session, "close")
+    app = FastAPI()
+    app.include_router(files.router, prefix="/files")
+
+    with TestClient(app) as client:
+        response = client.post("/files/index/stream", json={"directory_path": str(tmp_path)})
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["progress", "progress", "progress", "summary"]
+    assert [event["seen_count"] for event in events] == [2, 4, 5, 5]
+    assert events[-1]["added_count"] == 5
+    assert close.call_count == 1
+    assert len(session.exec(select(File)).all()) == 5
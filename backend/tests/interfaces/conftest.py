@@ -0,0 +1,5 @@
+import os
+
+# API 모듈은 임포트할 때 설정의 DATABASE_URL로 엔진을 만들므로, 테스트에서는 인메모리 DB를 지정합니다.
+# 테스트는 각자 필요한 엔진으로 바꿔서 사용합니다.
+os.environ.setdefault("DATABASE_URL", "sqlite://")